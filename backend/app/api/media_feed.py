@@ -1,4 +1,6 @@
+import json
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from ..services.enhanced_media_scraper import EnhancedMediaScraper
 
@@ -29,6 +31,44 @@ async def scrape_comprehensive_media(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
+@router.get("/media/stream-comprehensive")
+async def stream_comprehensive_media(
+    event_name: Optional[str] = Query(None, description="Current UFC event name"),
+    fighter_names: Optional[str] = Query(None, description="Comma-separated fighter names"),
+    max_per_platform: int = Query(25, description="Max content per platform"),
+    format: str = Query("ndjson", description="Stream format: 'ndjson' or 'sse'"),
+):
+    """Stream media content as each platform finishes, followed by a re-ranked summary frame"""
+    
+    if format not in ['ndjson', 'sse']:
+        raise HTTPException(status_code=400, detail="Invalid format")
+    
+    fighter_list = []
+    if fighter_names:
+        fighter_list = [name.strip() for name in fighter_names.split(',')]
+    
+    async def frames():
+        try:
+            async with EnhancedMediaScraper() as scraper:
+                async for frame in scraper.stream_all_platforms(
+                    event_name=event_name,
+                    fighter_names=fighter_list,
+                    max_per_platform=max_per_platform
+                ):
+                    yield _encode_frame(frame, format)
+        except Exception as e:
+            yield _encode_frame({'type': 'error', 'error': f"Scraping failed: {str(e)}"}, format)
+    
+    media_type = "text/event-stream" if format == 'sse' else "application/x-ndjson"
+    return StreamingResponse(frames(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+def _encode_frame(frame: dict, format: str) -> str:
+    """Serialize one stream frame as an NDJSON line or an SSE event"""
+    data = json.dumps(frame, default=str)
+    if format == 'sse':
+        return f"event: {frame.get('type', 'message')}\ndata: {data}\n\n"
+    return data + "\n"
+
 @router.get("/media/scrape-by-platform/{platform}")
 async def scrape_by_platform(
     platform: str,
@@ -0,0 +1,113 @@
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Deque
+from ..config.scraper_config import ScraperSource
+
+# Base poll interval by source priority (1-5); busy channels poll faster, quiet ones back off
+PRIORITY_POLL_MINUTES = {5: 15, 4: 30, 3: 60, 2: 120, 1: 240}
+MAX_BACKOFF_FACTOR = 4
+SEEN_IDS_LIMIT = 200
+
+
+@dataclass
+class ChannelPollState:
+    """What we already know about a YouTube channel's /videos page"""
+    source: ScraperSource
+    resolved_url: Optional[str] = None
+    newest_video_id: Optional[str] = None
+    newest_seen_at: Optional[datetime] = None
+    last_polled_at: Optional[datetime] = None
+    next_poll_at: Optional[datetime] = None
+    interval: timedelta = field(default_factory=lambda: timedelta(minutes=60))
+    seen_ids: Dict[str, None] = field(default_factory=dict)
+    # When recent polls found new videos; their spacing approximates how often the channel uploads
+    new_video_polls: Deque[datetime] = field(default_factory=lambda: deque(maxlen=10))
+    recent_items: List[Dict] = field(default_factory=list)
+
+    @property
+    def base_interval(self) -> timedelta:
+        return timedelta(minutes=PRIORITY_POLL_MINUTES.get(self.source.priority, 240))
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        return self.next_poll_at is None or (now or datetime.now()) >= self.next_poll_at
+
+    def candidate_urls(self) -> List[str]:
+        """URL formats to try, the one that worked last time first"""
+        channel_id = self.source.url.rstrip('/').split('/')[-1]
+        urls = [
+            f"https://www.youtube.com/{channel_id}/videos",
+            f"https://www.youtube.com/c/{channel_id}/videos",
+            f"https://www.youtube.com/channel/{channel_id}/videos"
+        ]
+        if self.resolved_url in urls:
+            urls.remove(self.resolved_url)
+            urls.insert(0, self.resolved_url)
+        return urls
+
+    def is_known(self, video_id: str) -> bool:
+        return video_id in self.seen_ids
+
+    def record_poll(self, new_items: List[Dict], limit: int, scanned_ids: Optional[List[str]] = None,
+                    now: Optional[datetime] = None):
+        """Remember new video IDs (newest first), keep relevant items and schedule the next poll"""
+        now = now or datetime.now()
+        self.last_polled_at = now
+        scanned_ids = scanned_ids or [item['platform_id'] for item in new_items]
+
+        if scanned_ids:
+            # The first poll only establishes the high-water mark; it says nothing about upload rate
+            if self.newest_video_id is not None:
+                self.new_video_polls.append(now)
+            self.newest_video_id = scanned_ids[0]
+            self.newest_seen_at = now
+            for video_id in scanned_ids:
+                self.seen_ids[video_id] = None
+            while len(self.seen_ids) > SEEN_IDS_LIMIT:
+                del self.seen_ids[next(iter(self.seen_ids))]
+        if new_items:
+            self.recent_items = (new_items + self.recent_items)[:limit]
+
+        self.interval = self._next_interval(bool(scanned_ids))
+        self.next_poll_at = now + self.interval
+
+    def record_failure(self, now: Optional[datetime] = None):
+        """The channel page couldn't be fetched: retry at the current interval, without backing off"""
+        now = now or datetime.now()
+        self.last_polled_at = now
+        self.next_poll_at = now + self.interval
+
+    def _next_interval(self, found_new: bool) -> timedelta:
+        base = self.base_interval
+        if not found_new:
+            # Nothing new: back off geometrically up to a cap
+            return min(self.interval * 1.5, base * MAX_BACKOFF_FACTOR)
+
+        if len(self.new_video_polls) >= 2:
+            span = self.new_video_polls[-1] - self.new_video_polls[0]
+            average_gap = span / (len(self.new_video_polls) - 1)
+            # Poll about twice per gap between polls that found new videos, within [base/2, base]
+            return max(base / 2, min(base, average_gap / 2))
+        return base
+
+
+class ChannelPollTracker:
+    """Per-channel high-water marks shared across scraper instances"""
+
+    def __init__(self):
+        self._states: Dict[str, ChannelPollState] = {}
+
+    def get(self, source: ScraperSource) -> ChannelPollState:
+        state = self._states.get(source.url)
+        if state is None:
+            state = ChannelPollState(source=source)
+            state.interval = state.base_interval
+            self._states[source.url] = state
+        return state
+
+    def reset(self):
+        self._states.clear()
+
+
+# Global instance
+channel_poll_tracker = ChannelPollTracker()
@@ -4,9 +4,12 @@ import json
 import re
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple, AsyncIterator
 from urllib.parse import quote_plus, urljoin
 from ..config.scraper_config import scraper_config, ScraperSource
+from .media_dedup import NearDuplicateIndex
+from .relevance_scorer import RelevanceScorer, default_scorer
+from .channel_poller import channel_poll_tracker
 
 class EnhancedMediaScraper:
     def __init__(self):
@@ -63,33 +66,95 @@ class EnhancedMediaScraper:
                 print(f"TikTok scraping failed: {tiktok_content}")
                 tiktok_content = []
             
-            # Combine and rank content
-            all_content = []
-            all_content.extend(youtube_content)
-            all_content.extend(twitter_content)
-            all_content.extend(tiktok_content)
-            
-            # Apply intelligent ranking
-            ranked_content = self._rank_content_by_relevance(all_content, event_name, fighter_names)
-            
-            return {
-                'total_content': len(all_content),
-                'youtube_count': len(youtube_content),
-                'twitter_count': len(twitter_content),
-                'tiktok_count': len(tiktok_content),
-                'content': ranked_content[:50],  # Top 50 pieces
-                'search_context': {
-                    'event_name': event_name,
-                    'fighter_names': fighter_names,
-                    'search_terms_used': len(search_terms['youtube'] + search_terms['twitter'] + search_terms['tiktok'])
-                },
-                'scraped_at': datetime.now().isoformat()
-            }
+            return self._build_feed_summary(
+                youtube_content, twitter_content, tiktok_content,
+                event_name, fighter_names, search_terms
+            )
             
         except Exception as e:
             print(f"Error in comprehensive scraping: {e}")
             return {'content': [], 'error': str(e)}
     
+    async def stream_all_platforms(self,
+                                   event_name: Optional[str] = None,
+                                   fighter_names: Optional[List[str]] = None,
+                                   max_per_platform: int = 30) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each platform's content as soon as its scraper finishes, then a re-ranked summary"""
+        
+        search_terms = self._generate_search_terms(event_name, fighter_names)
+        platform_content = {'youtube': [], 'twitter': [], 'tiktok': []}
+        
+        tasks = {
+            asyncio.ensure_future(self._scrape_youtube_comprehensive(search_terms['youtube'], max_per_platform)): 'youtube',
+            asyncio.ensure_future(self._scrape_twitter_comprehensive(search_terms['twitter'], max_per_platform)): 'twitter',
+            asyncio.ensure_future(self._scrape_tiktok_comprehensive(search_terms['tiktok'], max_per_platform)): 'tiktok',
+        }
+        pending = set(tasks)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    platform = tasks[task]
+                    if task.exception():
+                        print(f"{platform} scraping failed: {task.exception()}")
+                        yield {'type': 'platform', 'platform': platform, 'content': [], 'count': 0,
+                               'error': str(task.exception())}
+                        continue
+                    
+                    content = task.result()
+                    platform_content[platform] = content
+                    yield {
+                        'type': 'platform',
+                        'platform': platform,
+                        'content': self._rank_content_by_relevance(content, event_name, fighter_names),
+                        'count': len(content)
+                    }
+            
+            yield {
+                'type': 'summary',
+                **self._build_feed_summary(
+                    platform_content['youtube'], platform_content['twitter'], platform_content['tiktok'],
+                    event_name, fighter_names, search_terms
+                )
+            }
+        finally:
+            # Client went away or consumer stopped early: don't keep scraping in the background
+            for task in pending:
+                task.cancel()
+    
+    def _build_feed_summary(self, youtube_content: List[Dict], twitter_content: List[Dict], tiktok_content: List[Dict],
+                            event_name: Optional[str], fighter_names: Optional[List[str]],
+                            search_terms: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Combine, de-duplicate and rank per-platform results into the feed response"""
+        
+        # Combine and rank content
+        all_content = []
+        all_content.extend(youtube_content)
+        all_content.extend(twitter_content)
+        all_content.extend(tiktok_content)
+        
+        # Collapse reposts/clips of the same item across platforms and channels
+        unique_content = NearDuplicateIndex().collapse(all_content)
+        
+        # Apply intelligent ranking
+        ranked_content = self._rank_content_by_relevance(unique_content, event_name, fighter_names)
+        
+        return {
+            'total_content': len(all_content),
+            'youtube_count': len(youtube_content),
+            'twitter_count': len(twitter_content),
+            'tiktok_count': len(tiktok_content),
+            'duplicates_collapsed': len(all_content) - len(unique_content),
+            'content': ranked_content[:50],  # Top 50 pieces
+            'search_context': {
+                'event_name': event_name,
+                'fighter_names': fighter_names,
+                'search_terms_used': len(search_terms['youtube'] + search_terms['twitter'] + search_terms['tiktok'])
+            },
+            'scraped_at': datetime.now().isoformat()
+        }
+    
     def _generate_search_terms(self, event_name: Optional[str], fighter_names: Optional[List[str]]) -> Dict[str, List[str]]:
         """Generate dynamic search terms based on context"""
         
@@ -128,9 +193,9 @@ class EnhancedMediaScraper:
                 tiktok_terms.extend(fighter_tiktok[:5])
         
         return {
-            'youtube': list(set(youtube_terms)),  # Remove duplicates
-            'twitter': list(set(twitter_terms)),
-            'tiktok': list(set(tiktok_terms))
+            'youtube': list(dict.fromkeys(youtube_terms)),  # Remove duplicates, keep order stable
+            'twitter': list(dict.fromkeys(twitter_terms)),
+            'tiktok': list(dict.fromkeys(tiktok_terms))
         }
     
     async def _scrape_youtube_comprehensive(self, search_terms: List[str], max_results: int) -> List[Dict]:
@@ -150,6 +215,11 @@ class EnhancedMediaScraper:
         priority_channels = [src for src in scraper_config.YOUTUBE_SOURCES if src.priority >= 4]
         for channel_source in priority_channels[:5]:  # Monitor top 5 channels
             try:
+                state = channel_poll_tracker.get(channel_source)
+                if not state.is_due():
+                    # Polled recently; reuse what we already have without a request
+                    all_videos.extend(state.recent_items)
+                    continue
                 channel_videos = await self._scrape_youtube_channel_recent(channel_source)
                 all_videos.extend(channel_videos)
                 await asyncio.sleep(self.rate_limit_delay['youtube'])
@@ -167,55 +237,58 @@ class EnhancedMediaScraper:
         
         async with self.session.get(url) as response:
             content = await response.text()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Find script with video data
-            script_pattern = re.compile(r'var ytInitialData = ({.+?});')
-            video_data = None
-            
-            for script in soup.find_all('script'):
-                if script.string:
-                    match = script_pattern.search(script.string)
-                    if match:
-                        try:
-                            video_data = json.loads(match.group(1))
-                            break
-                        except json.JSONDecodeError:
-                            continue
-            
-            if not video_data:
-                return []
-            
-            return self._extract_youtube_videos_from_data(video_data, limit)
+            return self._parse_youtube_search_page(content, limit)
+    
+    def _parse_youtube_search_page(self, content: str, limit: int) -> List[Dict]:
+        """Parse videos out of a YouTube search results page"""
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Find script with video data
+        script_pattern = re.compile(r'var ytInitialData = ({.+?});')
+        video_data = None
+        
+        for script in soup.find_all('script'):
+            if script.string:
+                match = script_pattern.search(script.string)
+                if match:
+                    try:
+                        video_data = json.loads(match.group(1))
+                        break
+                    except json.JSONDecodeError:
+                        continue
+        
+        if not video_data:
+            return []
+        
+        return self._extract_youtube_videos_from_data(video_data, limit)
     
     async def _scrape_youtube_channel_recent(self, channel_source: ScraperSource, limit: int = 5) -> List[Dict]:
-        """Scrape recent videos from specific YouTube channel"""
-        # Extract channel ID or username from URL
-        channel_id = channel_source.url.split('/')[-1]
-        
-        # Try different URL formats
-        urls_to_try = [
-            f"https://www.youtube.com/{channel_id}/videos",
-            f"https://www.youtube.com/c/{channel_id}/videos",
-            f"https://www.youtube.com/channel/{channel_id}/videos"
-        ]
+        """Scrape recent videos from specific YouTube channel, stopping at already seen videos"""
+        state = channel_poll_tracker.get(channel_source)
         
-        for url in urls_to_try:
+        # Try the URL format that worked last time first
+        for url in state.candidate_urls():
             try:
                 async with self.session.get(url) as response:
                     if response.status == 200:
                         content = await response.text()
                         soup = BeautifulSoup(content, 'html.parser')
                         
-                        # Extract recent videos
-                        videos = self._extract_channel_videos(soup, channel_source, limit)
-                        if videos:
-                            return videos
+                        # Extract videos newer than the channel's high-water mark
+                        new_videos, scanned_ids, reached_known = self._extract_new_channel_videos(
+                            soup, channel_source, limit, state.is_known
+                        )
+                        if scanned_ids or reached_known:
+                            state.resolved_url = url
+                            state.record_poll(new_videos, limit, scanned_ids)
+                            return list(state.recent_items)
             except Exception as e:
                 print(f"Failed to scrape {url}: {e}")
                 continue
         
-        return []
+        # No URL could be fetched or parsed; that says nothing about new uploads, so don't back off
+        state.record_failure()
+        return list(state.recent_items)
     
     def _extract_youtube_videos_from_data(self, video_data: Dict, limit: int) -> List[Dict]:
         """Extract video information from YouTube's data structure"""
@@ -241,13 +314,30 @@ class EnhancedMediaScraper:
     
     def _extract_channel_videos(self, soup: BeautifulSoup, channel_source: ScraperSource, limit: int) -> List[Dict]:
         """Extract videos from channel page"""
+        videos, _, _ = self._extract_new_channel_videos(soup, channel_source, limit)
+        return videos
+    
+    def _extract_new_channel_videos(self, soup: BeautifulSoup, channel_source: ScraperSource, limit: int,
+                                    is_known: Optional[Callable[[str], bool]] = None) -> Tuple[List[Dict], List[str], bool]:
+        """Extract videos from a newest-first channel page until a known video is reached
+        
+        Returns the relevant new videos, every new video ID scanned and whether a known video stopped the scan.
+        """
         videos = []
+        scanned_ids = []
         
         # Look for video containers
-        video_containers = soup.find_all('div', {'id': re.compile(r'content.*')})
+        video_containers = soup.find_all('div', {'id': re.compile(r'content.*')}, limit=limit)
         
-        for container in video_containers[:limit]:
+        for container in video_containers:
             try:
+                link = container.find('a', href=re.compile(r'/watch\?v='))
+                if link:
+                    video_id = link['href'].split('v=')[1].split('&')[0]
+                    if is_known and is_known(video_id):
+                        return videos, scanned_ids, True
+                    scanned_ids.append(video_id)
+                
                 # Extract video info from container
                 video_info = self._parse_channel_video_container(container, channel_source)
                 if video_info and self._is_mma_relevant(video_info):
@@ -255,7 +345,7 @@ class EnhancedMediaScraper:
             except Exception as e:
                 print(f"Error parsing channel video container: {e}")
         
-        return videos
+        return videos, scanned_ids, False
     
     def _parse_channel_video_container(self, container, channel_source: ScraperSource) -> Optional[Dict]:
         """Parse individual video from channel page"""
@@ -385,25 +475,29 @@ class EnhancedMediaScraper:
                     return []
                 
                 content = await response.text()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                tweets = []
-                tweet_containers = soup.find_all('div', class_='timeline-item')
-                
-                for container in tweet_containers[:limit]:
-                    try:
-                        tweet_info = self._extract_tweet_info(container)
-                        if tweet_info and self._is_mma_relevant(tweet_info):
-                            tweets.append(tweet_info)
-                    except Exception as e:
-                        print(f"Error parsing tweet: {e}")
-                
-                return tweets
+                return self._parse_nitter_page(content, limit)
                 
         except Exception as e:
             print(f"Error scraping nitter: {e}")
             return []
     
+    def _parse_nitter_page(self, content: str, limit: int) -> List[Dict]:
+        """Parse tweets out of a nitter search page"""
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        tweets = []
+        tweet_containers = soup.find_all('div', class_='timeline-item')
+        
+        for container in tweet_containers[:limit]:
+            try:
+                tweet_info = self._extract_tweet_info(container)
+                if tweet_info and self._is_mma_relevant(tweet_info):
+                    tweets.append(tweet_info)
+            except Exception as e:
+                print(f"Error parsing tweet: {e}")
+        
+        return tweets
+    
     def _extract_tweet_info(self, tweet_container) -> Optional[Dict]:
         """Extract tweet information from nitter HTML"""
         try:
@@ -496,75 +590,23 @@ class EnhancedMediaScraper:
     
     def _classify_content_type(self, title: str) -> str:
         """Classify content based on title keywords"""
-        title_lower = title.lower()
-        
-        for category, keywords in scraper_config.CONTENT_CATEGORIES.items():
-            if any(keyword in title_lower for keyword in keywords):
-                return category
-        
-        return 'general'
+        return default_scorer.classify(title)
     
     def _calculate_youtube_relevance(self, title: str, channel: str) -> int:
         """Calculate relevance score for YouTube content"""
-        score = 0
-        text = f"{title} {channel}".lower()
-        
-        # High-value keywords
-        if 'ufc' in text: score += 50
-        if 'knockout' in text or 'ko' in text: score += 30
-        if 'highlights' in text: score += 25
-        if 'interview' in text: score += 20
-        if 'breakdown' in text or 'analysis' in text: score += 20
-        if 'press conference' in text or 'weigh in' in text: score += 25
-        
-        # Channel authority bonus
-        source_priority = self._get_source_priority(channel, 'youtube')
-        score += source_priority * 10
-        
-        return min(score, 100)
+        return default_scorer.youtube_relevance(title, channel)
     
     def _calculate_tweet_relevance(self, text: str, username: str) -> int:
         """Calculate relevance score for tweet"""
-        score = 0
-        content = f"{text} {username}".lower()
-        
-        # High value keywords
-        if 'ufc' in content: score += 40
-        if 'knockout' in content or 'ko' in content: score += 30
-        if 'fight' in content: score += 20
-        if 'mma' in content: score += 15
-        
-        # Verified accounts or official UFC accounts
-        if 'ufc' in username.lower(): score += 35
-        if 'dana' in username.lower(): score += 25
-        
-        return min(score, 100)
+        return default_scorer.tweet_relevance(text, username)
     
     def _get_source_priority(self, source_name: str, platform: str) -> int:
         """Get priority score for a source"""
-        sources = {
-            'youtube': scraper_config.YOUTUBE_SOURCES,
-            'twitter': scraper_config.TWITTER_SOURCES,
-            'tiktok': scraper_config.TIKTOK_SOURCES
-        }.get(platform, [])
-        
-        for source in sources:
-            if source.name.lower() in source_name.lower():
-                return source.priority
-        
-        return 1  # Default priority
+        return default_scorer.source_priority(source_name, platform)
     
     def _is_mma_relevant(self, content: Dict) -> bool:
         """Check if content is MMA/UFC relevant"""
-        text_to_check = f"{content.get('title', '')} {content.get('author_name', '')}".lower()
-        
-        mma_keywords = [
-            'ufc', 'mma', 'mixed martial arts', 'fight', 'fighter', 'knockout', 'ko',
-            'submission', 'octagon', 'championship', 'title fight', 'main event',
-            'weigh in', 'press conference', 'face off', 'staredown'
-        ]
-        
-        return any(keyword in text_to_check for keyword in mma_keywords)
+        return default_scorer.is_mma_relevant(content)
     
     def _is_high_quality_youtube(self, video: Dict) -> bool:
         """Filter for high-quality YouTube content"""
@@ -605,51 +647,7 @@ class EnhancedMediaScraper:
     
     def _rank_content_by_relevance(self, content: List[Dict], event_name: Optional[str], fighter_names: Optional[List[str]]) -> List[Dict]:
         """Intelligent content ranking based on context"""
-        
-        def calculate_contextual_score(item: Dict) -> float:
-            base_score = item.get('relevance_score', 0)
-            
-            # Boost for event-specific content
-            if event_name:
-                text = f"{item.get('title', '')} {item.get('description', '')}".lower()
-                if event_name.lower() in text:
-                    base_score += 30
-            
-            # Boost for fighter-specific content
-            if fighter_names:
-                text = f"{item.get('title', '')} {item.get('description', '')}".lower()
-                for fighter in fighter_names:
-                    if fighter.lower() in text:
-                        base_score += 20
-                        break
-            
-            # Platform-specific adjustments
-            platform = item.get('platform', '')
-            if platform == 'youtube':
-                base_score += item.get('view_count', 0) / 10000  # View count bonus
-            elif platform == 'twitter':
-                base_score += item.get('like_count', 0) / 100   # Like count bonus
-            elif platform == 'tiktok':
-                base_score += item.get('view_count', 0) / 50000  # View count bonus
-            
-            # Recency bonus
-            published_at = datetime.fromisoformat(item.get('published_at', '').replace('Z', '+00:00'))
-            hours_ago = (datetime.now() - published_at.replace(tzinfo=None)).total_seconds() / 3600
-            if hours_ago < 24:
-                base_score += 20
-            elif hours_ago < 72:
-                base_score += 10
-            
-            # Source priority bonus
-            base_score += item.get('source_priority', 1) * 5
-            
-            return base_score
-        
-        # Calculate contextual scores and sort
-        for item in content:
-            item['contextual_score'] = calculate_contextual_score(item)
-        
-        return sorted(content, key=lambda x: x['contextual_score'], reverse=True)
+        return RelevanceScorer(event_name, fighter_names).rank(content)
     
     # Helper methods for parsing
     def _parse_view_count(self, view_text: str) -> int:
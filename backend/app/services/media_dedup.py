@@ -0,0 +1,206 @@
+import hashlib
+import re
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_YOUTUBE_THUMB_PATTERN = re.compile(r'/vi(?:_webp)?/([A-Za-z0-9_-]{6,})/')
+
+# Words that carry no signal for "is this the same clip"
+_STOPWORDS = frozenset([
+    'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'for', 'with',
+    'vs', 'v', 'is', 'it', 'this', 'that', 'his', 'her', 'he', 'she', 'by',
+    'full', 'video', 'official', 'new', 'watch', 'https', 'http', 'www', 'com',
+])
+
+
+class NearDuplicateIndex:
+    """SimHash index for collapsing the same media item posted across platforms/channels.
+
+    Each item gets a 64-bit SimHash over its normalized title/text. The hash is split
+    into ``bands`` equal blocks; two hashes within ``max_distance`` bits of each other
+    always share at least one identical block when ``max_distance < bands``, so candidate
+    lookup is a handful of dict probes instead of a scan. Texts with fewer than
+    ``min_tokens`` tokens ("UFC 300", "Highlights") are too generic to match on SimHash
+    alone. Thumbnails are fingerprinted separately (http(s) URLs only, so shared ``data:``
+    placeholders never match), and a thumbnail match still needs the texts within
+    ``thumbnail_max_distance`` bits, since channel pages reuse generic images. Only the
+    last ``window_size`` items are kept, so memory and per-item work stay bounded during
+    ingestion.
+    """
+
+    HASH_BITS = 64
+
+    def __init__(self, max_distance: int = 3, bands: int = 4, window_size: int = 2000,
+                 min_tokens: int = 4, thumbnail_max_distance: int = 18):
+        if max_distance >= bands:
+            raise ValueError("max_distance must be smaller than bands")
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+        self.thumbnail_max_distance = thumbnail_max_distance
+        self.bands = bands
+        self.band_bits = self.HASH_BITS // bands
+        self.band_mask = (1 << self.band_bits) - 1
+        self.window_size = window_size
+
+        self._window = deque()
+        self._band_buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._thumb_buckets: Dict[str, List[int]] = {}
+        # entry id -> (simhash, thumbnail key, cluster id, whether the text is long enough to band)
+        self._entries: Dict[int, Tuple[int, Optional[str], int, bool]] = {}
+        self._next_id = 0
+
+    def add(self, item: Dict[str, Any]) -> Optional[int]:
+        """Add an item and return the cluster id it joined, or None if it starts a new one"""
+        tokens = self.normalize_tokens(self._item_text(item))
+        simhash = self._simhash_tokens(tokens)
+        banded = bool(simhash) and len(tokens) >= self.min_tokens
+        thumb_key = self.thumbnail_fingerprint(item.get('thumbnail_url'))
+
+        cluster = self._find_cluster(simhash, thumb_key, banded)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        cluster_id = cluster if cluster is not None else entry_id
+
+        self._entries[entry_id] = (simhash, thumb_key, cluster_id, banded)
+        self._window.append(entry_id)
+        if banded:
+            for band, key in enumerate(self._band_keys(simhash)):
+                self._band_buckets[band].setdefault(key, []).append(entry_id)
+        if thumb_key and simhash:
+            self._thumb_buckets.setdefault(thumb_key, []).append(entry_id)
+
+        if len(self._window) > self.window_size:
+            self._evict(self._window.popleft())
+
+        return cluster
+
+    def collapse(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Collapse near-duplicate items, keeping the highest relevance item per cluster"""
+        clusters: Dict[int, List[Dict[str, Any]]] = {}
+        order: List[int] = []
+
+        for item in items:
+            start_id = self._next_id
+            cluster = self.add(item)
+            cluster_id = cluster if cluster is not None else start_id
+            if cluster_id not in clusters:
+                clusters[cluster_id] = []
+                order.append(cluster_id)
+            clusters[cluster_id].append(item)
+
+        collapsed = []
+        for cluster_id in order:
+            members = clusters[cluster_id]
+            best = max(members, key=lambda x: x.get('relevance_score', 0))
+            if len(members) > 1:
+                best['duplicate_count'] = len(members) - 1
+                best['also_on'] = sorted({
+                    m.get('platform', '') for m in members if m is not best and m.get('platform')
+                })
+            collapsed.append(best)
+
+        return collapsed
+
+    def simhash(self, text: str) -> int:
+        """64-bit SimHash over unigram and bigram tokens of normalized text"""
+        return self._simhash_tokens(self.normalize_tokens(text))
+
+    def _simhash_tokens(self, tokens: List[str]) -> int:
+        if not tokens:
+            return 0
+
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        weights = [0] * self.HASH_BITS
+        for feature in features:
+            h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+            for bit in range(self.HASH_BITS):
+                if h >> bit & 1:
+                    weights[bit] += 1
+                else:
+                    weights[bit] -= 1
+
+        result = 0
+        for bit, weight in enumerate(weights):
+            if weight > 0:
+                result |= 1 << bit
+        return result
+
+    @staticmethod
+    def normalize_tokens(text: str) -> List[str]:
+        """Lowercase, strip punctuation/hashtags/mentions and drop stopwords"""
+        return [t for t in _TOKEN_PATTERN.findall((text or '').lower()) if t not in _STOPWORDS]
+
+    @staticmethod
+    def thumbnail_fingerprint(url: Optional[str]) -> Optional[str]:
+        """Stable key for a thumbnail URL, ignoring size variants and query strings.
+
+        None for anything but http(s) URLs: inline ``data:`` placeholders and relative
+        paths are shared by unrelated items.
+        """
+        if not url:
+            return None
+
+        youtube_match = _YOUTUBE_THUMB_PATTERN.search(url)
+        if youtube_match:
+            return f"yt:{youtube_match.group(1)}"
+
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return None
+        path = parsed.path.rsplit('/', 1)[-1]
+        if not path:
+            return None
+        # Drop size suffixes such as "_400x400" or "~tplv-..." so resized copies match
+        path = re.split(r'[~?]', path)[0]
+        path = re.sub(r'_\d+x\d+', '', path)
+        return f"{parsed.netloc}:{path}"
+
+    def _item_text(self, item: Dict[str, Any]) -> str:
+        title = item.get('title', '') or ''
+        description = item.get('description', '') or ''
+        # Search results reuse the title as description; don't weight it twice
+        if description and description != title:
+            return f"{title} {description[:200]}"
+        return title
+
+    def _band_keys(self, simhash: int) -> List[int]:
+        return [(simhash >> (band * self.band_bits)) & self.band_mask for band in range(self.bands)]
+
+    def _find_cluster(self, simhash: int, thumb_key: Optional[str], banded: bool) -> Optional[int]:
+        if simhash == 0:
+            return None
+
+        # Same thumbnail, and titles at least loosely alike
+        if thumb_key:
+            for entry_id in self._thumb_buckets.get(thumb_key, ()):
+                other_hash, _, cluster_id, _ = self._entries[entry_id]
+                if bin(simhash ^ other_hash).count('1') <= self.thumbnail_max_distance:
+                    return cluster_id
+
+        if not banded:
+            return None
+
+        for band, key in enumerate(self._band_keys(simhash)):
+            for entry_id in self._band_buckets[band].get(key, ()):
+                other_hash, _, cluster_id, _ = self._entries[entry_id]
+                if bin(simhash ^ other_hash).count('1') <= self.max_distance:
+                    return cluster_id
+
+        return None
+
+    def _evict(self, entry_id: int):
+        simhash, thumb_key, _, banded = self._entries.pop(entry_id)
+        for band, key in enumerate(self._band_keys(simhash) if banded else ()):
+            bucket = self._band_buckets[band].get(key)
+            if bucket:
+                bucket.remove(entry_id)
+                if not bucket:
+                    del self._band_buckets[band][key]
+        thumb_bucket = self._thumb_buckets.get(thumb_key) if thumb_key else None
+        if thumb_bucket and entry_id in thumb_bucket:
+            thumb_bucket.remove(entry_id)
+            if not thumb_bucket:
+                del self._thumb_buckets[thumb_key]
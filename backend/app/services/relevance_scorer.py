@@ -0,0 +1,276 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Optional, Iterable, Set, Tuple
+from ..config.scraper_config import scraper_config
+
+# Keyword -> signal tables mirroring the original per-item substring checks
+YOUTUBE_SIGNALS = [
+    ('ufc', ['ufc'], 50),
+    ('knockout', ['knockout', 'ko'], 30),
+    ('highlights', ['highlights'], 25),
+    ('interview', ['interview'], 20),
+    ('analysis', ['breakdown', 'analysis'], 20),
+    ('event', ['press conference', 'weigh in'], 25),
+]
+
+TWEET_SIGNALS = [
+    ('ufc', ['ufc'], 40),
+    ('knockout', ['knockout', 'ko'], 30),
+    ('fight', ['fight'], 20),
+    ('mma', ['mma'], 15),
+]
+
+TWEET_USERNAME_SIGNALS = [
+    ('ufc', ['ufc'], 35),
+    ('dana', ['dana'], 25),
+]
+
+MMA_KEYWORDS = [
+    'ufc', 'mma', 'mixed martial arts', 'fight', 'fighter', 'knockout', 'ko',
+    'submission', 'octagon', 'championship', 'title fight', 'main event',
+    'weigh in', 'press conference', 'face off', 'staredown'
+]
+
+
+class KeywordMatcher:
+    """Precompiled substring matcher over a fixed keyword set.
+
+    Keywords without whitespace can only occur inside a single whitespace-separated
+    word, so each distinct word is matched against them once and its label bitmask is
+    memoized; vocabulary repeats heavily across titles, so most words are a dict hit.
+    Multi-word phrases are checked against the full text, skipping any whose labels
+    are already set. The result equals running ``keyword in text`` for every keyword.
+    Keywords listed in ``whole_word`` must instead appear as whole words and are
+    matched with one combined regex.
+    """
+
+    WORD_CACHE_SIZE = 50000
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], whole_word: Optional[Iterable[str]] = None):
+        # keywords: lowercase keyword -> labels it contributes
+        self.bits: Dict[str, int] = {}
+        self.masks: Dict[str, int] = {}
+        for keyword, labels in keywords.items():
+            keyword = keyword.lower()
+            if keyword:
+                self.masks[keyword] = self.masks.get(keyword, 0) | self.mask(labels, create=True)
+
+        self.whole_word = {w.lower() for w in (whole_word or ()) if w.lower() in self.masks}
+        substring_keywords = [k for k in self.masks if k not in self.whole_word]
+        self.word_keywords = [(k, self.masks[k]) for k in substring_keywords if len(k.split()) == 1 and k == k.strip()]
+        self.phrase_keywords = [(k, self.masks[k]) for k in substring_keywords if (k, self.masks[k]) not in self.word_keywords]
+
+        self.whole_word_pattern = None
+        if self.whole_word:
+            alternatives = '|'.join(re.escape(k) for k in sorted(self.whole_word, key=len, reverse=True))
+            self.whole_word_pattern = re.compile(r'(?<!\w)(?:' + alternatives + r')(?!\w)')
+
+        self._word_cache: Dict[str, int] = {}
+
+    def mask(self, labels: Iterable[str], create: bool = False) -> int:
+        """Bitmask for label names"""
+        result = 0
+        for label in labels:
+            if label not in self.bits:
+                if not create:
+                    continue
+                self.bits[label] = 1 << len(self.bits)
+            result |= self.bits[label]
+        return result
+
+    def match(self, text: str) -> int:
+        """Return the label bitmask of every keyword occurring in already-lowercased text"""
+        labels = 0
+        if self.word_keywords:
+            cache = self._word_cache
+            for word in text.split():
+                word_mask = cache.get(word)
+                if word_mask is None:
+                    word_mask = self._word_mask(word)
+                labels |= word_mask
+
+        for phrase, phrase_mask in self.phrase_keywords:
+            if phrase_mask & ~labels and phrase in text:
+                labels |= phrase_mask
+
+        if self.whole_word_pattern:
+            for keyword in self.whole_word_pattern.findall(text):
+                labels |= self.masks[keyword]
+        return labels
+
+    def _word_mask(self, word: str) -> int:
+        if len(self._word_cache) >= self.WORD_CACHE_SIZE:
+            self._word_cache.clear()
+        word_mask = 0
+        for keyword, keyword_mask in self.word_keywords:
+            if keyword in word:
+                word_mask |= keyword_mask
+        self._word_cache[word] = word_mask
+        return word_mask
+
+
+def _signal_keywords(*tables: Tuple[str, List[Tuple[str, List[str], int]]]) -> Dict[str, Set[str]]:
+    keywords: Dict[str, Set[str]] = {}
+    for prefix, table in tables:
+        for label, words, _ in table:
+            for word in words:
+                keywords.setdefault(word, set()).add(f"{prefix}:{label}")
+    return keywords
+
+
+def _build_static_matcher() -> KeywordMatcher:
+    keywords = _signal_keywords(('yt', YOUTUBE_SIGNALS), ('tw', TWEET_SIGNALS))
+    for word in MMA_KEYWORDS:
+        keywords.setdefault(word, set()).add('mma')
+    for category, words in scraper_config.CONTENT_CATEGORIES.items():
+        for word in words:
+            keywords.setdefault(word, set()).add(f"category:{category}")
+    return KeywordMatcher(keywords)
+
+
+_static_matcher = _build_static_matcher()
+_username_matcher = KeywordMatcher(_signal_keywords(('user', TWEET_USERNAME_SIGNALS)))
+
+
+@lru_cache(maxsize=8192)
+def _static_labels(text: str) -> int:
+    # Titles are matched once and reused by classification, relevance and MMA checks;
+    # channel and user names repeat across items so they are almost always cache hits
+    return _static_matcher.match(text.lower())
+
+
+def _signal_masks(matcher: KeywordMatcher, prefix: str, table: List[Tuple[str, List[str], int]]) -> List[Tuple[int, int]]:
+    return [(matcher.mask([f"{prefix}:{label}"]), weight) for label, _, weight in table]
+
+
+def _weighted_score(labels: int, signals: List[Tuple[int, int]]) -> int:
+    return sum(weight for mask, weight in signals if labels & mask)
+
+
+class RelevanceScorer:
+    """Precompiled relevance scoring for scraped media items.
+
+    Keyword, category and MMA-relevance checks share one static matcher compiled at
+    import time. Event and fighter context (including ``FIGHTER_ALIASES``) is compiled
+    once per ranking request, and ``rank`` scores every item in a single pass.
+    """
+
+    _youtube_signals = _signal_masks(_static_matcher, 'yt', YOUTUBE_SIGNALS)
+    _tweet_signals = _signal_masks(_static_matcher, 'tw', TWEET_SIGNALS)
+    _username_signals = _signal_masks(_username_matcher, 'user', TWEET_USERNAME_SIGNALS)
+    _mma_mask = _static_matcher.mask(['mma'])
+    _category_masks = [
+        (category, _static_matcher.mask([f"category:{category}"]))
+        for category in scraper_config.CONTENT_CATEGORIES
+    ]
+
+    def __init__(self, event_name: Optional[str] = None, fighter_names: Optional[List[str]] = None):
+        self.event_name = event_name
+        self.fighter_names = fighter_names or []
+        self._youtube_scores: Dict[int, int] = {}
+        self._tweet_scores: Dict[int, int] = {}
+        # Source names come from scraped items, so the per-scorer cache is bounded
+        self.source_priority = lru_cache(maxsize=4096)(self._source_priority)
+        self._sources = {
+            platform: [(source.name.lower(), source.priority) for source in sources]
+            for platform, sources in (
+                ('youtube', scraper_config.YOUTUBE_SOURCES),
+                ('twitter', scraper_config.TWITTER_SOURCES),
+                ('tiktok', scraper_config.TIKTOK_SOURCES),
+            )
+        }
+
+        # Ranking matches the full fighter names only; FIGHTER_ALIASES are for search terms,
+        # since nicknames like "The Great" or "DC" turn up in unrelated titles
+        context: Dict[str, Set[str]] = {}
+        if event_name:
+            context.setdefault(event_name.lower(), set()).add('event')
+        for fighter in self.fighter_names:
+            context.setdefault(fighter.lower(), set()).add('fighter')
+        self._context_matcher = KeywordMatcher(context) if context else None
+        if self._context_matcher:
+            self._event_mask = self._context_matcher.mask(['event'])
+            self._fighter_mask = self._context_matcher.mask(['fighter'])
+
+    def youtube_relevance(self, title: str, channel: str) -> int:
+        """Relevance score for YouTube content"""
+        labels = _static_labels(title) | _static_labels(channel)
+        score = self._youtube_scores.get(labels)
+        if score is None:
+            score = self._youtube_scores[labels] = _weighted_score(labels, self._youtube_signals)
+        return min(score + self.source_priority(channel, 'youtube') * 10, 100)
+
+    def tweet_relevance(self, text: str, username: str) -> int:
+        """Relevance score for a tweet"""
+        labels = _static_labels(text) | _static_labels(username)
+        score = self._tweet_scores.get(labels)
+        if score is None:
+            score = self._tweet_scores[labels] = _weighted_score(labels, self._tweet_signals)
+        score += _weighted_score(_username_matcher.match(username.lower()), self._username_signals)
+        return min(score, 100)
+
+    def classify(self, title: str) -> str:
+        """Content category for a title, first matching category wins"""
+        labels = _static_labels(title)
+        for category, mask in self._category_masks:
+            if labels & mask:
+                return category
+        return 'general'
+
+    def is_mma_relevant(self, content: Dict) -> bool:
+        """Check if content is MMA/UFC relevant"""
+        labels = _static_labels(content.get('title', '')) | _static_labels(content.get('author_name', '') or '')
+        return bool(labels & self._mma_mask)
+
+    def _source_priority(self, source_name: str, platform: str) -> int:
+        """Priority for a source; called through the per-instance source_priority cache"""
+        name = source_name.lower()
+        for source_lower, source_priority in self._sources.get(platform, []):
+            if source_lower in name:
+                return source_priority
+        return 1  # Default priority
+
+    def contextual_score(self, item: Dict, now: datetime) -> float:
+        """Context-aware ranking score for a single item"""
+        base_score = item.get('relevance_score', 0)
+
+        if self._context_matcher:
+            title = item.get('title', '')
+            description = item.get('description', '')
+            # Search results reuse the title as description; scan it once
+            text = title if description == title else f"{title} {description}"
+            context = self._context_matcher.match(text.lower())
+            if context & self._event_mask:
+                base_score += 30
+            if context & self._fighter_mask:
+                base_score += 20
+
+        platform = item.get('platform', '')
+        if platform == 'youtube':
+            base_score += item.get('view_count', 0) / 10000
+        elif platform == 'twitter':
+            base_score += item.get('like_count', 0) / 100
+        elif platform == 'tiktok':
+            base_score += item.get('view_count', 0) / 50000
+
+        published_at = datetime.fromisoformat(item.get('published_at', '').replace('Z', '+00:00'))
+        hours_ago = (now - published_at.replace(tzinfo=None)).total_seconds() / 3600
+        if hours_ago < 24:
+            base_score += 20
+        elif hours_ago < 72:
+            base_score += 10
+
+        base_score += item.get('source_priority', 1) * 5
+        return base_score
+
+    def rank(self, content: List[Dict]) -> List[Dict]:
+        """Score all items in one pass and sort by contextual score"""
+        now = datetime.now()
+        for item in content:
+            item['contextual_score'] = self.contextual_score(item, now)
+        return sorted(content, key=lambda x: x['contextual_score'], reverse=True)
+
+
+# Shared scorer for context-free scoring during parsing
+default_scorer = RelevanceScorer()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the media scraping pipeline
+
+Uses the fixtures in backend/benchmarks/fixtures/media (see media_replay.py)
+to report per-page parse time, items/sec, memory high-water mark and
+end-to-end scrape_all_platforms latency against a local replay server.
+YouTube and nitter pages only; the TikTok scraper makes no requests.
+
+Usage:
+    python backend/benchmarks/bench_media_scraper.py [--repeat 5]
+    python backend/benchmarks/media_replay.py record --event "UFC 300" --fighters "Alex Pereira" --max-per-platform 100
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.app.config.scraper_config import ScraperSource
+from backend.app.services.enhanced_media_scraper import EnhancedMediaScraper
+from backend.benchmarks.media_replay import FIXTURE_DIR, FixtureStore, replaying_scraper
+
+
+def classify_page(url: str) -> str:
+    parsed = urlparse(url)
+    if 'nitter' in parsed.netloc:
+        return 'nitter_search'
+    if parsed.path.startswith('/results'):
+        return 'youtube_search'
+    if parsed.path.endswith('/videos'):
+        return 'youtube_channel'
+    return 'other'
+
+
+def parse_page(scraper: EnhancedMediaScraper, kind: str, url: str, body: str) -> int:
+    """Run the scraper's parser for one page and return the number of items it produced"""
+    if kind == 'youtube_search':
+        return len(scraper._parse_youtube_search_page(body, 50))
+    if kind == 'nitter_search':
+        return len(scraper._parse_nitter_page(body, 50))
+    if kind == 'youtube_channel':
+        source = ScraperSource('Replay', url.rsplit('/videos', 1)[0], 'youtube', 'media', 3)
+        soup = BeautifulSoup(body, 'html.parser')
+        return len(scraper._extract_new_channel_videos(soup, source, 50)[0])
+    return 0
+
+
+def bench_parsing(store: FixtureStore, repeat: int):
+    scraper = EnhancedMediaScraper()
+    stats = defaultdict(lambda: {'pages': 0, 'items': 0, 'seconds': 0.0, 'bytes': 0})
+
+    for url, entry in store.responses.items():
+        if entry['status'] != 200:
+            continue
+        kind = classify_page(url)
+        if kind == 'other':
+            continue
+        body = store.read_body(url)
+
+        best = float('inf')
+        items = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = parse_page(scraper, kind, url, body)
+            best = min(best, time.perf_counter() - start)
+
+        stats[kind]['pages'] += 1
+        stats[kind]['items'] += items
+        stats[kind]['seconds'] += best
+        stats[kind]['bytes'] += len(body)
+
+    print("📄 Parse time per page (best of %d)" % repeat)
+    for kind, s in sorted(stats.items()):
+        per_page = s['seconds'] / s['pages'] * 1000
+        items_per_sec = s['items'] / s['seconds'] if s['seconds'] else 0
+        print(f"   {kind:16s} {s['pages']:4d} pages  {per_page:8.2f} ms/page  "
+              f"{s['bytes'] / s['pages'] / 1024:7.1f} KB/page  {items_per_sec:10,.0f} items/s")
+    if not stats:
+        print("   (no parseable pages recorded)")
+
+
+async def bench_end_to_end(store: FixtureStore, repeat: int):
+    scenario = store.scenario
+    timings = []
+    peak_bytes = 0
+    result = {}
+    misses = 0
+
+    for _ in range(repeat):
+        async with replaying_scraper(store) as (scraper, server):
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = await scraper.scrape_all_platforms(
+                scenario.get('event_name'), scenario.get('fighter_names'), scenario.get('max_per_platform', 30)
+            )
+            timings.append(time.perf_counter() - start)
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            misses = len(server.misses)
+
+    best = min(timings)
+    total = result.get('total_content', 0)
+    print(f"\n⏱️  End-to-end scrape_all_platforms (replay, {repeat} runs)")
+    print(f"   Latency:          best {best * 1000:.1f} ms, median {sorted(timings)[len(timings) // 2] * 1000:.1f} ms")
+    print(f"   Items:            {total} ({total / best:,.0f} items/s)")
+    print(f"   Peak traced mem:  {peak_bytes / 1024 / 1024:.1f} MB")
+    print(f"   Max RSS:          {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+    if misses:
+        print(f"   ⚠️  {misses} requests had no recorded fixture; re-record to cover them")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the media scraper against recorded fixtures')
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='Fixture directory')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    if not store.responses:
+        print(f"❌ No fixtures in {args.fixtures}; record them with media_replay.py first")
+        sys.exit(1)
+
+    print(f"🚀 Media scraper benchmark ({len(store.responses)} recorded responses)\n")
+    bench_parsing(store, args.repeat)
+    asyncio.run(bench_end_to_end(store, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark media relevance scoring on synthetic items
+
+Compares the original per-item substring scoring with the precompiled
+RelevanceScorer and checks both produce the same scores.
+
+Usage: python backend/benchmarks/bench_relevance_scoring.py [--items 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.app.config.scraper_config import scraper_config
+from backend.app.services.relevance_scorer import RelevanceScorer, _static_labels
+
+WORDS = [
+    'UFC', 'highlights', 'knockout', 'interview', 'breakdown', 'press conference',
+    'weigh in', 'submission', 'full fight', 'reaction', 'MMA', 'news', 'staredown',
+    'Pereira', 'Adesanya', 'Poatan', 'Alex Pereira', 'Hill', 'Makhachev', 'Volkanovski', 'Jones', 'title', 'fight',
+    'training', 'camp', 'vlog', 'podcast', 'episode', 'octagon', 'main event',
+    'Alexander Volkanovski', 'Volk', 'The Great', 'the great comeback', 'Izzy', 'DC',
+]
+CHANNELS = [s.name for s in scraper_config.YOUTUBE_SOURCES] + ['Random Channel', 'Fan Edits']
+USERNAMES = ['@ufc', '@danawhite', '@arielhelwani', '@mmafan', '@randomuser']
+
+
+def make_items(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now = datetime.now()
+    items = []
+    for i in range(count):
+        platform = rng.choice(['youtube', 'twitter', 'tiktok'])
+        title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 10)))
+        author = rng.choice(USERNAMES if platform == 'twitter' else CHANNELS)
+        items.append({
+            'platform': platform,
+            'platform_id': str(i),
+            'title': title,
+            'description': title,
+            'author_name': author,
+            'published_at': (now - timedelta(hours=rng.randint(0, 200))).isoformat(),
+            'view_count': rng.randint(0, 2000000),
+            'like_count': rng.randint(0, 5000),
+            'source_priority': rng.randint(1, 5),
+        })
+    return items
+
+
+# Original implementation, kept here as the comparison baseline
+def baseline_source_priority(source_name, platform):
+    sources = {
+        'youtube': scraper_config.YOUTUBE_SOURCES,
+        'twitter': scraper_config.TWITTER_SOURCES,
+        'tiktok': scraper_config.TIKTOK_SOURCES
+    }.get(platform, [])
+    for source in sources:
+        if source.name.lower() in source_name.lower():
+            return source.priority
+    return 1
+
+
+def baseline_youtube_relevance(title, channel):
+    score = 0
+    text = f"{title} {channel}".lower()
+    if 'ufc' in text: score += 50
+    if 'knockout' in text or 'ko' in text: score += 30
+    if 'highlights' in text: score += 25
+    if 'interview' in text: score += 20
+    if 'breakdown' in text or 'analysis' in text: score += 20
+    if 'press conference' in text or 'weigh in' in text: score += 25
+    score += baseline_source_priority(channel, 'youtube') * 10
+    return min(score, 100)
+
+
+def baseline_tweet_relevance(text, username):
+    score = 0
+    content = f"{text} {username}".lower()
+    if 'ufc' in content: score += 40
+    if 'knockout' in content or 'ko' in content: score += 30
+    if 'fight' in content: score += 20
+    if 'mma' in content: score += 15
+    if 'ufc' in username.lower(): score += 35
+    if 'dana' in username.lower(): score += 25
+    return min(score, 100)
+
+
+def baseline_classify(title):
+    title_lower = title.lower()
+    for category, keywords in scraper_config.CONTENT_CATEGORIES.items():
+        if any(keyword in title_lower for keyword in keywords):
+            return category
+    return 'general'
+
+
+def baseline_is_mma_relevant(content):
+    text_to_check = f"{content.get('title', '')} {content.get('author_name', '')}".lower()
+    mma_keywords = [
+        'ufc', 'mma', 'mixed martial arts', 'fight', 'fighter', 'knockout', 'ko',
+        'submission', 'octagon', 'championship', 'title fight', 'main event',
+        'weigh in', 'press conference', 'face off', 'staredown'
+    ]
+    return any(keyword in text_to_check for keyword in mma_keywords)
+
+
+def baseline_rank(content, event_name, fighter_names):
+    def calculate_contextual_score(item):
+        base_score = item.get('relevance_score', 0)
+        if event_name:
+            text = f"{item.get('title', '')} {item.get('description', '')}".lower()
+            if event_name.lower() in text:
+                base_score += 30
+        if fighter_names:
+            text = f"{item.get('title', '')} {item.get('description', '')}".lower()
+            for fighter in fighter_names:
+                if fighter.lower() in text:
+                    base_score += 20
+                    break
+        platform = item.get('platform', '')
+        if platform == 'youtube':
+            base_score += item.get('view_count', 0) / 10000
+        elif platform == 'twitter':
+            base_score += item.get('like_count', 0) / 100
+        elif platform == 'tiktok':
+            base_score += item.get('view_count', 0) / 50000
+        published_at = datetime.fromisoformat(item.get('published_at', '').replace('Z', '+00:00'))
+        hours_ago = (datetime.now() - published_at.replace(tzinfo=None)).total_seconds() / 3600
+        if hours_ago < 24:
+            base_score += 20
+        elif hours_ago < 72:
+            base_score += 10
+        base_score += item.get('source_priority', 1) * 5
+        return base_score
+
+    for item in content:
+        item['contextual_score'] = calculate_contextual_score(item)
+    return sorted(content, key=lambda x: x['contextual_score'], reverse=True)
+
+
+# Per-item work done while parsing (classification, relevance, MMA filter) plus ranking
+def run_baseline(items, event_name, fighter_names):
+    for item in items:
+        item['content_type'] = baseline_classify(item['title'])
+        item['mma_relevant'] = baseline_is_mma_relevant(item)
+        if item['platform'] == 'twitter':
+            item['relevance_score'] = baseline_tweet_relevance(item['title'], item['author_name'])
+            item['source_priority'] = baseline_source_priority(item['author_name'], 'twitter')
+        else:
+            item['relevance_score'] = baseline_youtube_relevance(item['title'], item['author_name'])
+            item['source_priority'] = baseline_source_priority(item['author_name'], 'youtube')
+    return baseline_rank(items, event_name, fighter_names)
+
+
+def run_scorer(items, event_name, fighter_names):
+    _static_labels.cache_clear()  # measure cold, not memoized, title matching
+    scorer = RelevanceScorer(event_name, fighter_names)
+    for item in items:
+        item['content_type'] = scorer.classify(item['title'])
+        item['mma_relevant'] = scorer.is_mma_relevant(item)
+        if item['platform'] == 'twitter':
+            item['relevance_score'] = scorer.tweet_relevance(item['title'], item['author_name'])
+            item['source_priority'] = scorer.source_priority(item['author_name'], 'twitter')
+        else:
+            item['relevance_score'] = scorer.youtube_relevance(item['title'], item['author_name'])
+            item['source_priority'] = scorer.source_priority(item['author_name'], 'youtube')
+    return scorer.rank(items)
+
+
+def time_run(func, items, event_name, fighter_names, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        batch = [dict(item) for item in items]
+        start = time.perf_counter()
+        result = func(batch, event_name, fighter_names)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark media relevance scoring')
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    event_name = 'UFC 300'
+    # Volkanovski has aliases ("Volk", "The Great"); ranking must only match the full name
+    fighter_names = ['Alex Pereira', 'Jamahal Hill', 'Alexander Volkanovski']
+
+    baseline_time, baseline_result = time_run(run_baseline, items, event_name, fighter_names, args.repeat)
+    scorer_time, scorer_result = time_run(run_scorer, items, event_name, fighter_names, args.repeat)
+
+    fields = ('content_type', 'mma_relevant', 'relevance_score', 'source_priority')
+    by_id = {item['platform_id']: item for item in scorer_result}
+    mismatches = sum(
+        1 for item in baseline_result
+        if any(item[f] != by_id[item['platform_id']][f] for f in fields)
+        or abs(item['contextual_score'] - by_id[item['platform_id']]['contextual_score']) > 1e-9
+    )
+
+    print(f"📊 Relevance scoring benchmark ({args.items} items, best of {args.repeat})")
+    print(f"   Baseline:  {baseline_time * 1000:8.1f} ms  ({args.items / baseline_time:,.0f} items/s)")
+    print(f"   Compiled:  {scorer_time * 1000:8.1f} ms  ({args.items / scorer_time:,.0f} items/s)")
+    print(f"   Speedup:   {baseline_time / scorer_time:.2f}x")
+    print(f"   Score mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Record/replay harness for the media scrapers
+
+Records real YouTube and nitter responses into fixture files, then serves them
+from a local aiohttp server so the media pipeline can be run and benchmarked
+offline. TikTok isn't covered: _scrape_tiktok_search makes no requests yet.
+
+fixtures/media holds a small committed set for a "UFC 300" scenario: one
+trimmed page per URL the pipeline requests, in the markup its parsers read
+(ytInitialData search results, channel video grids, nitter timelines).
+Re-record it to measure against current live markup.
+
+Usage:
+    python backend/benchmarks/media_replay.py record --event "UFC 300" --fighters "Alex Pereira,Israel Adesanya"
+    python backend/benchmarks/media_replay.py replay
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, quote
+
+import aiohttp
+from aiohttp import web
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.app.services.enhanced_media_scraper import EnhancedMediaScraper
+from backend.app.services.channel_poller import channel_poll_tracker
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'media')
+
+PLATFORM_HOSTS = {
+    'www.youtube.com': 'youtube',
+    'youtube.com': 'youtube',
+    'nitter.net': 'twitter',
+}
+
+
+class FixtureStore:
+    """Recorded responses on disk: an index.json plus one body file per URL"""
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        self.index_path = os.path.join(fixture_dir, 'index.json')
+        self.scenario: Dict[str, Any] = {}
+        self.responses: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.scenario = data.get('scenario', {})
+            self.responses = data.get('responses', {})
+
+    def add(self, url: str, status: int, content_type: str, body: str):
+        host = urlparse(url).netloc
+        platform = PLATFORM_HOSTS.get(host, host)
+        filename = f"{platform}_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}.html"
+
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(os.path.join(self.fixture_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(body)
+
+        self.responses[url] = {
+            'file': filename,
+            'status': status,
+            'content_type': content_type,
+            'platform': platform,
+        }
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self.responses.get(url)
+
+    def read_body(self, url: str) -> str:
+        entry = self.responses[url]
+        with open(os.path.join(self.fixture_dir, entry['file']), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def save(self):
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({'scenario': self.scenario, 'responses': self.responses}, f, indent=2, sort_keys=True)
+
+
+class _BufferedResponse:
+    """Minimal stand-in for the parts of aiohttp's response the scrapers use"""
+
+    def __init__(self, status: int, body: str):
+        self.status = status
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body
+
+
+class _BufferedRequest:
+    def __init__(self, fetch):
+        self._fetch = fetch
+
+    async def __aenter__(self) -> _BufferedResponse:
+        return await self._fetch()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class RecordingSession:
+    """Wraps a live ClientSession and saves every response into a FixtureStore"""
+
+    def __init__(self, session: aiohttp.ClientSession, store: FixtureStore):
+        self.session = session
+        self.store = store
+
+    def get(self, url: str, **kwargs) -> _BufferedRequest:
+        async def fetch():
+            async with self.session.get(url, **kwargs) as response:
+                body = await response.text()
+                self.store.add(url, response.status, response.headers.get('Content-Type', 'text/html'), body)
+                return _BufferedResponse(response.status, body)
+        return _BufferedRequest(fetch)
+
+    async def close(self):
+        await self.session.close()
+
+
+class ReplayServer:
+    """Local aiohttp server answering recorded URLs from a FixtureStore"""
+
+    def __init__(self, store: FixtureStore, host: str = '127.0.0.1', port: int = 0):
+        self.store = store
+        self.host = host
+        self.port = port
+        self.hits = 0
+        self.misses = []
+        self._runner = None
+        self._bodies: Dict[str, str] = {}
+
+    async def start(self):
+        # Load bodies up front so file I/O doesn't show up in replay timings
+        self._bodies = {url: self.store.read_body(url) for url in self.store.responses}
+
+        app = web.Application()
+        app.router.add_get('/replay', self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def replay_url(self, url: str) -> str:
+        return f"{self.base_url}/replay?url={quote(url, safe='')}"
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        url = request.query.get('url', '')
+        entry = self.store.get(url)
+        if entry is None:
+            self.misses.append(url)
+            return web.Response(status=404, text='')
+        self.hits += 1
+        content_type = entry.get('content_type', 'text/html').split(';')[0]
+        return web.Response(status=entry['status'], text=self._bodies[url], content_type=content_type)
+
+
+class ReplaySession:
+    """ClientSession wrapper that routes every request through a ReplayServer"""
+
+    def __init__(self, session: aiohttp.ClientSession, server: ReplayServer):
+        self.session = session
+        self.server = server
+
+    def get(self, url: str, **kwargs):
+        return self.session.get(self.server.replay_url(url), **kwargs)
+
+    async def close(self):
+        await self.session.close()
+
+
+@asynccontextmanager
+async def replaying_scraper(store: FixtureStore):
+    """EnhancedMediaScraper wired to a local replay server, with rate-limit sleeps disabled"""
+    server = ReplayServer(store)
+    await server.start()
+    channel_poll_tracker.reset()
+    try:
+        async with EnhancedMediaScraper() as scraper:
+            scraper.session = ReplaySession(scraper.session, server)
+            scraper.rate_limit_delay = {platform: 0 for platform in scraper.rate_limit_delay}
+            yield scraper, server
+    finally:
+        await server.stop()
+
+
+async def record(event_name: Optional[str], fighter_names: list, max_per_platform: int, fixture_dir: str):
+    """Run scrape_all_platforms against the live sites and save every response"""
+    store = FixtureStore(fixture_dir)
+    store.scenario = {
+        'event_name': event_name,
+        'fighter_names': fighter_names,
+        'max_per_platform': max_per_platform,
+    }
+    channel_poll_tracker.reset()
+
+    async with EnhancedMediaScraper() as scraper:
+        scraper.session = RecordingSession(scraper.session, store)
+        result = await scraper.scrape_all_platforms(event_name, fighter_names, max_per_platform)
+
+    store.save()
+    print(f"✅ Recorded {len(store.responses)} responses to {fixture_dir}")
+    print(f"   Items: {result.get('total_content', 0)}")
+
+
+async def replay(fixture_dir: str):
+    """Run scrape_all_platforms against recorded fixtures"""
+    store = FixtureStore(fixture_dir)
+    if not store.responses:
+        print(f"❌ No fixtures in {fixture_dir}; run the 'record' command first")
+        return
+
+    scenario = store.scenario
+    async with replaying_scraper(store) as (scraper, server):
+        result = await scraper.scrape_all_platforms(
+            scenario.get('event_name'), scenario.get('fighter_names'), scenario.get('max_per_platform', 30)
+        )
+
+    print(f"✅ Replayed {server.hits} responses ({len(server.misses)} misses)")
+    print(f"   Items: {result.get('total_content', 0)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record/replay media scraper responses')
+    parser.add_argument('command', choices=['record', 'replay'])
+    parser.add_argument('--event', default=None, help='Event name used for search terms')
+    parser.add_argument('--fighters', default='', help='Comma-separated fighter names')
+    parser.add_argument('--max-per-platform', type=int, default=30)
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='Fixture directory')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        fighters = [name.strip() for name in args.fighters.split(',') if name.strip()]
+        asyncio.run(record(args.event, fighters, args.max_per_platform, args.fixtures))
+    else:
+        asyncio.run(replay(args.fixtures))
+
+
+if __name__ == "__main__":
+    main()
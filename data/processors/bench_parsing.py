@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Validate and benchmark the shared record/date/method parsers
+
+Collects every date, method and record value from the data/exports corpus
+(JSON and CSV, plus the data/live fighter profiles for records), checks that
+the shared parsers agree with the previous per-call implementations wherever
+those produced a result, and reports values/sec for both.
+
+Method strings the legacy substring match misfiled (e.g. "TKO (submission to
+punches)" counted as a Submission) are listed as reclassified, not failures.
+
+Usage: python data/processors/bench_parsing.py [--repeat 20] [export files ...]
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(__file__))
+
+from parsing import parse_dates, parse_methods, parse_records, clear_caches, cache_info
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+
+DATE_FIELDS = {'date', 'event_date'}
+METHOD_FIELDS = {'method'}
+RECORD_FIELDS = {'record'}
+
+
+# Previous UFCDataProcessor implementations, kept as the baseline
+
+def legacy_parse_record(record_data):
+    try:
+        if isinstance(record_data, dict):
+            return {'wins': record_data.get('wins', 0), 'losses': record_data.get('losses', 0),
+                    'draws': record_data.get('draws', 0)}
+        elif isinstance(record_data, str):
+            parts = record_data.split('-')
+            return {'wins': int(parts[0]) if len(parts) > 0 else 0,
+                    'losses': int(parts[1]) if len(parts) > 1 else 0,
+                    'draws': int(parts[2]) if len(parts) > 2 else 0}
+        return {'wins': 0, 'losses': 0, 'draws': 0}
+    except Exception:
+        return None
+
+
+def legacy_parse_date(date_str):
+    if not date_str:
+        return None
+    for fmt in ['%B %d, %Y', '%b %d, %Y', '%Y-%m-%d', '%m/%d/%Y']:
+        try:
+            return datetime.strptime(date_str, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_parse_method(method_str):
+    method_info = {'method': 'Unknown', 'round': None, 'time': None}
+    if not method_str:
+        return method_info
+    for method in ['KO/TKO', 'Submission', 'Decision', 'DQ', 'No Contest']:
+        if method.lower() in method_str.lower():
+            method_info['method'] = method
+            break
+    round_match = re.search(r'Round (\d+)', method_str, re.IGNORECASE)
+    if round_match:
+        method_info['round'] = int(round_match.group(1))
+    time_match = re.search(r'(\d+):(\d+)', method_str)
+    if time_match:
+        method_info['time'] = f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}"
+    return method_info
+
+
+def collect(value, fields, corpus):
+    """Walk a JSON document and gather the values of date/method/record fields"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                collect(item, fields, corpus)
+            elif key in fields and item not in (None, ''):
+                corpus[fields[key]].append(item)
+    elif isinstance(value, list):
+        for item in value:
+            collect(item, fields, corpus)
+
+
+def load_corpus(paths):
+    fields = {**{f: 'dates' for f in DATE_FIELDS}, **{f: 'methods' for f in METHOD_FIELDS},
+              **{f: 'records' for f in RECORD_FIELDS}}
+    corpus = {'dates': [], 'methods': [], 'records': []}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.endswith('.csv'):
+                collect(list(csv.DictReader(f)), fields, corpus)
+            else:
+                collect(json.load(f), fields, corpus)
+    return corpus
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(label, values, legacy, shared, strict=True):
+    """Count values where the legacy parser gave an answer the shared one disagrees with"""
+    mismatches = []
+    for value, old, new in zip(values, legacy, shared):
+        if old is None or (isinstance(old, dict) and old.get('method') == 'Unknown'):
+            continue
+        if old != new:
+            mismatches.append((value, old, new))
+    improved = sum(1 for old, new in zip(legacy, shared)
+                   if (old is None or (isinstance(old, dict) and old.get('method') == 'Unknown'))
+                   and new is not None and not (isinstance(new, dict) and new.get('method') == 'Unknown'))
+    print(f"   {label:8s} {len(values):6d} values, {len(set(map(str, values))):5d} distinct, "
+          f"{improved:5d} newly parsed, {len(mismatches)} {'disagreements' if strict else 'reclassified'}")
+    for value, old, new in mismatches[:5]:
+        print(f"      {'❌' if strict else '↪️ '} {value!r}: legacy {old!r} -> shared {new!r}")
+    return len(mismatches) if strict else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate and benchmark the shared fight data parsers')
+    parser.add_argument('exports', nargs='*', help='Export files (defaults to everything in data/exports)')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.exports or sorted(glob.glob(os.path.join(REPO_ROOT, 'data', 'exports', '*.json')) +
+                                   glob.glob(os.path.join(REPO_ROOT, 'data', 'exports', '*.csv')) +
+                                   glob.glob(os.path.join(REPO_ROOT, 'data', 'live', '*.csv')))
+    if not paths:
+        print("❌ No export files found")
+        sys.exit(1)
+
+    corpus = load_corpus(paths)
+    dates, methods, records = corpus['dates'], corpus['methods'], corpus['records']
+    print(f"🔍 Checking {len(paths)} files")
+
+    failures = 0
+    failures += compare('dates', dates, [legacy_parse_date(v) for v in dates], parse_dates(dates))
+    failures += compare('methods', methods, [legacy_parse_method(v) for v in methods], parse_methods(methods), strict=False)
+    failures += compare('records', records, [legacy_parse_record(v) for v in records], parse_records(records))
+
+    def shared_cold(func, values):
+        def run():
+            clear_caches()
+            func(values)
+        return run
+
+    print(f"\n📊 Parse throughput (best of {args.repeat})")
+    for label, values, legacy, shared in (
+        ('dates', dates, legacy_parse_date, parse_dates),
+        ('methods', methods, legacy_parse_method, parse_methods),
+        ('records', records, legacy_parse_record, parse_records),
+    ):
+        if not values:
+            continue
+        legacy_time = best_time(lambda: [legacy(v) for v in values], args.repeat)
+        cold_time = best_time(shared_cold(shared, values), args.repeat)
+        warm_time = best_time(lambda: shared(values), args.repeat)
+        print(f"   {label:8s} legacy {len(values) / legacy_time:12,.0f}/s   "
+              f"shared (cold cache) {len(values) / cold_time:12,.0f}/s   "
+              f"shared (warm) {len(values) / warm_time:12,.0f}/s")
+        if label == 'dates':
+            print(f"            date cache holds {cache_info()['date'].currsize} entries")
+
+    if failures:
+        print(f"\n❌ {failures} disagreements with the legacy parsers")
+        sys.exit(1)
+    print("\n✅ Shared parsers agree with the legacy parsers on the corpus")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Columnar export of processed UFC data
+Writes fighters, fights, events and rankings as Parquet and/or Arrow IPC
+tables with a fixed schema, so consumers can memory-map a file and read only
+the columns they need instead of parsing the whole processed JSON:
+
+    fights = read_table('processed_ufc_data', 'fights',
+                        columns=['fighter1', 'fighter2', 'winner', 'method'])
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # columnar output is optional; JSON output works without it
+    pa = None
+
+SCHEMA_VERSION = '1'
+BATCH_ROWS = 10000
+FORMATS = ('parquet', 'arrow')
+TABLES = ('fighters', 'fights', 'events', 'rankings')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Columnar output requires pyarrow (pip install pyarrow)")
+
+
+def _schema(fields) -> 'pa.Schema':
+    return pa.schema(fields, metadata={'schema_version': SCHEMA_VERSION})
+
+
+def build_schemas() -> Dict[str, 'pa.Schema']:
+    """The table schemas; column names and types only change with SCHEMA_VERSION"""
+    _require_pyarrow()
+    return {
+        'fighters': _schema([
+            ('id', pa.string()),
+            ('name', pa.string()),
+            ('wins', pa.int32()),
+            ('losses', pa.int32()),
+            ('draws', pa.int32()),
+            ('divisions', pa.list_(pa.string())),
+            ('upcoming_fights', pa.int32()),
+            ('past_results', pa.int32()),
+        ]),
+        # Upcoming fights and past results in one table, told apart by status
+        'fights': _schema([
+            ('id', pa.string()),
+            ('status', pa.string()),            # 'upcoming' or 'completed'
+            ('fighter1', pa.string()),
+            ('fighter2', pa.string()),
+            ('fighter1_wins', pa.int32()),
+            ('fighter1_losses', pa.int32()),
+            ('fighter1_draws', pa.int32()),
+            ('fighter2_wins', pa.int32()),
+            ('fighter2_losses', pa.int32()),
+            ('fighter2_draws', pa.int32()),
+            ('winner', pa.string()),            # 'fighter1', 'fighter2' or null
+            ('winner_name', pa.string()),
+            ('weight_class', pa.string()),
+            ('fight_type', pa.string()),
+            ('method', pa.string()),
+            ('round', pa.int32()),
+            ('time', pa.string()),
+            ('scraped_at', pa.string()),
+        ]),
+        'events': _schema([
+            ('id', pa.string()),
+            ('status', pa.string()),            # 'upcoming' or 'past'
+            ('title', pa.string()),
+            ('date', pa.timestamp('ms')),
+            ('date_str', pa.string()),
+            ('location', pa.string()),
+            ('event_url', pa.string()),
+            ('type', pa.string()),
+            ('scraped_at', pa.string()),
+        ]),
+        'rankings': _schema([
+            ('id', pa.string()),
+            ('division', pa.string()),
+            ('rank', pa.int32()),
+            ('fighter_name', pa.string()),
+            ('wins', pa.int32()),
+            ('losses', pa.int32()),
+            ('draws', pa.int32()),
+            ('fighter_url', pa.string()),
+            ('scraped_at', pa.string()),
+        ]),
+    }
+
+
+# Processed records -> table rows
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(value) if value is not None and value != '' else None
+    except (TypeError, ValueError):
+        return None
+
+
+def fighter_row(fighter: Dict) -> Dict:
+    return {
+        'id': fighter['id'],
+        'name': fighter['name'],
+        'wins': _int(fighter.get('wins')),
+        'losses': _int(fighter.get('losses')),
+        'draws': _int(fighter.get('draws')),
+        'divisions': sorted({ranking['division'] for ranking in fighter.get('rankings', [])}),
+        'upcoming_fights': len(fighter.get('fights', [])),
+        'past_results': len(fighter.get('results', [])),
+    }
+
+
+def upcoming_fight_row(fight: Dict) -> Dict:
+    fighter1, fighter2 = fight['fighter1'], fight['fighter2']
+    return {
+        'id': fight['id'],
+        'status': 'upcoming',
+        'fighter1': fighter1['name'],
+        'fighter2': fighter2['name'],
+        'fighter1_wins': _int(fighter1.get('wins')),
+        'fighter1_losses': _int(fighter1.get('losses')),
+        'fighter1_draws': _int(fighter1.get('draws')),
+        'fighter2_wins': _int(fighter2.get('wins')),
+        'fighter2_losses': _int(fighter2.get('losses')),
+        'fighter2_draws': _int(fighter2.get('draws')),
+        'weight_class': fight.get('weight_class'),
+        'fight_type': fight.get('fight_type'),
+        'scraped_at': fight.get('scraped_at'),
+    }
+
+
+def result_row(result: Dict) -> Dict:
+    return {
+        'id': result['id'],
+        'status': 'completed',
+        'fighter1': result['fighter1'],
+        'fighter2': result['fighter2'],
+        'winner': result.get('winner'),
+        'winner_name': result.get('winner_name'),
+        'weight_class': result.get('weight_class'),
+        'method': result.get('method'),
+        'round': _int(result.get('round')),
+        'time': result.get('time'),
+        'scraped_at': result.get('scraped_at'),
+    }
+
+
+def event_row(event: Dict, status: str) -> Dict:
+    return {
+        'id': event['id'],
+        'status': status,
+        'title': event.get('title'),
+        'date': event.get('date'),
+        'date_str': event.get('date_str'),
+        'location': event.get('location'),
+        'event_url': event.get('event_url'),
+        'type': event.get('type'),
+        'scraped_at': event.get('scraped_at'),
+    }
+
+
+def ranking_row(ranking: Dict) -> Dict:
+    return {
+        'id': ranking['id'],
+        'division': ranking.get('division'),
+        'rank': _int(ranking.get('rank')),
+        'fighter_name': ranking.get('fighter_name'),
+        'wins': _int(ranking.get('wins')),
+        'losses': _int(ranking.get('losses')),
+        'draws': _int(ranking.get('draws')),
+        'fighter_url': ranking.get('fighter_url'),
+        'scraped_at': ranking.get('scraped_at'),
+    }
+
+
+def _batch(rows: List[Dict], schema: 'pa.Schema') -> 'pa.RecordBatch':
+    columns = {field.name: [row.get(field.name) for row in rows] for field in schema}
+    # ISO strings -> timestamps; pyarrow won't cast strings implicitly
+    for field in schema:
+        if pa.types.is_timestamp(field.type):
+            columns[field.name] = pa.array(columns[field.name], type=pa.string()).cast(field.type)
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+class ColumnarWriter:
+    """Writes table rows in batches to <directory>/<table>.parquet and/or .arrow.
+
+    Rows can be added one at a time (as the streaming processor produces them);
+    at most BATCH_ROWS rows per table are buffered in memory.
+    """
+
+    def __init__(self, directory: str, formats: Sequence[str] = FORMATS, batch_rows: int = BATCH_ROWS):
+        _require_pyarrow()
+        unknown = set(formats) - set(FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown columnar formats: {sorted(unknown)}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.formats = tuple(formats)
+        self.batch_rows = batch_rows
+        self.schemas = build_schemas()
+        self.counts = {table: 0 for table in TABLES}
+        self._buffers: Dict[str, List[Dict]] = {table: [] for table in TABLES}
+        self._writers: Dict[str, List] = {}
+        self._paths: List[str] = []
+
+    def _open(self, table: str) -> List:
+        writers = []
+        schema = self.schemas[table]
+        for fmt in self.formats:
+            path = os.path.join(self.directory, f"{table}.{fmt}")
+            tmp_path = f"{path}.tmp"
+            if fmt == 'parquet':
+                writers.append(pq.ParquetWriter(tmp_path, schema, compression='zstd'))
+            else:
+                # Uncompressed IPC file so readers can memory-map it without copying
+                writers.append(ipc.new_file(tmp_path, schema))
+            self._paths.append(path)
+        return writers
+
+    def _flush(self, table: str):
+        rows = self._buffers[table]
+        if not rows:
+            return
+        batch = _batch(rows, self.schemas[table])
+        for writer in self._writers[table]:
+            writer.write_batch(batch)
+        self._buffers[table] = []
+
+    def add(self, table: str, row: Dict):
+        if table not in self._writers:
+            self._writers[table] = self._open(table)
+        self._buffers[table].append(row)
+        self.counts[table] += 1
+        if len(self._buffers[table]) >= self.batch_rows:
+            self._flush(table)
+
+    def add_many(self, table: str, rows: Iterable[Dict]):
+        for row in rows:
+            self.add(table, row)
+
+    def close(self) -> List[str]:
+        """Finish every table (empty ones included) and move the files into place"""
+        for table in TABLES:
+            if table not in self._writers:
+                self._writers[table] = self._open(table)
+            self._flush(table)
+            for writer in self._writers[table]:
+                writer.close()
+        for path in self._paths:
+            os.replace(f"{path}.tmp", path)
+        return list(self._paths)
+
+    def abort(self):
+        for writers in self._writers.values():
+            for writer in writers:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+        for path in self._paths:
+            if os.path.exists(f"{path}.tmp"):
+                os.remove(f"{path}.tmp")
+
+
+def write_tables(processed_data: Dict, directory: str, formats: Sequence[str] = FORMATS) -> List[str]:
+    """Write an in-memory processed dataset as columnar tables; returns the file paths"""
+    writer = ColumnarWriter(directory, formats)
+    try:
+        writer.add_many('fighters', map(fighter_row, processed_data.get('fighters', [])))
+        writer.add_many('fights', map(upcoming_fight_row, processed_data.get('upcoming_fights', [])))
+        writer.add_many('fights', map(result_row, processed_data.get('past_results', [])))
+        writer.add_many('events', (event_row(e, 'upcoming') for e in processed_data.get('upcoming_events', [])))
+        writer.add_many('events', (event_row(e, 'past') for e in processed_data.get('past_events', [])))
+        writer.add_many('rankings', map(ranking_row, processed_data.get('rankings', [])))
+        return writer.close()
+    except Exception:
+        writer.abort()
+        raise
+
+
+def read_table(directory: str, table: str, columns: Optional[List[str]] = None,
+               memory_map: bool = True) -> 'pa.Table':
+    """Load a table, reading only the requested columns.
+
+    The Arrow IPC file is preferred: it is memory-mapped, so unrequested
+    columns are never read from disk. Parquet is the fallback.
+    """
+    _require_pyarrow()
+    arrow_path = os.path.join(directory, f"{table}.arrow")
+    if os.path.exists(arrow_path):
+        source = pa.memory_map(arrow_path) if memory_map else pa.OSFile(arrow_path)
+        with ipc.open_file(source) as reader:
+            if columns is None:
+                return reader.read_all()
+            return pa.Table.from_batches(
+                [reader.get_batch(i).select(columns) for i in range(reader.num_record_batches)],
+                schema=pa.schema([reader.schema.field(name) for name in columns])
+            )
+    return pq.read_table(os.path.join(directory, f"{table}.parquet"), columns=columns, memory_map=memory_map)
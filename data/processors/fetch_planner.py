@@ -0,0 +1,230 @@
+"""
+Fetch planner for fights and the rows they reference
+Takes a list of fights and resolves every fighter and event they point at
+with as few PostgREST requests as possible: ids are de-duplicated across all
+fights, rows already in the identity map are skipped, the rest are split into
+id=in.(...) queries that each fit under MAX_URL_LENGTH, and those queries run
+concurrently. Cached rows expire after CACHE_TTL seconds so edited and newly
+created rows show up, and ids with no row aren't cached.
+
+    planner = FetchPlanner(session=supabase_session())
+    fights = planner.resolve(fights)   # each fight gains fighter1, fighter2, event
+
+The backend reaches this module the same way it reaches the other processors
+(data/ on sys.path, `from processors.fetch_planner import FetchPlanner`);
+lib/services/fetch_planner.dart is the app's copy.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Kept well under the ~8 KB request line limit of the proxies in front of
+# PostgREST; about 50 uuids per query
+MAX_URL_LENGTH = 2048
+MAX_WORKERS = 8
+CACHE_TTL = 300
+
+# fight column -> (referenced table, key the row is attached under)
+REFERENCES = {
+    'fighter1_id': ('fighters', 'fighter1'),
+    'fighter2_id': ('fighters', 'fighter2'),
+    'event_id': ('events', 'event'),
+}
+
+class IdentityMap:
+    """One row object per (table, id), shared by every lookup while it's fresh; safe across threads"""
+
+    def __init__(self, ttl: float = CACHE_TTL):
+        self.ttl = ttl
+        self._rows: Dict[Tuple[str, str], Tuple[Dict, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self._fresh(key) is not None
+
+    def _fresh(self, key: Tuple[str, str]) -> Optional[Dict]:
+        entry = self._rows.get(key)
+        if entry is None:
+            return None
+        row, fetched_at = entry
+        if time.monotonic() - fetched_at > self.ttl:
+            return None
+        return row
+
+    def get(self, table: str, row_id) -> Optional[Dict]:
+        return self._fresh((table, str(row_id)))
+
+    def partition(self, table: str, ids: Iterable) -> Tuple[Dict[str, Dict], List[str]]:
+        """(cached rows by id, ids still to fetch)"""
+        cached, uncached = {}, []
+        with self._lock:
+            for row_id in ids:
+                row = self._fresh((table, row_id))
+                if row is None:
+                    uncached.append(row_id)
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    cached[row_id] = row
+        return cached, uncached
+
+    def put(self, table: str, rows: List[Dict]) -> Dict[str, Dict]:
+        """Store rows, keeping the existing object for ids whose entry is still fresh"""
+        stored = {}
+        now = time.monotonic()
+        with self._lock:
+            for row in rows:
+                key = (table, str(row['id']))
+                current = self._fresh(key)
+                if current is None:
+                    self._rows[key] = (row, now)
+                    current = row
+                stored[key[1]] = current
+        return stored
+
+    def clear(self, table: Optional[str] = None):
+        with self._lock:
+            if table is None:
+                self._rows.clear()
+            else:
+                for key in [key for key in self._rows if key[0] == table]:
+                    del self._rows[key]
+
+
+@dataclass
+class FetchQuery:
+    """One id=in.(...) request"""
+    table: str
+    ids: List[str]
+    params: Dict[str, str] = field(default_factory=dict)
+
+
+def chunk_ids(ids: List[str], base_length: int, max_length: int = MAX_URL_LENGTH) -> List[List[str]]:
+    """Split ids into runs whose encoded in.(...) filter keeps the URL at or under max_length"""
+    separator = len(quote_plus(','))
+    budget = max_length - base_length
+    chunks, chunk, used = [], [], 0
+    for row_id in ids:
+        cost = len(quote_plus(row_id)) + (separator if chunk else 0)
+        if chunk and used + cost > budget:
+            chunks.append(chunk)
+            chunk, used = [], 0
+            cost -= separator
+        chunk.append(row_id)
+        used += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class FetchPlanner:
+    """Resolves the fighters and events referenced by fights in batched, concurrent queries"""
+
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 session: Optional[requests.Session] = None, cache: Optional[IdentityMap] = None,
+                 columns: Optional[Dict[str, str]] = None, max_workers: int = MAX_WORKERS,
+                 max_url_length: int = MAX_URL_LENGTH):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        # Queries run on worker threads; a session passed in must be safe to share
+        # (scripts/http_client.py's sessions are), the default is one requests.Session per thread
+        self._session = session
+        self._key = supabase_key or os.getenv('SUPABASE_SERVICE_KEY')
+        self._local = threading.local()
+        self.cache = cache if cache is not None else IdentityMap()
+        self.columns = columns or {}  # table -> select list; must include id
+        self.max_workers = max_workers
+        self.max_url_length = max_url_length
+        self.requests = 0
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is not None:
+            return self._session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update({'apikey': self._key, 'Authorization': f'Bearer {self._key}'})
+        return session
+
+    def referenced_ids(self, fights: List[Dict]) -> Dict[str, List[str]]:
+        """Distinct ids per referenced table, in first-seen order"""
+        ids: Dict[str, Dict[str, None]] = {}
+        for fight in fights:
+            for column, (table, _) in REFERENCES.items():
+                value = fight.get(column)
+                if value:
+                    ids.setdefault(table, {})[str(value)] = None
+        return {table: list(table_ids) for table, table_ids in ids.items()}
+
+    def plan(self, fights: List[Dict]) -> List[FetchQuery]:
+        """The queries resolve() would send for these fights, given what's cached"""
+        queries = []
+        for table, ids in self.referenced_ids(fights).items():
+            queries.extend(self._queries(table, ids))
+        return queries
+
+    def _queries(self, table: str, ids: List[str]) -> List[FetchQuery]:
+        _, uncached = self.cache.partition(table, ids)
+        if not uncached:
+            return []
+        select = self.columns.get(table, '*')
+        # Length of the URL with an empty id list; the chunks fill the rest
+        base = f"{self.base_url}/{table}?" + urlencode({'select': select, 'id': 'in.()'})
+        return [FetchQuery(table, chunk, {'select': select, 'id': f"in.({','.join(chunk)})"})
+                for chunk in chunk_ids(uncached, len(base), self.max_url_length)]
+
+    def _run(self, query: FetchQuery) -> Tuple[FetchQuery, List[Dict]]:
+        response = self.session.get(f"{self.base_url}/{query.table}", params=query.params)
+        response.raise_for_status()
+        return query, response.json()
+
+    def fetch(self, queries: List[FetchQuery]) -> int:
+        """Send the queries concurrently and load their rows into the identity map; returns rows fetched"""
+        if not queries:
+            return 0
+        if len(queries) == 1 or self.max_workers <= 1:
+            results = [self._run(query) for query in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as executor:
+                results = list(executor.map(self._run, queries))
+        self.requests += len(queries)
+
+        fetched = 0
+        for query, rows in results:
+            self.cache.put(query.table, rows)
+            fetched += len(rows)
+        logger.debug(f"📥 {fetched} rows in {len(queries)} queries")
+        return fetched
+
+    def fetch_by_ids(self, table: str, ids: Iterable) -> Dict[str, Dict]:
+        """Rows of one table by id, from the identity map where possible"""
+        ids = list(dict.fromkeys(str(row_id) for row_id in ids if row_id))
+        self.fetch(self._queries(table, ids))
+        return {row_id: row for row_id in ids if (row := self.cache.get(table, row_id)) is not None}
+
+    def resolve(self, fights: List[Dict]) -> List[Dict]:
+        """Copies of the fights with fighter1, fighter2 and event attached (None where the row doesn't exist)"""
+        self.fetch(self.plan(fights))
+        resolved = []
+        for fight in fights:
+            fight = dict(fight)
+            for column, (table, key) in REFERENCES.items():
+                value = fight.get(column)
+                fight[key] = self.cache.get(table, value) if value else None
+            resolved.append(fight)
+        return resolved
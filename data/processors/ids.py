@@ -0,0 +1,90 @@
+"""
+Deterministic IDs for processed UFC data
+IDs are hashes of canonical keys, so the same fighter, event, ranking or bout
+gets the same ID on every run and loaders can upsert on it:
+
+    fighter  fighter|<normalized name>
+    event    event|<normalized title>|<date>  (or <event slug> without a title)
+    ranking  ranking|<normalized division>|<fighter key>
+    fight    fight|<event key>|<sorted fighter keys>  (|<n> for the nth bout of a pairing on one card)
+
+Keys are hashed with BLAKE2b to 20 hex characters (80 bits), which keeps the
+chance of any collision across a full fight history negligible.
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    from .indexes import normalize_fighter_name
+except ImportError:  # run as a script from data/processors
+    from indexes import normalize_fighter_name
+
+ID_BYTES = 10
+EVENT_SLUG_RE = re.compile(r'/event/([^/?#]+)')
+
+
+def stable_id(key: str) -> str:
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=ID_BYTES).hexdigest()
+
+
+def fighter_key(name: str) -> str:
+    return normalize_fighter_name(name)
+
+
+def event_key(event_url: Optional[str] = None, title: Optional[str] = None,
+              date: Optional[str] = None) -> str:
+    """The event's normalized title and day ("ufc 311|2025-01-18"), else its URL slug ("ufc-311")
+
+    Title and date come first because every writer has them: the processor's
+    ufc.com events and the scripts' Wikipedia cards (card_writer) get the same
+    key for the same event, while only the processor knows the ufc.com URL.
+    """
+    if title:
+        return f"{normalize_fighter_name(title)}|{(date or '')[:10]}"
+    if event_url:
+        match = EVENT_SLUG_RE.search(event_url)
+        return (match.group(1) if match else event_url.rstrip('/').rsplit('/', 1)[-1]).lower()
+    return ''
+
+
+def fighter_id(name: str) -> str:
+    return stable_id(f"fighter|{fighter_key(name)}")
+
+
+def event_id(event_url: Optional[str] = None, title: Optional[str] = None, date: Optional[str] = None) -> str:
+    return stable_id(f"event|{event_key(event_url, title, date)}")
+
+
+def ranking_id(division: str, fighter_name: str) -> str:
+    return stable_id(f"ranking|{normalize_fighter_name(division)}|{fighter_key(fighter_name)}")
+
+
+def pairing_key(fighter1: str, fighter2: str) -> str:
+    """The two fighters in either corner"""
+    return '|'.join(sorted((fighter_key(fighter1), fighter_key(fighter2))))
+
+
+def fight_id(fighter1: str, fighter2: str, event: str = '', occurrence: int = 1) -> str:
+    """ID of one bout; the corner order of the two fighters doesn't matter.
+
+    event is an event_key. The bout's position on the card isn't part of the
+    key, so adding or cancelling other bouts leaves the ID unchanged;
+    occurrence only separates a second bout between the same pair on one card
+    (see pairing_occurrences). Without an event (e.g. data from older scrapes)
+    a rematch gets the same ID as the first fight.
+    """
+    key = f"fight|{event}|{pairing_key(fighter1, fighter2)}"
+    return stable_id(key if occurrence <= 1 else f"{key}|{occurrence}")
+
+
+def pairing_occurrences(pairs: Iterable[Tuple[str, str]]) -> List[int]:
+    """For a card's bouts in card order, the nth time each pairing appears (1 unless it's a rematch)"""
+    seen = {}
+    occurrences = []
+    for fighter1, fighter2 in pairs:
+        key = pairing_key(fighter1, fighter2)
+        seen[key] = seen.get(key, 0) + 1
+        occurrences.append(seen[key])
+    return occurrences
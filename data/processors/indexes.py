@@ -0,0 +1,121 @@
+"""
+Hash indexes over processed UFC data
+Maps fighter names, normalized names, divisions and fight participants to
+positions in the processed lists so lookups don't scan the whole dataset.
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+INDEX_VERSION = 1
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_fighter_name(name: str) -> str:
+    """Case, accent and punctuation-insensitive key: "José Aldo" -> "jose aldo" """
+    ascii_name = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    return NON_ALNUM.sub(' ', ascii_name.lower()).strip()
+
+
+def index_path_for(data_path: str) -> str:
+    """processed_ufc_data.json -> processed_ufc_data.index.json"""
+    root, _ = os.path.splitext(data_path)
+    return f"{root}.index.json"
+
+
+class ProcessedDataIndex:
+    """Positions of fighters and fights in a processed dataset, keyed for O(1) lookup"""
+
+    def __init__(self):
+        self.processed_at: Optional[str] = None
+        self.counts: Dict[str, int] = {'fighters': 0, 'upcoming_fights': 0, 'past_results': 0}
+        self.by_name: Dict[str, int] = {}
+        self.by_normalized_name: Dict[str, int] = {}
+        self.by_division: Dict[str, List[int]] = {}
+        self.upcoming_fights_by_fighter: Dict[str, List[int]] = {}
+        self.results_by_fighter: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, processed_data: Dict) -> 'ProcessedDataIndex':
+        index = cls()
+        index.processed_at = processed_data.get('processed_at')
+        for fighter in processed_data.get('fighters', []):
+            index.add_fighter(fighter)
+        for fight in processed_data.get('upcoming_fights', []):
+            index.add_upcoming_fight(fight)
+        for result in processed_data.get('past_results', []):
+            index.add_result(result)
+        return index
+
+    # Incremental builders; positions follow insertion order, so items must be
+    # added in the same order they are written out
+
+    def add_fighter(self, fighter: Dict):
+        position = self.counts['fighters']
+        self.counts['fighters'] += 1
+        name = fighter['name']
+        self.by_name.setdefault(name, position)
+        self.by_normalized_name.setdefault(normalize_fighter_name(name), position)
+        for division in {ranking['division'].lower() for ranking in fighter.get('rankings', [])}:
+            self.by_division.setdefault(division, []).append(position)
+
+    def add_upcoming_fight(self, fight: Dict):
+        position = self.counts['upcoming_fights']
+        self.counts['upcoming_fights'] += 1
+        for name in {fight['fighter1']['name'], fight['fighter2']['name']}:
+            self.upcoming_fights_by_fighter.setdefault(name, []).append(position)
+
+    def add_result(self, result: Dict):
+        position = self.counts['past_results']
+        self.counts['past_results'] += 1
+        for name in {result['fighter1'], result['fighter2']}:
+            self.results_by_fighter.setdefault(name, []).append(position)
+
+    def fighter_position(self, name: str) -> Optional[int]:
+        """Exact name first, then the normalized name"""
+        position = self.by_name.get(name)
+        if position is None:
+            position = self.by_normalized_name.get(normalize_fighter_name(name))
+        return position
+
+    def matches(self, processed_data: Dict) -> bool:
+        """Whether this index was built for the given dataset"""
+        return (self.processed_at == processed_data.get('processed_at') and
+                all(len(processed_data.get(key, [])) == count for key, count in self.counts.items()))
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': INDEX_VERSION,
+            'processed_at': self.processed_at,
+            'counts': self.counts,
+            'by_name': self.by_name,
+            'by_normalized_name': self.by_normalized_name,
+            'by_division': self.by_division,
+            'upcoming_fights_by_fighter': self.upcoming_fights_by_fighter,
+            'results_by_fighter': self.results_by_fighter,
+        }
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> Optional['ProcessedDataIndex']:
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            return None
+        index = cls()
+        index.processed_at = data['processed_at']
+        index.counts = data['counts']
+        index.by_name = data['by_name']
+        index.by_normalized_name = data['by_normalized_name']
+        index.by_division = data['by_division']
+        index.upcoming_fights_by_fighter = data['upcoming_fights_by_fighter']
+        index.results_by_fighter = data['results_by_fighter']
+        return index
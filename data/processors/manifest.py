@@ -0,0 +1,218 @@
+"""
+Content-hash manifest of processed UFC data
+Records a hash of every fighter, event and fight keyed by its stable ID, so
+a run can be diffed against the previous one and only the added, changed and
+removed entities handed to the Firestore and Supabase sync stages.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+KINDS = ('fighters', 'events', 'fights')
+
+# Sections of the processed data that make up each manifest kind
+KIND_SECTIONS = {
+    'fighters': ('fighters',),
+    'events': ('upcoming_events', 'past_events'),
+    'fights': ('upcoming_fights', 'past_results'),
+}
+
+# Re-scraping an unchanged page only moves these, so they don't count as changes
+VOLATILE_FIELDS = frozenset({'scraped_at'})
+
+
+def _stable(value):
+    if isinstance(value, dict):
+        return {key: _stable(item) for key, item in value.items() if key not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_stable(item) for item in value]
+    return value
+
+
+def content_hash(record: Dict) -> str:
+    payload = json.dumps(_stable(record), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def iter_section_entities(read_section: Callable[[str], Iterable[Dict]]) -> Iterator[Tuple[str, Dict]]:
+    """(kind, record) for every fighter, event and fight, reading each section with read_section"""
+    for kind in KINDS:
+        for section in KIND_SECTIONS[kind]:
+            for record in read_section(section):
+                yield kind, record
+
+
+def iter_entities(processed_data: Dict) -> Iterator[Tuple[str, Dict]]:
+    """(kind, record) for every fighter, event and fight in a processed dataset"""
+    return iter_section_entities(lambda section: processed_data.get(section, []))
+
+
+class Delta:
+    """Added, changed and removed entity IDs per kind, with the records to upsert"""
+
+    def __init__(self):
+        self.added: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.changed: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.removed: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.records: Dict[str, Dict[str, Dict]] = {kind: {} for kind in KINDS}
+        # Upserts a sync stage couldn't write; commit_manifest keeps them pending
+        self.skipped: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        self.created_at = datetime.now().isoformat()
+        self.manifest_path: Optional[str] = None
+
+    def upserts(self, kind: str) -> List[Dict]:
+        """Records added or changed since the previous run"""
+        return [self.records[kind][record_id] for record_id in self.added[kind] + self.changed[kind]]
+
+    def skip(self, kind: str, record_ids: Iterable[str]):
+        """Mark upserts as not synced, so the next run diffs them as added or changed again"""
+        for record_id in record_ids:
+            if record_id not in self.skipped[kind]:
+                self.skipped[kind].append(record_id)
+
+    def is_empty(self) -> bool:
+        return not any(self.added[kind] or self.changed[kind] or self.removed[kind] for kind in KINDS)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        return {
+            kind: {'added': len(self.added[kind]), 'changed': len(self.changed[kind]),
+                   'removed': len(self.removed[kind])}
+            for kind in KINDS
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': MANIFEST_VERSION,
+            'created_at': self.created_at,
+            'manifest_path': self.manifest_path,
+            'summary': self.summary(),
+            'added': self.added,
+            'changed': self.changed,
+            'removed': self.removed,
+            'upserts': {kind: self.upserts(kind) for kind in KINDS},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Delta':
+        delta = cls()
+        delta.created_at = data.get('created_at', delta.created_at)
+        delta.manifest_path = data.get('manifest_path')
+        for kind in KINDS:
+            delta.added[kind] = list(data['added'].get(kind, []))
+            delta.changed[kind] = list(data['changed'].get(kind, []))
+            delta.removed[kind] = list(data['removed'].get(kind, []))
+            delta.records[kind] = {record['id']: record for record in data['upserts'].get(kind, [])}
+        return delta
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'Delta':
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+def pending_manifest_path(manifest_path: str) -> str:
+    return f"{manifest_path}.pending"
+
+
+def commit_manifest(manifest_path: Optional[str], skipped: Optional[Dict[str, List[str]]] = None):
+    """Promote the pending manifest written with a delta once that delta is synced
+
+    skipped ({kind: [ids]}, see Delta.skip) keeps their previous hash (or no
+    entry, if they were new), so the next run picks them up again. Raises if
+    there is nothing to promote, since the next run would then diff against an
+    older baseline and resend changes that were already synced.
+    """
+    if not manifest_path:
+        raise ValueError("Delta has no manifest_path; it wasn't written by compute_delta")
+    pending = pending_manifest_path(manifest_path)
+    if not os.path.exists(pending):
+        raise FileNotFoundError(f"No pending manifest at {pending}")
+
+    if skipped and any(skipped.values()):
+        manifest = ContentManifest.load(pending)
+        previous = ContentManifest.load(manifest_path) or ContentManifest()
+        for kind, record_ids in skipped.items():
+            for record_id in record_ids:
+                if record_id in previous.hashes[kind]:
+                    manifest.hashes[kind][record_id] = previous.hashes[kind][record_id]
+                else:
+                    manifest.hashes[kind].pop(record_id, None)
+        manifest.save(pending)
+    os.replace(pending, manifest_path)
+
+
+class ContentManifest:
+    """Content hash per entity ID, per kind"""
+
+    def __init__(self):
+        self.hashes: Dict[str, Dict[str, str]] = {kind: {} for kind in KINDS}
+        self.created_at: Optional[str] = None
+
+    @classmethod
+    def build(cls, processed_data: Dict) -> 'ContentManifest':
+        return cls.from_entities(iter_entities(processed_data), processed_data.get('processed_at'))
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Tuple[str, Dict]], created_at: Optional[str] = None) -> 'ContentManifest':
+        """Manifest of (kind, record) pairs, e.g. streamed from a processed file; only hashes are kept"""
+        manifest = cls()
+        manifest.created_at = created_at
+        for kind, record in entities:
+            manifest.hashes[kind][record['id']] = content_hash(record)
+        return manifest
+
+    def diff(self, previous: 'ContentManifest', processed_data: Dict) -> Delta:
+        """What changed between previous and this manifest; processed_data is the
+        dataset this manifest was built from and supplies the records to upsert"""
+        return self.diff_entities(previous, iter_entities(processed_data))
+
+    def diff_entities(self, previous: 'ContentManifest', entities: Iterable[Tuple[str, Dict]]) -> Delta:
+        """diff, with the records to upsert picked out of (kind, record) pairs as they go by"""
+        delta = Delta()
+        wanted = {kind: set() for kind in KINDS}
+        for kind in KINDS:
+            old_hashes = previous.hashes[kind]
+            for record_id, digest in self.hashes[kind].items():
+                if record_id not in old_hashes:
+                    delta.added[kind].append(record_id)
+                    wanted[kind].add(record_id)
+                elif old_hashes[record_id] != digest:
+                    delta.changed[kind].append(record_id)
+                    wanted[kind].add(record_id)
+            delta.removed[kind] = [record_id for record_id in old_hashes if record_id not in self.hashes[kind]]
+
+        # Last occurrence wins, matching the hashes recorded by build()
+        for kind, record in entities:
+            if record['id'] in wanted[kind]:
+                delta.records[kind][record['id']] = record
+        return delta
+
+    def save(self, path: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'created_at': self.created_at, 'hashes': self.hashes},
+                      f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['ContentManifest']:
+        """The saved manifest, or None if there isn't one (every entity is then new)"""
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != MANIFEST_VERSION:
+            return None
+        manifest = cls()
+        manifest.created_at = data.get('created_at')
+        for kind in KINDS:
+            manifest.hashes[kind] = data['hashes'].get(kind, {})
+        return manifest
@@ -0,0 +1,184 @@
+"""
+Shared parsers for fight data fields
+Records ("27-1-0"), dates ("Dec 14, 2024", "14 December 2024", "2024-12-14")
+and methods ("TKO (punches)", "Submission Round 2 4:05") in one place, with
+precompiled patterns, memoized parsers (the same dates, methods and records
+repeat across every fight of a card) and batch helpers.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DATE_CACHE_SIZE = 4096
+METHOD_CACHE_SIZE = 4096
+RECORD_CACHE_SIZE = 4096
+
+RECORD_RE = re.compile(r'(\d+)\s*[-–—]\s*(\d+)(?:\s*[-–—]\s*(\d+))?')
+
+FOOTNOTE_RE = re.compile(r'\[[^\]]*\]')
+WHITESPACE_RE = re.compile(r'\s+')
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\.?\s+(\d{1,2}),?\s+(\d{4})')   # December 15, 2024 / Dec. 15 2024
+DAY_MONTH_YEAR_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\.?,?\s+(\d{4})')   # 15 December 2024
+US_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')                     # 12/15/2024
+
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Checked in order; the first match wins
+METHOD_PATTERNS = [
+    ('KO/TKO', re.compile(r'\bT?KO\b', re.IGNORECASE)),
+    ('Submission', re.compile(r'\bsubmission\b|\bsub\b', re.IGNORECASE)),
+    ('Decision', re.compile(r'\bdecision\b|\bdec\b', re.IGNORECASE)),
+    ('DQ', re.compile(r'\bDQ\b|\bdisqualification\b', re.IGNORECASE)),
+    ('No Contest', re.compile(r'\bno contest\b|\bNC\b', re.IGNORECASE)),
+]
+ROUND_RE = re.compile(r'\bRound\s*(\d+)', re.IGNORECASE)
+TIME_RE = re.compile(r'(\d+):(\d{2})')
+
+
+def empty_record() -> Dict[str, int]:
+    return {'wins': 0, 'losses': 0, 'draws': 0}
+
+
+@lru_cache(maxsize=RECORD_CACHE_SIZE)
+def _parse_record_text(record_text: str) -> Tuple[int, int, int]:
+    match = RECORD_RE.search(record_text)
+    if not match:
+        return 0, 0, 0
+    return int(match.group(1)), int(match.group(2)), int(match.group(3) or 0)
+
+
+def _record_count(value) -> int:
+    """One wins/losses/draws value as an int; 0 for missing or unparseable values ("N/A", "")"""
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_record(record_data) -> Dict[str, int]:
+    """Fighter record from a {'wins', 'losses', 'draws'} dict or a "W-L-D" string.
+
+    Anything unparseable gives a 0-0-0 record.
+    """
+    if isinstance(record_data, dict):
+        return {
+            'wins': _record_count(record_data.get('wins')),
+            'losses': _record_count(record_data.get('losses')),
+            'draws': _record_count(record_data.get('draws'))
+        }
+    if isinstance(record_data, str):
+        wins, losses, draws = _parse_record_text(record_data)
+        return {'wins': wins, 'losses': losses, 'draws': draws}
+    return empty_record()
+
+
+def parse_records(values: Iterable) -> List[Dict[str, int]]:
+    return [parse_record(value) for value in values]
+
+
+def _month_number(name: str) -> Optional[int]:
+    return MONTHS.get(name.lower())
+
+
+def parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    """Date text to a datetime (midnight), or None if it isn't a recognisable date.
+
+    Footnote markers and non-breaking spaces from Wikipedia are ignored. Results
+    are memoized: every fight on a card carries the same date string.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_datetime_cached(date_str)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_datetime_cached(date_str: str) -> Optional[datetime]:
+    text = WHITESPACE_RE.sub(' ', FOOTNOTE_RE.sub('', date_str)).strip()
+
+    try:
+        match = ISO_DATE_RE.search(text)
+        if match:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+        for match in MONTH_DAY_YEAR_RE.finditer(text):
+            month = _month_number(match.group(1))
+            if month:
+                return datetime(int(match.group(3)), month, int(match.group(2)))
+
+        for match in DAY_MONTH_YEAR_RE.finditer(text):
+            month = _month_number(match.group(2))
+            if month:
+                return datetime(int(match.group(3)), month, int(match.group(1)))
+
+        match = US_DATE_RE.search(text)
+        if match:
+            return datetime(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+    except ValueError:  # out-of-range day or month, e.g. "February 30, 2024"
+        return None
+
+    return None
+
+
+def parse_date(date_str: Optional[str]) -> Optional[str]:
+    """Date text to an ISO timestamp ("2024-12-15T00:00:00"), or None"""
+    parsed = parse_datetime(date_str)
+    return parsed.isoformat() if parsed else None
+
+
+def parse_dates(values: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """parse_date over many values, parsing each distinct string once"""
+    values = list(values)
+    parsed = {value: parse_date(value) for value in set(values) if isinstance(value, str)}
+    return [parsed.get(value) if isinstance(value, str) else None for value in values]
+
+
+@lru_cache(maxsize=METHOD_CACHE_SIZE)
+def _parse_method_cached(method_str: str) -> Tuple[str, Optional[int], Optional[str]]:
+    method = 'Unknown'
+    for name, pattern in METHOD_PATTERNS:
+        if pattern.search(method_str):
+            method = name
+            break
+
+    round_match = ROUND_RE.search(method_str)
+    time_match = TIME_RE.search(method_str)
+    return (
+        method,
+        int(round_match.group(1)) if round_match else None,
+        f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}" if time_match else None
+    )
+
+
+def parse_method(method_str: Optional[str]) -> Dict:
+    """Method, round and time from a result string.
+
+    Methods are bucketed as KO/TKO, Submission, Decision, DQ or No Contest
+    ('Unknown' otherwise); round and time are None when absent.
+    """
+    if not method_str or not isinstance(method_str, str):
+        return {'method': 'Unknown', 'round': None, 'time': None}
+    method, round_number, fight_time = _parse_method_cached(method_str)
+    return {'method': method, 'round': round_number, 'time': fight_time}
+
+
+def parse_methods(values: Iterable[Optional[str]]) -> List[Dict]:
+    return [parse_method(value) for value in values]
+
+
+def cache_info() -> Dict[str, Tuple]:
+    return {'date': _parse_datetime_cached.cache_info(), 'method': _parse_method_cached.cache_info(),
+            'record': _parse_record_text.cache_info()}
+
+
+def clear_caches():
+    _parse_datetime_cached.cache_clear()
+    _parse_method_cached.cache_clear()
+    _parse_record_text.cache_clear()
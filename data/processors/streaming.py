@@ -0,0 +1,178 @@
+"""
+Streaming helpers for UFCDataProcessor
+Incremental readers for raw scrape dumps, an incremental JSON writer and a
+disk-backed fighter accumulator, so processing memory stays flat as the
+fight history grows.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # only needed to stream plain .json dumps; NDJSON works without it
+    ijson = None
+
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def is_ndjson(path: str) -> bool:
+    return path.endswith(NDJSON_EXTENSIONS)
+
+
+def iter_raw_records(path: str, section: str) -> Iterator[Dict]:
+    """Yield the records of one raw-data section without loading the whole dump.
+
+    Plain JSON dumps ({"rankings": [...], ...}) are read with ijson. NDJSON dumps
+    hold one {"section": ..., "data": {...}} envelope per line, as written by
+    write_raw_ndjson.
+    """
+    if is_ndjson(path):
+        prefix = json.dumps({'section': section})[:-1] + ','
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                # Envelopes start with their section, so other sections are skipped unparsed
+                if line.startswith(prefix):
+                    yield json.loads(line)['data']
+        return
+
+    if ijson is None:
+        raise ImportError("Streaming a .json dump requires ijson (pip install ijson); "
+                          "or convert it to NDJSON with write_raw_ndjson")
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, f'{section}.item', use_float=True)
+
+
+def write_raw_ndjson(raw_sections: Dict[str, Iterable[Dict]], path: str) -> int:
+    """Write raw-data sections as NDJSON envelopes; returns the number of records"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for section, records in raw_sections.items():
+            if not isinstance(records, list):
+                continue
+            for record in records:
+                f.write(json.dumps({'section': section, 'data': record}) + '\n')
+                count += 1
+    return count
+
+
+class JSONStreamWriter:
+    """Writes a top-level JSON object one key (and one array item) at a time"""
+
+    def __init__(self, f):
+        self.f = f
+        self._first_key = True
+        self.f.write('{')
+
+    def _key(self, key: str):
+        self.f.write('\n  ' if self._first_key else ',\n  ')
+        self._first_key = False
+        self.f.write(json.dumps(key) + ': ')
+
+    def write_value(self, key: str, value: Any):
+        self._key(key)
+        self.f.write(json.dumps(value))
+
+    def write_array(self, key: str, items: Iterable[Any]) -> int:
+        """Write items as a JSON array, one per line; returns how many were written"""
+        self._key(key)
+        self.f.write('[')
+        count = 0
+        for item in items:
+            self.f.write('\n    ' if count == 0 else ',\n    ')
+            self.f.write(json.dumps(item))
+            count += 1
+        self.f.write('\n  ]' if count else ']')
+        return count
+
+    def close(self):
+        self.f.write('\n}\n')
+
+
+class SpilledFighterStore:
+    """Accumulates per-fighter rankings/fights/results in a temporary SQLite file.
+
+    Mirrors the in-memory fighters database: the first sighting of a name fixes
+    its id and record, later sightings append entries. Only a name -> row id map
+    is held in memory.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, directory: Optional[str] = None):
+        fd, self.path = tempfile.mkstemp(prefix='fighters_', suffix='.sqlite', dir=directory)
+        os.close(fd)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=OFF')
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.execute('CREATE TABLE fighters (seq INTEGER PRIMARY KEY, name TEXT, id TEXT, record TEXT)')
+        self.conn.execute('CREATE TABLE entries (fighter_seq INTEGER, kind TEXT, payload TEXT)')
+        self._seq_by_name: Dict[str, int] = {}
+        self._pending_entries = []
+
+    def add(self, name: str, fighter_id: str, record: Dict, kind: str, entry: Dict):
+        seq = self._seq_by_name.get(name)
+        if seq is None:
+            seq = self._seq_by_name[name] = len(self._seq_by_name) + 1
+            self.conn.execute('INSERT INTO fighters VALUES (?, ?, ?, ?)', (seq, name, fighter_id, json.dumps(record)))
+        self._pending_entries.append((seq, kind, json.dumps(entry)))
+        if len(self._pending_entries) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self._pending_entries:
+            self.conn.executemany('INSERT INTO entries VALUES (?, ?, ?)', self._pending_entries)
+            self._pending_entries = []
+
+    def __len__(self) -> int:
+        return len(self._seq_by_name)
+
+    def iter_fighters(self) -> Iterator[Dict]:
+        """Yield assembled fighters in first-seen order, one at a time"""
+        self._flush()
+        self.conn.execute('CREATE INDEX entries_by_fighter ON entries (fighter_seq)')
+        rows = self.conn.execute(
+            'SELECT f.seq, f.name, f.id, f.record, e.kind, e.payload '
+            'FROM fighters f LEFT JOIN entries e ON e.fighter_seq = f.seq '
+            'ORDER BY f.seq, e.rowid'
+        )
+        fighter, current_seq = None, None
+        for seq, name, fighter_id, record, kind, payload in rows:
+            if seq != current_seq:
+                if fighter is not None:
+                    yield fighter
+                record = json.loads(record)
+                fighter = {
+                    'id': fighter_id,
+                    'name': name,
+                    'record': record,
+                    'wins': record['wins'],
+                    'losses': record['losses'],
+                    'draws': record['draws'],
+                    'rankings': [],
+                    'fights': [],
+                    'results': []
+                }
+                current_seq = seq
+            if kind:
+                fighter[kind].append(json.loads(payload))
+        if fighter is not None:
+            yield fighter
+
+    def close(self):
+        self.conn.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def tap(items: Iterable[Dict], callback) -> Iterator[Dict]:
+    """Pass items through unchanged, calling callback on each one"""
+    for item in items:
+        callback(item)
+        yield item
+
+
+FighterEntry = Tuple[str, str, Dict, str, Dict]
@@ -1,15 +1,32 @@
 import json
+import os
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple
 import logging
-import re
+
+try:
+    from .streaming import iter_raw_records, JSONStreamWriter, SpilledFighterStore, tap, FighterEntry
+    from .indexes import ProcessedDataIndex, index_path_for
+    from .parsing import parse_record, parse_date, parse_method
+    from . import columnar
+    from . import ids
+    from .manifest import ContentManifest, Delta, commit_manifest, pending_manifest_path, iter_section_entities
+except ImportError:  # run as a script from data/processors
+    from streaming import iter_raw_records, JSONStreamWriter, SpilledFighterStore, tap, FighterEntry
+    from indexes import ProcessedDataIndex, index_path_for
+    from parsing import parse_record, parse_date, parse_method
+    import columnar
+    import ids
+    from manifest import ContentManifest, Delta, commit_manifest, pending_manifest_path, iter_section_entities
 
 logger = logging.getLogger(__name__)
 
 class UFCDataProcessor:
     def __init__(self):
         self.processed_data = {}
+        self._index: Optional[ProcessedDataIndex] = None
         
     def process_raw_data(self, raw_data: Dict) -> Dict:
         """Process raw scraped data into structured format for FightHub"""
@@ -50,6 +67,7 @@ class UFCDataProcessor:
             }
             
             self.processed_data = processed_data
+            self._index = ProcessedDataIndex.build(processed_data)
             logger.info("UFC data processing completed!")
             return processed_data
             
@@ -57,10 +75,96 @@ class UFCDataProcessor:
             logger.error(f"Error processing UFC data: {e}")
             return {}
     
+    def process_raw_file_streaming(self, input_path: str, output_path: str,
+                                   columnar_dir: Optional[str] = None) -> Dict:
+        """Process a raw dump file section by section without holding it in memory
+        
+        Raw records are read incrementally (ijson for .json dumps, line by line for
+        .ndjson/.jsonl), processed as generators and written to output_path as they
+        are produced; per-fighter entries are spilled to a temporary SQLite file.
+        The output has the same layout as save_processed_data, and its lookup index
+        is built on the fly and saved alongside. With columnar_dir, the Parquet/Arrow
+        tables are written in the same pass. Returns the metadata;
+        self.processed_data is left untouched.
+        """
+        logger.info(f"Streaming raw UFC data from {input_path}...")
+        
+        sections = [
+            ('rankings', 'total_rankings', self._iter_rankings, self._ranking_fighter_entries),
+            ('upcoming_events', 'total_upcoming_events', self._iter_events, None),
+            ('past_events', 'total_past_events', self._iter_events, None),
+            ('upcoming_fights', 'total_upcoming_fights', self._iter_fights, self._fight_fighter_entries),
+            ('past_results', 'total_past_results', self._iter_fight_results, self._result_fighter_entries),
+        ]
+        metadata = {}
+        index = ProcessedDataIndex()
+        index_adders = {'upcoming_fights': index.add_upcoming_fight, 'past_results': index.add_result}
+        tables = columnar.ColumnarWriter(columnar_dir) if columnar_dir else None
+        fighters = SpilledFighterStore(directory=os.path.dirname(os.path.abspath(output_path)))
+        tmp_path = f"{output_path}.tmp"
+        
+        try:
+            with open(tmp_path, 'w') as f:
+                writer = JSONStreamWriter(f)
+                for section, count_key, process, fighter_entries in sections:
+                    items = process(iter_raw_records(input_path, section))
+                    if fighter_entries:
+                        items = tap(items, self._fighter_spiller(fighters, fighter_entries))
+                    if section in index_adders:
+                        items = tap(items, index_adders[section])
+                    if tables:
+                        items = tap(items, self._columnar_adder(tables, section))
+                    metadata[count_key] = writer.write_array(section, items)
+                
+                fighter_items = tap(fighters.iter_fighters(), index.add_fighter)
+                if tables:
+                    fighter_items = tap(fighter_items, self._columnar_adder(tables, 'fighters'))
+                metadata['total_fighters'] = writer.write_array('fighters', fighter_items)
+                index.processed_at = datetime.now().isoformat()
+                writer.write_value('processed_at', index.processed_at)
+                writer.write_value('metadata', metadata)
+                writer.close()
+            os.replace(tmp_path, output_path)
+            index.save(index_path_for(output_path))
+            if tables:
+                tables.close()
+                tables = None
+        finally:
+            if tables:
+                tables.abort()
+            fighters.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        logger.info(f"UFC data streamed to {output_path}: {metadata}")
+        return metadata
+    
+    @staticmethod
+    def _fighter_spiller(fighters: SpilledFighterStore, fighter_entries):
+        def spill(item: Dict):
+            for entry in fighter_entries(item):
+                fighters.add(*entry)
+        return spill
+    
+    @staticmethod
+    def _columnar_adder(tables: 'columnar.ColumnarWriter', section: str):
+        """Callback adding one processed record of a section to its columnar table"""
+        to_row = {
+            'rankings': ('rankings', columnar.ranking_row),
+            'upcoming_events': ('events', lambda event: columnar.event_row(event, 'upcoming')),
+            'past_events': ('events', lambda event: columnar.event_row(event, 'past')),
+            'upcoming_fights': ('fights', columnar.upcoming_fight_row),
+            'past_results': ('fights', columnar.result_row),
+            'fighters': ('fighters', columnar.fighter_row),
+        }
+        table, row = to_row[section]
+        return lambda item: tables.add(table, row(item))
+    
     def _process_rankings(self, raw_rankings: List[Dict]) -> List[Dict]:
         """Process and clean rankings data"""
-        processed_rankings = []
-        
+        return list(self._iter_rankings(raw_rankings))
+    
+    def _iter_rankings(self, raw_rankings: Iterable[Dict]) -> Iterator[Dict]:
         for ranking in raw_rankings:
             try:
                 # Clean fighter name
@@ -68,13 +172,15 @@ class UFCDataProcessor:
                 if not fighter_name:
                     continue
                 
+                division = ranking.get('division', '').replace('-', ' ').title()
+                
                 # Parse record
                 record = self._parse_record(ranking.get('record', ''))
                 
                 # Create processed ranking
                 processed_ranking = {
-                    'id': self._generate_id(fighter_name),
-                    'division': ranking.get('division', '').replace('-', ' ').title(),
+                    'id': ids.ranking_id(division, fighter_name),
+                    'division': division,
                     'rank': ranking.get('rank', 0),
                     'fighter_name': fighter_name,
                     'record': record,
@@ -85,18 +191,17 @@ class UFCDataProcessor:
                     'scraped_at': ranking.get('scraped_at')
                 }
                 
-                processed_rankings.append(processed_ranking)
+                yield processed_ranking
                 
             except Exception as e:
                 logger.error(f"Error processing ranking: {e}")
                 continue
-        
-        return processed_rankings
     
     def _process_events(self, raw_events: List[Dict]) -> List[Dict]:
         """Process and clean events data"""
-        processed_events = []
-        
+        return list(self._iter_events(raw_events))
+    
+    def _iter_events(self, raw_events: Iterable[Dict]) -> Iterator[Dict]:
         for event in raw_events:
             try:
                 # Clean event title
@@ -110,7 +215,7 @@ class UFCDataProcessor:
                 
                 # Create processed event
                 processed_event = {
-                    'id': self._generate_id(title),
+                    'id': ids.event_id(event.get('event_url'), title, parsed_date),
                     'title': title,
                     'date': parsed_date,
                     'date_str': date_str,
@@ -120,18 +225,18 @@ class UFCDataProcessor:
                     'scraped_at': event.get('scraped_at')
                 }
                 
-                processed_events.append(processed_event)
+                yield processed_event
                 
             except Exception as e:
                 logger.error(f"Error processing event: {e}")
                 continue
-        
-        return processed_events
     
     def _process_fights(self, raw_fights: List[Dict]) -> List[Dict]:
         """Process and clean fights data"""
-        processed_fights = []
-        
+        return list(self._iter_fights(raw_fights))
+    
+    def _iter_fights(self, raw_fights: Iterable[Dict]) -> Iterator[Dict]:
+        seen = {}
         for fight in raw_fights:
             try:
                 # Extract fighter names
@@ -147,7 +252,8 @@ class UFCDataProcessor:
                 
                 # Create processed fight
                 processed_fight = {
-                    'id': self._generate_id(f"{fighter1_name} vs {fighter2_name}"),
+                    'id': self._fight_id(fight, fighter1_name, fighter2_name, seen),
+                    'event_id': self._event_id(fight),
                     'fighter1': {
                         'name': fighter1_name,
                         'record': record1,
@@ -167,18 +273,18 @@ class UFCDataProcessor:
                     'scraped_at': fight.get('scraped_at')
                 }
                 
-                processed_fights.append(processed_fight)
+                yield processed_fight
                 
             except Exception as e:
                 logger.error(f"Error processing fight: {e}")
                 continue
-        
-        return processed_fights
     
     def _process_fight_results(self, raw_results: List[Dict]) -> List[Dict]:
         """Process and clean fight results data"""
-        processed_results = []
-        
+        return list(self._iter_fight_results(raw_results))
+    
+    def _iter_fight_results(self, raw_results: Iterable[Dict]) -> Iterator[Dict]:
+        seen = {}
         for result in raw_results:
             try:
                 # Extract fighter names
@@ -201,7 +307,8 @@ class UFCDataProcessor:
                 
                 # Create processed result
                 processed_result = {
-                    'id': self._generate_id(f"{fighter1_name} vs {fighter2_name}"),
+                    'id': self._fight_id(result, fighter1_name, fighter2_name, seen),
+                    'event_id': self._event_id(result),
                     'fighter1': fighter1_name,
                     'fighter2': fighter2_name,
                     'winner': winner,
@@ -213,254 +320,259 @@ class UFCDataProcessor:
                     'scraped_at': result.get('scraped_at')
                 }
                 
-                processed_results.append(processed_result)
+                yield processed_result
                 
             except Exception as e:
                 logger.error(f"Error processing fight result: {e}")
                 continue
-        
-        return processed_results
     
     def _create_fighters_database(self, rankings: List[Dict], fights: List[Dict], results: List[Dict]) -> List[Dict]:
         """Create comprehensive fighters database"""
         fighters = {}
         
-        # Add fighters from rankings
-        for ranking in rankings:
-            fighter_name = ranking['fighter_name']
+        entries = chain(
+            chain.from_iterable(map(self._ranking_fighter_entries, rankings)),
+            chain.from_iterable(map(self._fight_fighter_entries, fights)),
+            chain.from_iterable(map(self._result_fighter_entries, results))
+        )
+        for fighter_name, fighter_id, record, kind, entry in entries:
             if fighter_name not in fighters:
                 fighters[fighter_name] = {
-                    'id': ranking['id'],
+                    'id': fighter_id,
                     'name': fighter_name,
-                    'record': ranking['record'],
-                    'wins': ranking['wins'],
-                    'losses': ranking['losses'],
-                    'draws': ranking['draws'],
+                    'record': record,
+                    'wins': record['wins'],
+                    'losses': record['losses'],
+                    'draws': record['draws'],
                     'rankings': [],
                     'fights': [],
                     'results': []
                 }
-            
-            # Add ranking info
-            fighters[fighter_name]['rankings'].append({
-                'division': ranking['division'],
-                'rank': ranking['rank'],
-                'scraped_at': ranking['scraped_at']
-            })
-        
-        # Add fighters from fights
-        for fight in fights:
-            for fighter_key in ['fighter1', 'fighter2']:
-                fighter_name = fight[fighter_key]['name']
-                if fighter_name not in fighters:
-                    fighters[fighter_name] = {
-                        'id': self._generate_id(fighter_name),
-                        'name': fighter_name,
-                        'record': fight[fighter_key]['record'],
-                        'wins': fight[fighter_key]['wins'],
-                        'losses': fight[fighter_key]['losses'],
-                        'draws': fight[fighter_key]['draws'],
-                        'rankings': [],
-                        'fights': [],
-                        'results': []
-                    }
-                
-                # Add fight info
-                fighters[fighter_name]['fights'].append({
-                    'fight_id': fight['id'],
-                    'opponent': fight['fighter2']['name'] if fighter_key == 'fighter1' else fight['fighter1']['name'],
-                    'weight_class': fight['weight_class'],
-                    'fight_type': fight['fight_type'],
-                    'scraped_at': fight['scraped_at']
-                })
-        
-        # Add fighters from results
-        for result in results:
-            for fighter_name in [result['fighter1'], result['fighter2']]:
-                if fighter_name not in fighters:
-                    fighters[fighter_name] = {
-                        'id': self._generate_id(fighter_name),
-                        'name': fighter_name,
-                        'record': {'wins': 0, 'losses': 0, 'draws': 0},
-                        'wins': 0,
-                        'losses': 0,
-                        'draws': 0,
-                        'rankings': [],
-                        'fights': [],
-                        'results': []
-                    }
-                
-                # Add result info
-                is_winner = result['winner_name'] == fighter_name
-                fighters[fighter_name]['results'].append({
-                    'result_id': result['id'],
-                    'opponent': result['fighter2'] if result['fighter1'] == fighter_name else result['fighter1'],
-                    'result': 'W' if is_winner else 'L',
-                    'method': result['method'],
-                    'round': result['round'],
-                    'weight_class': result['weight_class'],
-                    'scraped_at': result['scraped_at']
-                })
+            fighters[fighter_name][kind].append(entry)
         
         return list(fighters.values())
     
+    def _ranking_fighter_entries(self, ranking: Dict) -> Iterator[FighterEntry]:
+        """(name, id, record, kind, entry) tuples a ranking contributes to the fighters database"""
+        yield ranking['fighter_name'], ids.fighter_id(ranking['fighter_name']), ranking['record'], 'rankings', {
+            'division': ranking['division'],
+            'rank': ranking['rank'],
+            'scraped_at': ranking['scraped_at']
+        }
+    
+    def _fight_fighter_entries(self, fight: Dict) -> Iterator[FighterEntry]:
+        for fighter_key in ['fighter1', 'fighter2']:
+            fighter_name = fight[fighter_key]['name']
+            yield fighter_name, ids.fighter_id(fighter_name), fight[fighter_key]['record'], 'fights', {
+                'fight_id': fight['id'],
+                'opponent': fight['fighter2']['name'] if fighter_key == 'fighter1' else fight['fighter1']['name'],
+                'weight_class': fight['weight_class'],
+                'fight_type': fight['fight_type'],
+                'scraped_at': fight['scraped_at']
+            }
+    
+    def _result_fighter_entries(self, result: Dict) -> Iterator[FighterEntry]:
+        for fighter_name in [result['fighter1'], result['fighter2']]:
+            is_winner = result['winner_name'] == fighter_name
+            yield fighter_name, ids.fighter_id(fighter_name), {'wins': 0, 'losses': 0, 'draws': 0}, 'results', {
+                'result_id': result['id'],
+                'opponent': result['fighter2'] if result['fighter1'] == fighter_name else result['fighter1'],
+                'result': 'W' if is_winner else 'L',
+                'method': result['method'],
+                'round': result['round'],
+                'weight_class': result['weight_class'],
+                'scraped_at': result['scraped_at']
+            }
+    
     def _parse_record(self, record_data):
         """Parse fighter record from various formats"""
-        try:
-            if isinstance(record_data, dict):
-                # New format: {'wins': 0, 'losses': 0, 'draws': 0}
-                return {
-                    'wins': record_data.get('wins', 0),
-                    'losses': record_data.get('losses', 0),
-                    'draws': record_data.get('draws', 0)
-                }
-            elif isinstance(record_data, str):
-                # Old format: "27-1-0"
-                parts = record_data.split('-')
-                return {
-                    'wins': int(parts[0]) if len(parts) > 0 else 0,
-                    'losses': int(parts[1]) if len(parts) > 1 else 0,
-                    'draws': int(parts[2]) if len(parts) > 2 else 0
-                }
-            else:
-                return {'wins': 0, 'losses': 0, 'draws': 0}
-        except Exception as e:
-            logger.error(f"Error parsing record '{record_data}': {e}")
-            return {'wins': 0, 'losses': 0, 'draws': 0}
+        return parse_record(record_data)
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string to ISO format"""
-        try:
-            if not date_str:
-                return None
-            
-            # Try different date formats
-            date_formats = [
-                '%B %d, %Y',  # December 15, 2024
-                '%b %d, %Y',  # Dec 15, 2024
-                '%Y-%m-%d',   # 2024-12-15
-                '%m/%d/%Y',   # 12/15/2024
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.isoformat()
-                except ValueError:
-                    continue
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error parsing date '{date_str}': {e}")
-            return None
+        return parse_date(date_str)
     
     def _parse_method(self, method_str: str) -> Dict:
         """Parse fight method and round information"""
-        try:
-            method_info = {
-                'method': 'Unknown',
-                'round': None,
-                'time': None
-            }
-            
-            if not method_str:
-                return method_info
-            
-            # Common methods
-            methods = ['KO/TKO', 'Submission', 'Decision', 'DQ', 'No Contest']
-            for method in methods:
-                if method.lower() in method_str.lower():
-                    method_info['method'] = method
-                    break
-            
-            # Extract round number
-            round_match = re.search(r'Round (\d+)', method_str, re.IGNORECASE)
-            if round_match:
-                method_info['round'] = int(round_match.group(1))
-            
-            # Extract time
-            time_match = re.search(r'(\d+):(\d+)', method_str)
-            if time_match:
-                minutes = int(time_match.group(1))
-                seconds = int(time_match.group(2))
-                method_info['time'] = f"{minutes:02d}:{seconds:02d}"
-            
-            return method_info
-            
-        except Exception as e:
-            logger.error(f"Error parsing method '{method_str}': {e}")
-            return {'method': 'Unknown', 'round': None, 'time': None}
+        return parse_method(method_str)
+    
+    def _fight_id(self, fight: Dict, fighter1_name: str, fighter2_name: str, seen: Dict[str, int]) -> str:
+        """Stable bout ID from the event and both fighters
+        
+        seen counts the pairings met so far in this pass; fights arrive in card
+        (bout_order) order, so a rematch on the same card is numbered after the
+        first bout and every other bout keeps its ID when the card changes.
+        """
+        event = self._event_key(fight)
+        key = f"{event}|{ids.pairing_key(fighter1_name, fighter2_name)}"
+        seen[key] = seen.get(key, 0) + 1
+        return ids.fight_id(fighter1_name, fighter2_name, event, seen[key])
     
-    def _generate_id(self, text: str) -> str:
-        """Generate a unique ID from text"""
-        import hashlib
-        return hashlib.md5(text.encode()).hexdigest()[:8]
+    def _event_fields(self, fight: Dict) -> Tuple[Optional[str], str, Optional[str]]:
+        """(event_url, title, parsed date) of the fight's event, as _iter_events reads them"""
+        return (fight.get('event_url'), (fight.get('event') or '').strip(),
+                self._parse_date(fight.get('event_date', '')))
+    
+    def _event_key(self, fight: Dict) -> str:
+        return ids.event_key(*self._event_fields(fight))
+    
+    def _event_id(self, fight: Dict) -> Optional[str]:
+        """ID of the fight's event, matching the one _iter_events gives it; None without event details"""
+        event_url, title, date = self._event_fields(fight)
+        if not event_url and not title:
+            return None
+        return ids.event_id(event_url, title, date)
     
     def save_processed_data(self, filepath: str):
-        """Save processed data to JSON file"""
+        """Save processed data to JSON file, with its lookup index alongside"""
         try:
             with open(filepath, 'w') as f:
                 json.dump(self.processed_data, f, indent=2)
+            self.index.save(index_path_for(filepath))
             logger.info(f"Processed data saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving processed data: {e}")
     
+    def save_columnar(self, directory: str, formats=columnar.FORMATS) -> List[str]:
+        """Write fighters, fights, events and rankings as Parquet/Arrow tables
+        
+        Consumers can memory-map these and load only the columns they need with
+        columnar.read_table. Requires pyarrow.
+        """
+        paths = columnar.write_tables(self.processed_data, directory, formats)
+        logger.info(f"Columnar tables saved to {directory}")
+        return paths
+    
+    def compute_delta(self, manifest_path: str, processed_path: Optional[str] = None) -> Delta:
+        """Diff processed_data against the manifest saved by the previous run
+        
+        Returns the added/changed/removed fighters, events and fights for the sync
+        stages. The new manifest is saved as pending and only replaces the previous
+        one in commit_manifest, once those stages have succeeded, so changes from a
+        failed sync are picked up again by the next run.
+        
+        With processed_path (a file written by process_raw_file_streaming), the
+        records are streamed from that file twice, once for the hashes and once
+        for the changed records, instead of loading it.
+        """
+        previous = ContentManifest.load(manifest_path) or ContentManifest()
+        if processed_path:
+            def entities():
+                return iter_section_entities(lambda section: iter_raw_records(processed_path, section))
+            current = ContentManifest.from_entities(entities(), datetime.now().isoformat())
+            delta = current.diff_entities(previous, entities())
+        else:
+            current = ContentManifest.build(self.processed_data)
+            delta = current.diff(previous, self.processed_data)
+        # Absolute, so delta_sync can commit it from any working directory
+        delta.manifest_path = os.path.abspath(manifest_path)
+        current.save(pending_manifest_path(manifest_path))
+        logger.info(f"Changes since the previous run: {delta.summary()}")
+        return delta
+    
+    def commit_manifest(self, delta: Delta):
+        """Mark a delta as synced, making its manifest the baseline for the next run"""
+        commit_manifest(delta.manifest_path)
+    
+    def load_processed_data(self, filepath: str) -> Dict:
+        """Load processed data and its saved index (rebuilt if missing or stale)"""
+        with open(filepath, 'r') as f:
+            self.processed_data = json.load(f)
+        
+        index = ProcessedDataIndex.load(index_path_for(filepath))
+        if index is None or not index.matches(self.processed_data):
+            logger.info(f"Rebuilding lookup index for {filepath}")
+            index = ProcessedDataIndex.build(self.processed_data)
+        self._index = index
+        return self.processed_data
+    
+    @property
+    def index(self) -> ProcessedDataIndex:
+        """Lookup index for processed_data, built on first use if needed"""
+        if self._index is None or not self._index.matches(self.processed_data):
+            self._index = ProcessedDataIndex.build(self.processed_data)
+        return self._index
+    
     def get_fighters_by_division(self, division: str) -> List[Dict]:
         """Get all fighters in a specific division"""
         if not self.processed_data:
             return []
         
-        return [
-            fighter for fighter in self.processed_data.get('fighters', [])
-            if any(ranking['division'].lower() == division.lower() 
-                   for ranking in fighter.get('rankings', []))
-        ]
+        fighters = self.processed_data.get('fighters', [])
+        return [fighters[i] for i in self.index.by_division.get(division.lower(), [])]
     
     def get_upcoming_fights_for_fighter(self, fighter_name: str) -> List[Dict]:
         """Get upcoming fights for a specific fighter"""
         if not self.processed_data:
             return []
         
-        return [
-            fight for fight in self.processed_data.get('upcoming_fights', [])
-            if (fight['fighter1']['name'] == fighter_name or 
-                fight['fighter2']['name'] == fighter_name)
-        ]
+        fights = self.processed_data.get('upcoming_fights', [])
+        return [fights[i] for i in self.index.upcoming_fights_by_fighter.get(fighter_name, [])]
+    
+    def get_results_for_fighter(self, fighter_name: str) -> List[Dict]:
+        """Get past results for a specific fighter"""
+        if not self.processed_data:
+            return []
+        
+        results = self.processed_data.get('past_results', [])
+        return [results[i] for i in self.index.results_by_fighter.get(fighter_name, [])]
     
     def get_fighter_stats(self, fighter_name: str) -> Optional[Dict]:
-        """Get comprehensive stats for a fighter"""
+        """Get comprehensive stats for a fighter (exact name, then normalized name)"""
         if not self.processed_data:
             return None
         
-        for fighter in self.processed_data.get('fighters', []):
-            if fighter['name'] == fighter_name:
-                return fighter
-        
-        return None
+        position = self.index.fighter_position(fighter_name)
+        return self.processed_data['fighters'][position] if position is not None else None
 
 def main():
     """Test the data processor"""
+    import argparse
+    parser = argparse.ArgumentParser(description='Process raw UFC data')
+    parser.add_argument('input', nargs='?', default='ufc_data.json', help='Raw dump (.json, or .ndjson/.jsonl)')
+    parser.add_argument('output', nargs='?', default='processed_ufc_data.json')
+    parser.add_argument('--stream', action='store_true', help='Process incrementally with flat memory use')
+    parser.add_argument('--columnar', metavar='DIR', help='Also write Parquet/Arrow tables to DIR (needs pyarrow)')
+    parser.add_argument('--manifest', metavar='PATH',
+                        help='Diff against the manifest at PATH and write the changes to <output>.delta.json '
+                             'for services/delta_sync.py')
+    args = parser.parse_args()
+    
     processor = UFCDataProcessor()
     
-    # Load sample data (you would load your scraped data here)
-    try:
-        with open('ufc_data.json', 'r') as f:
-            raw_data = json.load(f)
-    except FileNotFoundError:
-        print("No ufc_data.json found. Run the scraper first.")
+    if not os.path.exists(args.input):
+        print(f"No {args.input} found. Run the scraper first.")
         return
     
-    # Process the data
-    processed_data = processor.process_raw_data(raw_data)
-    
-    # Save processed data
-    processor.save_processed_data('processed_ufc_data.json')
+    if args.stream:
+        metadata = processor.process_raw_file_streaming(args.input, args.output, columnar_dir=args.columnar)
+        print(f"Processed {metadata.get('total_fighters', 0)} fighters")
+        print(f"Processed {metadata.get('total_upcoming_fights', 0)} upcoming fights")
+        print(f"Processed {metadata.get('total_rankings', 0)} rankings")
+    else:
+        # Load sample data (you would load your scraped data here)
+        with open(args.input, 'r') as f:
+            raw_data = json.load(f)
+        
+        # Process the data
+        processed_data = processor.process_raw_data(raw_data)
+        
+        # Save processed data
+        processor.save_processed_data(args.output)
+        if args.columnar:
+            processor.save_columnar(args.columnar)
+        
+        # Print some stats
+        print(f"Processed {len(processed_data.get('fighters', []))} fighters")
+        print(f"Processed {len(processed_data.get('upcoming_fights', []))} upcoming fights")
+        print(f"Processed {len(processed_data.get('rankings', []))} rankings")
     
-    # Print some stats
-    print(f"Processed {len(processed_data.get('fighters', []))} fighters")
-    print(f"Processed {len(processed_data.get('upcoming_fights', []))} upcoming fights")
-    print(f"Processed {len(processed_data.get('rankings', []))} rankings")
+    if args.manifest:
+        # services/delta_sync.py commits the manifest after applying the delta
+        delta = processor.compute_delta(args.manifest, processed_path=args.output if args.stream else None)
+        delta_path = f"{os.path.splitext(args.output)[0]}.delta.json"
+        delta.save(delta_path)
+        print(f"Changes written to {delta_path}: {delta.summary()}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
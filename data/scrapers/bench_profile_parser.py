@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Validate and benchmark the static fighter profile parser
+
+Parses the saved debug__fighter_*.html / debug_ufc_fighter_page.html pages,
+checks the extracted fields against values read off those pages, and reports
+profiles/sec for the lxml fast path next to a BeautifulSoup parse of the
+same pages.
+
+Usage: python data/scrapers/bench_profile_parser.py [--repeat 20] [fixture.html ...]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(__file__))
+
+from ufc_profile_parser import parse_fighter_profile, is_complete_profile
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+
+# Values read off the saved pages; None means the page is not a profile and must fall back
+EXPECTED = {
+    'debug__fighter_islam-makhachev.html': {
+        'fighter_url': '/athlete/islam-makhachev',
+        'name': 'Islam Makhachev',
+        'division': 'Lightweight',
+        'record': {'wins': 27, 'losses': 1, 'draws': 0},
+        'stats': {'fight_win_streak': 15, 'wins_by_submission': 13, 'sig_strikes_attempted': 773,
+                  'striking_accuracy': 59.0, 'takedown_defense': 91.0, 'average_fight_time': '10:12'},
+        'personal_info': {'age': 33, 'reach': 70.5, 'place_of_birth': 'Dagestan Republic, Russia',
+                          'fighting_style': 'Sambo'},
+        'first_fight': {'opponent': 'Moicano', 'result': 'Win', 'method': 'Submission', 'round': 1,
+                        'time': '4:05', 'event': 'ufc-311'},
+    },
+    'debug_ufc_fighter_page.html': {
+        'fighter_url': '/athlete/alexandre-pantoja',
+        'name': 'Alexandre Pantoja',
+        'division': 'Flyweight',
+        'record': {'wins': 30, 'losses': 5, 'draws': 0},
+        'stats': {'wins_by_knockout': 8, 'sig_strikes_landed': 935, 'takedown_accuracy': 48.0,
+                  'sig_strikes_landed_per_min': 4.36},
+        'personal_info': {'age': 35, 'height': 65.0, 'training_at': 'American Top Team'},
+        'first_fight': {'opponent': 'France', 'date': 'Jun. 28, 2025', 'event': 'ufc-317'},
+    },
+    # Saved while the athlete URL redirected to the athletes listing page
+    'debug__fighter_alexander-volkanovski.html': None,
+}
+
+
+def fighter_url_for(path: str) -> str:
+    filename = os.path.basename(path)
+    expected = EXPECTED.get(filename)
+    if expected:
+        return expected['fighter_url']
+    return '/athlete/' + filename.replace('debug__fighter_', '').replace('.html', '')
+
+
+def validate(path: str, profile) -> list:
+    """Return a list of mismatches against the expected values for a fixture"""
+    filename = os.path.basename(path)
+    if filename not in EXPECTED:
+        return []
+    expected = EXPECTED[filename]
+    if expected is None:
+        return [] if not is_complete_profile(profile) else ['expected fallback, got a profile']
+    if not is_complete_profile(profile):
+        return ['no profile parsed']
+
+    errors = []
+    for field in ('name', 'division', 'record'):
+        if profile[field] != expected[field]:
+            errors.append(f"{field}: {profile[field]!r} != {expected[field]!r}")
+    for section in ('stats', 'personal_info'):
+        for key, value in expected[section].items():
+            if profile[section].get(key) != value:
+                errors.append(f"{section}.{key}: {profile[section].get(key)!r} != {value!r}")
+    first_fight = profile['fight_history'][0] if profile['fight_history'] else {}
+    for key, value in expected['first_fight'].items():
+        if first_fight.get(key) != value:
+            errors.append(f"fight_history[0].{key}: {first_fight.get(key)!r} != {value!r}")
+    return errors
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate and benchmark the static fighter profile parser')
+    parser.add_argument('fixtures', nargs='*', help='Saved athlete pages (defaults to the debug pages in the repo root)')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.fixtures or sorted(
+        glob.glob(os.path.join(REPO_ROOT, 'debug__fighter_*.html')) +
+        glob.glob(os.path.join(REPO_ROOT, 'debug_ufc_fighter_page.html'))
+    )
+    if not paths:
+        print("❌ No fixture pages found")
+        sys.exit(1)
+
+    pages = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            pages.append((path, f.read(), fighter_url_for(path)))
+
+    print(f"🔍 Validating {len(pages)} saved pages")
+    failures = 0
+    profiles = 0
+    for path, body, fighter_url in pages:
+        profile = parse_fighter_profile(body, fighter_url)
+        errors = validate(path, profile)
+        label = os.path.basename(path)
+        if is_complete_profile(profile):
+            profiles += 1
+            print(f"   ✅ {label}: {profile['name']} {profile['record']} - "
+                  f"{len(profile['fight_history'])} fights")
+        else:
+            print(f"   ↩️  {label}: no static profile, Selenium fallback")
+        for error in errors:
+            print(f"      ❌ {error}")
+        failures += len(errors)
+
+    static_time = best_time(lambda: [parse_fighter_profile(body, url) for _, body, url in pages], args.repeat)
+    soup_time = best_time(lambda: [BeautifulSoup(body, 'html.parser') for _, body, _ in pages], args.repeat)
+
+    print(f"\n📊 Parse throughput ({len(pages)} pages, best of {args.repeat})")
+    print(f"   lxml static profile:        {static_time / len(pages) * 1000:7.2f} ms/page  "
+          f"({len(pages) / static_time:,.1f} profiles/s)")
+    print(f"   BeautifulSoup (parse only): {soup_time / len(pages) * 1000:7.2f} ms/page  "
+          f"({len(pages) / soup_time:,.1f} pages/s)")
+    print(f"   Profiles parsed statically: {profiles}/{len(pages)}")
+
+    if failures:
+        print(f"\n❌ {failures} field mismatches")
+        sys.exit(1)
+    print("\n✅ All fixtures match")
+
+
+if __name__ == "__main__":
+    main()
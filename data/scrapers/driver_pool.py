@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Selenium WebDriver pool
+A bounded pool of pre-warmed headless Chrome drivers for pages that only
+render with JavaScript. Drivers are recycled after a number of pages, and
+images, fonts and stylesheets are blocked so each page load stays cheap.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Subresources the scrapers never read; blocked through the DevTools protocol
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css', '*.mp4', '*.webm',
+]
+
+
+@lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    """Resolve (and download if needed) the chromedriver binary once per process"""
+    return ChromeDriverManager().install()
+
+
+def build_chrome_options(user_agent: str = DEFAULT_USER_AGENT) -> Options:
+    chrome_options = Options()
+    # Return control at DOMContentLoaded instead of waiting for every subresource
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    return chrome_options
+
+
+def create_chrome_driver(user_agent: str = DEFAULT_USER_AGENT, page_load_timeout: int = 30) -> webdriver.Chrome:
+    """Headless Chrome with images, fonts and CSS blocked"""
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=build_chrome_options(user_agent))
+    driver.set_page_load_timeout(page_load_timeout)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        logger.warning(f"Could not enable request blocking: {e}")
+    return driver
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class WebDriverPool:
+    """Bounded pool of headless drivers handed out one caller at a time.
+
+    ``start`` pre-warms every driver in parallel. A driver is quit and replaced
+    after ``max_pages_per_driver`` pages, or as soon as a page fails with a
+    WebDriverException (crashed tabs leak memory and rarely recover).
+    """
+
+    def __init__(self, size: int = 2, max_pages_per_driver: int = 50,
+                 driver_factory: Optional[Callable[[], webdriver.Chrome]] = None):
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.driver_factory = driver_factory or create_chrome_driver
+        self._idle: List[_PooledDriver] = []
+        self._created = 0
+        self._all: List[_PooledDriver] = []
+        self._lock = threading.Lock()
+        # Signalled whenever a driver is returned or a slot is freed by a recycled driver
+        self._available = threading.Condition(self._lock)
+
+    def _create(self) -> _PooledDriver:
+        pooled = _PooledDriver(self.driver_factory())
+        with self._lock:
+            self._all.append(pooled)
+        return pooled
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _release_slot(self):
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+    def _put_idle(self, pooled: _PooledDriver):
+        with self._available:
+            self._idle.append(pooled)
+            self._available.notify()
+
+    def _checkout(self, timeout: Optional[float]) -> Optional[_PooledDriver]:
+        """An idle driver, or None when a free slot was reserved for a new one
+
+        Waits while every slot holds a busy driver; raises TimeoutError after timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No WebDriver free within {timeout}s")
+                self._available.wait(remaining)
+
+    def start(self):
+        """Create all drivers up front so the first pages don't pay Chrome's startup cost"""
+        slots = 0
+        while self._reserve_slot():
+            slots += 1
+        if not slots:
+            return
+
+        def warm(_):
+            try:
+                self._put_idle(self._create())
+            except Exception as e:
+                logger.error(f"Failed to start WebDriver: {e}")
+                self._release_slot()
+
+        with ThreadPoolExecutor(max_workers=slots) as executor:
+            list(executor.map(warm, range(slots)))
+        logger.info(f"WebDriver pool ready with {len(self._idle)} drivers")
+
+    def _quit(self, pooled: _PooledDriver):
+        with self._lock:
+            if pooled in self._all:
+                self._all.remove(pooled)
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing WebDriver: {e}")
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Check out a driver, blocking while all of them are busy
+
+        A recycled driver frees its slot, so a waiting caller starts the replacement.
+        """
+        pooled = self._checkout(timeout)
+        if pooled is None:
+            try:
+                pooled = self._create()
+            except Exception:
+                self._release_slot()
+                raise
+
+        healthy = True
+        try:
+            yield pooled.driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            pooled.pages += 1
+            if not healthy or pooled.pages >= self.max_pages_per_driver:
+                self._quit(pooled)
+                self._release_slot()
+            else:
+                self._put_idle(pooled)
+
+    def map(self, func: Callable[[webdriver.Chrome, T], R], items: Iterable[T]) -> List[Optional[R]]:
+        """Run func(driver, item) for every item across the pool, preserving order.
+
+        Items are handed out from the executor's work queue as drivers free up;
+        an item whose call raises is logged and yields None.
+        """
+        items = list(items)
+        if not items:
+            return []
+        self.start()
+
+        def run(item):
+            try:
+                with self.driver() as driver:
+                    return func(driver, item)
+            except Exception as e:
+                logger.error(f"WebDriver task failed for {item}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def close(self):
+        """Quit every driver; the pool can be started again afterwards"""
+        with self._lock:
+            drivers = list(self._all)
+        for pooled in drivers:
+            self._quit(pooled)
+        with self._lock:
+            self._created = 0
+            self._idle.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Polite crawling helpers
+Per-host concurrency caps with an adaptive delay, a fetch-once page cache,
+and an append-only checkpoint so interrupted crawls resume without
+re-fetching finished pages.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class _HostState:
+    def __init__(self, max_concurrency: int, delay: float):
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.lock = threading.Lock()
+        self.delay = delay
+        self.next_request_at = 0.0
+
+
+class HostThrottle:
+    """Caps concurrent requests per host and spaces request starts by an adaptive delay.
+
+    The delay shrinks slowly while a host answers normally and doubles on
+    throttling responses (429/5xx) or connection errors, honouring Retry-After.
+    """
+
+    def __init__(self, max_concurrency: int = 4, min_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_concurrency = max_concurrency
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, url: str) -> _HostState:
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_concurrency, self.min_delay)
+            return state
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's request slots, waiting out the current delay first"""
+        state = self._state(url)
+        with state.semaphore:
+            with state.lock:
+                wait = state.next_request_at - time.monotonic()
+                state.next_request_at = max(state.next_request_at, time.monotonic()) + state.delay
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def record(self, url: str, status_code: Optional[int] = None, retry_after: Optional[str] = None):
+        """Adapt the host delay to a response status (None means the request failed)"""
+        state = self._state(url)
+        with state.lock:
+            if status_code is not None and status_code not in RETRYABLE_STATUS:
+                state.delay = max(self.min_delay, state.delay * 0.9)
+                return
+
+            state.delay = min(self.max_delay, max(state.delay * 2, self.min_delay))
+            if retry_after and retry_after.isdigit():
+                state.delay = min(self.max_delay, max(state.delay, float(retry_after)))
+            state.next_request_at = max(state.next_request_at, time.monotonic() + state.delay)
+            logger.info(f"Backing off {urlparse(url).netloc}: delay now {state.delay:.1f}s")
+
+    def delay_for(self, url: str) -> float:
+        return self._state(url).delay
+
+
+class PageCache:
+    """URL-keyed page cache with a TTL, shared by every phase of a scrape.
+
+    Concurrent requests for the same URL wait on a per-URL lock, so a page is
+    downloaded at most once while its entry is fresh. Failed fetches are not cached.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, url: str) -> Optional[bytes]:
+        entry = self._entries.get(url)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], bytes]) -> bytes:
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+        with url_lock:
+            content = self._fresh(url)
+            if content is not None:
+                with self._lock:
+                    self.hits += 1
+                return content
+            content = fetch(url)
+            with self._lock:
+                self.misses += 1
+                self._entries[url] = (time.monotonic(), content)
+            return content
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._url_locks.clear()
+
+
+class CrawlCheckpoint:
+    """Append-only NDJSON checkpoint of finished crawl results keyed by URL"""
+
+    def __init__(self, path: str, max_age_hours: float = 24):
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """Results from a previous interrupted run, ignoring stale checkpoints and torn lines"""
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        age_hours = (time.time() - os.path.getmtime(self.path)) / 3600
+        if age_hours > self.max_age_hours:
+            # Removed, or the next save() would append to it and make the old results look fresh
+            logger.info(f"Discarding stale checkpoint {self.path} ({age_hours:.1f}h old)")
+            self.clear()
+            return {}
+
+        results = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partially written line from an interrupted run
+                results[entry['key']] = entry['value']
+        return results
+
+    def save(self, key: str, value: Dict):
+        if not self.path:
+            return
+        line = json.dumps({'key': key, 'value': value}) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the Selenium WebDriver pool
+
+Serves a small athlete page from a local HTTP server in place of ufc.com,
+renders it through UFCScraper's driver pool and checks that profiles are
+extracted, drivers are recycled, and images, fonts and CSS are never requested.
+
+Usage: python data/scrapers/test_driver_pool.py [--pages 6] [--pool-size 2]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(__file__))
+
+from ufc_scraper import UFCScraper
+
+TEST_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Test Fighter | UFC</title>
+  <link rel="stylesheet" href="/static/site.css">
+  <style>@font-face {{ font-family: Test; src: url('/static/font.woff2'); }}</style>
+</head>
+<body>
+  <img src="/static/headshot.png">
+  <div id="root"></div>
+  <script>
+    // Render the hero section client-side, like the pages that need Selenium
+    document.getElementById('root').innerHTML =
+      '<div class="hero-content"><h1>Test Fighter {number}</h1>' +
+      '<div class="hero-content__record">{number}-1-0</div>' +
+      '<div class="hero-content__division">Lightweight</div></div>';
+  </script>
+</body>
+</html>
+"""
+
+
+class TestPageHandler(SimpleHTTPRequestHandler):
+    requested_paths = []
+
+    def do_GET(self):
+        TestPageHandler.requested_paths.append(self.path)
+        if self.path.startswith('/athlete/test-fighter-'):
+            number = self.path.rsplit('-', 1)[-1]
+            body = TEST_PAGE.format(number=number).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Test the Selenium WebDriver pool against a local page')
+    parser.add_argument('--pages', type=int, default=6)
+    parser.add_argument('--pool-size', type=int, default=2)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(TestPageHandler, directory=os.getcwd()))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    scraper = UFCScraper(min_delay=0, driver_pool_size=args.pool_size, pages_per_driver=2)
+    scraper.base_url = f"http://127.0.0.1:{server.server_port}"
+
+    created = []
+    factory = scraper.driver_pool.driver_factory
+    scraper.driver_pool.driver_factory = lambda: created.append(1) or factory()
+
+    urls = [f"/athlete/test-fighter-{i}" for i in range(1, args.pages + 1)]
+
+    print(f"🧪 Rendering {len(urls)} local pages with a pool of {args.pool_size} drivers...")
+    try:
+        start = time.perf_counter()
+        profiles = scraper.render_fighter_profiles(urls)
+        elapsed = time.perf_counter() - start
+    finally:
+        scraper._close_driver()
+        server.shutdown()
+
+    failures = 0
+    for i, profile in enumerate(profiles, 1):
+        expected = f"Test Fighter {i}"
+        if profile.get('name') != expected or profile.get('record', {}).get('wins') != i:
+            print(f"   ❌ {urls[i - 1]}: got {profile.get('name')!r} {profile.get('record')}")
+            failures += 1
+
+    blocked = [path for path in TestPageHandler.requested_paths if path.startswith('/static/')]
+    if blocked:
+        print(f"   ❌ Blocked resources were requested: {sorted(set(blocked))}")
+        failures += 1
+
+    expected_drivers = -(-len(urls) // 2)  # each driver is recycled after 2 pages
+    if len(created) < expected_drivers:
+        print(f"   ❌ Expected at least {expected_drivers} drivers to be created, got {len(created)}")
+        failures += 1
+
+    print(f"   Rendered {len(profiles)} pages in {elapsed:.2f}s ({len(profiles) / elapsed:.1f} pages/s), "
+          f"{len(created)} drivers started")
+    if failures:
+        print(f"❌ {failures} checks failed")
+        sys.exit(1)
+    print("✅ WebDriver pool test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Static UFC fighter profile parser
+Extracts a full fighter profile from the server-rendered ufc.com athlete page
+with lxml, so profiles can be scraped over plain HTTP without a browser.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from lxml import etree, html
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _xpath(path: str) -> etree.XPath:
+    return etree.XPath(re.sub(r'\.([\w-]+)', lambda m: f"[{_has_class(m.group(1))}]", path))
+
+
+# Precompiled XPath selectors (".class" is shorthand for a class match)
+NAME = _xpath("//h1.hero-profile__name")
+DIVISION_TITLE = _xpath("//p.hero-profile__division-title")
+DIVISION_BODY = _xpath("//p.hero-profile__division-body")
+PROFILE_IMAGE = _xpath("//img.hero-profile__image/@src")
+HERO_STATS = _xpath("//div.hero-profile__stat")
+HERO_STAT_NUMBER = _xpath(".//p.hero-profile__stat-numb")
+HERO_STAT_TEXT = _xpath(".//p.hero-profile__stat-text")
+ATHLETE_STATS = _xpath("//div.athlete-stats__stat")
+ATHLETE_STAT_NUMBER = _xpath(".//p.athlete-stats__stat-numb")
+ATHLETE_STAT_TEXT = _xpath(".//p.athlete-stats__stat-text")
+OVERLAP_BLOCKS = _xpath("//div.c-overlap__inner")
+OVERLAP_TITLE = _xpath(".//div.c-overlap--stats__title")
+OVERLAP_PERCENT = _xpath("../div.c-overlap__chart//*.e-chart-circle__percent")
+OVERLAP_STATS = _xpath(".//dl.c-overlap__stats")
+COMPARE_GROUPS = _xpath("//div.c-stat-compare__group")
+COMPARE_NUMBER = _xpath("./div.c-stat-compare__number/text()")
+COMPARE_LABEL = _xpath("./div.c-stat-compare__label")
+BIO_FIELDS = _xpath("//div.c-bio__field")
+BIO_LABEL = _xpath("./div.c-bio__label")
+BIO_TEXT = _xpath("./div.c-bio__text")
+RESULT_CARDS = _xpath("//article.c-card-event--athlete-results")
+RESULT_CORNERS = _xpath(".//div.c-card-event--athlete-results__image")
+RESULT_PLAQUE = _xpath("./div.c-card-event--athlete-results__plaque")
+RESULT_HEADLINE_LINKS = _xpath(".//h3.c-card-event--athlete-results__headline/a")
+RESULT_DATE = _xpath(".//div.c-card-event--athlete-results__date")
+RESULT_FIELDS = _xpath(".//div.c-card-event--athlete-results__result")
+RESULT_FIELD_LABEL = _xpath("./div.c-card-event--athlete-results__result-label")
+RESULT_FIELD_TEXT = _xpath("./div.c-card-event--athlete-results__result-text")
+EVENT_LINKS = _xpath(".//a[contains(@href, '/event/')]/@href")
+
+RECORD_PATTERN = re.compile(r'(\d+)-(\d+)(?:-(\d+))?')
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+# Page label -> key used by get_deep_fighter_profile
+COUNT_STATS = {
+    'fight win streak': 'fight_win_streak',
+    'wins by knockout': 'wins_by_knockout',
+    'wins by submission': 'wins_by_submission',
+}
+ACCURACY_STATS = {
+    'striking accuracy': 'striking_accuracy',
+    'takedown accuracy': 'takedown_accuracy',
+}
+TOTAL_STATS = {
+    'sig. strikes landed': 'sig_strikes_landed',
+    'sig. strikes attempted': 'sig_strikes_attempted',
+    'takedowns landed': 'takedowns_landed',
+    'takedowns attempted': 'takedowns_attempted',
+}
+COMPARE_STATS = {
+    'sig. str. landed': 'sig_strikes_landed_per_min',
+    'sig. str. absorbed': 'sig_strikes_absorbed_per_min',
+    'takedown avg': 'takedown_avg_per_15_min',
+    'submission avg': 'submission_avg_per_15_min',
+    'sig. str. defense': 'sig_strikes_defense',
+    'takedown defense': 'takedown_defense',
+    'knockdown avg': 'knockdown_avg',
+    'average fight time': 'average_fight_time',
+}
+BIO_FIELDS_MAP = {
+    'status': ('status', str),
+    'place of birth': ('place_of_birth', str),
+    'trains at': ('training_at', str),
+    'fighting style': ('fighting_style', str),
+    'age': ('age', int),
+    'height': ('height', float),
+    'weight': ('weight', float),
+    'octagon debut': ('octagon_debut', str),
+    'reach': ('reach', float),
+    'leg reach': ('leg_reach', float),
+}
+
+
+def default_stats() -> Dict:
+    return {
+        'fight_win_streak': 0,
+        'wins_by_knockout': 0,
+        'wins_by_submission': 0,
+        'striking_accuracy': 0.0,
+        'sig_strikes_landed': 0,
+        'sig_strikes_attempted': 0,
+        'takedown_accuracy': 0.0,
+        'takedowns_landed': 0,
+        'takedowns_attempted': 0,
+        'sig_strikes_landed_per_min': 0.0,
+        'sig_strikes_absorbed_per_min': 0.0,
+        'takedown_avg_per_15_min': 0.0,
+        'submission_avg_per_15_min': 0.0,
+        'sig_strikes_defense': 0.0,
+        'takedown_defense': 0.0,
+        'knockdown_avg': 0.0,
+        'average_fight_time': '0:00'
+    }
+
+
+def default_personal_info() -> Dict:
+    return {
+        'age': None,
+        'height': None,
+        'weight': None,
+        'reach': None,
+        'leg_reach': None,
+        'place_of_birth': None,
+        'training_at': None,
+        'fighting_style': None,
+        'octagon_debut': None
+    }
+
+
+def parse_record_text(record_text: str) -> Optional[Dict]:
+    """Parse a record like "27-1-0 (W-L-D)" or "25-3" into wins/losses/draws"""
+    match = RECORD_PATTERN.search(record_text or '')
+    if not match:
+        return None
+    return {
+        'wins': int(match.group(1)),
+        'losses': int(match.group(2)),
+        'draws': int(match.group(3) or 0)
+    }
+
+
+def _text(elements: List) -> str:
+    if not elements:
+        return ''
+    element = elements[0]
+    text = element if isinstance(element, str) else element.text_content()
+    return ' '.join(text.split())
+
+
+def _number(text: str, cast=float):
+    match = NUMBER_PATTERN.search(text or '')
+    return cast(float(match.group(0))) if match else None
+
+
+def _slug(url: str) -> str:
+    return url.rstrip('/').split('#')[0].split('/')[-1]
+
+
+def _parse_stats(doc) -> Dict:
+    stats = default_stats()
+
+    for blocks, number, label in ((HERO_STATS, HERO_STAT_NUMBER, HERO_STAT_TEXT),
+                                  (ATHLETE_STATS, ATHLETE_STAT_NUMBER, ATHLETE_STAT_TEXT)):
+        for block in blocks(doc):
+            key = COUNT_STATS.get(_text(label(block)).lower())
+            value = _number(_text(number(block)), int)
+            if key and value is not None:
+                stats[key] = value
+
+    for block in OVERLAP_BLOCKS(doc):
+        key = ACCURACY_STATS.get(_text(OVERLAP_TITLE(block)).lower())
+        value = _number(_text(OVERLAP_PERCENT(block)))
+        if key and value is not None:
+            stats[key] = value
+        for stat in OVERLAP_STATS(block):
+            key = TOTAL_STATS.get(_text(stat.xpath('./dt')).lower())
+            value = _number(_text(stat.xpath('./dd')), int)
+            if key and value is not None:
+                stats[key] = value
+
+    for group in COMPARE_GROUPS(doc):
+        key = COMPARE_STATS.get(_text(COMPARE_LABEL(group)).lower())
+        value = _text(COMPARE_NUMBER(group))
+        if not key or not value:
+            continue
+        if key == 'average_fight_time':
+            stats[key] = value
+        else:
+            number = _number(value)
+            if number is not None:
+                stats[key] = number
+
+    return stats
+
+
+def _parse_personal_info(doc) -> Dict:
+    personal_info = default_personal_info()
+    for field in BIO_FIELDS(doc):
+        mapping = BIO_FIELDS_MAP.get(_text(BIO_LABEL(field)).lower())
+        value = _text(BIO_TEXT(field))
+        if not mapping or not value:
+            continue
+        key, cast = mapping
+        personal_info[key] = value if cast is str else _number(value, cast)
+    return personal_info
+
+
+def _parse_fight_history(doc, fighter_id: str, limit: int) -> List[Dict]:
+    fight_history = []
+    for card in RESULT_CARDS(doc)[:limit]:
+        fight_data = {
+            'opponent': 'Unknown',
+            'result': 'Unknown',
+            'method': 'Unknown',
+            'round': None,
+            'time': 'Unknown',
+            'date': _text(RESULT_DATE(card)) or 'Unknown',
+            'event': 'Unknown'
+        }
+
+        # The plaque sits on the winner's corner; draws and no contests mark both
+        own_plaque, other_plaque = '', ''
+        for corner in RESULT_CORNERS(card):
+            link = corner.xpath('./a/@href')
+            plaque = _text(RESULT_PLAQUE(corner))
+            if link and _slug(link[0]) == fighter_id:
+                own_plaque = plaque
+            else:
+                other_plaque = plaque
+        if own_plaque:
+            fight_data['result'] = own_plaque.title()
+        elif other_plaque.lower() == 'win':
+            fight_data['result'] = 'Loss'
+        elif other_plaque:
+            fight_data['result'] = other_plaque.title()
+
+        for link in RESULT_HEADLINE_LINKS(card):
+            if _slug(link.get('href', '')) != fighter_id:
+                fight_data['opponent'] = _text([link])
+
+        for field in RESULT_FIELDS(card):
+            label = _text(RESULT_FIELD_LABEL(field)).lower()
+            value = _text(RESULT_FIELD_TEXT(field))
+            if not value:
+                continue
+            if label == 'round':
+                fight_data['round'] = _number(value, int)
+            elif label in ('time', 'method'):
+                fight_data[label] = value
+
+        event_links = EVENT_LINKS(card)
+        if event_links:
+            fight_data['event'] = _slug(event_links[0])
+            fight_data['event_url'] = event_links[0]
+
+        fight_history.append(fight_data)
+    return fight_history
+
+
+def parse_fighter_profile(page_html, fighter_url: str, history_limit: int = 10) -> Optional[Dict]:
+    """Parse an athlete page into the get_deep_fighter_profile schema.
+
+    Returns None when the page has no hero profile (redirects, listing pages,
+    bot challenges), so callers can fall back to a rendered page.
+    """
+    doc = html.fromstring(page_html)
+
+    name = _text(NAME(doc))
+    if not name:
+        return None
+
+    fighter_id = _slug(fighter_url)
+    division = _text(DIVISION_TITLE(doc))
+    image = PROFILE_IMAGE(doc)
+    record = parse_record_text(_text(DIVISION_BODY(doc)))
+
+    return {
+        'id': fighter_id,
+        'name': name,
+        'record': record or {'wins': 0, 'losses': 0, 'draws': 0},
+        'record_found': record is not None,
+        'division': re.sub(r'\s+Division$', '', division) or 'Unknown Division',
+        'image_url': image[0] if image else None,
+        'stats': _parse_stats(doc),
+        'fight_history': _parse_fight_history(doc, fighter_id, history_limit),
+        'personal_info': _parse_personal_info(doc),
+        'scraped_at': datetime.now().isoformat()
+    }
+
+
+def is_complete_profile(profile: Optional[Dict]) -> bool:
+    """A static profile is usable when the hero section yielded a name and a record (0-0-0 counts)"""
+    return bool(profile and profile.get('name') and profile.get('record_found'))
@@ -6,7 +6,6 @@ Scrapes fighter and fight data from various UFC sources
 
 import requests
 import pandas as pd
-import time
 import logging
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
@@ -14,61 +13,86 @@ import json
 import os
 from datetime import datetime, timedelta
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    from .ufc_profile_parser import parse_fighter_profile, is_complete_profile, parse_record_text
+    from .polite_crawl import HostThrottle, CrawlCheckpoint, PageCache
+    from .driver_pool import WebDriverPool
+except ImportError:  # run as a script from data/scrapers
+    from ufc_profile_parser import parse_fighter_profile, is_complete_profile, parse_record_text
+    from polite_crawl import HostThrottle, CrawlCheckpoint, PageCache
+    from driver_pool import WebDriverPool
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Next to the live profile exports, whatever directory the scraper is run from
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'live',
+                                       'ufc_profiles_checkpoint.json')
+
 class UFCScraper:
     """Scraper for UFC fighter and fight data"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, per_host_concurrency: int = 4, min_delay: float = 0.5,
+                 page_cache_ttl: float = 3600, driver_pool_size: int = 2, pages_per_driver: int = 50):
         """Initialize the UFC scraper"""
         self.base_url = "https://www.ufc.com"
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.driver = None
-    
-    def _init_driver(self):
-        """Initialize Selenium WebDriver for deep scraping"""
-        if self.driver is None:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")  # Run in background
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
+        # Size the connection pool for the profile crawl workers
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.throttle = HostThrottle(max_concurrency=per_host_concurrency, min_delay=min_delay)
+        # Profile pages are shared by the rankings record lookups and the profile crawl
+        self.page_cache = PageCache(ttl_seconds=page_cache_ttl)
+        # Headless browsers for the pages the static parser can't handle, started on first use
+        self.driver_pool = WebDriverPool(size=driver_pool_size, max_pages_per_driver=pages_per_driver)
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the per-host throttle, feeding the response status back into its delay"""
+        kwargs.setdefault('timeout', 15)
+        with self.throttle.slot(url):
             try:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                logger.info("Selenium WebDriver initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize WebDriver: {e}")
-                self.driver = None
-                
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException:
+                self.throttle.record(url, None)
+                raise
+        self.throttle.record(url, response.status_code, response.headers.get('Retry-After'))
+        return response
+    
+    def _fetch_profile_page(self, fighter_url: str) -> bytes:
+        """Download an athlete page at most once per cache TTL"""
+        def fetch(url: str) -> bytes:
+            response = self._get(url)
+            response.raise_for_status()
+            return response.content
+        return self.page_cache.get_or_fetch(self._full_url(fighter_url), fetch)
+    
     def _close_driver(self):
-        """Close the Selenium WebDriver"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.driver = None
-                logger.info("WebDriver closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing WebDriver: {e}")
-    
-    def scrape_rankings(self) -> List[Dict]:
-        """Scrape current UFC rankings from the official rankings page"""
+        """Quit every pooled Selenium WebDriver"""
+        try:
+            self.driver_pool.close()
+            logger.info("WebDriver pool closed")
+        except Exception as e:
+            logger.error(f"Error closing WebDriver pool: {e}")
+    
+    def scrape_rankings(self, defer_records: bool = False) -> List[Dict]:
+        """Scrape current UFC rankings from the official rankings page
+        
+        With defer_records, rows get an empty record and no profile pages are
+        fetched here; scrape_all_data fills the records in from its profile crawl.
+        """
         logger.info("Scraping UFC rankings from official page...")
         
         try:
@@ -106,7 +130,7 @@ class UFCScraper:
                         if champ_name:
                             champions_set.add(champ_name)  # Track champion
                             # Get real record from fighter profile
-                            champ_record = self.get_fighter_record(champ_url)
+                            champ_record = self._ranking_record(champ_url, defer_records)
                             
                             rankings.append({
                                 'id': f"{division.lower().replace(' ', '-').replace('&', 'and')}-champion",
@@ -158,7 +182,7 @@ class UFCScraper:
                                     rank_change = change_text
                                     
                             # Get real record from fighter profile
-                            fighter_record = self.get_fighter_record(fighter_url)
+                            fighter_record = self._ranking_record(fighter_url, defer_records)
                             
                             rankings.append({
                                 'id': f"{division.lower().replace(' ', '-').replace('&', 'and')}-{rank}",
@@ -186,6 +210,18 @@ class UFCScraper:
             logger.error(f"Error scraping rankings: {e}")
             return []
     
+    def _ranking_record(self, fighter_url: str, defer: bool) -> Dict:
+        if defer:
+            return {'wins': 0, 'losses': 0, 'draws': 0}
+        return self.get_fighter_record(fighter_url)
+    
+    @staticmethod
+    def _apply_record(ranking: Dict, record: Dict):
+        ranking['record'] = dict(record)
+        ranking['wins'] = record.get('wins', 0)
+        ranking['losses'] = record.get('losses', 0)
+        ranking['draws'] = record.get('draws', 0)
+    
     def get_upcoming_events(self) -> List[Dict]:
         """Scrape upcoming UFC events"""
         logger.info("Scraping upcoming UFC events...")
@@ -256,10 +292,12 @@ class UFCScraper:
             # Find fight cards
             fight_cards = soup.find_all('div', {'class': 'c-listing-fight'})
             
-            for card in fight_cards:
+            # Bout order is the card position; IDs only use it to number a rematch on the same card
+            for bout_order, card in enumerate(fight_cards, 1):
                 try:
                     fight_data = self._parse_fight_card(card)
                     if fight_data:
+                        fight_data.update(event_url=event_url, bout_order=bout_order)
                         fights.append(fight_data)
                 except Exception as e:
                     logger.error(f"Error parsing fight card: {e}")
@@ -424,10 +462,11 @@ class UFCScraper:
             # Find completed fights
             fight_cards = soup.find_all('div', {'class': 'c-listing-fight--featured'})
             
-            for card in fight_cards:
+            for bout_order, card in enumerate(fight_cards, 1):
                 try:
                     result_data = self._parse_fight_result(card)
                     if result_data:
+                        result_data.update(event_url=event_url, bout_order=bout_order)
                         results.append(result_data)
                 except Exception as e:
                     logger.error(f"Error parsing fight result: {e}")
@@ -473,8 +512,15 @@ class UFCScraper:
             logger.error(f"Error parsing fight result: {e}")
             return None
     
-    def scrape_all_data(self) -> Dict:
-        """Scrape all UFC data including rankings and fighter profiles"""
+    def scrape_all_data(self, checkpoint_path: Optional[str] = DEFAULT_CHECKPOINT_PATH) -> Dict:
+        """Scrape all UFC data including rankings and fighter profiles
+        
+        Profiles are crawled concurrently over HTTP (bounded by max_workers and the
+        per-host throttle); pages the static parser can't handle are then rendered
+        across the WebDriver pool. Finished profiles are appended to checkpoint_path
+        so an interrupted run resumes where it stopped; the checkpoint is removed
+        after a complete run.
+        """
         logger.info("Starting comprehensive UFC data scraping...")
         
         all_data = {
@@ -482,139 +528,202 @@ class UFCScraper:
             'fighters': [],
             'scraped_at': datetime.now().isoformat()
         }
+        ranking_by_url, finished = {}, {}
+        fighters_collected = False
         
         try:
             # 1. Scrape rankings first
             logger.info("Step 1: Scraping UFC rankings...")
-            rankings = self.scrape_rankings()
+            # Records come from the profile crawl below, so each page is fetched once
+            rankings = self.scrape_rankings(defer_records=True)
             all_data['rankings'] = rankings
             logger.info(f"✅ Scraped {len(rankings)} rankings")
             
-            # 2. Scrape detailed fighter profiles for top fighters
+            # 2. Scrape detailed fighter profiles for ranked fighters
             logger.info("Step 2: Scraping detailed fighter profiles...")
-            fighters = []
             
-            # Get unique fighter URLs from rankings
-            fighter_urls = set()
+            # Index ranking rows by fighter URL (first row wins, in ranking order)
+            ranking_by_url = {}
             for ranking in rankings:
                 if ranking.get('fighter_url'):
-                    fighter_urls.add(ranking['fighter_url'])
-            
-            logger.info(f"Found {len(fighter_urls)} unique fighters to profile")
-            
-            # Scrape detailed profiles for each fighter
-            for i, fighter_url in enumerate(fighter_urls, 1):
-                try:
-                    logger.info(f"Scraping fighter profile {i}/{len(fighter_urls)}: {fighter_url}")
-                    
-                    # Get detailed fighter profile
-                    fighter_profile = self.get_deep_fighter_profile(fighter_url)
-                    
-                    if fighter_profile and fighter_profile.get('name'):
-                        # Merge ranking data with profile data
-                        ranking_data = next((r for r in rankings if r.get('fighter_url') == fighter_url), {})
-                        
-                        fighter_data = {
-                            'id': fighter_profile.get('id', ''),
-                            'name': fighter_profile.get('name', ''),
-                            'division': fighter_profile.get('division', ranking_data.get('division', '')),
-                            'record': fighter_profile.get('record', {'wins': 0, 'losses': 0, 'draws': 0}),
-                            'image_url': None,  # UFC doesn't provide direct image URLs
-                            'status': 'Active',
-                            'place_of_birth': fighter_profile.get('personal_info', {}).get('place_of_birth'),
-                            'training_at': fighter_profile.get('personal_info', {}).get('training_at'),
-                            'fighting_style': fighter_profile.get('personal_info', {}).get('fighting_style'),
-                            'age': fighter_profile.get('personal_info', {}).get('age'),
-                            'height': fighter_profile.get('personal_info', {}).get('height'),
-                            'weight': fighter_profile.get('personal_info', {}).get('weight'),
-                            'octagon_debut': fighter_profile.get('personal_info', {}).get('octagon_debut'),
-                            'reach': fighter_profile.get('personal_info', {}).get('reach'),
-                            'leg_reach': fighter_profile.get('personal_info', {}).get('leg_reach'),
-                            'stats': fighter_profile.get('stats', {}),
-                            'fight_history': fighter_profile.get('fight_history', []),
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                        
-                        fighters.append(fighter_data)
-                        logger.info(f"✅ Scraped profile for {fighter_data['name']}")
+                    ranking_by_url.setdefault(ranking['fighter_url'], ranking)
+            
+            checkpoint = CrawlCheckpoint(checkpoint_path)
+            finished = checkpoint.load()
+            pending = [url for url in ranking_by_url if url not in finished]
+            logger.info(f"Found {len(ranking_by_url)} unique fighters to profile "
+                        f"({len(finished)} resumed from checkpoint)")
+            
+            def store(fighter_url: str, fighter_profile: Optional[Dict]) -> bool:
+                if not fighter_profile or not fighter_profile.get('name'):
+                    return False
+                fighter_data = self._merge_profile(fighter_profile, ranking_by_url[fighter_url])
+                finished[fighter_url] = fighter_data
+                checkpoint.save(fighter_url, fighter_data)
+                return True
+            
+            needs_browser = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.get_static_fighter_profile, url): url for url in pending}
+                for i, future in enumerate(as_completed(futures), 1):
+                    fighter_url = futures[future]
+                    fighter_profile = future.result()
+                    if is_complete_profile(fighter_profile) and store(fighter_url, fighter_profile):
+                        logger.info(f"✅ [{i}/{len(pending)}] Scraped profile for {fighter_profile['name']}")
+                    else:
+                        needs_browser.append(fighter_url)
+            
+            # 3. Render the remaining JS-only pages across the WebDriver pool
+            if needs_browser:
+                logger.info(f"Step 3: Rendering {len(needs_browser)} profiles with Selenium...")
+                for fighter_url, fighter_profile in zip(needs_browser, self.render_fighter_profiles(needs_browser)):
+                    if store(fighter_url, fighter_profile):
+                        logger.info(f"✅ Rendered profile for {fighter_profile['name']}")
                     else:
                         logger.warning(f"❌ Failed to get profile for {fighter_url}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error scraping fighter profile {fighter_url}: {e}")
-                    continue
-                
-                # Be respectful to the server
-                time.sleep(2)
             
-            all_data['fighters'] = fighters
-            logger.info(f"✅ Scraped {len(fighters)} detailed fighter profiles")
+            all_data['fighters'] = [finished[url] for url in ranking_by_url if url in finished]
+            fighters_collected = True
+            logger.info(f"✅ Scraped {len(all_data['fighters'])} detailed fighter profiles "
+                        f"({self.page_cache.misses} pages downloaded, {self.page_cache.hits} cache hits)")
+            
+            # Fill in the ranking records deferred in step 1
+            for ranking in rankings:
+                fighter_data = finished.get(ranking.get('fighter_url'))
+                if fighter_data:
+                    self._apply_record(ranking, fighter_data['record'])
+            if len(all_data['fighters']) == len(ranking_by_url):
+                checkpoint.clear()
             
         except Exception as e:
             logger.error(f"❌ Error in comprehensive scraping: {e}")
         finally:
-            # Clean up WebDriver
+            # Keep the profiles finished before a failure
+            if not fighters_collected:
+                all_data['fighters'] = [finished[url] for url in ranking_by_url if url in finished]
+            # Clean up WebDriver and drop cached pages
             self._close_driver()
+            self.page_cache.clear()
         
         logger.info(f"🎉 Comprehensive scraping complete! Total: {len(all_data['rankings'])} rankings, {len(all_data['fighters'])} fighters")
         return all_data
     
+    def _merge_profile(self, fighter_profile: Dict, ranking_data: Dict) -> Dict:
+        """Merge ranking data with profile data"""
+        personal_info = fighter_profile.get('personal_info', {})
+        return {
+            'id': fighter_profile.get('id', ''),
+            'name': fighter_profile.get('name', ''),
+            'division': fighter_profile.get('division', ranking_data.get('division', '')),
+            'record': fighter_profile.get('record', {'wins': 0, 'losses': 0, 'draws': 0}),
+            'image_url': fighter_profile.get('image_url'),
+            'status': 'Active',
+            'place_of_birth': personal_info.get('place_of_birth'),
+            'training_at': personal_info.get('training_at'),
+            'fighting_style': personal_info.get('fighting_style'),
+            'age': personal_info.get('age'),
+            'height': personal_info.get('height'),
+            'weight': personal_info.get('weight'),
+            'octagon_debut': personal_info.get('octagon_debut'),
+            'reach': personal_info.get('reach'),
+            'leg_reach': personal_info.get('leg_reach'),
+            'stats': fighter_profile.get('stats', {}),
+            'fight_history': fighter_profile.get('fight_history', []),
+            'scraped_at': datetime.now().isoformat()
+        }
+    
+    def _full_url(self, fighter_url: str) -> str:
+        return f"{self.base_url}{fighter_url}" if fighter_url.startswith('/') else fighter_url
+    
     def get_deep_fighter_profile(self, fighter_url: str) -> Dict:
-        """Get comprehensive fighter profile data using Selenium"""
+        """Get comprehensive fighter profile data, parsing the static page first and using Selenium as a fallback"""
         if not fighter_url:
             return {}
-            
-        self._init_driver()
-        if not self.driver:
-            logger.error("WebDriver not available for deep scraping")
+        
+        profile = self.get_static_fighter_profile(fighter_url)
+        if is_complete_profile(profile):
+            logger.info(f"Successfully parsed static profile for {profile['name']}")
+            return profile
+        
+        logger.info(f"Static profile incomplete for {fighter_url}, falling back to Selenium")
+        return self.get_selenium_fighter_profile(fighter_url)
+    
+    def get_static_fighter_profile(self, fighter_url: str) -> Optional[Dict]:
+        """Fetch the server-rendered athlete page over HTTP and parse it with lxml"""
+        try:
+            return parse_fighter_profile(self._fetch_profile_page(fighter_url), fighter_url)
+        except Exception as e:
+            logger.warning(f"Static profile fetch failed for {fighter_url}: {e}")
+            return None
+    
+    def get_selenium_fighter_profile(self, fighter_url: str) -> Dict:
+        """Get comprehensive fighter profile data using a pooled Selenium WebDriver"""
+        if not fighter_url:
             return {}
-            
+        
         try:
-            full_url = f"{self.base_url}{fighter_url}" if fighter_url.startswith('/') else fighter_url
+            with self.driver_pool.driver() as driver:
+                return self._render_fighter_profile(driver, fighter_url)
+        except Exception as e:
+            logger.error(f"Error scraping fighter profile {fighter_url}: {e}")
+            return {}
+    
+    def render_fighter_profiles(self, fighter_urls: List[str]) -> List[Dict]:
+        """Render several JS-only profile pages in parallel across the WebDriver pool"""
+        profiles = self.driver_pool.map(self._render_fighter_profile, fighter_urls)
+        return [profile or {} for profile in profiles]
+    
+    def _render_fighter_profile(self, driver, fighter_url: str) -> Dict:
+        try:
+            full_url = self._full_url(fighter_url)
             logger.info(f"Scraping fighter profile: {full_url}")
             
-            self.driver.get(full_url)
-            WebDriverWait(self.driver, 10).until(
+            with self.throttle.slot(full_url):
+                driver.get(full_url)
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "hero-content"))
             )
             
             # Extract all fighter data
             fighter_data = {
                 'id': fighter_url.split('/')[-1] if '/' in fighter_url else fighter_url,
-                'name': self._extract_fighter_name(),
-                'record': self._extract_fighter_record(),
-                'division': self._extract_fighter_division(),
-                'stats': self._extract_detailed_stats(),
-                'fight_history': self._extract_fight_history(),
-                'personal_info': self._extract_personal_info(),
+                'name': self._extract_fighter_name(driver),
+                'record': self._extract_fighter_record(driver),
+                'division': self._extract_fighter_division(driver),
+                'stats': self._extract_detailed_stats(driver),
+                'fight_history': self._extract_fight_history(driver),
+                'personal_info': self._extract_personal_info(driver),
                 'scraped_at': datetime.now().isoformat()
             }
             
             logger.info(f"Successfully scraped profile for {fighter_data['name']}")
             return fighter_data
             
+        except TimeoutException as e:
+            logger.error(f"Timed out rendering fighter profile {fighter_url}: {e}")
+            return {}
+        except WebDriverException:
+            raise  # let the pool replace a crashed driver
         except Exception as e:
             logger.error(f"Error scraping fighter profile {fighter_url}: {e}")
             return {}
-        finally:
-            time.sleep(1)  # Be respectful to the server
     
-    def _extract_fighter_name(self) -> str:
+    def _extract_fighter_name(self, driver) -> str:
         """Extract fighter name from profile page"""
         try:
-            name_elem = self.driver.find_element(By.CSS_SELECTOR, ".hero-content h1")
+            name_elem = driver.find_element(By.CSS_SELECTOR, ".hero-content h1")
             return name_elem.text.strip()
         except:
             try:
-                name_elem = self.driver.find_element(By.CSS_SELECTOR, ".hero-content .hero-content__title")
+                name_elem = driver.find_element(By.CSS_SELECTOR, ".hero-content .hero-content__title")
                 return name_elem.text.strip()
             except:
                 return "Unknown Fighter"
     
-    def _extract_fighter_record(self) -> Dict:
+    def _extract_fighter_record(self, driver) -> Dict:
         """Extract fighter record from profile page"""
         try:
-            record_elem = self.driver.find_element(By.CSS_SELECTOR, ".hero-content .hero-content__record")
+            record_elem = driver.find_element(By.CSS_SELECTOR, ".hero-content .hero-content__record")
             record_text = record_elem.text.strip()
             
             # Parse record like "25-1-0" or "25-1"
@@ -629,7 +738,7 @@ class UFCScraper:
         
         return {'wins': 0, 'losses': 0, 'draws': 0}
     
-    def _extract_fighter_division(self) -> str:
+    def _extract_fighter_division(self, driver) -> str:
         """Extract fighter division from profile page"""
         try:
             # Try multiple selectors for division
@@ -642,7 +751,7 @@ class UFCScraper:
             
             for selector in selectors:
                 try:
-                    div_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    div_elem = driver.find_element(By.CSS_SELECTOR, selector)
                     division = div_elem.text.strip()
                     if division:
                         return division
@@ -650,7 +759,7 @@ class UFCScraper:
                     continue
                     
             # Try to find division in the page content
-            page_text = self.driver.page_source
+            page_text = driver.page_source
             divisions = ['Heavyweight', 'Light Heavyweight', 'Middleweight', 'Welterweight', 
                         'Lightweight', 'Featherweight', 'Bantamweight', 'Flyweight', 
                         'Women\'s Bantamweight', 'Women\'s Flyweight', 'Women\'s Strawweight',
@@ -665,7 +774,7 @@ class UFCScraper:
         
         return "Unknown Division"
     
-    def _extract_detailed_stats(self) -> Dict:
+    def _extract_detailed_stats(self, driver) -> Dict:
         """Extract detailed fighter statistics"""
         stats = {
             'fight_win_streak': 0,
@@ -689,7 +798,7 @@ class UFCScraper:
         
         try:
             # Look for stats in various sections
-            stats_sections = self.driver.find_elements(By.CSS_SELECTOR, ".stats-section, .fighter-stats, .statistics")
+            stats_sections = driver.find_elements(By.CSS_SELECTOR, ".stats-section, .fighter-stats, .statistics")
             
             for section in stats_sections:
                 section_text = section.text.lower()
@@ -777,13 +886,13 @@ class UFCScraper:
         
         return stats
     
-    def _extract_fight_history(self) -> List[Dict]:
+    def _extract_fight_history(self, driver) -> List[Dict]:
         """Extract fighter's fight history"""
         fight_history = []
         
         try:
             # Look for fight history section
-            history_sections = self.driver.find_elements(By.CSS_SELECTOR, ".fight-history, .results, .last-fights")
+            history_sections = driver.find_elements(By.CSS_SELECTOR, ".fight-history, .results, .last-fights")
             
             for section in history_sections:
                 fight_items = section.find_elements(By.CSS_SELECTOR, ".fight-item, .result-item, .fight")
@@ -875,7 +984,7 @@ class UFCScraper:
             logger.warning(f"Error parsing fight history item: {e}")
             return {}
     
-    def _extract_personal_info(self) -> Dict:
+    def _extract_personal_info(self, driver) -> Dict:
         """Extract fighter's personal information"""
         personal_info = {
             'age': None,
@@ -891,7 +1000,7 @@ class UFCScraper:
         
         try:
             # Look for personal info sections
-            info_sections = self.driver.find_elements(By.CSS_SELECTOR, ".personal-info, .fighter-info, .bio")
+            info_sections = driver.find_elements(By.CSS_SELECTOR, ".personal-info, .fighter-info, .bio")
             
             for section in info_sections:
                 section_text = section.text.lower()
@@ -954,28 +1063,15 @@ class UFCScraper:
             if not fighter_url:
                 return {'wins': 0, 'losses': 0, 'draws': 0}
                 
-            full_url = f"{self.base_url}{fighter_url}"
-            response = self.session.get(full_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(self._fetch_profile_page(fighter_url), 'html.parser')
             
             # Use the correct selector found from debugging
             record_elem = soup.select_one('p.hero-profile__division-body')
             
-            if record_elem:
-                record_text = record_elem.text.strip()
-                # Parse record like "27-1-0 (W-L-D)" or "25-3"
-                if '(' in record_text:
-                    # Extract just the numbers before the parentheses
-                    record_part = record_text.split('(')[0].strip()
-                else:
-                    record_part = record_text
-                
-                parts = record_part.split('-')
-                if len(parts) >= 2:
-                    wins = int(parts[0]) if parts[0].isdigit() else 0
-                    losses = int(parts[1]) if parts[1].isdigit() else 0
-                    draws = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
-                    return {'wins': wins, 'losses': losses, 'draws': draws}
+            # Parse record like "27-1-0 (W-L-D)" or "25-3"
+            record = parse_record_text(record_elem.text) if record_elem else None
+            if record:
+                return record
             
             logger.warning(f"No record found for {fighter_url}")
             return {'wins': 0, 'losses': 0, 'draws': 0}
@@ -2,6 +2,7 @@ import 'package:supabase_flutter/supabase_flutter.dart';
 import '../models/fighter.dart';
 import '../models/fight.dart';
 import '../models/event.dart';
+import 'fetch_planner.dart';
 
 class DatabaseService {
   static DatabaseService? _instance;
@@ -134,45 +135,11 @@ class DatabaseService {
       final response = await query;
       List<Fight> fights = [];
       
-      // For each fight, get the fighter details separately
-      for (var fightJson in response) {
+      // Fighters and events for every fight, in a few batched queries
+      final resolved = await FetchPlanner.instance.resolve(response);
+      for (var fightJson in resolved) {
         try {
-          // Get fighter1 details
-          Fighter? fighter1;
-          if (fightJson['fighter1_id'] != null) {
-            final fighter1Response = await _client
-                .from('fighters')
-                .select('*')
-                .eq('id', fightJson['fighter1_id'])
-                .maybeSingle();
-            
-            if (fighter1Response != null) {
-              fighter1 = Fighter.fromJson(fighter1Response);
-            }
-          }
-          
-          // Get fighter2 details
-          Fighter? fighter2;
-          if (fightJson['fighter2_id'] != null) {
-            final fighter2Response = await _client
-                .from('fighters')
-                .select('*')
-                .eq('id', fightJson['fighter2_id'])
-                .maybeSingle();
-            
-            if (fighter2Response != null) {
-              fighter2 = Fighter.fromJson(fighter2Response);
-            }
-          }
-          
-          // Create fight with fighter details
-          final fight = Fight.fromJson({
-            ...fightJson,
-            'fighter1': fighter1 != null ? fighter1.toJson() : null,
-            'fighter2': fighter2 != null ? fighter2.toJson() : null,
-          });
-          
-          fights.add(fight);
+          fights.add(Fight.fromJson(fightJson));
         } catch (e) {
           print('Error processing fight: $e');
         }
@@ -195,40 +162,8 @@ class DatabaseService {
       
       if (response == null) return null;
       
-      // Get fighter1 details
-      Fighter? fighter1;
-      if (response['fighter1_id'] != null) {
-        final fighter1Response = await _client
-            .from('fighters')
-            .select('*')
-            .eq('id', response['fighter1_id'])
-            .maybeSingle();
-        
-        if (fighter1Response != null) {
-          fighter1 = Fighter.fromJson(fighter1Response);
-        }
-      }
-      
-      // Get fighter2 details
-      Fighter? fighter2;
-      if (response['fighter2_id'] != null) {
-        final fighter2Response = await _client
-            .from('fighters')
-            .select('*')
-            .eq('id', response['fighter2_id'])
-            .maybeSingle();
-        
-        if (fighter2Response != null) {
-          fighter2 = Fighter.fromJson(fighter2Response);
-        }
-      }
-      
-      // Create fight with fighter details
-      return Fight.fromJson({
-        ...response,
-        'fighter1': fighter1 != null ? fighter1.toJson() : null,
-        'fighter2': fighter2 != null ? fighter2.toJson() : null,
-      });
+      final resolved = await FetchPlanner.instance.resolve([response]);
+      return Fight.fromJson(resolved.first);
     } catch (e) {
       print('Error getting fight: $e');
       return null;
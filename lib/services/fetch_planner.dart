@@ -0,0 +1,140 @@
+import 'package:supabase_flutter/supabase_flutter.dart';
+
+/// Resolves the fighters and events referenced by fights in a few batched
+/// queries instead of one request per row. The app's copy of
+/// data/processors/fetch_planner.py: ids are de-duplicated across all fights,
+/// rows already in the identity map are skipped, the rest are split into
+/// `id=in.(...)` queries that fit under [maxUrlLength], and those queries run
+/// concurrently. Cached rows expire after [cacheTtl] so edited and newly
+/// created rows show up without a restart; ids with no row aren't cached.
+/// Call [clear] when the data is refreshed.
+class FetchPlanner {
+  static FetchPlanner? _instance;
+  static FetchPlanner get instance => _instance ??= FetchPlanner(Supabase.instance.client);
+
+  // Kept well under the ~8 KB request line limit in front of PostgREST; about 50 uuids per query
+  static const int maxUrlLength = 2048;
+  static const Duration cacheTtl = Duration(minutes: 5);
+
+  // fight column -> referenced table, and the key the row is attached under
+  static const Map<String, List<String>> references = {
+    'fighter1_id': ['fighters', 'fighter1'],
+    'fighter2_id': ['fighters', 'fighter2'],
+    'event_id': ['events', 'event'],
+  };
+
+  final SupabaseClient _client;
+  final Duration ttl;
+
+  // Identity map: one row per table and id, with when it was fetched
+  final Map<String, Map<String, _CachedRow>> _rows = {};
+
+  FetchPlanner(this._client, {this.ttl = cacheTtl});
+
+  void clear() => _rows.clear();
+
+  Map<String, dynamic>? cached(String table, String id) {
+    final entry = _rows[table]?[id];
+    if (entry == null) return null;
+    if (DateTime.now().difference(entry.fetchedAt) > ttl) {
+      _rows[table]!.remove(id);
+      return null;
+    }
+    return entry.row;
+  }
+
+  /// Length of the request URL for [table] with an empty id list; the chunks fill the rest
+  int _baseUrlLength(String table) {
+    return '${_client.rest.url}/$table'
+            '?select=${Uri.encodeQueryComponent('*')}&id=${Uri.encodeQueryComponent('in.()')}'
+        .length;
+  }
+
+  /// Distinct ids per referenced table, in first-seen order
+  Map<String, List<String>> referencedIds(List<Map<String, dynamic>> fights) {
+    final ids = <String, Set<String>>{};
+    for (final fight in fights) {
+      references.forEach((column, reference) {
+        final value = fight[column];
+        if (value != null && value.toString().isNotEmpty) {
+          ids.putIfAbsent(reference[0], () => <String>{}).add(value.toString());
+        }
+      });
+    }
+    return ids.map((table, tableIds) => MapEntry(table, tableIds.toList()));
+  }
+
+  /// Split ids into runs whose encoded in.(...) filter keeps the URL under [maxUrlLength]
+  static List<List<String>> chunkIds(List<String> ids, int baseUrlLength) {
+    final separator = Uri.encodeQueryComponent(',').length;
+    final budget = maxUrlLength - baseUrlLength;
+    final chunks = <List<String>>[];
+    var chunk = <String>[];
+    var used = 0;
+    for (final id in ids) {
+      final cost = Uri.encodeQueryComponent(id).length + separator;
+      if (chunk.isNotEmpty && used + cost > budget) {
+        chunks.add(chunk);
+        chunk = <String>[];
+        used = 0;
+      }
+      chunk.add(id);
+      used += cost;
+    }
+    if (chunk.isNotEmpty) chunks.add(chunk);
+    return chunks;
+  }
+
+  Future<void> _fetchChunk(String table, List<String> ids) async {
+    final rows = await _client.from(table).select().inFilter('id', ids);
+    final tableRows = _rows.putIfAbsent(table, () => {});
+    final fetchedAt = DateTime.now();
+    for (final row in rows) {
+      tableRows[row['id'].toString()] = _CachedRow(row, fetchedAt);
+    }
+  }
+
+  /// Rows of one table by id, from the identity map where possible
+  Future<Map<String, Map<String, dynamic>>> fetchByIds(String table, Iterable<String> ids) async {
+    final distinct = ids.where((id) => id.isNotEmpty).toSet().toList();
+    await _fetchAll({table: distinct});
+    final result = <String, Map<String, dynamic>>{};
+    for (final id in distinct) {
+      final row = cached(table, id);
+      if (row != null) result[id] = row;
+    }
+    return result;
+  }
+
+  Future<void> _fetchAll(Map<String, List<String>> idsByTable) async {
+    final queries = <Future<void>>[];
+    idsByTable.forEach((table, ids) {
+      final uncached = ids.where((id) => cached(table, id) == null).toList();
+      if (uncached.isEmpty) return;
+      for (final chunk in chunkIds(uncached, _baseUrlLength(table))) {
+        queries.add(_fetchChunk(table, chunk));
+      }
+    });
+    await Future.wait(queries);
+  }
+
+  /// Copies of the fights with fighter1, fighter2 and event attached (null where the row doesn't exist)
+  Future<List<Map<String, dynamic>>> resolve(List<Map<String, dynamic>> fights) async {
+    await _fetchAll(referencedIds(fights));
+    return fights.map((fight) {
+      final resolved = Map<String, dynamic>.from(fight);
+      references.forEach((column, reference) {
+        final value = fight[column];
+        resolved[reference[1]] = value != null ? cached(reference[0], value.toString()) : null;
+      });
+      return resolved;
+    }).toList();
+  }
+}
+
+class _CachedRow {
+  final Map<String, dynamic> row;
+  final DateTime fetchedAt;
+
+  _CachedRow(this.row, this.fetchedAt);
+}
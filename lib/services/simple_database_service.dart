@@ -6,6 +6,7 @@ import '../models/ranking_item.dart';
 import '../models/prediction.dart';
 import '../models/user_stats.dart';
 import 'supabase_service.dart';
+import 'fetch_planner.dart';
 
 class SimpleDatabaseService {
   static SimpleDatabaseService? _instance;
@@ -197,40 +198,8 @@ class SimpleDatabaseService {
       
       if (response == null) return null;
       
-      // Get fighter1 details
-      Fighter? fighter1;
-      if (response['fighter1_id'] != null) {
-        final fighter1Response = await _client
-            .from('fighters')
-            .select('*')
-            .eq('id', response['fighter1_id'])
-            .maybeSingle();
-        
-        if (fighter1Response != null) {
-          fighter1 = Fighter.fromJson(fighter1Response);
-        }
-      }
-      
-      // Get fighter2 details
-      Fighter? fighter2;
-      if (response['fighter2_id'] != null) {
-        final fighter2Response = await _client
-            .from('fighters')
-            .select('*')
-            .eq('id', response['fighter2_id'])
-            .maybeSingle();
-        
-        if (fighter2Response != null) {
-          fighter2 = Fighter.fromJson(fighter2Response);
-        }
-      }
-      
-      // Create fight with fighter details
-      return Fight.fromJson({
-        ...response,
-        'fighter1': fighter1 != null ? fighter1.toJson() : null,
-        'fighter2': fighter2 != null ? fighter2.toJson() : null,
-      });
+      final resolved = await FetchPlanner.instance.resolve([response]);
+      return Fight.fromJson(resolved.first);
     } catch (e) {
       print('Error getting fight: $e');
       return null;
@@ -13,8 +13,13 @@ import time
 import logging
 from typing import Dict, List, Optional
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from fighter_loader import FighterLoader
+from http_client import client, create_session
+
 load_dotenv('scripts/.env')
 
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -26,7 +31,7 @@ logger = logging.getLogger(__name__)
 
 class PastEventsScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -37,6 +42,10 @@ class PastEventsScraper:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
+        self.fighters = FighterLoader(SUPABASE_URL, SUPABASE_KEY,
+                                      defaults={'weight_class': 'Unknown',
+                                                'record': {'wins': 0, 'losses': 0, 'draws': 0},
+                                                'is_active': 'Active'})
         
         # Past UFC events with known fight data
         self.past_events = [
@@ -114,7 +123,7 @@ class PastEventsScraper:
         
         try:
             # Clear fights first (due to foreign key constraints)
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id&limit=1000",
                 headers=self.headers
             )
@@ -123,14 +132,14 @@ class PastEventsScraper:
                 logger.info(f"   📊 Found {len(fights)} fights to delete")
                 
                 for fight in fights:
-                    requests.delete(
+                    client.delete(
                         f"{self.supabase_url}/rest/v1/fights?id=eq.{fight['id']}",
                         headers=self.headers
                     )
                 logger.info(f"   ✅ Deleted {len(fights)} fights")
             
             # Clear events
-            events_response = requests.get(
+            events_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id&limit=1000",
                 headers=self.headers
             )
@@ -139,7 +148,7 @@ class PastEventsScraper:
                 logger.info(f"   📊 Found {len(events)} events to delete")
                 
                 for event in events:
-                    requests.delete(
+                    client.delete(
                         f"{self.supabase_url}/rest/v1/events?id=eq.{event['id']}",
                         headers=self.headers
                     )
@@ -149,45 +158,9 @@ class PastEventsScraper:
             logger.error(f"❌ Error clearing data: {e}")
     
     def get_or_create_fighter(self, fighter_name: str) -> Optional[str]:
-        """Get or create fighter in database"""
+        """Get or create fighter through the shared fighter map"""
         try:
-            # Check if fighter exists
-            response = requests.get(
-                f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                fighters = response.json()
-                if fighters:
-                    return fighters[0]['id']
-            
-            # Create new fighter
-            fighter_to_create = {
-                'name': fighter_name,
-                'weight_class': 'Unknown',
-                'record': {'wins': 0, 'losses': 0, 'draws': 0},
-                'is_active': 'Active'
-            }
-            
-            response = requests.post(
-                f"{self.supabase_url}/rest/v1/fighters",
-                headers=self.headers,
-                json=fighter_to_create
-            )
-            
-            if response.status_code == 201:
-                # Get the created fighter ID
-                response = requests.get(
-                    f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
-                    headers=self.headers
-                )
-                if response.status_code == 200:
-                    fighters = response.json()
-                    if fighters:
-                        return fighters[0]['id']
-            
-            return None
+            return self.fighters.get_or_create(fighter_name)
             
         except Exception as e:
             logger.error(f"Error with fighter {fighter_name}: {e}")
@@ -204,7 +177,7 @@ class PastEventsScraper:
                 'status': 'completed'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/events",
                 headers=self.headers,
                 json=event_to_create
@@ -212,7 +185,7 @@ class PastEventsScraper:
             
             if response.status_code == 201:
                 # Get the created event ID
-                response = requests.get(
+                response = client.get(
                     f"{self.supabase_url}/rest/v1/events?name=eq.{event_data['name']}",
                     headers=self.headers
                 )
@@ -254,7 +227,7 @@ class PastEventsScraper:
                 'weight_class': fight_data['weight_class']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/fights",
                 headers=self.headers,
                 json=fight_to_create
@@ -290,6 +263,13 @@ class PastEventsScraper:
             total_events_created += 1
             logger.info(f"   ✅ Created event: {event_data['name']}")
             
+            # Resolve the card's fighters up front so new ones go out in one insert
+            try:
+                self.fighters.resolve_many(name for fight in event_data['fights']
+                                           for name in (fight['fighter1'], fight['fighter2']))
+            except requests.RequestException as e:
+                logger.warning(f"⚠️ Could not resolve fighters for {event_data['name']}: {e}")
+            
             # Create fights for this event
             fights_created = 0
             for fight_data in event_data['fights']:
@@ -329,7 +309,7 @@ class PastEventsScraper:
         
         try:
             # Check events
-            events_response = requests.get(
+            events_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date&limit=10",
                 headers=self.headers
             )
@@ -340,7 +320,7 @@ class PastEventsScraper:
                     logger.info(f"      ✅ {event['name']} ({event['date']})")
             
             # Check fights
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id,event_id,winner_id&limit=10",
                 headers=self.headers
             )
@@ -352,7 +332,7 @@ class PastEventsScraper:
                 logger.info(f"      ✅ Fights with winners: {len(fights_with_winners)}")
             
             # Check fighters
-            fighters_response = requests.get(
+            fighters_response = client.get(
                 f"{self.supabase_url}/rest/v1/fighters?select=id,name&limit=10",
                 headers=self.headers
             )
@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 import os
-import requests
+from http_client import client
 load_dotenv('.env')
 
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -23,7 +23,7 @@ print("Adding schema properties...")
 
 for sql in sql_commands:
     print(f"Executing: {sql}")
-    response = requests.post(
+    response = client.post(
         f'{SUPABASE_URL}/rest/v1/rpc/exec_sql',
         headers=headers,
         json={'query': sql}
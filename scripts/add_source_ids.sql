@@ -0,0 +1,16 @@
+-- Add stable source IDs for incremental syncs
+-- source_id holds the processor's deterministic ID (data/processors/ids.py), so
+-- services/supabase_sync.py can upsert and delete only what changed between runs.
+-- Existing rows start with source_id NULL; the IDs are BLAKE2b hashes Postgres
+-- can't compute, so the writers fill them in instead: supabase_sync adopts
+-- fighters by their unique name, and scripts/card_writer.py adopts events by
+-- name and date and their fights by matchup before its first upsert.
+
+ALTER TABLE fighters ADD COLUMN IF NOT EXISTS source_id TEXT;
+ALTER TABLE events ADD COLUMN IF NOT EXISTS source_id TEXT;
+ALTER TABLE fights ADD COLUMN IF NOT EXISTS source_id TEXT;
+
+-- Unique so PostgREST upserts can use on_conflict=source_id
+CREATE UNIQUE INDEX IF NOT EXISTS idx_fighters_source_id ON fighters(source_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_events_source_id ON events(source_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_fights_source_id ON fights(source_id);
@@ -6,9 +6,10 @@ Comprehensive analysis of current scrapers and scaling opportunities
 
 import os
 import json
-import requests
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
+from health_checks import HealthChecks
 
 load_dotenv('scripts/.env')
 
@@ -23,6 +24,7 @@ class ScalingStrategyAnalyzer:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
+        self.checks = HealthChecks(SUPABASE_URL, SUPABASE_KEY)
     
     def analyze_current_database_state(self):
         """Analyze current state of the database"""
@@ -30,67 +32,38 @@ class ScalingStrategyAnalyzer:
         print("=" * 50)
         
         try:
-            # Check events
-            events_response = requests.get(
-                f"{self.supabase_url}/rest/v1/events?select=id,name,date,status&order=date.desc",
+            # Table and check counts in one call (health_summary RPC)
+            summary = self.checks.summary()
+            print(f"✅ Found {summary['events']} events in database")
+            print(f"   📅 Completed events: {summary['completed_events']}")
+            print(f"   📅 Upcoming events: {summary['scheduled_events']}")
+            print(f"   ⚠️ Events without fights: {summary['events_without_fights']}")
+            
+            # Show recent events
+            events_response = client.get(
+                f"{self.supabase_url}/rest/v1/events?select=id,name,date,status&order=date.desc&limit=5",
                 headers=self.headers
             )
-            
             if events_response.status_code == 200:
-                events = events_response.json()
-                print(f"✅ Found {len(events)} events in database")
-                
-                # Analyze event distribution
-                completed_events = [e for e in events if e.get('status') == 'completed']
-                upcoming_events = [e for e in events if e.get('status') == 'scheduled']
-                
-                print(f"   📅 Completed events: {len(completed_events)}")
-                print(f"   📅 Upcoming events: {len(upcoming_events)}")
-                
-                # Show recent events
                 print("\n📋 Recent Events:")
-                for event in events[:5]:
+                for event in events_response.json():
                     print(f"   • {event['name']} ({event['date']}) - {event['status']}")
             
-            # Check fights
-            fights_response = requests.get(
-                f"{self.supabase_url}/rest/v1/fights?select=id,event_id,weight_class,result&limit=100",
-                headers=self.headers
-            )
+            # Weight class breakdowns come grouped from the weight_class_counts view
+            weight_classes = self.checks.weight_class_counts()
             
-            if fights_response.status_code == 200:
-                fights = fights_response.json()
-                print(f"\n🥊 Found {len(fights)} fights in database")
-                
-                # Analyze fight distribution
-                weight_classes = {}
-                for fight in fights:
-                    wc = fight.get('weight_class', 'Unknown')
-                    weight_classes[wc] = weight_classes.get(wc, 0) + 1
-                
-                print("   📊 Fights by weight class:")
-                for wc, count in sorted(weight_classes.items(), key=lambda x: x[1], reverse=True):
-                    print(f"      • {wc}: {count} fights")
-            
-            # Check fighters
-            fighters_response = requests.get(
-                f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class&limit=100",
-                headers=self.headers
-            )
+            print(f"\n🥊 Found {summary['fights']} fights in database")
+            print("   📊 Fights by weight class:")
+            for row in weight_classes:
+                if row['source'] == 'fights':
+                    print(f"      • {row['weight_class'] or 'Unknown'}: {row['count']} fights")
             
-            if fighters_response.status_code == 200:
-                fighters = fighters_response.json()
-                print(f"\n👊 Found {len(fighters)} fighters in database")
-                
-                # Analyze fighter distribution
-                fighter_weight_classes = {}
-                for fighter in fighters:
-                    wc = fighter.get('weight_class', 'Unknown')
-                    fighter_weight_classes[wc] = fighter_weight_classes.get(wc, 0) + 1
-                
-                print("   📊 Fighters by weight class:")
-                for wc, count in sorted(fighter_weight_classes.items(), key=lambda x: x[1], reverse=True):
-                    print(f"      • {wc}: {count} fighters")
+            print(f"\n👊 Found {summary['fighters']} fighters in database")
+            print(f"   ⚠️ Fighters without records: {summary['fighters_without_records']}")
+            print("   📊 Fighters by weight class:")
+            for row in weight_classes:
+                if row['source'] == 'fighters':
+                    print(f"      • {row['weight_class'] or 'Unknown'}: {row['count']} fighters")
             
         except Exception as e:
             print(f"❌ Error analyzing database state: {e}")
@@ -4,9 +4,9 @@ Analyze URL Generation Gap
 Analyze why certain events weren't found and compare URL generation vs actual links
 """
 
-import requests
 from bs4 import BeautifulSoup
 import logging
+from http_client import client
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,7 +18,7 @@ def analyze_url_generation_gap():
     
     try:
         logger.info(f"🔍 Loading main UFC events page: {url}")
-        response = requests.get(url, headers={
+        response = client.get(url, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         response.raise_for_status()
@@ -5,9 +5,9 @@ Apply the new columns to the fights table using Supabase REST API
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -66,7 +66,7 @@ def apply_schema_changes():
             logger.info(f"🔧 Executing statement {i+1}/{len(statements)}")
             
             try:
-                response = requests.post(
+                response = client.post(
                     f"{SUPABASE_URL}/rest/v1/rpc/exec_sql",
                     headers=headers,
                     json={'query': statement}
@@ -89,7 +89,7 @@ def apply_schema_changes():
         # Verify the changes by checking if new columns exist
         logger.info("🔍 Verifying schema changes...")
         
-        verify_response = requests.get(
+        verify_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id,winner_name,loser_name,fight_order,is_main_event,is_co_main_event,method,round,time,notes', 'limit': 1}
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 import os
-import re
+import sys
 import logging
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from parsing import parse_datetime as parse_date
 
 load_dotenv('.env')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,29 +27,10 @@ WIKI_HEADERS = {'User-Agent': 'Mozilla/5.0'}
 BASE_WIKI = 'https://en.wikipedia.org'
 
 
-def parse_date(text: str):
-    try:
-        if not text:
-            return None
-        cleaned = re.sub(r'\[[^\]]*\]', '', text).replace('\xa0', ' ')
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        iso = re.search(r'(\d{4}-\d{2}-\d{2})', cleaned)
-        if iso:
-            return datetime.strptime(iso.group(1), '%Y-%m-%d')
-        for fmt in ['%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y', '%Y-%m-%d']:
-            try:
-                return datetime.strptime(cleaned, fmt)
-            except ValueError:
-                continue
-        return None
-    except Exception:
-        return None
-
-
 def main():
     # Get all events with missing or sentinel (<= 1905-01-01) dates
     logger.info('🔍 Loading events to backfill...')
-    resp = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name,location,venue,date", headers=HEADERS)
+    resp = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name,location,venue,date", headers=HEADERS)
     resp.raise_for_status()
     events = resp.json()
 
@@ -65,7 +50,7 @@ def main():
     logger.info(f"📊 Candidates needing date backfill: {len(candidates)}")
 
     # Discover wiki links from main list page mapping by name
-    list_page = requests.get(f"{BASE_WIKI}/wiki/List_of_UFC_events", headers=WIKI_HEADERS)
+    list_page = client.get(f"{BASE_WIKI}/wiki/List_of_UFC_events", headers=WIKI_HEADERS)
     list_page.raise_for_status()
     soup = BeautifulSoup(list_page.content, 'html.parser')
 
@@ -86,7 +71,7 @@ def main():
             logger.warning(f"No wiki href for {name}")
             continue
         url = BASE_WIKI + href
-        page = requests.get(url, headers=WIKI_HEADERS)
+        page = client.get(url, headers=WIKI_HEADERS)
         page.raise_for_status()
         psoup = BeautifulSoup(page.content, 'html.parser')
         infobox = psoup.find('table', class_='infobox')
@@ -104,7 +89,7 @@ def main():
             logger.warning(f"No date parsed for {name}")
             continue
         # Update in supabase
-        patch = requests.patch(
+        patch = client.patch(
             f"{SUPABASE_URL}/rest/v1/events?id=eq.{e['id']}",
             headers=HEADERS,
             json={'date': new_date.isoformat()}
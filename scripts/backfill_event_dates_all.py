@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
+"""
+Backfill event dates from Wikipedia
+Events without a date are matched to their Wikipedia page through the links
+on List_of_UFC_events and take the date from the list's Past events table
+(event_list.py). Only events that aren't in that table fall back to the
+date in their page's infobox. The list page and every infobox read are cached
+on disk (scripts/data/wiki_cache), and the dates go back as bulk upserts.
+
+Usage: python scripts/backfill_event_dates_all.py [--all] [--refresh] [--list-page FILE]
+  --all        re-check events that already have a date
+  --refresh    re-download the list page and infoboxes
+  --list-page  read List_of_UFC_events from a saved HTML file
+"""
+import argparse
+import json
 import os
 import re
+import sys
 import logging
-import requests
-from bs4 import BeautifulSoup
+from threading import Lock
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
+from http_client import client
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from parsing import parse_datetime as parse_date
+from event_names import normalize_name, short_key
+from event_list import BASE_WIKI, CACHE_DIR, WIKI_HEADERS, load_list_page, parse_past_events
 
 load_dotenv('.env')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,160 +43,202 @@ HEADERS = {
     'Content-Type': 'application/json'
 }
 
-WIKI_HEADERS = {'User-Agent': 'Mozilla/5.0'}
-BASE_WIKI = 'https://en.wikipedia.org'
-
+UPSERT_CHUNK_SIZE = 500
+EVENT_NUMBER_RE = re.compile(r'^UFC\s+\d+\b', flags=re.I)
 
-def normalize_name(name: str) -> str:
-    name = name or ''
-    name = name.replace('\xa0', ' ')
-    name = re.sub(r'\s+', ' ', name).strip()
-    # Normalize different dash types
-    name = name.replace('–', '-').replace('—', '-')
-    return name
 
+def event_number_key(name: str):
+    """"ufc 300" for numbered events, else None"""
+    m = EVENT_NUMBER_RE.match(normalize_name(name))
+    return re.sub(r'\s+', ' ', m.group(0)).lower() if m else None
 
-def short_key(name: str) -> str:
-    name = normalize_name(name)
-    # Prefer the prefix up to the first colon for numbered events like "UFC 317: ..."
-    if ':' in name:
-        return name.split(':', 1)[0].strip().lower()
-    return name.lower()
 
-
-def parse_date(text: str):
-    try:
-        if not text:
-            return None
-        cleaned = re.sub(r'\[[^\]]*\]', '', text).replace('\xa0', ' ')
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        iso = re.search(r'(\d{4}-\d{2}-\d{2})', cleaned)
-        if iso:
-            return datetime.strptime(iso.group(1), '%Y-%m-%d')
-        for fmt in ['%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y', '%Y-%m-%d']:
-            try:
-                return datetime.strptime(cleaned, fmt)
-            except ValueError:
-                continue
-        return None
-    except Exception:
-        return None
-
-
-def build_event_link_map():
-    logger.info('🔎 Loading List of UFC events...')
-    list_page = requests.get(f"{BASE_WIKI}/wiki/List_of_UFC_events", headers=WIKI_HEADERS)
-    list_page.raise_for_status()
-    soup = BeautifulSoup(list_page.content, 'html.parser')
+def build_event_link_map(html: str):
+    """name -> href for every UFC event link in the list page's tables, plus
+    indexes by short key and by event number"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('table'))
     mapping = {}
-    rows = soup.find_all('table')
-    for table in rows:
-        for a in table.select('a[href^="/wiki/"]'):
-            txt = normalize_name(a.get_text(strip=True))
-            href = a.get('href')
-            if not href:
-                continue
-            if 'UFC' in txt and ('/wiki/UFC_' in href or '/wiki/UFC' in href):
-                mapping[txt] = href
+    for a in soup.select('a[href^="/wiki/"]'):
+        txt = normalize_name(a.get_text(strip=True))
+        href = a.get('href')
+        if not href:
+            continue
+        if 'UFC' in txt and ('/wiki/UFC_' in href or '/wiki/UFC' in href):
+            mapping[txt] = href
     logger.info(f"📚 Built wiki link map: {len(mapping)} names")
-    # Build short key index as well
+    # Build short key and event number indexes as well
     short_index = {}
+    number_index = {}
     for full, href in mapping.items():
         short_index.setdefault(short_key(full), href)
-    return mapping, short_index
+        number = event_number_key(full)
+        if number:
+            number_index.setdefault(number, href)
+    return mapping, short_index, number_index
 
 
-def find_href_for_event(name: str, mapping, short_index):
+def find_href_for_event(name: str, mapping, short_index, number_index):
     name_n = normalize_name(name)
     if name_n in mapping:
         return mapping[name_n]
     sk = short_key(name_n)
     if sk in short_index:
         return short_index[sk]
-    # Fallback: try to extract "UFC <number>" token
-    m = re.search(r'UFC\s+\d+', name_n, flags=re.I)
+    # Fallback: the "UFC <number>" token, e.g. "UFC 300 - Pereira vs. Hill"
+    m = re.search(r'UFC\s+\d+\b', name_n, flags=re.I)
     if m:
-        token = m.group(0).lower()
-        for full, href in mapping.items():
-            if full.lower().startswith(token):
-                return href
-    # Fallback: exact link title search ignoring diacritics/dashes variants handled by normalize
+        return number_index.get(event_number_key(m.group(0)))
     return None
 
 
-def fetch_and_parse_date(href: str):
-    url = BASE_WIKI + href
-    page = requests.get(url, headers=WIKI_HEADERS)
-    page.raise_for_status()
-    psoup = BeautifulSoup(page.content, 'html.parser')
-    infobox = psoup.find('table', class_='infobox')
+def parse_infobox(html: str) -> dict:
+    """label -> value for the rows of an event page's infobox"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('table', class_='infobox'))
+    infobox = soup.find('table', class_='infobox')
     if not infobox:
-        return None
+        return {}
+    fields = {}
     for row in infobox.find_all('tr'):
         cells = row.find_all(['th', 'td'])
         if len(cells) >= 2:
-            label = cells[0].get_text(strip=True).lower()
-            if 'date' in label:
-                return parse_date(cells[1].get_text(strip=True))
+            fields.setdefault(cells[0].get_text(strip=True).lower(), cells[1].get_text(strip=True))
+    return fields
+
+
+class InfoboxCache:
+    """href -> infobox fields, kept in one JSON file"""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, refresh: bool = False):
+        self.path = os.path.join(cache_dir, 'infoboxes.json')
+        self.entries = {}
+        if not refresh and os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        self.fetched = 0
+        self._lock = Lock()
+
+    def get(self, href: str) -> dict:
+        with self._lock:
+            if href in self.entries:
+                return self.entries[href]
+        page = client.get(BASE_WIKI + href, headers=WIKI_HEADERS)
+        page.raise_for_status()
+        fields = parse_infobox(page.text)
+        with self._lock:
+            self.entries[href] = fields
+            self.fetched += 1
+        return fields
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+
+
+def infobox_date(fields: dict):
+    for label, value in fields.items():
+        if 'date' in label:
+            return parse_date(value)
     return None
 
 
-def patch_event_date(event_id: str, dt: datetime):
-    r = requests.patch(
-        f"{SUPABASE_URL}/rest/v1/events?id=eq.{event_id}",
-        headers=HEADERS,
-        json={'date': dt.isoformat()}
-    )
-    return r.status_code in (200, 204)
+def load_events(missing_only: bool = True):
+    """Events to backfill, read in pages"""
+    events = []
+    params = {'select': 'id,name,date', 'order': 'id', 'limit': 1000, 'offset': 0}
+    if missing_only:
+        params['date'] = 'is.null'
+    while True:
+        resp = client.get(f"{SUPABASE_URL}/rest/v1/events", headers=HEADERS, params=params)
+        resp.raise_for_status()
+        page = resp.json()
+        events.extend(page)
+        if len(page) < params['limit']:
+            return events
+        params['offset'] += params['limit']
+
+
+def upsert_event_dates(rows):
+    """Bulk upsert [{id, name, date}]; name keeps the insert half of the upsert valid"""
+    written = 0
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+        r = client.post(
+            f"{SUPABASE_URL}/rest/v1/events",
+            headers={**HEADERS, 'Prefer': 'resolution=merge-duplicates,return=minimal'},
+            params={'on_conflict': 'id', 'columns': 'id,name,date'},
+            json=chunk
+        )
+        if r.status_code in (200, 201, 204):
+            written += len(chunk)
+        else:
+            logger.error(f"❌ Upsert failed for {len(chunk)} events: {r.status_code}")
+    return written
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Backfill event dates from Wikipedia infoboxes')
+    parser.add_argument('--all', action='store_true', help='Re-check events that already have a date')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the on-disk cache')
+    parser.add_argument('--list-page', help='Saved List_of_UFC_events HTML to read instead of downloading')
+    args = parser.parse_args()
+
     # Load DB events
     logger.info('🔍 Loading events from Supabase...')
-    resp = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name,date", headers=HEADERS)
-    resp.raise_for_status()
-    events = resp.json()
-    logger.info(f"📊 Total events: {len(events)}")
-
-    # Build wiki mapping
-    mapping, short_index = build_event_link_map()
-
-    updated = 0
+    events = load_events(missing_only=not args.all)
+    logger.info(f"📊 Events to check: {len(events)}")
+    if not events:
+        return
+
+    # Build wiki mapping and the dates listed for past events
+    list_html = load_list_page(refresh=args.refresh, source=args.list_page)
+    mapping, short_index, number_index = build_event_link_map(list_html)
+    list_dates = {event['href']: event['date'] for event in parse_past_events(list_html) if event['href']}
+    infoboxes = InfoboxCache(refresh=args.refresh)
+
+    rows = []
     skipped = 0
 
     def work(ev):
         name = ev['name']
-        ev_id = ev['id']
-        href = find_href_for_event(name, mapping, short_index)
+        href = find_href_for_event(name, mapping, short_index, number_index)
         if not href:
             logger.warning(f"No wiki href match for: {name}")
-            return False
-        dt = fetch_and_parse_date(href)
+            return None
+        if list_dates.get(href):
+            dt = datetime.fromisoformat(list_dates[href])
+        else:
+            dt = infobox_date(infoboxes.get(href))
         if not dt:
             logger.warning(f"No date parsed for: {name}")
-            return False
-        ok = patch_event_date(ev_id, dt)
-        if ok:
-            logger.info(f"✅ {name} -> {dt.date()}")
-        else:
-            logger.error(f"❌ PATCH failed for {name}")
-        return ok
+            return None
+        if ev.get('date') and ev['date'][:10] == dt.date().isoformat():
+            return None
+        logger.info(f"✅ {name} -> {dt.date()}")
+        return {'id': ev['id'], 'name': name, 'date': dt.isoformat()}
 
     # Concurrency
-    with ThreadPoolExecutor(max_workers=6) as ex:
-        futures = [ex.submit(work, ev) for ev in events]
-        for fut in as_completed(futures):
-            try:
-                if fut.result():
-                    updated += 1
-                else:
+    try:
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            futures = [ex.submit(work, ev) for ev in events]
+            for fut in as_completed(futures):
+                try:
+                    row = fut.result()
+                    if row:
+                        rows.append(row)
+                    else:
+                        skipped += 1
+                except Exception as e:
+                    logger.error(f"Thread error: {e}")
                     skipped += 1
-            except Exception as e:
-                logger.error(f"Thread error: {e}")
-                skipped += 1
+    finally:
+        infoboxes.save()
 
-    logger.info(f"🎉 Date backfill complete. Updated: {updated}, Skipped: {skipped}")
+    updated = upsert_event_dates(rows)
+    logger.info(f"🎉 Date backfill complete. Updated: {updated}, Skipped: {skipped}, "
+                f"Pages fetched: {infoboxes.fetched}")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
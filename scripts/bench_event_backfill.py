@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the event date backfill on the saved List of UFC events page
+
+Builds the wiki link map from "List of UFC events - Wikipedia.html" with the
+previous html.parser implementation and the current one, then resolves a set
+of event names shaped like the database's (full titles, bare "UFC 300",
+"UFC 300 - Subtitle" and unknown names) through both lookups. Reports the
+time for each, any names the two resolve differently (the old "UFC <number>"
+fallback was a prefix scan, so "UFC 30" could land on UFC 300's page), and
+how many event pages each approach downloads for dates: the dates of past
+events now come from the list page itself.
+
+Usage: python scripts/bench_event_backfill.py [--repeat 5] [--page FILE]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backfill_event_dates_all import build_event_link_map, find_href_for_event, event_number_key
+from event_names import normalize_name, short_key
+from event_list import parse_past_events
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DEFAULT_PAGE = os.path.join(REPO_ROOT, 'List of UFC events - Wikipedia.html')
+
+
+# Previous backfill implementation, kept as the baseline
+
+def legacy_build_event_link_map(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    mapping = {}
+    for table in soup.find_all('table'):
+        for a in table.select('a[href^="/wiki/"]'):
+            txt = normalize_name(a.get_text(strip=True))
+            href = a.get('href')
+            if not href:
+                continue
+            if 'UFC' in txt and ('/wiki/UFC_' in href or '/wiki/UFC' in href):
+                mapping[txt] = href
+    short_index = {}
+    for full, href in mapping.items():
+        short_index.setdefault(short_key(full), href)
+    return mapping, short_index
+
+
+def legacy_find_href_for_event(name, mapping, short_index):
+    name_n = normalize_name(name)
+    if name_n in mapping:
+        return mapping[name_n]
+    sk = short_key(name_n)
+    if sk in short_index:
+        return short_index[sk]
+    m = re.search(r'UFC\s+\d+', name_n, flags=re.I)
+    if m:
+        token = m.group(0).lower()
+        for full, href in mapping.items():
+            if full.lower().startswith(token):
+                return href
+    return None
+
+
+def sample_names(mapping):
+    """Event names in the shapes the events table holds"""
+    names = []
+    for full in mapping:
+        names.append(full)
+        number = event_number_key(full)
+        if number:
+            names.append(f"{number.upper()} - Main Event")
+    names += [f"UFC {n}" for n in range(1, 40)]
+    names += ['UFC Fight Night: Nobody vs. Noone', 'Bellator 300']
+    return names
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the event date backfill on a saved list page')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--page', default=DEFAULT_PAGE)
+    args = parser.parse_args()
+
+    with open(args.page, 'r', encoding='utf-8') as f:
+        html = f.read()
+    print(f"🔍 {os.path.basename(args.page)} ({len(html) / 1e6:.1f} MB)")
+
+    legacy_time, (legacy_map, legacy_short) = timed(lambda: legacy_build_event_link_map(html), args.repeat)
+    new_time, (mapping, short_index, number_index) = timed(lambda: build_event_link_map(html), args.repeat)
+    print(f"\n📚 Link map: {len(mapping)} names ({len(legacy_map)} before)")
+    print(f"   legacy   {legacy_time * 1000:8.1f} ms")
+    print(f"   current  {new_time * 1000:8.1f} ms   ({legacy_time / new_time:.1f}x)")
+
+    names = sample_names(mapping)
+    legacy_time, legacy_hrefs = timed(
+        lambda: [legacy_find_href_for_event(n, legacy_map, legacy_short) for n in names], args.repeat)
+    new_time, hrefs = timed(
+        lambda: [find_href_for_event(n, mapping, short_index, number_index) for n in names], args.repeat)
+    print(f"\n🔗 {len(names)} lookups, {sum(1 for h in hrefs if h)} resolved")
+    print(f"   legacy   {legacy_time * 1000:8.1f} ms")
+    print(f"   current  {new_time * 1000:8.1f} ms   ({legacy_time / new_time:.1f}x)")
+    changed = [(n, old, new) for n, old, new in zip(names, legacy_hrefs, hrefs) if old != new]
+    for name, old, new in changed[:10]:
+        print(f"   ⚠️ {name!r}: {old} -> {new}")
+    if len(changed) > 10:
+        print(f"   ... {len(changed) - 10} more")
+
+    # Page downloads: before, one per event on every run; now only pages whose
+    # event isn't in the Past events table, and none once their infoboxes are cached
+    list_time, past_events = timed(lambda: parse_past_events(html), args.repeat)
+    listed = {event['href'] for event in past_events if event['date']}
+    resolved = [h for h in hrefs if h]
+    print(f"\n📅 Past events table: {len(listed)} dated events in {list_time * 1000:.1f} ms")
+    print(f"\n📥 Event pages downloaded for {len(names)} events")
+    print(f"   legacy   {len(resolved)} per run")
+    print(f"   current  {len(set(resolved) - listed)} first run, 0 on reruns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark fetching the fighters and events behind a page of fights
+
+Loads a page of fights, then resolves the fighters and events they reference
+three ways: per row (two fighters?id=eq. and one events?id=eq. request per
+fight, as the app's DatabaseService did), one unchunked id=in.(...) request per
+table (performance_monitor.py's batch test), and through FetchPlanner, cold
+and again with its identity map warm. By default the target is a local
+PostgREST stand-in that adds --latency ms to every response, roughly a round
+trip to Supabase, so the numbers are repeatable offline; pass --url to
+measure the real project with SUPABASE_SERVICE_KEY from .env.
+
+Replaces performance_monitor.py.
+
+Usage: python scripts/bench_fetch_planner.py [--fights 500] [--latency 20] [--url URL]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from fetch_planner import FetchPlanner, MAX_URL_LENGTH, REFERENCES
+from http_client import supabase_session
+
+load_dotenv()
+
+
+class PostgrestHandler(BaseHTTPRequestHandler):
+    """GET /rest/v1/<table> with id=eq./in.() filters and limit, after a fixed delay"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    tables = {}
+    latency = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        rows = self.tables.get(url.path.rsplit('/', 1)[-1], [])
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        id_filter = params.get('id', '')
+        if id_filter.startswith('eq.'):
+            rows = [row for row in rows if row['id'] == id_filter[3:]]
+        elif id_filter.startswith('in.'):
+            wanted = set(id_filter[3:].strip('()').split(','))
+            rows = [row for row in rows if row['id'] in wanted]
+        if 'limit' in params:
+            rows = rows[:int(params['limit'])]
+        time.sleep(self.latency)
+
+        body = json.dumps(rows).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_local_server(fights, fighters, events, latency_ms):
+    """Local stand-in seeded with random fight cards; returns (server, url)"""
+    fighter_rows = [{'id': str(uuid.uuid4()), 'name': f"Fighter {i}", 'record': '10-2-0'} for i in range(fighters)]
+    event_rows = [{'id': str(uuid.uuid4()), 'name': f"UFC {i}", 'date': '2024-01-01T00:00:00'} for i in range(events)]
+    fight_rows = []
+    for i in range(fights):
+        fighter1, fighter2 = random.sample(fighter_rows, 2)
+        fight_rows.append({'id': str(uuid.uuid4()), 'event_id': random.choice(event_rows)['id'],
+                           'fighter1_id': fighter1['id'], 'fighter2_id': fighter2['id']})
+    PostgrestHandler.tables = {'fights': fight_rows, 'fighters': fighter_rows, 'events': event_rows}
+    PostgrestHandler.latency = latency_ms / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PostgrestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# The approaches the planner replaces
+
+def per_row(session, base_url, fights):
+    """One request per reference per fight; returns (rows found, requests)"""
+    found = requests_sent = 0
+    for fight in fights:
+        for column, (table, _) in REFERENCES.items():
+            if fight.get(column):
+                response = session.get(f"{base_url}/{table}", params={'id': f"eq.{fight[column]}"})
+                requests_sent += 1
+                found += bool(response.json())
+    return found, requests_sent
+
+
+def single_batch(session, base_url, fights):
+    """One unchunked in.() request per table; returns (rows found, requests, longest URL)"""
+    found = requests_sent = longest = 0
+    ids = {}
+    for fight in fights:
+        for column, (table, _) in REFERENCES.items():
+            if fight.get(column):
+                ids.setdefault(table, set()).add(fight[column])
+    for table, table_ids in ids.items():
+        response = session.get(f"{base_url}/{table}", params={'id': f"in.({','.join(table_ids)})"})
+        requests_sent += 1
+        longest = max(longest, len(response.url))
+        if response.ok:
+            found += len(response.json())
+    return found, requests_sent, longest
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark resolving fight references per row, batched and planned')
+    parser.add_argument('--fights', type=int, default=500, help='Fights to resolve')
+    parser.add_argument('--fighters', type=int, default=900, help='Fighters in the local stand-in')
+    parser.add_argument('--events', type=int, default=60, help='Events in the local stand-in')
+    parser.add_argument('--latency', type=float, default=20, help='Local stand-in delay per request, in ms')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--url', help='Supabase project URL to measure instead of the local stand-in')
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url, key = args.url, os.getenv('SUPABASE_SERVICE_KEY')
+        print(f"🎯 Target: {url}")
+    else:
+        server, url = start_local_server(args.fights, args.fighters, args.events, args.latency)
+        key = 'local'
+        print(f"🎯 Target: local stand-in, {args.latency:.0f} ms per request")
+
+    session = supabase_session(key)
+    base_url = f"{url}/rest/v1"
+    response = session.get(f"{base_url}/fights", params={'select': 'id,event_id,fighter1_id,fighter2_id',
+                                                         'limit': args.fights})
+    response.raise_for_status()
+    fights = response.json()
+    planner = FetchPlanner(url, session=session, max_workers=args.workers)
+    distinct = sum(len(ids) for ids in planner.referenced_ids(fights).values())
+    print(f"🥊 {len(fights)} fights, {distinct} distinct fighters and events")
+
+    print("\n📊 Resolving fighters and events")
+    per_row_time, (found, sent) = timed(lambda: per_row(session, base_url, fights))
+    print(f"   per row        {per_row_time * 1000:9.1f} ms  {sent:5d} requests  {found} rows")
+    batch_time, (found, sent, longest) = timed(lambda: single_batch(session, base_url, fights))
+    print(f"   single batch   {batch_time * 1000:9.1f} ms  {sent:5d} requests  {found} rows")
+    if longest > MAX_URL_LENGTH:
+        print(f"   ⚠️ single batch URL is {longest} chars; Supabase rejects request lines past ~8 KB")
+
+    for label in ('planner cold', 'planner warm'):
+        before = planner.requests
+        planner_time, resolved = timed(lambda: planner.resolve(fights))
+        found = sum(1 for fight in resolved for _, key in REFERENCES.values() if fight[key])
+        print(f"   {label:14} {planner_time * 1000:9.1f} ms  {planner.requests - before:5d} requests  "
+              f"{found} references resolved")
+        if label == 'planner cold':
+            cold_time = planner_time
+
+    print(f"\n🚀 Planner vs per row: {per_row_time / cold_time:.1f}x faster, "
+          f"{len(planner.cache)} rows in the identity map")
+
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled sessions against per-call requests
+
+Sends the same number of GETs from a thread pool the size of the scrapers'
+(15 workers) twice: once with module-level requests.get, which opens a new
+connection per call, and once through the shared pooled client from
+http_client.py. By default the target is a local keep-alive HTTP server, so
+the numbers are repeatable offline; pass --url to measure a real endpoint
+(a Supabase table or a Wikipedia page), where the TLS handshakes saved make
+the difference much larger.
+
+Usage: python scripts/bench_http_client.py [--requests 2000] [--workers 15] [--url URL]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from http_client import create_session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without this, Nagle's algorithm
+    # stalls every response on a kept-alive connection
+    disable_nagle_algorithm = True
+    body = b'[{"id": 1, "name": "Fighter"}]'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/rest/v1/fighters"
+
+
+def run(get, url, total, workers, headers):
+    """Requests per second and failures for `total` GETs spread over `workers` threads"""
+    failures = 0
+    lock = threading.Lock()
+
+    def one(_):
+        nonlocal failures
+        try:
+            get(url, headers=headers, timeout=30).raise_for_status()
+        except requests.RequestException:
+            with lock:
+                failures += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(one, range(total)))
+    return total / (time.perf_counter() - start), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled HTTP sessions against per-call requests')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=15)
+    parser.add_argument('--url', help='Endpoint to measure instead of the local server')
+    args = parser.parse_args()
+
+    headers = {}
+    if args.url:
+        url = args.url
+        if os.getenv('SUPABASE_SERVICE_KEY') and '/rest/v1/' in url:
+            key = os.getenv('SUPABASE_SERVICE_KEY')
+            headers = {'apikey': key, 'Authorization': f'Bearer {key}'}
+    else:
+        server, url = start_local_server()
+
+    print(f"🔍 {args.requests} GETs to {url} with {args.workers} workers")
+    session = create_session(pool_maxsize=args.workers)
+    # Warm the pool so both runs measure steady state
+    run(session.get, url, args.workers, args.workers, headers)
+
+    results = {}
+    for label, get in (('requests', requests.get), ('pooled', session.get)):
+        results[label] = run(get, url, args.requests, args.workers, headers)
+        rate, failures = results[label]
+        print(f"   {label:8s} {rate:10,.0f} req/s   {failures} failed")
+
+    speedup = results['pooled'][0] / results['requests'][0]
+    print(f"\n{'✅' if speedup >= 1 else '⚠️'} Pooled sessions: {speedup:.1f}x the per-call throughput")
+
+    if not args.url:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,13 @@
 #!/usr/bin/env python3
 """
 Calculate Rankings Fighter Records
-Calculate fighter records specifically for ranked fighters
+Calculate fighter records specifically for ranked fighters that don't have one
+yet, reading their fights in bulk through record_engine.py
 """
 
-import os
-import sys
-import requests
 import logging
-import json
 from dotenv import load_dotenv
+from record_engine import RecordEngine
 
 load_dotenv('scripts/.env')
 
@@ -17,191 +15,38 @@ load_dotenv('scripts/.env')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
-
 class RankingsRecordCalculator:
     def __init__(self):
-        self.supabase_headers = {
-            'apikey': SUPABASE_KEY,
-            'Authorization': f'Bearer {SUPABASE_KEY}',
-            'Content-Type': 'application/json',
-        }
-    
-    def get_ranked_fighters(self):
-        """Get all fighters who are in rankings"""
-        try:
-            response = requests.get(
-                f"{SUPABASE_URL}/rest/v1/rankings?select=fighter_id",
-                headers=self.supabase_headers
-            )
-            
-            if response.status_code == 200:
-                rankings = response.json()
-                # Get unique fighter IDs
-                fighter_ids = list(set([ranking['fighter_id'] for ranking in rankings]))
-                logger.info(f"📊 Found {len(fighter_ids)} unique ranked fighters")
-                return fighter_ids
-            else:
-                logger.error(f"❌ Error getting rankings: {response.status_code}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"❌ Error getting rankings: {str(e)}")
-            return []
-    
-    def get_fighter_details(self, fighter_id):
-        """Get fighter details by ID"""
-        try:
-            response = requests.get(
-                f"{SUPABASE_URL}/rest/v1/fighters?id=eq.{fighter_id}&select=id,name,record",
-                headers=self.supabase_headers
-            )
-            
-            if response.status_code == 200:
-                fighters = response.json()
-                return fighters[0] if fighters else None
-            else:
-                logger.error(f"❌ Error getting fighter {fighter_id}: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ Error getting fighter {fighter_id}: {str(e)}")
-            return None
-    
-    def get_fighter_fights(self, fighter_id):
-        """Get all fights for a specific fighter"""
-        try:
-            # Get fights where fighter is fighter1 or fighter2
-            response = requests.get(
-                f"{SUPABASE_URL}/rest/v1/fights?select=*&or=(fighter1_id.eq.{fighter_id},fighter2_id.eq.{fighter_id})",
-                headers=self.supabase_headers
-            )
-            
-            if response.status_code == 200:
-                fights = response.json()
-                return fights
-            else:
-                logger.error(f"❌ Error getting fights for fighter {fighter_id}: {response.status_code}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"❌ Error getting fights for fighter {fighter_id}: {str(e)}")
-            return []
-    
-    def calculate_fighter_record(self, fighter_id, fights):
-        """Calculate fighter record from fights"""
-        wins = 0
-        losses = 0
-        draws = 0
-        
-        for fight in fights:
-            result = fight.get('result')
-            if not result:
-                continue
-                
-            winner_id = result.get('winner_id')
-            
-            if winner_id == fighter_id:
-                wins += 1
-            elif winner_id is not None:  # There's a winner but it's not this fighter
-                losses += 1
-            else:
-                # No winner means draw or no contest
-                draws += 1
-        
-        return {
-            'wins': wins,
-            'losses': losses,
-            'draws': draws,
-            'total': wins + losses + draws
-        }
-    
-    def update_fighter_record(self, fighter_id, record):
-        """Update fighter record in database"""
-        try:
-            record_string = f"{record['wins']}-{record['losses']}-{record['draws']}"
-            
-            response = requests.patch(
-                f"{SUPABASE_URL}/rest/v1/fighters?id=eq.{fighter_id}",
-                headers=self.supabase_headers,
-                json={'record': record_string}
-            )
-            
-            if response.status_code == 204:
-                logger.info(f"✅ Updated fighter {fighter_id}: {record_string}")
-                return True
-            else:
-                logger.error(f"❌ Error updating fighter {fighter_id}: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ Error updating fighter {fighter_id}: {str(e)}")
-            return False
+        self.engine = RecordEngine()
     
     def calculate_rankings_records(self):
         """Calculate records for ranked fighters only"""
         logger.info("🚀 Starting rankings fighter record calculation")
         logger.info("=" * 60)
         
-        # Get ranked fighters
-        fighter_ids = self.get_ranked_fighters()
-        if not fighter_ids:
-            logger.error("❌ No ranked fighters found")
-            return
-        
-        total_fighters = len(fighter_ids)
-        updated_count = 0
-        error_count = 0
-        skipped_count = 0
-        
-        for i, fighter_id in enumerate(fighter_ids, 1):
-            # Get fighter details
-            fighter = self.get_fighter_details(fighter_id)
-            if not fighter:
-                logger.warning(f"⚠️ Fighter {fighter_id} not found")
-                error_count += 1
-                continue
-            
-            fighter_name = fighter['name']
-            current_record = fighter.get('record')
-            
-            logger.info(f"📊 Processing {i}/{total_fighters}: {fighter_name}")
-            
-            # Skip if already has a record
-            if current_record and current_record != 'None':
-                logger.info(f"  ⏭️ Already has record: {current_record}")
-                skipped_count += 1
-                continue
-            
-            # Get fighter's fights
-            fights = self.get_fighter_fights(fighter_id)
-            
-            if not fights:
-                logger.info(f"  ⚠️ No fights found for {fighter_name}")
-                continue
-            
-            # Calculate record
-            record = self.calculate_fighter_record(fighter_id, fights)
-            
-            logger.info(f"  📈 {fighter_name}: {record['wins']}-{record['losses']}-{record['draws']} ({record['total']} fights)")
+        try:
+            fighter_ids = self.engine.fetch_ranked_fighter_ids()
+            if not fighter_ids:
+                logger.error("❌ No ranked fighters found")
+                return None
+            logger.info(f"📊 Found {len(fighter_ids)} unique ranked fighters")
             
-            # Update fighter record
-            if self.update_fighter_record(fighter_id, record):
-                updated_count += 1
-            else:
-                error_count += 1
+            # Fighters that already have a record are left alone
+            summary = self.engine.recompute(fighter_ids, only_missing=True)
+        except Exception as e:
+            logger.error(f"❌ Error calculating rankings records: {str(e)}")
+            return None
         
         logger.info("=" * 60)
         logger.info(f"🎉 Rankings record calculation completed!")
-        logger.info(f"✅ Updated: {updated_count} fighters")
-        logger.info(f"⏭️ Skipped (already had records): {skipped_count} fighters")
-        logger.info(f"❌ Errors: {error_count} fighters")
-        logger.info(f"📊 Total processed: {total_fighters} fighters")
+        logger.info(f"✅ Updated: {summary['changed']} fighters")
+        logger.info(f"⏭️ Skipped (already had records): {len(fighter_ids) - summary['fighters']} fighters")
+        logger.info(f"📊 Total processed: {len(fighter_ids)} fighters")
+        return summary
 
 def main():
     calculator = RankingsRecordCalculator()
     calculator.calculate_rankings_records()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Card Writer
+Bulk PostgREST writes for event cards. An event and all of its fights go out
+as two array upserts (events, then fights) keyed on the stable source_id
+column (scripts/add_source_ids.sql) instead of a POST plus a re-GET per row,
+and cards can be buffered and flushed together in bounded batches.
+
+Rows are plain column dicts that must carry a source_id; fight rows get their
+event_id filled in from the event upsert.
+
+Rows written before the source_id column existed have source_id NULL, and
+events.name isn't unique, so a plain upsert would insert a second copy of
+each. Before upserting, the writer adopts those rows instead: an event with
+the same name (and the same date, where both have one) and, on that event, a
+fight between the same two fighters get the new source_id written onto them,
+so the upsert then updates them in place. services/supabase_sync.py runs the
+same adoption before its delta upserts.
+
+Source IDs come from data/processors/ids.py, so an event gets the same
+source_id here as from the processor (normalized title and date).
+"""
+
+import os
+import sys
+import logging
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+import ids
+from indexes import normalize_fighter_name
+from http_client import supabase_session
+
+logger = logging.getLogger(__name__)
+
+# Rows per upsert request
+BATCH_ROWS = 500
+UPSERT_PREFER = 'return=representation,resolution=merge-duplicates'
+ADOPT_PREFER = 'return=minimal,resolution=merge-duplicates'
+# Values per in.() filter, so URLs stay short
+FILTER_CHUNK_SIZE = 50
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _quoted(value: str) -> str:
+    """A value inside a PostgREST in.() list"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _matchup(fight: Dict) -> Optional[tuple]:
+    """The bout's two fighters, by ids or else by names, in either corner; None when unknown"""
+    ids_pair = (fight.get('fighter1_id'), fight.get('fighter2_id'))
+    if all(ids_pair):
+        return ('id',) + tuple(sorted(map(str, ids_pair)))
+    for columns in (('fighter1_name', 'fighter2_name'), ('winner_name', 'loser_name')):
+        names = tuple(normalize_fighter_name(fight.get(column)) for column in columns)
+        if all(names):
+            return ('name',) + tuple(sorted(names))
+    return None
+
+
+def event_source_id(event_name: str, event_date: Optional[str]) -> str:
+    return ids.event_id(title=event_name, date=event_date)
+
+
+def fight_source_id(event_name: str, event_date: Optional[str], fighter1: str, fighter2: str,
+                    occurrence: int = 1) -> str:
+    return ids.fight_id(fighter1, fighter2, ids.event_key(title=event_name, date=event_date), occurrence)
+
+
+def fight_source_ids(event_name: str, event_date: Optional[str], pairs: List[Tuple[str, str]]) -> List[str]:
+    """Source IDs for a card's bouts in card order; only a rematch on the same card is numbered"""
+    return [fight_source_id(event_name, event_date, fighter1, fighter2, occurrence)
+            for (fighter1, fighter2), occurrence in zip(pairs, ids.pairing_occurrences(pairs))]
+
+
+class CardWriter:
+    """Upserts events and their fights in bulk.
+
+    write_card() writes one card straight away; add_card() buffers cards
+    (from any thread) and flushes them together once batch_rows fights are
+    waiting. Both return {event source_id: (event id, [fight ids])}.
+    """
+
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 batch_rows: int = BATCH_ROWS, timeout: int = 30):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        self.session = supabase_session(supabase_key)
+        self.batch_rows = batch_rows
+        self.timeout = timeout
+
+        self._pending: List[Tuple[Dict, List[Dict]]] = []
+        self._pending_fights = 0
+        self._lock = Lock()
+
+    def _upsert(self, table: str, rows: List[Dict]) -> Dict[str, str]:
+        """source_id -> id for the upserted rows"""
+        # A row may only be upserted once per statement, so the last copy of a source_id wins
+        unique_rows = list({row['source_id']: row for row in rows}.values())
+        stored = {}
+        for chunk in _chunks(unique_rows, self.batch_rows):
+            response = self.session.post(
+                f"{self.base_url}/{table}",
+                params={'on_conflict': 'source_id', 'select': 'id,source_id'},
+                headers={'Prefer': UPSERT_PREFER},
+                json=chunk,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            stored.update({row['source_id']: row['id'] for row in response.json()})
+        return stored
+
+    def _select(self, table: str, params: Dict) -> List[Dict]:
+        response = self.session.get(f"{self.base_url}/{table}", params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _adopt(self, table: str, rows: List[Dict]):
+        """Write source_id onto existing rows ({id, name?, source_id}) in one upsert on id"""
+        if not rows:
+            return
+        columns = ','.join(rows[0])
+        for chunk in _chunks(rows, self.batch_rows):
+            response = self.session.post(
+                f"{self.base_url}/{table}",
+                params={'on_conflict': 'id', 'columns': columns},
+                headers={'Prefer': ADOPT_PREFER},
+                json=chunk,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+        logger.info(f"🔗 Adopted {len(rows)} existing {table} rows")
+
+    def adopt_events(self, events: List[Dict]):
+        """Give events stored without a source_id the source_id of the matching new row"""
+        names = sorted({event['name'] for event in events if event.get('name')})
+        legacy = defaultdict(list)
+        for chunk in _chunks(names, FILTER_CHUNK_SIZE):
+            for row in self._select('events', {
+                'select': 'id,name,date', 'source_id': 'is.null',
+                'name': f"in.({','.join(_quoted(name) for name in chunk)})", 'order': 'created_at,id'
+            }):
+                legacy[row['name']].append(row)
+
+        adopted = []
+        for event in events:
+            candidates = legacy.get(event.get('name'), [])
+            date = (event.get('date') or '')[:10]
+            # Same date first, then rows with no date to compare
+            match = next((row for row in candidates if date and (row.get('date') or '')[:10] == date), None) \
+                or next((row for row in candidates if not row.get('date') or not date), None)
+            if match:
+                candidates.remove(match)
+                adopted.append({'id': match['id'], 'name': match['name'], 'source_id': event['source_id']})
+        self._adopt('events', adopted)
+
+    def adopt_fights(self, fights: List[Dict]):
+        """Give fights stored without a source_id, on the same event and between the same
+        fighters, the source_id of the matching new row"""
+        event_ids = sorted({fight['event_id'] for fight in fights})
+        legacy = defaultdict(list)
+        for chunk in _chunks(event_ids, FILTER_CHUNK_SIZE):
+            # * rather than a column list: older tables have fighter names instead of ids
+            for row in self._select('fights', {
+                'select': '*', 'source_id': 'is.null', 'event_id': f"in.({','.join(chunk)})", 'order': 'id'
+            }):
+                matchup = _matchup(row)
+                if matchup:
+                    legacy[(row['event_id'], matchup)].append(row)
+
+        adopted = []
+        for fight in fights:
+            candidates = legacy.get((fight['event_id'], _matchup(fight)))
+            if candidates:
+                adopted.append({'id': candidates.pop(0)['id'], 'event_id': fight['event_id'],
+                                'source_id': fight['source_id']})
+        self._adopt('fights', adopted)
+
+    def _write(self, cards: List[Tuple[Dict, List[Dict]]]) -> Dict[str, Tuple[str, List[str]]]:
+        if not cards:
+            return {}
+        events = [event for event, _ in cards]
+        self.adopt_events(events)
+        event_ids = self._upsert('events', events)
+
+        fight_rows = []
+        for event, fights in cards:
+            event_id = event_ids.get(event['source_id'])
+            if event_id:
+                fight_rows.extend({**fight, 'event_id': event_id} for fight in fights)
+        self.adopt_fights(fight_rows)
+        fight_ids = self._upsert('fights', fight_rows)
+
+        results = {}
+        for event, fights in cards:
+            event_id = event_ids.get(event['source_id'])
+            if event_id:
+                results[event['source_id']] = (
+                    event_id, [fight_ids[fight['source_id']] for fight in fights if fight['source_id'] in fight_ids]
+                )
+        return results
+
+    def write_card(self, event_row: Dict, fight_rows: List[Dict]) -> Tuple[Optional[str], List[str]]:
+        """Upsert one event and its fights now; (event id, fight ids)"""
+        return self._write([(event_row, fight_rows)]).get(event_row['source_id'], (None, []))
+
+    def add_card(self, event_row: Dict, fight_rows: List[Dict]) -> Dict[str, Tuple[str, List[str]]]:
+        """Buffer a card, flushing every buffered card once the batch is full"""
+        with self._lock:
+            self._pending.append((event_row, fight_rows))
+            self._pending_fights += len(fight_rows)
+            if self._pending_fights < self.batch_rows:
+                return {}
+            cards, self._pending, self._pending_fights = self._pending, [], 0
+        return self._write(cards)
+
+    def flush(self) -> Dict[str, Tuple[str, List[str]]]:
+        with self._lock:
+            cards, self._pending, self._pending_fights = self._pending, [], 0
+        results = self._write(cards)
+        if cards:
+            logger.info(f"✅ Wrote {len(results)}/{len(cards)} event cards")
+        return results
@@ -5,9 +5,9 @@ Check the current fight data to understand the update issue
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def check_current_fights():
         logger.info("🔍 Checking current fight data...")
         
         # Get a sample fight to understand the structure
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': '*', 'limit': 1}
@@ -53,7 +53,7 @@ def check_current_fights():
                 logger.info(f"\n🧪 Testing update for fight {fight_id}")
                 
                 # Try PATCH
-                patch_response = requests.patch(
+                patch_response = client.patch(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'id': f'eq.{fight_id}'},
@@ -65,7 +65,7 @@ def check_current_fights():
                     logger.info(f"   PATCH error: {patch_response.text}")
                 
                 # Try PUT
-                put_response = requests.put(
+                put_response = client.put(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'id': f'eq.{fight_id}'},
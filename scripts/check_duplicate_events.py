@@ -5,9 +5,9 @@ Check for duplicate events in the database
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from health_checks import HealthChecks
 
 load_dotenv('.env')
 
@@ -25,67 +25,30 @@ def check_duplicate_events():
         logger.error("❌ Missing Supabase credentials")
         return False
     
-    headers = {
-        'apikey': SUPABASE_KEY,
-        'Authorization': f'Bearer {SUPABASE_KEY}',
-        'Content-Type': 'application/json',
-    }
+    checks = HealthChecks(SUPABASE_URL, SUPABASE_KEY)
     
     try:
-        # Get all events
-        logger.info("🔍 Checking all events...")
-        events_response = requests.get(
-            f"{SUPABASE_URL}/rest/v1/events",
-            headers=headers,
-            params={'select': 'id,name,date', 'order': 'date.desc'}
-        )
+        # Duplicates are grouped by the database (duplicate_event_names view)
+        logger.info("🔍 Checking for duplicate events:")
+        duplicates = checks.duplicate_event_names()
+        logger.info(f"📊 Found {len(duplicates)} duplicated events")
         
-        if events_response.status_code == 200:
-            events = events_response.json()
-            logger.info(f"📊 Found {len(events)} total events")
-            
-            # Group by name to find duplicates
-            event_groups = {}
-            for event in events:
-                name = event.get('name', 'Unknown')
-                if name not in event_groups:
-                    event_groups[name] = []
-                event_groups[name].append(event)
-            
-            # Show duplicates
-            logger.info("🔍 Checking for duplicate events:")
-            for name, event_list in event_groups.items():
-                if len(event_list) > 1:
-                    logger.warning(f"⚠️ DUPLICATE: '{name}' has {len(event_list)} instances:")
-                    for i, event in enumerate(event_list):
-                        logger.warning(f"   {i+1}. ID: {event['id']}, Date: {event.get('date', 'N/A')}")
-                    
-                    # Check which ones have fights
-                    for i, event in enumerate(event_list):
-                        fights_response = requests.get(
-                            f"{SUPABASE_URL}/rest/v1/fights",
-                            headers=headers,
-                            params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
-                        )
-                        if fights_response.status_code == 200:
-                            fights = fights_response.json()
-                            logger.info(f"   {i+1}. Event {event['id']}: {len(fights)} fights")
-                        else:
-                            logger.warning(f"   {i+1}. Event {event['id']}: Error checking fights")
-                    logger.info("   ---")
-            
-            # Show events with fights
-            logger.info("🔍 Events with fights:")
-            for event in events:
-                fights_response = requests.get(
-                    f"{SUPABASE_URL}/rest/v1/fights",
-                    headers=headers,
-                    params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
-                )
-                if fights_response.status_code == 200:
-                    fights = fights_response.json()
-                    if len(fights) > 0:
-                        logger.info(f"✅ '{event.get('name', 'Unknown')}' (ID: {event['id']}): {len(fights)} fights")
+        if duplicates:
+            # Fight counts for every copy in one request
+            event_ids = [event_id for duplicate in duplicates for event_id in duplicate['event_ids']]
+            counts = {row['event_id']: row for row in checks.event_fight_counts(event_id=f"in.({','.join(event_ids)})")}
+            for duplicate in duplicates:
+                logger.warning(f"⚠️ DUPLICATE: '{duplicate['name']}' has {duplicate['copies']} instances:")
+                for i, event_id in enumerate(duplicate['event_ids']):
+                    event = counts.get(event_id, {})
+                    logger.warning(f"   {i+1}. ID: {event_id}, Date: {event.get('date', 'N/A')}, "
+                                   f"{event.get('fights', 0)} fights")
+                logger.info("   ---")
+        
+        # Show events with fights
+        logger.info("🔍 Events with fights:")
+        for event in checks.event_fight_counts(fights='gt.0'):
+            logger.info(f"✅ '{event.get('name', 'Unknown')}' (ID: {event['event_id']}): {event['fights']} fights")
         
         return True
         
@@ -5,8 +5,8 @@ Check how many events are actually in the database
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -26,7 +26,7 @@ def check_event_count():
     
     try:
         # Get total count
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1000", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1000", headers=headers)
         if response.status_code == 200:
             events = response.json()
             print(f"✅ Total events in database: {len(events)}")
@@ -5,9 +5,9 @@ See what's in the events table
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def check_events():
     try:
         # Get first few events
         logger.info("🔍 Checking events table...")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,title,date', 'limit': 5}
@@ -50,7 +50,7 @@ def check_events():
             logger.warning(f"⚠️ Response: {events_response.text}")
         
         # Get total count
-        count_response = requests.get(
+        count_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id'}
@@ -5,9 +5,10 @@ Check the fight_order values and main event identification
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
+from health_checks import HealthChecks
 
 load_dotenv('.env')
 
@@ -29,12 +30,23 @@ def check_fight_ordering():
         'Authorization': f'Bearer {SUPABASE_KEY}',
         'Content-Type': 'application/json',
     }
+    checks = HealthChecks(SUPABASE_URL, SUPABASE_KEY)
     
     try:
         logger.info("🔍 Checking fight ordering and main event identification...")
         
+        # Mismatches across every event come from the fight_order_mismatches view
+        mismatches = checks.fight_order_mismatches()
+        if mismatches:
+            logger.warning(f"⚠️ {len(mismatches)} fights whose fight_order disagrees with the main/co-main flags")
+            for fight in mismatches[:20]:
+                logger.warning(f"   Event {fight['event_id']}: fight_order {fight['fight_order']}, "
+                               f"main={fight['is_main_event']}, co-main={fight['is_co_main_event']}")
+        else:
+            logger.info("✅ fight_order matches the main/co-main flags on every fight")
+        
         # Get recent events
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 3}
@@ -44,47 +56,45 @@ def check_fight_ordering():
             events = events_response.json()
             logger.info(f"📊 Found {len(events)} recent events")
             
-            for event in events:
-                logger.info(f"\n🎯 Event: {event.get('name', 'Unknown')}")
-                logger.info(f"   ID: {event['id']}")
-                
-                # Get fights for this event ordered by fight_order
-                fights_response = requests.get(
+            # Fights for all of them in one request, ordered by fight_order
+            fights_by_event = {}
+            if events:
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={
-                        'event_id': f'eq.{event["id"]}',
-                        'select': 'winner_name,loser_name,method,fight_order,is_main_event,is_co_main_event,weight_class',
+                        'event_id': f"in.({','.join(event['id'] for event in events)})",
+                        'select': 'event_id,winner_name,loser_name,method,fight_order,is_main_event,is_co_main_event,weight_class',
                         'order': 'fight_order.asc'
                     }
                 )
+                if fights_response.status_code != 200:
+                    logger.warning(f"   ⚠️ Error getting fights: {fights_response.status_code}")
+                    return False
+                for fight in fights_response.json():
+                    fights_by_event.setdefault(fight['event_id'], []).append(fight)
+            
+            for event in events:
+                logger.info(f"\n🎯 Event: {event.get('name', 'Unknown')}")
+                logger.info(f"   ID: {event['id']}")
                 
-                if fights_response.status_code == 200:
-                    fights = fights_response.json()
-                    logger.info(f"   📊 {len(fights)} fights (ordered by fight_order):")
+                fights = fights_by_event.get(event['id'], [])
+                logger.info(f"   📊 {len(fights)} fights (ordered by fight_order):")
+                
+                for fight in fights:
+                    winner = fight.get('winner_name', 'N/A')
+                    loser = fight.get('loser_name', 'N/A')
+                    method = fight.get('method', 'N/A')
+                    order = fight.get('fight_order', 'N/A')
+                    is_main = fight.get('is_main_event', False)
+                    is_co_main = fight.get('is_co_main_event', False)
+                    weight = fight.get('weight_class', 'N/A')
                     
-                    for fight in fights:
-                        winner = fight.get('winner_name', 'N/A')
-                        loser = fight.get('loser_name', 'N/A')
-                        method = fight.get('method', 'N/A')
-                        order = fight.get('fight_order', 'N/A')
-                        is_main = fight.get('is_main_event', False)
-                        is_co_main = fight.get('is_co_main_event', False)
-                        weight = fight.get('weight_class', 'N/A')
-                        
-                        main_text = " (MAIN EVENT)" if is_main else ""
-                        co_main_text = " (CO-MAIN)" if is_co_main else ""
-                        event_text = main_text + co_main_text
-                        
-                        logger.info(f"      {order}. {winner} def. {loser} - {method} - {weight}{event_text}")
-                        
-                        # Check if fight_order matches is_main_event
-                        if order == 1 and not is_main:
-                            logger.warning(f"      ⚠️ Fight order {order} but is_main_event is {is_main}")
-                        elif order == 2 and not is_co_main:
-                            logger.warning(f"      ⚠️ Fight order {order} but is_co_main_event is {is_co_main}")
-                else:
-                    logger.warning(f"   ⚠️ Error getting fights: {fights_response.status_code}")
+                    main_text = " (MAIN EVENT)" if is_main else ""
+                    co_main_text = " (CO-MAIN)" if is_co_main else ""
+                    event_text = main_text + co_main_text
+                    
+                    logger.info(f"      {order}. {winner} def. {loser} - {method} - {weight}{event_text}")
         
         return True
         
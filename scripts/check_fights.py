@@ -5,9 +5,9 @@ Check what fights are in the database
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def check_fights():
     try:
         # Get all fights
         logger.info("🔍 Checking fights table...")
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id,event_id,winner_name,loser_name,fight_order,is_main_event,weight_class,method', 'limit': 10}
@@ -58,7 +58,7 @@ def check_fights():
             logger.warning(f"⚠️ Response: {fights_response.text}")
         
         # Get total count
-        count_response = requests.get(
+        count_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id'}
@@ -70,7 +70,7 @@ def check_fights():
         
         # Check events
         logger.info("🔍 Checking events table...")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name', 'limit': 5}
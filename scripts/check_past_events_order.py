@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -13,7 +13,7 @@ headers = {
 
 def main():
     # Fetch past events ordered by date desc
-    r = requests.get(f"{SUPABASE_URL}/rest/v1/events?order=date.desc&select=id,name,date,location", headers=headers)
+    r = client.get(f"{SUPABASE_URL}/rest/v1/events?order=date.desc&select=id,name,date,location", headers=headers)
     r.raise_for_status()
     events = r.json()
     print(f"Total events: {len(events)}")
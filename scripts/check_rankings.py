@@ -5,9 +5,9 @@ Simple script to check how many rankings are in the database
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -28,7 +28,7 @@ def check_rankings():
     }
     
     try:
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/rankings?select=id",
             headers=headers
         )
@@ -5,9 +5,9 @@ Check the actual schema of the events and fights tables
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -36,7 +36,7 @@ def check_schema():
         logger.info("🔍 Checking events table schema...")
         
         # Try to get a single event with all possible columns
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date,venue,location,type', 'limit': 1}
@@ -58,7 +58,7 @@ def check_schema():
         # Check fights table schema
         logger.info("🔍 Checking fights table schema...")
         
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id,event_id,fighter1_id,fighter2_id,date,weight_class,rounds,result,winner_id,method,round,time,is_main_event,is_title_fight,status,winner_name,loser_name,fight_order,is_co_main_event,notes', 'limit': 1}
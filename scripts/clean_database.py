@@ -5,9 +5,9 @@ Remove duplicates and empty fights from the database
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def clean_database():
         logger.info("🧹 Cleaning database...")
         
         # Get all fights
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id,winner_name,loser_name,event_id'}
@@ -72,7 +72,7 @@ def clean_database():
             # Delete the fights
             deleted_count = 0
             for fight_id in fights_to_delete:
-                delete_response = requests.delete(
+                delete_response = client.delete(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'id': f'eq.{fight_id}'}
@@ -86,7 +86,7 @@ def clean_database():
             logger.info(f"✅ Deleted {deleted_count} fights")
             
             # Verify cleanup
-            remaining_response = requests.get(
+            remaining_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=headers,
                 params={'select': 'id'}
@@ -97,7 +97,7 @@ def clean_database():
                 logger.info(f"📊 Remaining fights: {len(remaining_fights)}")
                 
                 # Show sample of remaining fights
-                sample_response = requests.get(
+                sample_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'select': 'winner_name,loser_name,method,fight_order', 'limit': 5}
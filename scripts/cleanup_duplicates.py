@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """
 Cleanup Duplicates
-Delete duplicate events that have no fights
+Merge duplicate events: keep the copy with the most fights, move over any
+fights it's missing and delete the rest in bulk (event_dedup.py).
+
+Usage: python scripts/cleanup_duplicates.py [--dry-run]
 """
 
 import os
-import requests
+import sys
 import logging
 from dotenv import load_dotenv
+from event_dedup import EventDeduper
 
 load_dotenv('.env')
 
@@ -18,140 +22,40 @@ logger = logging.getLogger(__name__)
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
-def cleanup_duplicates():
-    """Delete duplicate events that have no fights"""
+def cleanup_duplicates(dry_run=False):
+    """Merge duplicate events; with dry_run only print what would change"""
     
     if not SUPABASE_URL or not SUPABASE_KEY:
         logger.error("❌ Missing Supabase credentials")
         return False
     
-    headers = {
-        'apikey': SUPABASE_KEY,
-        'Authorization': f'Bearer {SUPABASE_KEY}',
-        'Content-Type': 'application/json',
-    }
+    deduper = EventDeduper(SUPABASE_URL, SUPABASE_KEY)
     
     try:
-        # Get all events
-        logger.info("🔍 Getting all events...")
-        events_response = requests.get(
-            f"{SUPABASE_URL}/rest/v1/events",
-            headers=headers,
-            params={'select': 'id,name,date', 'order': 'date.desc'}
-        )
-        
-        if events_response.status_code != 200:
-            logger.error(f"❌ Could not get events: {events_response.status_code}")
-            return False
-        
-        all_events = events_response.json()
-        logger.info(f"📊 Found {len(all_events)} total events")
-        
-        # Group events by name
-        event_groups = {}
-        for event in all_events:
-            name = event.get('name', 'Unknown')
-            if name not in event_groups:
-                event_groups[name] = []
-            event_groups[name].append(event)
+        logger.info("🔍 Getting all events with fight counts...")
+        groups = deduper.plan()
+        logger.info(f"📊 Found {len(groups)} duplicated events")
         
-        # Find events to delete (duplicates with no fights)
-        events_to_delete = []
+        for line in deduper.diff(groups):
+            logger.info(f"   {line}")
         
-        for name, event_list in event_groups.items():
-            if len(event_list) > 1:
-                logger.info(f"🔍 Processing duplicates for '{name}' ({len(event_list)} instances)")
-                
-                # Check which ones have fights
-                events_with_fights = []
-                events_without_fights = []
-                
-                for event in event_list:
-                    fights_response = requests.get(
-                        f"{SUPABASE_URL}/rest/v1/fights",
-                        headers=headers,
-                        params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
-                    )
-                    
-                    if fights_response.status_code == 200:
-                        fights = fights_response.json()
-                        if len(fights) > 0:
-                            events_with_fights.append(event)
-                            logger.info(f"   ✅ Event {event['id']}: {len(fights)} fights (KEEP)")
-                        else:
-                            events_without_fights.append(event)
-                            logger.info(f"   ❌ Event {event['id']}: 0 fights (DELETE)")
-                    else:
-                        events_without_fights.append(event)
-                        logger.info(f"   ❌ Event {event['id']}: Error checking fights (DELETE)")
-                
-                # Keep the first event with fights, delete the rest
-                if events_with_fights:
-                    # Keep only the first event with fights
-                    keep_event = events_with_fights[0]
-                    logger.info(f"   🎯 Keeping event {keep_event['id']} with fights")
-                    
-                    # Delete all other events (including other events with fights)
-                    for event in event_list:
-                        if event['id'] != keep_event['id']:
-                            events_to_delete.append(event)
-                            logger.info(f"   🗑️ Marking for deletion: {event['id']}")
-                else:
-                    # If no events have fights, keep the first one
-                    keep_event = event_list[0]
-                    logger.info(f"   🎯 No events have fights, keeping first: {keep_event['id']}")
-                    
-                    # Delete all other events
-                    for event in event_list[1:]:
-                        events_to_delete.append(event)
-                        logger.info(f"   🗑️ Marking for deletion: {event['id']}")
-        
-        # Delete the marked events
-        logger.info(f"\n🗑️ Deleting {len(events_to_delete)} duplicate events...")
-        deleted_count = 0
-        
-        for event in events_to_delete:
-            try:
-                delete_response = requests.delete(
-                    f"{SUPABASE_URL}/rest/v1/events",
-                    headers=headers,
-                    params={'id': f'eq.{event["id"]}'}
-                )
-                
-                if delete_response.status_code == 200:
-                    deleted_count += 1
-                    logger.info(f"   ✅ Deleted event {event['id']} ({event.get('name', 'Unknown')})")
-                else:
-                    logger.warning(f"   ⚠️ Failed to delete event {event['id']}: {delete_response.status_code}")
-                    
-            except Exception as e:
-                logger.error(f"   ❌ Error deleting event {event['id']}: {e}")
+        if dry_run:
+            logger.info("🔍 Dry run, nothing changed")
+            return True
         
+        moved = sum(len(group.move) for group in groups)
+        deleted_count = deduper.apply(groups)
         logger.info(f"\n📊 Cleanup completed!")
+        logger.info(f"   ✅ Re-pointed {moved} fights")
         logger.info(f"   ✅ Deleted {deleted_count} duplicate events")
         
         # Verify the cleanup
         logger.info("\n🔍 Verifying cleanup...")
-        verify_response = requests.get(
-            f"{SUPABASE_URL}/rest/v1/events",
-            headers=headers,
-            params={'select': 'id,name', 'order': 'date.desc'}
-        )
-        
-        if verify_response.status_code == 200:
-            remaining_events = verify_response.json()
-            logger.info(f"📊 Remaining events: {len(remaining_events)}")
-            
-            for event in remaining_events:
-                fights_response = requests.get(
-                    f"{SUPABASE_URL}/rest/v1/fights",
-                    headers=headers,
-                    params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
-                )
-                if fights_response.status_code == 200:
-                    fights = fights_response.json()
-                    logger.info(f"   {event.get('name', 'Unknown')}: {len(fights)} fights")
-        
+        remaining = deduper.plan()
+        if remaining:
+            logger.warning(f"⚠️ {len(remaining)} duplicated events remain")
+            return False
+        logger.info("✅ No duplicate events remain")
         return True
         
     except Exception as e:
@@ -159,9 +63,9 @@ def cleanup_duplicates():
         return False
 
 if __name__ == "__main__":
-    success = cleanup_duplicates()
+    success = cleanup_duplicates(dry_run='--dry-run' in sys.argv)
     if success:
         print("✅ Duplicate cleanup completed!")
     else:
         print("❌ Duplicate cleanup failed!")
-        exit(1) 
\ No newline at end of file
+        exit(1)
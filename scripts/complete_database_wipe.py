@@ -6,9 +6,9 @@ Wipe ALL tables including rankings, fights, fighters, and events
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -34,7 +34,7 @@ class CompleteDatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Step 1: Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}  # Delete all fights
@@ -48,7 +48,7 @@ class CompleteDatabaseWiper:
             
             # Step 2: Delete all rankings (due to foreign key constraints)
             logger.info("🗑️ Step 2: Deleting all rankings...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/rankings",
                 headers=self.supabase_headers,
                 params={'fighter_id': 'not.is.null'}  # Delete all rankings
@@ -62,7 +62,7 @@ class CompleteDatabaseWiper:
             
             # Step 3: Delete all fighters
             logger.info("🗑️ Step 3: Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all fighters
@@ -76,7 +76,7 @@ class CompleteDatabaseWiper:
             
             # Step 4: Delete all events
             logger.info("🗑️ Step 4: Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all events
@@ -102,7 +102,7 @@ class CompleteDatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -115,7 +115,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Events table is empty")
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -128,7 +128,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Fighters table is empty")
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -141,7 +141,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Fights table is empty")
             
             # Check rankings
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id&limit=1",
                 headers=self.supabase_headers
             )
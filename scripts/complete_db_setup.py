@@ -6,9 +6,9 @@ Wipes events and fights tables and applies enhanced schema
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -40,7 +40,7 @@ def setup_database():
         
         # Step 1: Wipe fights table
         logger.info("🗑️ Step 1: Wiping fights table...")
-        fights_response = requests.delete(
+        fights_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id'}
@@ -54,7 +54,7 @@ def setup_database():
         
         # Step 2: Wipe events table
         logger.info("🗑️ Step 2: Wiping events table...")
-        events_response = requests.delete(
+        events_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id'}
@@ -124,7 +124,7 @@ def setup_database():
             logger.info(f"🔧 Applying schema change {i}/{len(schema_changes)}...")
             
             # Use Supabase's SQL endpoint
-            sql_response = requests.post(
+            sql_response = client.post(
                 f"{SUPABASE_URL}/rest/v1/rpc/exec_sql",
                 headers=headers,
                 json={"query": change["sql"]}
@@ -140,13 +140,13 @@ def setup_database():
         logger.info("🔍 Step 4: Verifying setup...")
         
         # Check if tables are empty
-        fights_check = requests.get(
+        fights_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id', 'limit': 1}
         )
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
@@ -164,7 +164,7 @@ def setup_database():
         
         # Check if new columns exist
         logger.info("🔍 Checking if new columns exist...")
-        columns_check = requests.get(
+        columns_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'winner_name,loser_name,fight_order,is_main_event,is_co_main_event', 'limit': 1}
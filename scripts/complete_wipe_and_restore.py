@@ -6,10 +6,10 @@ Wipe ALL databases including rankings, then restore complete rankings
 
 import os
 import sys
-import requests
 import logging
 import subprocess
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -35,7 +35,7 @@ class CompleteDatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}  # Delete all fights
@@ -49,7 +49,7 @@ class CompleteDatabaseWiper:
             
             # Step 2: Delete all rankings
             logger.info("🗑️ Deleting all rankings...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/rankings",
                 headers=self.supabase_headers,
                 params={'fighter_id': 'not.is.null'}  # Delete all rankings
@@ -63,7 +63,7 @@ class CompleteDatabaseWiper:
             
             # Step 3: Delete all fighters
             logger.info("🗑️ Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all fighters
@@ -77,7 +77,7 @@ class CompleteDatabaseWiper:
             
             # Step 4: Delete all events
             logger.info("🗑️ Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all events
@@ -103,7 +103,7 @@ class CompleteDatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -116,7 +116,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Events table is empty")
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -129,7 +129,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Fighters table is empty")
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -142,7 +142,7 @@ class CompleteDatabaseWiper:
                     logger.info("✅ Fights table is empty")
             
             # Check rankings
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -0,0 +1,117 @@
+-- Server-side health checks for the diagnostic scripts
+-- Each check is a view PostgREST exposes as a read-only table, and
+-- health_summary() returns every check's count in one RPC call, so a health
+-- check is one round trip instead of pulling whole tables into Python.
+-- scripts/health_checks.py is the client; its SQLite stand-in mirrors these views.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- Same key as event_names.event_match_key: "ufc 317" for numbered events,
+-- otherwise the case, accent and punctuation-insensitive full name
+CREATE OR REPLACE FUNCTION event_match_key(event_name TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN short_key ~ '^ufc [0-9]+$' THEN short_key
+        ELSE btrim(regexp_replace(lower(unaccent(coalesce(event_name, ''))), '[^a-z0-9]+', ' ', 'g'))
+    END
+    FROM (
+        SELECT lower(btrim(split_part(
+            btrim(regexp_replace(translate(coalesce(event_name, ''), E'\u00A0', ' '), '\s+', ' ', 'g')), ':', 1
+        ))) AS short_key
+    ) k
+$$ LANGUAGE sql STABLE;
+
+-- Fights and decided fights per event, including events with none
+CREATE OR REPLACE VIEW event_fight_counts AS
+SELECT
+    e.id AS event_id,
+    e.name,
+    e.date,
+    COUNT(f.id) AS fights,
+    COUNT(f.id) FILTER (WHERE f.result->>'winner_id' IS NOT NULL) AS fights_with_winner
+FROM events e
+LEFT JOIN fights f ON f.event_id = e.id
+GROUP BY e.id, e.name, e.date;
+
+-- Fights without an event, or pointing at an event or fighter that doesn't exist
+CREATE OR REPLACE VIEW orphan_fights AS
+SELECT
+    f.id AS fight_id,
+    f.event_id,
+    f.fighter1_id,
+    f.fighter2_id,
+    CASE
+        WHEN f.event_id IS NULL THEN 'no_event'
+        WHEN e.id IS NULL THEN 'missing_event'
+        ELSE 'missing_fighter'
+    END AS problem
+FROM fights f
+LEFT JOIN events e ON e.id = f.event_id
+LEFT JOIN fighters f1 ON f1.id = f.fighter1_id
+LEFT JOIN fighters f2 ON f2.id = f.fighter2_id
+WHERE e.id IS NULL
+   OR (f.fighter1_id IS NOT NULL AND f1.id IS NULL)
+   OR (f.fighter2_id IS NOT NULL AND f2.id IS NULL);
+
+-- Events stored more than once under the same match key
+CREATE OR REPLACE VIEW duplicate_event_names AS
+SELECT
+    event_match_key(name) AS name_key,
+    MIN(name) AS name,
+    COUNT(*) AS copies,
+    array_agg(id ORDER BY created_at, id) AS event_ids
+FROM events
+GROUP BY event_match_key(name)
+HAVING COUNT(*) > 1;
+
+-- The same pairing stored more than once on one event
+CREATE OR REPLACE VIEW duplicate_fights AS
+SELECT
+    event_id,
+    LEAST(fighter1_id, fighter2_id) AS fighter_a,
+    GREATEST(fighter1_id, fighter2_id) AS fighter_b,
+    COUNT(*) AS copies
+FROM fights
+WHERE fighter1_id IS NOT NULL AND fighter2_id IS NOT NULL
+GROUP BY event_id, LEAST(fighter1_id, fighter2_id), GREATEST(fighter1_id, fighter2_id)
+HAVING COUNT(*) > 1;
+
+CREATE OR REPLACE VIEW fighters_without_records AS
+SELECT id AS fighter_id, name
+FROM fighters
+WHERE record IS NULL OR trim(record) IN ('', 'None');
+
+-- Bouts whose fight_order disagrees with the main/co-main flags
+CREATE OR REPLACE VIEW fight_order_mismatches AS
+SELECT id AS fight_id, event_id, fight_order, is_main_event, is_co_main_event
+FROM fights
+WHERE (fight_order = 1 AND is_main_event IS NOT TRUE)
+   OR (fight_order = 2 AND is_co_main_event IS NOT TRUE);
+
+CREATE OR REPLACE VIEW weight_class_counts AS
+SELECT 'fights' AS source, weight_class, COUNT(*) AS count FROM fights GROUP BY weight_class
+UNION ALL
+SELECT 'fighters' AS source, weight_class, COUNT(*) AS count FROM fighters GROUP BY weight_class;
+
+-- Every check's count in one call: POST /rest/v1/rpc/health_summary
+CREATE OR REPLACE FUNCTION health_summary()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'events', (SELECT COUNT(*) FROM events),
+        'completed_events', (SELECT COUNT(*) FROM events WHERE status = 'completed'),
+        'scheduled_events', (SELECT COUNT(*) FROM events WHERE status = 'scheduled'),
+        'fights', (SELECT COUNT(*) FROM fights),
+        'fighters', (SELECT COUNT(*) FROM fighters),
+        'events_without_fights', (SELECT COUNT(*) FROM event_fight_counts WHERE fights = 0),
+        'orphan_fights', (SELECT COUNT(*) FROM orphan_fights),
+        'duplicate_event_names', (SELECT COUNT(*) FROM duplicate_event_names),
+        'duplicate_fights', (SELECT COUNT(*) FROM duplicate_fights),
+        'fighters_without_records', (SELECT COUNT(*) FROM fighters_without_records),
+        'fight_order_mismatches', (SELECT COUNT(*) FROM fight_order_mismatches)
+    )
+$$ LANGUAGE sql STABLE;
+
+-- Indexes the checks lean on
+CREATE INDEX IF NOT EXISTS idx_fights_event_id ON fights(event_id);
+CREATE INDEX IF NOT EXISTS idx_fights_fighter1_id ON fights(fighter1_id);
+CREATE INDEX IF NOT EXISTS idx_fights_fighter2_id ON fights(fighter2_id);
@@ -4,16 +4,16 @@ Debug Date Scraping
 Check what dates are being extracted from the Wikipedia table
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
+from http_client import client
 
 def debug_date_scraping():
     """Debug the date scraping from Wikipedia"""
     url = "https://en.wikipedia.org/wiki/List_of_UFC_events"
     
     try:
-        response = requests.get(url)
+        response = client.get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         
@@ -5,8 +5,8 @@ Test creating a single event to see what's causing the JSON parsing error
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -42,7 +42,7 @@ def debug_event_creation():
     
     try:
         print("🚀 Attempting to create event...")
-        response = requests.post(
+        response = client.post(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             json=test_event
@@ -5,10 +5,10 @@ Check what data the Flutter app should be seeing and identify any issues
 """
 
 import os
-import requests
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -31,7 +31,7 @@ class FlutterDataDebugger:
         
         try:
             # Get all events
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date,status&order=date.desc",
                 headers=self.headers
             )
@@ -48,7 +48,7 @@ class FlutterDataDebugger:
                     print(f"   Status: {event['status']}")
                     
                     # Get fights for this event
-                    fights_response = requests.get(
+                    fights_response = client.get(
                         f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=id,fighter1_id,fighter2_id,weight_class,result",
                         headers=self.headers
                     )
@@ -82,7 +82,7 @@ class FlutterDataDebugger:
         
         try:
             # Get past events (completed status)
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date,status&status=eq.completed&order=date.desc",
                 headers=self.headers
             )
@@ -95,7 +95,7 @@ class FlutterDataDebugger:
                 total_fights = 0
                 for event in events:
                     # Get fights for this event
-                    fights_response = requests.get(
+                    fights_response = client.get(
                         f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=id",
                         headers=self.headers
                     )
@@ -121,7 +121,7 @@ class FlutterDataDebugger:
         
         try:
             # Get first event
-            events_response = requests.get(
+            events_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name&limit=1",
                 headers=self.headers
             )
@@ -134,7 +134,7 @@ class FlutterDataDebugger:
                     print(f"   ID: {event['id']}")
                     
                     # Get fights for this event
-                    fights_response = requests.get(
+                    fights_response = client.get(
                         f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=*&limit=5",
                         headers=self.headers
                     )
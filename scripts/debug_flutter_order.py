@@ -5,9 +5,9 @@ Check what data the Flutter app is actually getting from Supabase
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -28,7 +28,7 @@ def debug_flutter_order():
     try:
         # Get the UFC 317 event ID
         logger.info("🔍 Getting UFC 317 event ID...")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events?name=eq.UFC 317: Topuria vs. Oliveira",
             headers=headers
         )
@@ -47,7 +47,7 @@ def debug_flutter_order():
         
         # Get fights for this event - EXACTLY like Flutter does
         logger.info("🔍 Getting fights for event (like Flutter does)...")
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}&order=fight_order.asc",
             headers=headers
         )
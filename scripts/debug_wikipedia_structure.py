@@ -4,15 +4,15 @@ Debug Wikipedia Structure
 Check the actual structure of the Wikipedia UFC events page
 """
 
-import requests
 from bs4 import BeautifulSoup
+from http_client import client
 
 def debug_wikipedia_structure():
     """Debug the structure of the Wikipedia UFC events page"""
     url = "https://en.wikipedia.org/wiki/List_of_UFC_events"
     
     try:
-        response = requests.get(url)
+        response = client.get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         
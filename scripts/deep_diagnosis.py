@@ -5,9 +5,9 @@ Comprehensive analysis of why Flutter can't find fights
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -33,7 +33,7 @@ def deep_diagnosis():
     
     try:
         logger.info("🔍 STEP 1: Check all events in database")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc'}
@@ -50,7 +50,7 @@ def deep_diagnosis():
         logger.info("\n🔍 STEP 2: Check which events have fights")
         events_with_fights = []
         for event in all_events:
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=headers,
                 params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
@@ -68,7 +68,7 @@ def deep_diagnosis():
         
         logger.info("\n🔍 STEP 3: Check Flutter's event loading logic")
         # Simulate what Flutter is doing - get events ordered by date
-        flutter_events_response = requests.get(
+        flutter_events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 10}
@@ -81,7 +81,7 @@ def deep_diagnosis():
                 logger.info(f"   {i+1}. {event.get('name', 'Unknown')} (ID: {event['id']})")
                 
                 # Check if this event has fights
-                fights_response = requests.get(
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
@@ -93,7 +93,7 @@ def deep_diagnosis():
                     logger.warning(f"      -> Error checking fights: {fights_response.status_code}")
         
         logger.info("\n🔍 STEP 4: Check if there are any fights at all")
-        all_fights_response = requests.get(
+        all_fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id,event_id,winner_name,loser_name', 'limit': 5}
@@ -116,7 +116,7 @@ def deep_diagnosis():
             logger.info(f"  Date: {event.get('date', 'N/A')}")
             
             # Check fights for this event
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=headers,
                 params={'event_id': f'eq.{event["id"]}', 'select': 'id,winner_name,loser_name'}
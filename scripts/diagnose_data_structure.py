@@ -5,8 +5,8 @@ Analyze the current database structure and identify what needs to be fixed
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -30,7 +30,7 @@ def diagnose_data_structure():
     
     # Check events table structure
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=*&limit=1", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=*&limit=1", headers=headers)
         if response.status_code == 200:
             events = response.json()
             if events:
@@ -47,7 +47,7 @@ def diagnose_data_structure():
     
     # Check fights table structure
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=1", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=1", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             if fights:
@@ -68,7 +68,7 @@ def diagnose_data_structure():
     
     # Check if fights have event_id
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=event_id&limit=5", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=event_id&limit=5", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             has_event_id = any('event_id' in fight for fight in fights)
@@ -80,7 +80,7 @@ def diagnose_data_structure():
     
     # Check if fights have winner_id/loser_id
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=winner_id,loser_id&limit=5", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=winner_id,loser_id&limit=5", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             has_winner_loser = any('winner_id' in fight or 'loser_id' in fight for fight in fights)
@@ -98,19 +98,19 @@ def diagnose_data_structure():
     
     try:
         # Count events
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1000", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1000", headers=headers)
         if response.status_code == 200:
             events = response.json()
             print(f"✅ Events count: {len(events)}")
         
         # Count fights
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1000", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1000", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             print(f"✅ Fights count: {len(fights)}")
         
         # Count fighters
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1000", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1000", headers=headers)
         if response.status_code == 200:
             fighters = response.json()
             print(f"✅ Fighters count: {len(fighters)}")
@@ -125,7 +125,7 @@ def diagnose_data_structure():
     print("-" * 40)
     
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=3", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=3", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             for i, fight in enumerate(fights):
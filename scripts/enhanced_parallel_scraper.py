@@ -6,19 +6,20 @@ Based on the working script that got 667 events with 1% fail rate
 
 import os
 import sys
-import requests
 import logging
-import time
 import json
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from card_writer import CardWriter, event_source_id, fight_source_ids
+from fighter_loader import FighterLoader
+from history_crawler import HistoryCrawler, default_queue_path
+
 load_dotenv('scripts/.env')
 
 # Set up logging
@@ -40,13 +41,9 @@ class EnhancedParallelScraper:
             'Content-Type': 'application/json',
         }
         self.base_url = "https://en.wikipedia.org"
-        
-        # Thread-safe counters
-        self.lock = Lock()
-        self.successful_events = 0
-        self.failed_events = 0
-        self.total_fights = 0
-        self.processed_events = 0
+        self.fighters = FighterLoader(SUPABASE_URL, SUPABASE_KEY,
+                                      defaults={'weight_class': None, 'record': None, 'ufc_ranking': None})
+        self.writer = CardWriter(SUPABASE_URL, SUPABASE_KEY)
         
     def get_all_past_events_with_actual_links(self):
         """Get all past events with their actual Wikipedia links"""
@@ -54,7 +51,7 @@ class EnhancedParallelScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = client.get(url, headers=self.headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -201,77 +198,41 @@ class EnhancedParallelScraper:
         
         return None
     
-    def process_single_event(self, event_data):
-        """Process a single event"""
-        event_name = event_data['name']
-        wikipedia_url = event_data['wikipedia_url']
+    def fetch_event(self, event_data):
+        """Download an event's Wikipedia page"""
+        if not event_data['wikipedia_url']:
+            raise ValueError("no Wikipedia link")
+        response = client.get(event_data['wikipedia_url'], headers=self.headers, timeout=30)
+        response.raise_for_status()
+        return response.text
+    
+    def parse_event(self, event_data, html):
+        """Fight data from an event page"""
+        soup = BeautifulSoup(html, 'html.parser')
         
-        try:
-            # Step 1: Scrape fighter data using the actual Wikipedia URL
-            fights_data = self.scrape_event_fighters(wikipedia_url, event_name)
-            
-            if not fights_data:
-                with self.lock:
-                    self.failed_events += 1
-                    self.processed_events += 1
-                return f"❌ No fights found for: {event_name}"
-            
-            # Step 2: Create event in database
-            event_id = self.create_event(event_data)
-            
-            if not event_id:
-                with self.lock:
-                    self.failed_events += 1
-                    self.processed_events += 1
-                return f"❌ Failed to create event: {event_name}"
-            
-            # Step 3: Create fights in database
-            created_fights = 0
-            for fight_data in fights_data:
-                fight_id = self.create_fight(fight_data, event_id)
-                if fight_id:
-                    created_fights += 1
-            
-            # Update counters thread-safely
-            with self.lock:
-                self.successful_events += 1
-                self.total_fights += created_fights
-                self.processed_events += 1
-            
-            return f"✅ {event_name}: {created_fights}/{len(fights_data)} fights created"
-            
-        except Exception as e:
-            with self.lock:
-                self.failed_events += 1
-                self.processed_events += 1
-            return f"❌ Error processing {event_name}: {str(e)}"
+        fights_data = []
+        for table in soup.find_all('table'):
+            # Look for tables with "def." patterns
+            if 'def.' in table.get_text():
+                # Parse this table for fights
+                fights_data.extend(self._parse_fight_table(table))
+        
+        if not fights_data:
+            raise ValueError("no fights found")
+        return fights_data
     
-    def scrape_event_fighters(self, url, event_name):
-        """Scrape fighter data from a UFC event page"""
-        try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            all_tables = soup.find_all('table')
-            
-            fights_data = []
-            
-            for table_idx, table in enumerate(all_tables):
-                # Look for tables with "def." patterns
-                table_text = table.get_text()
-                if 'def.' in table_text:
-                    # Parse this table for fights
-                    table_fights = self._parse_fight_table(table)
-                    if table_fights:
-                        fights_data.extend(table_fights)
-            
-            return fights_data
-            
-        except Exception as e:
-            logger.error(f"❌ Error scraping {url}: {str(e)}")
-            return []
+    def write_event(self, event_data, fights_data):
+        """Write an event card; returns how many fights were written"""
+        # Resolve the card's fighters up front so any new ones go out in a single insert
+        self.fighters.resolve_many(self.clean_fighter_name(name) for fight in fights_data
+                                   for name in (fight['winner'], fight['loser']))
+        
+        # Write the event and all its fights as one bulk upsert each
+        event_id, fight_ids = self.writer.write_card(self.build_event_row(event_data),
+                                                     self.build_fight_rows(fights_data, event_data))
+        if not event_id:
+            raise RuntimeError("event was not written")
+        return len(fight_ids)
     
     def _parse_fight_table(self, table):
         """Parse a fight table to extract fight data"""
@@ -317,58 +278,14 @@ class EnhancedParallelScraper:
         return fights
     
     def get_or_create_fighter(self, fighter_name):
-        """Get or create a fighter in the database"""
+        """Get or create a fighter through the shared fighter map"""
         try:
             # Clean fighter name
             fighter_name = self.clean_fighter_name(fighter_name)
             if not fighter_name:
                 return None
             
-            # First, try to get existing fighter
-            response = requests.get(
-                f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
-                headers=self.supabase_headers,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                existing_fighters = response.json()
-                if existing_fighters:
-                    return existing_fighters[0]['id']
-            
-            # Create new fighter
-            fighter_data = {
-                'name': fighter_name,
-                'weight_class': None,
-                'record': None,
-                'ufc_ranking': None
-            }
-            
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/fighters",
-                headers=self.supabase_headers,
-                json=fighter_data,
-                timeout=10
-            )
-            
-            if response.status_code == 201:
-                # Handle empty response body
-                try:
-                    return response.json()['id']
-                except (ValueError, KeyError):
-                    # If response is empty, try to get the fighter by name
-                    fetch_response = requests.get(
-                        f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
-                        headers=self.supabase_headers,
-                        timeout=10
-                    )
-                    if fetch_response.status_code == 200:
-                        fighters = fetch_response.json()
-                        if fighters:
-                            return fighters[0]['id']
-                    return None
-            else:
-                return None
+            return self.fighters.get_or_create(fighter_name)
                 
         except Exception as e:
             return None
@@ -406,58 +323,30 @@ class EnhancedParallelScraper:
         
         return cleaned_name if cleaned_name else None
     
-    def create_event(self, event_data):
-        """Create an event in the database"""
-        try:
-            event_to_create = {
-                'name': event_data['name'],
-                'date': event_data['date'],
-                'venue': event_data['venue'],
-                'location': event_data['location']
-            }
-            
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/events",
-                headers=self.supabase_headers,
-                json=event_to_create,
-                timeout=10
-            )
-            
-            if response.status_code == 201:
-                # Handle empty response body
-                try:
-                    return response.json()['id']
-                except (ValueError, KeyError):
-                    # If response is empty, try to get the event by name
-                    fetch_response = requests.get(
-                        f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
-                        headers=self.supabase_headers,
-                        timeout=10
-                    )
-                    if fetch_response.status_code == 200:
-                        events = fetch_response.json()
-                        if events:
-                            return events[0]['id']
-                    return None
-            else:
-                return None
-                
-        except Exception as e:
-            return None
+    def build_event_row(self, event_data):
+        """Events row for a card, keyed on its stable source ID"""
+        return {
+            'source_id': event_source_id(event_data['name'], event_data['date']),
+            'name': event_data['name'],
+            'date': event_data['date'],
+            'venue': event_data['venue'],
+            'location': event_data['location']
+        }
     
-    def create_fight(self, fight_data, event_id):
-        """Create a fight in the database"""
-        try:
-            # Get or create fighters
+    def build_fight_rows(self, fights_data, event_data):
+        """Fights rows for a card; the writer links them to the event"""
+        rows = []
+        source_ids = fight_source_ids(event_data['name'], event_data['date'],
+                                      [(fight_data['winner'], fight_data['loser']) for fight_data in fights_data])
+        for source_id, fight_data in zip(source_ids, fights_data):
             winner_id = self.get_or_create_fighter(fight_data['winner'])
             loser_id = self.get_or_create_fighter(fight_data['loser'])
             
             if not winner_id or not loser_id:
-                return None
+                continue
             
-            # Create fight
-            fight_to_create = {
-                'event_id': event_id,
+            rows.append({
+                'source_id': source_id,
                 'fighter1_id': winner_id,
                 'fighter2_id': loser_id,
                 'weight_class': fight_data['weight_class'],
@@ -468,111 +357,26 @@ class EnhancedParallelScraper:
                     'round': fight_data['round'],
                     'time': fight_data['time']
                 }
-            }
-            
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/fights",
-                headers=self.supabase_headers,
-                json=fight_to_create,
-                timeout=10
-            )
-            
-            if response.status_code == 201:
-                # Handle empty response body
-                try:
-                    return response.json()['id']
-                except (ValueError, KeyError):
-                    # If response is empty, try to get the fight by event and fighters
-                    fetch_response = requests.get(
-                        f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}&fighter1_id=eq.{winner_id}&fighter2_id=eq.{loser_id}",
-                        headers=self.supabase_headers,
-                        timeout=10
-                    )
-                    if fetch_response.status_code == 200:
-                        fights = fetch_response.json()
-                        if fights:
-                            return fights[0]['id']
-                    return None
-            else:
-                return None
-                
-        except Exception as e:
-            return None
+            })
+        return rows
     
-    def run_enhanced_parallel_scraper(self, max_events=None, start_from=0):
-        """Run the enhanced parallel scraper"""
+    def run_enhanced_parallel_scraper(self, max_events=None, reset=False):
+        """Run the enhanced parallel scraper through the resumable history crawler.
+
+        Progress is kept in scripts/data/crawl_queue_enhanced.sqlite, so a rerun
+        continues where the last one stopped; pass reset=True after wiping
+        the database to start over.
+        """
         logger.info("🚀 Starting Enhanced Parallel Scraper")
         logger.info(f"⚡ Using {self.max_workers} parallel workers")
         logger.info("=" * 60)
         
-        # Step 1: Get all past events with their actual Wikipedia links
-        events = self.get_all_past_events_with_actual_links()
-        
-        if not events:
-            logger.error("❌ No events found")
-            return
-        
-        # Apply limits
-        if start_from > 0:
-            events = events[start_from:]
-        
-        if max_events:
-            events = events[:max_events]
-        
-        logger.info(f"📊 Processing {len(events)} events in parallel (starting from event {start_from})")
-        
-        # Step 2: Process events in parallel
-        start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_event = {
-                executor.submit(self.process_single_event, event): event 
-                for event in events
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_event):
-                event = future_to_event[future]
-                try:
-                    result = future.result()
-                    logger.info(f"📊 Progress: {self.processed_events}/{len(events)} - {result}")
-                    
-                    # Progress update every 20 events
-                    if self.processed_events % 20 == 0:
-                        elapsed_time = time.time() - start_time
-                        events_per_second = self.processed_events / elapsed_time if elapsed_time > 0 else 0
-                        estimated_total_time = len(events) / events_per_second if events_per_second > 0 else 0
-                        remaining_time = estimated_total_time - elapsed_time
-                        
-                        logger.info(f"📈 Progress Update:")
-                        logger.info(f"   ✅ Successful: {self.successful_events}, ❌ Failed: {self.failed_events}")
-                        logger.info(f"   🎯 Total fights: {self.total_fights}")
-                        logger.info(f"   ⚡ Events/sec: {events_per_second:.2f}")
-                        logger.info(f"   ⏱️ Estimated remaining time: {remaining_time/60:.1f} minutes")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Exception processing {event['name']}: {str(e)}")
-                    with self.lock:
-                        self.failed_events += 1
-                        self.processed_events += 1
-        
-        # Final Summary
-        total_time = time.time() - start_time
-        events_per_second = len(events) / total_time if total_time > 0 else 0
-        
-        logger.info(f"\n📊 ENHANCED PARALLEL SCRAPING SUMMARY")
-        logger.info("=" * 60)
-        logger.info(f"✅ Successful events: {self.successful_events}/{len(events)}")
-        logger.info(f"❌ Failed events: {self.failed_events}/{len(events)}")
-        logger.info(f"🎯 Total fights created: {self.total_fights}")
-        logger.info(f"📊 Average fights per successful event: {self.total_fights/self.successful_events if self.successful_events > 0 else 0:.1f}")
-        logger.info(f"⚡ Processing speed: {events_per_second:.2f} events/second")
-        logger.info(f"⏱️ Total time: {total_time/60:.1f} minutes")
+        crawler = HistoryCrawler(self, default_queue_path('enhanced'), max_workers=self.max_workers)
+        return crawler.run(max_events=max_events, reset=reset)
 
 if __name__ == "__main__":
     # Create enhanced parallel scraper with 15 workers for maximum speed
     scraper = EnhancedParallelScraper(max_workers=15)
     
     # Run the full scraper on ALL events
-    scraper.run_enhanced_parallel_scraper(max_events=None, start_from=0) 
\ No newline at end of file
+    scraper.run_enhanced_parallel_scraper(max_events=None) 
\ No newline at end of file
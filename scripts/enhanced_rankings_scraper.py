@@ -6,13 +6,13 @@ Blends rankings scraping with fighter profile scraping to get both rankings and
 
 import os
 import sys
-import requests
 import json
 import logging
 import time
 from datetime import datetime
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from http_client import client, create_session
 
 # Add the scrapers directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -28,7 +28,7 @@ SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
 class EnhancedRankingsScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -339,7 +339,7 @@ class EnhancedRankingsScraper:
                 'weight_class': fighter_data['weight_class']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 json=fighter_to_create
@@ -350,7 +350,7 @@ class EnhancedRankingsScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fighter by name
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -376,7 +376,7 @@ class EnhancedRankingsScraper:
                 'rank_type': 'champion' if ranking_data['isChampion'] else 'contender'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/rankings",
                 headers=self.supabase_headers,
                 json=ranking_to_create
@@ -387,7 +387,7 @@ class EnhancedRankingsScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the ranking by fighter and division
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/rankings?fighter_id=eq.{fighter_id}&weight_class=eq.{ranking_data['weight_class']}",
                         headers=self.supabase_headers
                     )
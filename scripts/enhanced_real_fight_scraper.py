@@ -5,12 +5,12 @@ Gets actual fight data from past UFC events
 """
 
 import os
-import requests
 import time
 import re
 from datetime import datetime
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from http_client import client, create_session
 
 load_dotenv()
 
@@ -25,7 +25,7 @@ class EnhancedRealFightScraper:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
@@ -35,7 +35,7 @@ class EnhancedRealFightScraper:
         print("🗑️ Clearing all existing fights...")
         
         try:
-            response = requests.get(f"{self.supabase_url}/rest/v1/fights?select=id&limit=1000", headers=self.headers)
+            response = client.get(f"{self.supabase_url}/rest/v1/fights?select=id&limit=1000", headers=self.headers)
             if response.status_code == 200:
                 fights = response.json()
                 print(f"   📊 Found {len(fights)} fights to delete")
@@ -43,7 +43,7 @@ class EnhancedRealFightScraper:
                 deleted_count = 0
                 for fight in fights:
                     try:
-                        delete_response = requests.delete(
+                        delete_response = client.delete(
                             f"{self.supabase_url}/rest/v1/fights?id=eq.{fight['id']}",
                             headers=self.headers
                         )
@@ -139,7 +139,7 @@ class EnhancedRealFightScraper:
         """Get existing fighter or create new one"""
         try:
             # Search for existing fighter
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
                 headers=self.headers
             )
@@ -161,7 +161,7 @@ class EnhancedRealFightScraper:
                 'is_active': True
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/fighters",
                 headers=self.headers,
                 json=fighter_data
@@ -170,7 +170,7 @@ class EnhancedRealFightScraper:
             if response.status_code == 201:
                 print(f"   ✅ Created fighter: {fighter_name}")
                 # Get the created fighter ID
-                response = requests.get(
+                response = client.get(
                     f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
                     headers=self.headers
                 )
@@ -198,7 +198,7 @@ class EnhancedRealFightScraper:
             print(f"\n   📅 Processing: {event_data['name']}")
             
             # Get or create event
-            event_response = requests.get(
+            event_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?name=eq.{event_data['name']}",
                 headers=self.headers
             )
@@ -219,7 +219,7 @@ class EnhancedRealFightScraper:
                         'type': 'numbered'
                     }
                     
-                    response = requests.post(
+                    response = client.post(
                         f"{self.supabase_url}/rest/v1/events",
                         headers=self.headers,
                         json=event_data_to_create
@@ -227,7 +227,7 @@ class EnhancedRealFightScraper:
                     
                     if response.status_code == 201:
                         # Get the created event ID
-                        response = requests.get(
+                        response = client.get(
                             f"{self.supabase_url}/rest/v1/events?name=eq.{event_data['name']}",
                             headers=self.headers
                         )
@@ -266,7 +266,7 @@ class EnhancedRealFightScraper:
                     }
                     
                     try:
-                        response = requests.post(
+                        response = client.post(
                             f"{self.supabase_url}/rest/v1/fights",
                             headers=self.headers,
                             json=fight_to_create
@@ -293,12 +293,12 @@ class EnhancedRealFightScraper:
         
         try:
             # Check events with fights
-            events_response = requests.get(f"{self.supabase_url}/rest/v1/events?select=id,name&limit=10", headers=self.headers)
+            events_response = client.get(f"{self.supabase_url}/rest/v1/events?select=id,name&limit=10", headers=self.headers)
             if events_response.status_code == 200:
                 events = events_response.json()
                 
                 for event in events:
-                    fights_response = requests.get(f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=id,status,result&limit=20", headers=self.headers)
+                    fights_response = client.get(f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=id,status,result&limit=20", headers=self.headers)
                     if fights_response.status_code == 200:
                         fights = fights_response.json()
                         if fights:
@@ -6,7 +6,6 @@ Scrapes events and fights with fighter names as fields (no separate fighter reco
 
 import os
 import sys
-import requests
 import logging
 import time
 import json
@@ -14,6 +13,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -57,7 +57,7 @@ class EnhancedWikipediaScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -216,7 +216,7 @@ class EnhancedWikipediaScraper:
     def scrape_event_fighters(self, url, event_name):
         """Scrape fighter data from a UFC event page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -306,7 +306,7 @@ class EnhancedWikipediaScraper:
             print(f"🔍 DEBUG: Creating event: {event_data['name']}")
             print(f"   Data: {event_to_create}")
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_to_create
@@ -321,7 +321,7 @@ class EnhancedWikipediaScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the event by name
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -360,7 +360,7 @@ class EnhancedWikipediaScraper:
                 '# is_main_event: self._is_main_event_fight(fight_data, event_name)  # TODO: Add schema property
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_to_create
@@ -372,7 +372,7 @@ class EnhancedWikipediaScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fight by event and fighter names
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}&fighter1_name=eq.{fight_data['winner']}&fighter2_name=eq.{fight_data['loser']}",
                         headers=self.supabase_headers
                     )
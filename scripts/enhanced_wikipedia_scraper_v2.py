@@ -6,7 +6,6 @@ Scrapes UFC events from Wikipedia with proper winner/loser detection and fight o
 
 import os
 import sys
-import requests
 import logging
 import time
 import json
@@ -17,6 +16,7 @@ from threading import Lock
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -56,7 +56,7 @@ class EnhancedWikipediaScraperV2:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -192,7 +192,7 @@ class EnhancedWikipediaScraperV2:
     def get_event_info(self, url):
         """Extract event information from Wikipedia page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -230,7 +230,7 @@ class EnhancedWikipediaScraperV2:
     def scrape_event_fights(self, url, event_name):
         """Extract all fights from a UFC event page with proper winner/loser detection"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -418,7 +418,7 @@ class EnhancedWikipediaScraperV2:
         """Create event in database or return existing one"""
         try:
             # First check if event already exists
-            check_response = requests.get(
+            check_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': f'eq.{event_data["name"]}', 'select': 'id', 'limit': 1}
@@ -439,7 +439,7 @@ class EnhancedWikipediaScraperV2:
                 'location': event_data.get('venue', '')  # Use venue as location for now
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_payload
@@ -450,7 +450,7 @@ class EnhancedWikipediaScraperV2:
                 # We need to get the created event ID by querying for it
                 try:
                     # Query for the event we just created
-                    query_response = requests.get(
+                    query_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events",
                         headers=self.supabase_headers,
                         params={'name': f'eq.{event_data["name"]}', 'select': 'id', 'limit': 1}
@@ -496,7 +496,7 @@ class EnhancedWikipediaScraperV2:
                 'notes': fight_data.get('notes', '')
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_payload
@@ -507,7 +507,7 @@ class EnhancedWikipediaScraperV2:
                 # We need to get the created fight ID by querying for it
                 try:
                     # Query for the fight we just created
-                    query_response = requests.get(
+                    query_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fights",
                         headers=self.supabase_headers,
                         params={'event_id': f'eq.{event_id}', 'winner_name': f'eq.{fight_data.get("winner_name", "")}', 'select': 'id', 'limit': 1}
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Event Dedup
+Finds and merges duplicate events in one pass. Events come back with their
+fight counts in a single paged query (an embedded fights(count)), duplicates
+are grouped by event_names.event_match_key, and only the groups where a
+losing row still has fights need a second query for those fights.
+
+For each group the row with the most fights (then a date, then the oldest)
+is kept. Fights on the other rows that the keeper doesn't already have are
+re-pointed to it, and the other rows are then deleted in bulk; their
+remaining fights are duplicates and go with them (ON DELETE CASCADE).
+
+A fight is a duplicate when the keeper has a fight with the same pair of
+fighter ids, or, for rows without ids (the name-only fights schema), the same
+pair of fighter names. Fights with neither are always moved, never dropped.
+Events with blank names are never grouped.
+"""
+
+import logging
+import os
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from indexes import normalize_fighter_name
+from event_names import event_match_key
+from http_client import supabase_session
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000
+# Event IDs per in.() filter, so URLs stay short
+FILTER_CHUNK_SIZE = 100
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _fight_count(event: Dict) -> int:
+    counts = event.get('fights') or [{'count': 0}]
+    return counts[0]['count']
+
+
+def _pair(fight: Dict) -> Optional[tuple]:
+    """The fight's matchup, by fighter ids or else by names; None when either side is unknown"""
+    ids = (fight.get('fighter1_id'), fight.get('fighter2_id'))
+    if all(ids):
+        return ('id',) + tuple(sorted(ids))
+    names = tuple(normalize_fighter_name(fight.get(column)) for column in ('fighter1_name', 'fighter2_name'))
+    if all(names):
+        return ('name',) + tuple(sorted(names))
+    return None
+
+
+@dataclass
+class MergeGroup:
+    key: str
+    keep: Dict
+    drop: List[Dict]
+    # fight id -> the event it's re-pointed from
+    move: Dict[str, str] = field(default_factory=dict)
+    duplicate_fights: int = 0
+
+
+class EventDeduper:
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 page_size: int = PAGE_SIZE):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        self.session = supabase_session(supabase_key)
+        self.page_size = page_size
+
+    def _select(self, table: str, params: Dict) -> List[Dict]:
+        rows = []
+        offset = 0
+        while True:
+            response = self.session.get(
+                f"{self.base_url}/{table}",
+                params={**params, 'order': 'id', 'limit': self.page_size, 'offset': offset}
+            )
+            response.raise_for_status()
+            page = response.json()
+            rows.extend(page)
+            if len(page) < self.page_size:
+                return rows
+            offset += self.page_size
+
+    def fetch_events(self) -> List[Dict]:
+        """Every event with its fight count"""
+        events = self._select('events', {'select': 'id,name,date,created_at,fights(count)'})
+        for event in events:
+            event['fight_count'] = _fight_count(event)
+        return events
+
+    def fetch_fights(self, event_ids: List[str]) -> List[Dict]:
+        fights = []
+        for chunk in _chunks(sorted(event_ids), FILTER_CHUNK_SIZE):
+            fights.extend(self._select('fights', {
+                # * rather than a column list: older tables have fighter names instead of ids
+                'select': '*', 'event_id': f"in.({','.join(chunk)})"
+            }))
+        return fights
+
+    @staticmethod
+    def group_duplicates(events: List[Dict]) -> List[MergeGroup]:
+        by_key = defaultdict(list)
+        for event in events:
+            key = event_match_key(event.get('name'))
+            if key:
+                by_key[key].append(event)
+
+        groups = []
+        for key, rows in by_key.items():
+            if len(rows) < 2:
+                continue
+            rows.sort(key=lambda e: (-e['fight_count'], e.get('date') is None, e.get('created_at') or '', e['id']))
+            groups.append(MergeGroup(key=key, keep=rows[0], drop=rows[1:]))
+        return groups
+
+    def plan(self) -> List[MergeGroup]:
+        """Duplicate groups, with the fights each losing row hands over to its keeper"""
+        groups = self.group_duplicates(self.fetch_events())
+        moving = [group for group in groups if any(event['fight_count'] for event in group.drop)]
+        if not moving:
+            return groups
+
+        fights_by_event = defaultdict(list)
+        event_ids = [event['id'] for group in moving for event in [group.keep] + group.drop]
+        for fight in self.fetch_fights(event_ids):
+            fights_by_event[fight['event_id']].append(fight)
+
+        for group in moving:
+            pairs = {_pair(fight) for fight in fights_by_event[group.keep['id']]} - {None}
+            for event in group.drop:
+                for fight in fights_by_event[event['id']]:
+                    pair = _pair(fight)
+                    if pair is not None and pair in pairs:
+                        group.duplicate_fights += 1
+                    else:
+                        if pair is not None:
+                            pairs.add(pair)
+                        group.move[fight['id']] = event['id']
+        return groups
+
+    def apply(self, groups: List[MergeGroup]) -> int:
+        """Re-point fights and delete the losing events; returns events deleted"""
+        for group in groups:
+            if not group.move:
+                continue
+            for chunk in _chunks(sorted(group.move), FILTER_CHUNK_SIZE):
+                response = self.session.patch(
+                    f"{self.base_url}/fights",
+                    params={'id': f"in.({','.join(chunk)})"},
+                    json={'event_id': group.keep['id']}
+                )
+                response.raise_for_status()
+
+        drop_ids = [event['id'] for group in groups for event in group.drop]
+        for chunk in _chunks(drop_ids, FILTER_CHUNK_SIZE):
+            response = self.session.delete(
+                f"{self.base_url}/events",
+                params={'id': f"in.({','.join(chunk)})"}
+            )
+            response.raise_for_status()
+        return len(drop_ids)
+
+    @staticmethod
+    def diff(groups: List[MergeGroup]) -> List[str]:
+        """Human-readable plan, one block per duplicate group"""
+        lines = []
+        for group in groups:
+            keep = group.keep
+            lines.append(f"= {keep['name']} [{keep['id']}] {(keep.get('date') or '')[:10]} "
+                         f"({keep['fight_count']} fights)")
+            moved_from = defaultdict(int)
+            for event_id in group.move.values():
+                moved_from[event_id] += 1
+            for event in group.drop:
+                lines.append(f"- {event['name']} [{event['id']}] {(event.get('date') or '')[:10]} "
+                             f"({event['fight_count']} fights, {moved_from[event['id']]} moved)")
+            if group.duplicate_fights:
+                lines.append(f"  {group.duplicate_fights} duplicate fights dropped")
+        return lines
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Event List
+Reads List_of_UFC_events once and yields every past event from its "Past
+events" table: number, name, page href, date, venue and location. Dates come
+from the table's sort keys, so event pages only need fetching for their fight
+cards. The page itself is cached on disk for a day (scripts/data/wiki_cache).
+
+Venue and location cells span several rows when consecutive events share
+them; rowspans are expanded so every event gets its own values.
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from parsing import parse_datetime
+from http_client import client
+
+logger = logging.getLogger(__name__)
+
+BASE_WIKI = 'https://en.wikipedia.org'
+LIST_HREF = '/wiki/List_of_UFC_events'
+WIKI_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+PAST_EVENTS_TABLE_ID = 'Past_events'
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'wiki_cache')
+LIST_PAGE_MAX_AGE = 24 * 3600
+
+SORT_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+COLUMNS = {'#': 'number', 'event': 'name', 'date': 'date', 'venue': 'venue', 'location': 'location'}
+
+
+def load_list_page(cache_dir: str = CACHE_DIR, refresh: bool = False, source: Optional[str] = None) -> str:
+    """List_of_UFC_events HTML: a saved file, the cached copy while it's fresh, or a new download"""
+    if source:
+        with open(source, 'r', encoding='utf-8') as f:
+            return f.read()
+    path = os.path.join(cache_dir, 'List_of_UFC_events.html')
+    if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < LIST_PAGE_MAX_AGE:
+        logger.info('📦 Using cached List of UFC events')
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    logger.info('🔎 Loading List of UFC events...')
+    list_page = client.get(BASE_WIKI + LIST_HREF, headers=WIKI_HEADERS)
+    list_page.raise_for_status()
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(list_page.text)
+    return list_page.text
+
+
+def _span(cell, attr: str) -> int:
+    digits = re.sub(r'\D', '', cell.get(attr) or '')
+    return max(int(digits), 1) if digits else 1
+
+
+def _grid(table) -> List[List]:
+    """Cells of each row, with row- and colspanned cells repeated into every slot they cover"""
+    rows = []
+    spans = {}  # column -> [cell, rows still covered]
+    for tr in table.find_all('tr'):
+        cells = iter(tr.find_all(['td', 'th'], recursive=False))
+        row = []
+        while True:
+            col = len(row)
+            if col in spans:
+                cell, left = spans[col]
+                row.append(cell)
+                if left == 1:
+                    del spans[col]
+                else:
+                    spans[col][1] -= 1
+                continue
+            cell = next(cells, None)
+            if cell is None:
+                break
+            rowspan = _span(cell, 'rowspan')
+            for _ in range(_span(cell, 'colspan')):
+                if rowspan > 1:
+                    spans[len(row)] = [cell, rowspan - 1]
+                row.append(cell)
+        rows.append(row)
+    return rows
+
+
+def _text(cell) -> str:
+    for ref in cell.find_all('sup', class_='reference'):
+        ref.decompose()
+    return re.sub(r'\s+', ' ', cell.get_text()).replace(' ,', ',').strip()
+
+
+def _date(cell) -> Optional[str]:
+    """ISO date from the cell's sort key, else its text"""
+    sort_key = cell.find(attrs={'data-sort-value': True})
+    match = SORT_DATE_RE.search(sort_key['data-sort-value']) if sort_key else None
+    if match:
+        return f"{match.group(1)}-{match.group(2)}-{match.group(3)}T00:00:00"
+    parsed = parse_datetime(_text(cell))
+    return parsed.isoformat() if parsed else None
+
+
+def _find_table(soup):
+    table = soup.find('table', id=PAST_EVENTS_TABLE_ID)
+    if table:
+        return table
+    # Older page revisions have no table ids; the past events table is the longest one with these columns
+    candidates = [t for t in soup.find_all('table')
+                  if {'event', 'date', 'venue'} <= {th.get_text(strip=True).lower() for th in t.find_all('th')}]
+    return max(candidates, key=lambda t: len(t.find_all('tr')), default=None)
+
+
+def parse_past_events(html: str) -> List[Dict]:
+    """[{number, name, href, url, date, venue, location}] for the Past events table, newest first"""
+    strainer = SoupStrainer('table', id=PAST_EVENTS_TABLE_ID) if f'id="{PAST_EVENTS_TABLE_ID}"' in html \
+        else SoupStrainer('table')
+    table = _find_table(BeautifulSoup(html, 'lxml', parse_only=strainer))
+    if table is None:
+        logger.error("❌ Could not find Past events table")
+        return []
+
+    rows = _grid(table)
+    header = [cell.get_text(strip=True).lower() for cell in rows[0]] if rows else []
+    columns = {COLUMNS[name]: i for i, name in enumerate(header) if name in COLUMNS}
+    if 'name' not in columns:
+        logger.error("❌ Past events table has no Event column")
+        return []
+
+    events = []
+    for row in rows[1:]:
+        if len(row) <= columns['name'] or row[columns['name']].name == 'th':
+            continue
+        event_cell = row[columns['name']]
+        link = event_cell.find('a', href=True)
+        href = link['href'] if link and link['href'].startswith('/wiki/') else None
+        event = {
+            'number': _text(row[columns['number']]) if 'number' in columns else None,
+            'name': _text(event_cell),
+            'href': href,
+            'url': BASE_WIKI + href if href else None,
+            'date': _date(row[columns['date']]) if 'date' in columns and len(row) > columns['date'] else None,
+        }
+        for field in ('venue', 'location'):
+            i = columns.get(field)
+            event[field] = _text(row[i]) if i is not None and i < len(row) else None
+        if event['name']:
+            events.append(event)
+    return events
+
+
+def load_past_events(cache_dir: str = CACHE_DIR, refresh: bool = False, source: Optional[str] = None) -> List[Dict]:
+    events = parse_past_events(load_list_page(cache_dir, refresh, source))
+    logger.info(f"📋 {len(events)} past events on List of UFC events")
+    return events
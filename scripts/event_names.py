@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Event Names
+Normalized keys for matching UFC event names across Wikipedia and the
+database, where the same event shows up with different dashes, spacing,
+non-breaking spaces or with and without its "UFC 317: ..." subtitle.
+"""
+
+import os
+import re
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+
+from indexes import normalize_fighter_name
+
+NUMBERED_EVENT_RE = re.compile(r'^ufc \d+$')
+
+
+def normalize_name(name: str) -> str:
+    name = name or ''
+    name = name.replace('\xa0', ' ')
+    name = re.sub(r'\s+', ' ', name).strip()
+    # Normalize different dash types
+    name = name.replace('–', '-').replace('—', '-')
+    return name
+
+
+def short_key(name: str) -> str:
+    name = normalize_name(name)
+    # Prefer the prefix up to the first colon for numbered events like "UFC 317: ..."
+    if ':' in name:
+        return name.split(':', 1)[0].strip().lower()
+    return name.lower()
+
+
+def event_match_key(name: str) -> str:
+    """Key two rows of the same event share: "ufc 317" for numbered events,
+    otherwise the case, accent and punctuation-insensitive full name (a bare
+    "UFC Fight Night" prefix would lump unrelated cards together)"""
+    short = short_key(name)
+    if NUMBERED_EVENT_RE.match(short):
+        return short
+    return normalize_fighter_name(normalize_name(name))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Fighter Loader
+Shared fighter name -> id resolution for the Supabase loaders. Every fighter is
+read once in a paged select into a thread-safe map keyed on the normalized name
+(data/processors/indexes.py), and only names missing from it are created, in a
+single bulk insert per batch, instead of a GET/POST/GET per fighter per fight.
+"""
+
+import os
+import sys
+import logging
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+from indexes import normalize_fighter_name
+from http_client import supabase_session
+
+logger = logging.getLogger(__name__)
+
+# Rows per page when preloading (PostgREST's default max-rows), rows per insert,
+# and names per in.(...) filter so URLs stay short
+PAGE_SIZE = 1000
+INSERT_CHUNK_SIZE = 500
+FILTER_CHUNK_SIZE = 100
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _in_filter(values: List[str]) -> str:
+    """in.(...) filter with every value quoted, so commas and dots in names survive"""
+    quoted = ['"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values]
+    return f"in.({','.join(quoted)})"
+
+
+class FighterLoader:
+    """Normalized fighter name -> Supabase fighter id, creating misses in bulk.
+
+    defaults are the extra columns written for a fighter the loader creates.
+    The map is loaded lazily on first use and shared by all threads.
+    """
+
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 defaults: Optional[Dict] = None, timeout: int = 10):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        self.session = supabase_session(supabase_key)
+        self.defaults = dict(defaults or {})
+        self.timeout = timeout
+
+        self._ids: Dict[str, str] = {}
+        self._loaded = False
+        self._lock = Lock()
+        # Serializes inserts so two threads never create the same fighter
+        self._create_lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
+
+    def load(self):
+        """Read every fighter in pages of PAGE_SIZE"""
+        ids = {}
+        offset = 0
+        while True:
+            response = self.session.get(
+                f"{self.base_url}/fighters",
+                params={'select': 'id,name', 'order': 'id', 'limit': PAGE_SIZE, 'offset': offset},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            page = response.json()
+            for row in page:
+                ids.setdefault(normalize_fighter_name(row['name']), row['id'])
+            if len(page) < PAGE_SIZE:
+                break
+            offset += PAGE_SIZE
+
+        with self._lock:
+            self._ids = ids
+            self._loaded = True
+        logger.info(f"✅ Loaded {len(ids)} fighters")
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._create_lock:
+            if not self._loaded:
+                self.load()
+
+    def get(self, fighter_name: str) -> Optional[str]:
+        """The fighter's id if it's already known, without creating it"""
+        self._ensure_loaded()
+        with self._lock:
+            return self._ids.get(normalize_fighter_name(fighter_name))
+
+    def resolve_many(self, fighter_names: Iterable[str]) -> Dict[str, str]:
+        """Ids for all the names, creating the ones not in the database.
+
+        Returns {name: id} for every name that could be resolved; call it with
+        a whole card's fighters so the misses go out in one insert.
+        """
+        self._ensure_loaded()
+        wanted = {}
+        for name in fighter_names:
+            if name and normalize_fighter_name(name):
+                wanted.setdefault(normalize_fighter_name(name), name)
+
+        with self._lock:
+            missing = {key: name for key, name in wanted.items() if key not in self._ids}
+
+        if missing:
+            with self._create_lock:
+                with self._lock:
+                    missing = {key: name for key, name in missing.items() if key not in self._ids}
+                if missing:
+                    self._create(missing)
+
+        with self._lock:
+            return {name: self._ids[key] for key, name in wanted.items() if key in self._ids}
+
+    def get_or_create(self, fighter_name: str) -> Optional[str]:
+        if not fighter_name:
+            return None
+        return self.resolve_many([fighter_name]).get(fighter_name)
+
+    def _create(self, missing: Dict[str, str]):
+        """Insert the missing fighters; rows another writer created first are
+        skipped by the insert and read back by name instead"""
+        created = {}
+        for chunk in _chunks(list(missing.values()), INSERT_CHUNK_SIZE):
+            response = self.session.post(
+                f"{self.base_url}/fighters",
+                params={'on_conflict': 'name', 'select': 'id,name'},
+                headers={'Prefer': 'return=representation,resolution=ignore-duplicates'},
+                json=[{**self.defaults, 'name': name} for name in chunk],
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            for row in response.json() if response.content else []:
+                created[normalize_fighter_name(row['name'])] = row['id']
+
+        unresolved = [name for key, name in missing.items() if key not in created]
+        for chunk in _chunks(unresolved, FILTER_CHUNK_SIZE):
+            response = self.session.get(
+                f"{self.base_url}/fighters",
+                params={'select': 'id,name', 'name': _in_filter(chunk)},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            for row in response.json():
+                created.setdefault(normalize_fighter_name(row['name']), row['id'])
+
+        with self._lock:
+            self._ids.update(created)
+        logger.info(f"✅ Added {len(created)} new fighters")
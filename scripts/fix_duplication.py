@@ -5,10 +5,10 @@ Clears all duplicated fights and creates proper, unique fight cards
 """
 
 import os
-import requests
 import time
 import random
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv()
 
@@ -30,7 +30,7 @@ class FightDuplicationFixer:
         
         try:
             # Get all fight IDs
-            response = requests.get(f"{self.supabase_url}/rest/v1/fights?select=id&limit=1000", headers=self.headers)
+            response = client.get(f"{self.supabase_url}/rest/v1/fights?select=id&limit=1000", headers=self.headers)
             if response.status_code == 200:
                 fights = response.json()
                 print(f"   📊 Found {len(fights)} fights to delete")
@@ -39,7 +39,7 @@ class FightDuplicationFixer:
                 deleted_count = 0
                 for fight in fights:
                     try:
-                        delete_response = requests.delete(
+                        delete_response = client.delete(
                             f"{self.supabase_url}/rest/v1/fights?id=eq.{fight['id']}",
                             headers=self.headers
                         )
@@ -63,8 +63,8 @@ class FightDuplicationFixer:
         
         try:
             # Get fighters and events
-            fighters_response = requests.get(f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class&limit=100", headers=self.headers)
-            events_response = requests.get(f"{self.supabase_url}/rest/v1/events?select=id,name,date&limit=10", headers=self.headers)
+            fighters_response = client.get(f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class&limit=100", headers=self.headers)
+            events_response = client.get(f"{self.supabase_url}/rest/v1/events?select=id,name,date&limit=10", headers=self.headers)
             
             if fighters_response.status_code != 200 or events_response.status_code != 200:
                 print("❌ Failed to get fighters or events")
@@ -116,7 +116,7 @@ class FightDuplicationFixer:
                             }
                             
                             try:
-                                response = requests.post(
+                                response = client.post(
                                     f"{self.supabase_url}/rest/v1/fights",
                                     headers=self.headers,
                                     json=fight_data
@@ -145,7 +145,7 @@ class FightDuplicationFixer:
         
         try:
             # Check for duplicate fight combinations
-            fights_response = requests.get(f"{self.supabase_url}/rest/v1/fights?select=fighter1_id,fighter2_id&limit=100", headers=self.headers)
+            fights_response = client.get(f"{self.supabase_url}/rest/v1/fights?select=fighter1_id,fighter2_id&limit=100", headers=self.headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 
@@ -165,7 +165,7 @@ class FightDuplicationFixer:
                     print("   ✅ No duplicate fight combinations found!")
                 
                 # Check fights per event
-                events_response = requests.get(f"{self.supabase_url}/rest/v1/events?select=id,name&limit=10", headers=self.headers)
+                events_response = client.get(f"{self.supabase_url}/rest/v1/events?select=id,name&limit=10", headers=self.headers)
                 if events_response.status_code == 200:
                     events = events_response.json()
                     
@@ -5,8 +5,8 @@ Fixes the issue where fights are not properly linked to events
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv()
 
@@ -26,7 +26,7 @@ def fix_event_fight_linking():
     
     # Step 1: Get all events
     print("\n📅 Getting events...")
-    events_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=20", headers=headers)
+    events_response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=20", headers=headers)
     if events_response.status_code != 200:
         print(f"❌ Failed to get events: {events_response.status_code}")
         return
@@ -38,7 +38,7 @@ def fix_event_fight_linking():
     
     # Step 2: Get all fights
     print("\n🥊 Getting fights...")
-    fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status&limit=50", headers=headers)
+    fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status&limit=50", headers=headers)
     if fights_response.status_code != 200:
         print(f"❌ Failed to get fights: {fights_response.status_code}")
         return
@@ -69,7 +69,7 @@ def fix_event_fight_linking():
             }
             
             try:
-                response = requests.patch(
+                response = client.patch(
                     f"{SUPABASE_URL}/rest/v1/fights?id=eq.{fight['id']}",
                     headers=headers,
                     json=update_data
@@ -87,7 +87,7 @@ def fix_event_fight_linking():
     
     # Step 5: Verify the fix
     print("\n🔍 Verifying the fix...")
-    verify_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status&limit=20", headers=headers)
+    verify_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status&limit=20", headers=headers)
     if verify_response.status_code == 200:
         updated_fights = verify_response.json()
         fights_with_events_after = [f for f in updated_fights if f.get('event_id')]
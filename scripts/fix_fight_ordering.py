@@ -5,9 +5,9 @@ Update existing fights with correct fight_order values
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def fix_fight_ordering():
         logger.info("🔧 Fixing fight ordering...")
         
         # Get recent events
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 3}
@@ -49,7 +49,7 @@ def fix_fight_ordering():
                 logger.info(f"   ID: {event['id']}")
                 
                 # Get fights for this event
-                fights_response = requests.get(
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={
@@ -77,7 +77,7 @@ def fix_fight_ordering():
                             logger.info(f"      Updating fight {fight_id}: order {current_order} -> {new_order}")
                             
                             # Update the fight
-                            update_response = requests.patch(
+                            update_response = client.patch(
                                 f"{SUPABASE_URL}/rest/v1/fights",
                                 headers=headers,
                                 params={'id': f'eq.{fight_id}'},
@@ -5,11 +5,11 @@ Scrapes fighter data from a single UFC event with proper table structure parsing
 """
 
 import os
-import requests
 import re
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import logging
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -27,7 +27,7 @@ class FocusedFighterScraper:
         """Scrape fighter data from a UFC event page"""
         try:
             logger.info(f"🔍 Scraping fighters from: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
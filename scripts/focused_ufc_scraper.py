@@ -10,10 +10,10 @@ import csv
 import json
 import time
 import logging
-import requests
 from datetime import datetime
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
+from http_client import create_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 class FocusedUFCScraper:
     def __init__(self):
         self.base_url = "https://en.wikipedia.org"
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 import os
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from threading import Lock
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from http_client import client
 
 # Load environment variables
 load_dotenv('.env')
@@ -40,7 +40,7 @@ class FullWikipediaScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -152,7 +152,7 @@ class FullWikipediaScraper:
     def scrape_event_fighters(self, url, event_name):
         """Scrape fighter data from a UFC event page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -220,7 +220,7 @@ class FullWikipediaScraper:
                 'location': event_data['location']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_to_create
@@ -230,7 +230,7 @@ class FullWikipediaScraper:
                 try:
                     return response.json()['id']
                 except (ValueError, KeyError):
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -267,7 +267,7 @@ class FullWikipediaScraper:
                 'fight_order': fight_order
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_to_create
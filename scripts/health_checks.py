@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Health Checks
+Client for the server-side checks in scripts/create_health_checks.sql. Each
+check is one PostgREST request against a view (or the health_summary RPC),
+so the diagnostic scripts no longer pull whole tables and loop over them.
+
+    checks = HealthChecks()
+    checks.summary()                       # every count, one call
+    checks.duplicate_event_names()
+    checks.event_fight_counts(order='fights.desc', limit=10)
+
+Filters take PostgREST syntax (event_id='in.(a,b)', fights='gt.0').
+
+SQLiteHealthChecks runs the same views from the same SQL file on a SQLite
+connection, for testing the checks without a Postgres server.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from event_names import event_match_key
+from http_client import supabase_session
+
+SQL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'create_health_checks.sql')
+
+VIEW_RE = re.compile(r'CREATE OR REPLACE VIEW (\w+) AS\n(.*?);\n', re.S)
+SUMMARY_RE = re.compile(r'FUNCTION health_summary\(\).*?\$\$(.*?)\$\$', re.S)
+
+# Postgres spellings in create_health_checks.sql and their SQLite equivalents
+SQLITE_DIALECT = [
+    (re.compile(r'array_agg\((\w+) ORDER BY [^)]*\)'), r'json_group_array(\1)'),
+    (re.compile(r'\bLEAST\('), 'MIN('),
+    (re.compile(r'\bGREATEST\('), 'MAX('),
+    (re.compile(r'\bjson_build_object\('), 'json_object('),
+]
+# Array columns come back from SQLite as JSON text
+ARRAY_COLUMNS = {'event_ids'}
+
+# Tables with the columns the checks read, for SQLite test databases
+SQLITE_TABLES = """
+CREATE TABLE IF NOT EXISTS events (id TEXT PRIMARY KEY, name TEXT NOT NULL, date TEXT, status TEXT,
+                                   created_at TEXT DEFAULT CURRENT_TIMESTAMP);
+CREATE TABLE IF NOT EXISTS fighters (id TEXT PRIMARY KEY, name TEXT NOT NULL, record TEXT, weight_class TEXT);
+CREATE TABLE IF NOT EXISTS fights (id TEXT PRIMARY KEY, event_id TEXT, fighter1_id TEXT, fighter2_id TEXT,
+                                   weight_class TEXT, result TEXT, fight_order INTEGER,
+                                   is_main_event BOOLEAN DEFAULT FALSE, is_co_main_event BOOLEAN DEFAULT FALSE);
+"""
+
+FILTER_OPS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+
+class HealthChecks:
+    """The checks over PostgREST"""
+
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        self.session = supabase_session(supabase_key)
+
+    def rows(self, view: str, order: Optional[str] = None, limit: Optional[int] = None, **filters) -> List[Dict]:
+        params = dict(filters)
+        if order:
+            params['order'] = order
+        if limit is not None:
+            params['limit'] = limit
+        response = self.session.get(f"{self.base_url}/{view}", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def summary(self) -> Dict[str, int]:
+        """Counts for every check (and table), in one call"""
+        response = self.session.post(f"{self.base_url}/rpc/health_summary", json={})
+        response.raise_for_status()
+        return response.json()
+
+    def event_fight_counts(self, order: str = 'date.desc', limit: Optional[int] = None, **filters) -> List[Dict]:
+        """event_id, name, date, fights, fights_with_winner per event"""
+        return self.rows('event_fight_counts', order, limit, **filters)
+
+    def orphan_fights(self, limit: Optional[int] = None) -> List[Dict]:
+        """fight_id, event_id, fighter ids and the problem: no_event, missing_event or missing_fighter"""
+        return self.rows('orphan_fights', 'fight_id', limit)
+
+    def duplicate_event_names(self) -> List[Dict]:
+        """name_key, name, copies and event_ids (oldest first) of events stored more than once"""
+        return self.rows('duplicate_event_names', 'copies.desc')
+
+    def duplicate_fights(self, limit: Optional[int] = None) -> List[Dict]:
+        return self.rows('duplicate_fights', 'copies.desc', limit)
+
+    def fighters_without_records(self, limit: Optional[int] = None) -> List[Dict]:
+        return self.rows('fighters_without_records', 'name', limit)
+
+    def fight_order_mismatches(self, limit: Optional[int] = None, **filters) -> List[Dict]:
+        return self.rows('fight_order_mismatches', 'event_id', limit, **filters)
+
+    def weight_class_counts(self, source: Optional[str] = None) -> List[Dict]:
+        """source ('fights' or 'fighters'), weight_class, count"""
+        filters = {'source': f"eq.{source}"} if source else {}
+        return self.rows('weight_class_counts', 'count.desc', **filters)
+
+
+def _sqlite_sql(sql: str) -> str:
+    for pattern, replacement in SQLITE_DIALECT:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def _literal(value: str):
+    """PostgREST filter values are text; numbers must compare as numbers in SQLite"""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _sqlite_filter(column: str, value: str):
+    """(SQL, params) for one PostgREST filter"""
+    if not re.fullmatch(r'\w+', column):
+        raise ValueError(f"Bad column: {column}")
+    op, _, operand = value.partition('.')
+    if value == 'is.null':
+        return f"{column} IS NULL", []
+    if value == 'not.is.null':
+        return f"{column} IS NOT NULL", []
+    if op == 'in':
+        items = [item.strip('"') for item in operand.strip('()').split(',') if item]
+        return f"{column} IN ({','.join('?' * len(items))})", items
+    if op in FILTER_OPS:
+        return f"{column} {FILTER_OPS[op]} ?", [_literal(operand)]
+    raise ValueError(f"Unsupported filter: {column}={value}")
+
+
+class SQLiteHealthChecks(HealthChecks):
+    """The same checks on a SQLite connection, built from create_health_checks.sql"""
+
+    def __init__(self, conn: sqlite3.Connection, create_tables: bool = False, sql_path: str = SQL_PATH):
+        self.conn = conn
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function('event_match_key', 1, event_match_key, deterministic=True)
+        if create_tables:
+            self.conn.executescript(SQLITE_TABLES)
+
+        with open(sql_path, 'r', encoding='utf-8') as f:
+            sql = f.read()
+        for name, body in VIEW_RE.findall(sql):
+            self.conn.execute(f"DROP VIEW IF EXISTS {name}")
+            self.conn.execute(f"CREATE VIEW {name} AS {_sqlite_sql(body)}")
+        self.summary_sql = _sqlite_sql(SUMMARY_RE.search(sql).group(1))
+
+    def rows(self, view: str, order: Optional[str] = None, limit: Optional[int] = None, **filters) -> List[Dict]:
+        sql, params = f"SELECT * FROM {view}", []
+        clauses = []
+        for column, value in filters.items():
+            clause, values = _sqlite_filter(column, value)
+            clauses.append(clause)
+            params.extend(values)
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if order:
+            terms = []
+            for term in order.split(','):
+                column, _, direction = term.partition('.')
+                terms.append(f"{column} {'DESC' if direction == 'desc' else 'ASC'}")
+            sql += ' ORDER BY ' + ', '.join(terms)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        rows = []
+        for row in self.conn.execute(sql, params):
+            row = dict(row)
+            for column in ARRAY_COLUMNS & row.keys():
+                row[column] = json.loads(row[column])
+            rows.append(row)
+        return rows
+
+    def summary(self) -> Dict[str, int]:
+        return json.loads(self.conn.execute(self.summary_sql).fetchone()[0])
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+History Crawler
+One resumable engine for the Wikipedia fight-history scrapers. Events from
+List_of_UFC_events go into a SQLite work queue and each moves through
+pending -> fetched -> parsed -> written, with the fetched page and parsed
+fights checkpointed along the way. A failed stage is retried with exponential
+backoff, and a rerun picks up exactly where the last one stopped, so a crash
+at event 600 doesn't redo the first 599.
+
+A scraper plugs in by providing:
+    get_all_past_events_with_actual_links() -> [event_data, ...]
+    fetch_event(event_data)          -> page HTML
+    parse_event(event_data, html)    -> [fight_data, ...]
+    write_event(event_data, fights)  -> number of fights written
+parse_event may add details from the page to event_data; they're checkpointed
+with the fights.
+
+Usage: python scripts/history_crawler.py parallel|ultra|enhanced|perfect
+           [--workers N] [--max-events N] [--queue PATH] [--refresh] [--retry-failed] [--reset]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from card_writer import event_source_id
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PENDING, FETCHED, PARSED, WRITTEN, FAILED = 'pending', 'fetched', 'parsed', 'written', 'failed'
+DEFAULT_QUEUE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+MAX_ATTEMPTS = 3
+BACKOFF_SECONDS = 2.0
+
+
+def default_queue_path(name: str) -> str:
+    return os.path.join(DEFAULT_QUEUE_DIR, f"crawl_queue_{name}.sqlite")
+
+
+class CrawlQueue:
+    """SQLite-backed queue of events and how far each one got"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS events ('
+            ' key TEXT PRIMARY KEY, position INTEGER, event TEXT, state TEXT,'
+            ' attempts INTEGER DEFAULT 0, next_attempt REAL DEFAULT 0, claimed INTEGER DEFAULT 0,'
+            ' error TEXT, html BLOB, fights TEXT, written_fights INTEGER, updated_at REAL)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS events_by_state ON events (state, position)')
+        # Claims don't survive a restart; whatever was in flight is picked up again
+        self.conn.execute('UPDATE events SET claimed = 0')
+        self.conn.commit()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+            self.conn.commit()
+            return cursor
+
+    def __len__(self) -> int:
+        return self._execute('SELECT COUNT(*) FROM events').fetchone()[0]
+
+    def seed(self, events: List[Dict]) -> int:
+        """Add events not already queued; returns how many were new"""
+        before = len(self)
+        with self._lock:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO events (key, position, event, state, updated_at) VALUES (?, ?, ?, ?, ?)',
+                [(event_source_id(event['name'], event.get('date')), position, json.dumps(event), PENDING, time.time())
+                 for position, event in enumerate(events)]
+            )
+            self.conn.commit()
+        return len(self) - before
+
+    def claim(self, limit: Optional[int] = None) -> Optional[Dict]:
+        """Next unclaimed event that's due, in list order (first `limit` events only)"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT key, event, state, attempts, html, fights FROM events'
+                ' WHERE state NOT IN (?, ?) AND claimed = 0 AND next_attempt <= ? AND position < ?'
+                ' ORDER BY position LIMIT 1',
+                (WRITTEN, FAILED, time.time(), limit if limit is not None else sys.maxsize)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute('UPDATE events SET claimed = 1 WHERE key = ?', (row[0],))
+            self.conn.commit()
+        key, event, state, attempts, html, fights = row
+        return {
+            'key': key,
+            'event': json.loads(event),
+            'state': state,
+            'attempts': attempts,
+            'html': zlib.decompress(html).decode('utf-8') if html else None,
+            'fights': json.loads(fights) if fights else None,
+        }
+
+    def next_due(self, limit: Optional[int] = None) -> Optional[float]:
+        """When the earliest waiting retry is due, or None if nothing is left to claim"""
+        row = self._execute(
+            'SELECT MIN(next_attempt), COUNT(*) FROM events WHERE state NOT IN (?, ?) AND claimed = 0'
+            ' AND position < ?',
+            (WRITTEN, FAILED, limit if limit is not None else sys.maxsize)
+        ).fetchone()
+        return row[0] if row[1] else None
+
+    def mark_fetched(self, key: str, html: str):
+        self._execute('UPDATE events SET state = ?, html = ?, updated_at = ? WHERE key = ?',
+                      (FETCHED, zlib.compress(html.encode('utf-8')), time.time(), key))
+
+    def mark_parsed(self, key: str, event: Dict, fights: List[Dict]):
+        # The page isn't needed once its fights are stored
+        self._execute('UPDATE events SET state = ?, event = ?, html = NULL, fights = ?, updated_at = ? WHERE key = ?',
+                      (PARSED, json.dumps(event), json.dumps(fights), time.time(), key))
+
+    def mark_written(self, key: str, written_fights: int):
+        self._execute('UPDATE events SET state = ?, fights = NULL, written_fights = ?, error = NULL,'
+                      ' claimed = 0, updated_at = ? WHERE key = ?',
+                      (WRITTEN, written_fights, time.time(), key))
+
+    def mark_error(self, key: str, state: str, attempts: int, error: str, retry_at: Optional[float]):
+        """Record a failed attempt; without retry_at the event is given up on"""
+        html_sql = ', html = NULL' if state == PENDING else ''
+        self._execute(f'UPDATE events SET state = ?, attempts = ?, error = ?, next_attempt = ?, claimed = 0,'
+                      f' updated_at = ?{html_sql} WHERE key = ?',
+                      (state if retry_at is not None else FAILED, attempts, error, retry_at or 0, time.time(), key))
+
+    def clear(self):
+        self._execute('DELETE FROM events')
+
+    def retry_failed(self) -> int:
+        return self._execute('UPDATE events SET state = ?, attempts = 0, next_attempt = 0 WHERE state = ?',
+                             (PENDING, FAILED)).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._execute('SELECT state, COUNT(*) FROM events GROUP BY state').fetchall())
+
+    def written_fights(self) -> int:
+        return self._execute('SELECT COALESCE(SUM(written_fights), 0) FROM events').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class HistoryCrawler:
+    """Runs a scraper's events through the queue on a pool of workers"""
+
+    def __init__(self, scraper, queue_path: str, max_workers: int = 10,
+                 max_attempts: int = MAX_ATTEMPTS, backoff: float = BACKOFF_SECONDS):
+        self.scraper = scraper
+        self.queue = CrawlQueue(queue_path)
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.limit: Optional[int] = None
+
+    def _advance(self, item: Dict):
+        """Take one event as far as it'll go, checkpointing each stage"""
+        key, event, state = item['key'], item['event'], item['state']
+        try:
+            if state == PENDING:
+                item['html'] = self.scraper.fetch_event(event)
+                self.queue.mark_fetched(key, item['html'])
+                state = FETCHED
+            if state == FETCHED:
+                item['fights'] = self.scraper.parse_event(event, item['html'])
+                self.queue.mark_parsed(key, event, item['fights'])
+                state = PARSED
+            written = self.scraper.write_event(event, item['fights'])
+            self.queue.mark_written(key, written)
+            logger.info(f"✅ {event['name']}: {written}/{len(item['fights'])} fights written")
+        except Exception as e:
+            attempts = item['attempts'] + 1
+            # Fetch and parse problems are retried from a fresh download, write problems from the parsed fights
+            retry_state = PARSED if state == PARSED else PENDING
+            retry_at = time.time() + self.backoff * 2 ** (attempts - 1) if attempts < self.max_attempts else None
+            self.queue.mark_error(key, retry_state, attempts, str(e), retry_at)
+            if retry_at is None:
+                logger.error(f"❌ {event['name']} failed after {attempts} attempts: {e}")
+            else:
+                logger.warning(f"⚠️ {event['name']} ({state}): {e}, retrying (attempt {attempts + 1})")
+
+    def _worker(self):
+        while True:
+            item = self.queue.claim(self.limit)
+            if item is None:
+                due = self.queue.next_due(self.limit)
+                if due is None:
+                    return
+                time.sleep(min(max(due - time.time(), 0.05), self.backoff))
+                continue
+            self._advance(item)
+
+    def run(self, max_events: Optional[int] = None, refresh: bool = False, retry_failed: bool = False,
+            reset: bool = False):
+        """Crawl every queued event (the first max_events only, if given).
+
+        The event list is fetched once per queue: refresh re-reads it to pick
+        up new events, reset drops all progress (e.g. after wiping the
+        database) and retry_failed re-queues events that ran out of attempts.
+        """
+        if reset:
+            self.queue.clear()
+        if refresh or not len(self.queue):
+            events = self.scraper.get_all_past_events_with_actual_links()
+            if not events:
+                logger.error("❌ No events found")
+                return None
+            logger.info(f"📋 Queued {self.queue.seed(events)} new events")
+        if retry_failed:
+            logger.info(f"🔁 Re-queued {self.queue.retry_failed()} failed events")
+
+        self.limit = max_events
+        logger.info(f"📊 Queue: {self.queue.counts()}")
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in range(self.max_workers):
+                executor.submit(self._worker)
+
+        counts = self.queue.counts()
+        total_time = time.time() - start_time
+        logger.info("📊 CRAWL SUMMARY")
+        logger.info("=" * 60)
+        logger.info(f"✅ Written events: {counts.get(WRITTEN, 0)}/{len(self.queue)}")
+        logger.info(f"❌ Failed events: {counts.get(FAILED, 0)}")
+        logger.info(f"🎯 Total fights written: {self.queue.written_fights()}")
+        logger.info(f"⏱️ Total time: {total_time/60:.1f} minutes")
+        return counts
+
+
+def make_scraper(name: str, max_workers: Optional[int] = None):
+    if name == 'parallel':
+        from parallel_robust_scraper import ParallelRobustScraper as scraper_class
+    elif name == 'ultra':
+        from ultra_robust_scraper import UltraRobustScraper as scraper_class
+    elif name == 'enhanced':
+        from enhanced_parallel_scraper import EnhancedParallelScraper as scraper_class
+    else:
+        from perfect_order_scraper import PerfectOrderScraper as scraper_class
+    return scraper_class(max_workers=max_workers) if max_workers else scraper_class()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resumable Wikipedia fight-history crawler')
+    parser.add_argument('scraper', choices=['parallel', 'ultra', 'enhanced', 'perfect'])
+    parser.add_argument('--workers', type=int, help="Worker threads (defaults to the scraper's own)")
+    parser.add_argument('--max-events', type=int, help='Only crawl the first N events of the list')
+    parser.add_argument('--queue', help='Queue file (default: scripts/data/crawl_queue_<scraper>.sqlite)')
+    parser.add_argument('--refresh', action='store_true', help='Re-read the event list for new events')
+    parser.add_argument('--retry-failed', action='store_true', help='Re-queue events that ran out of attempts')
+    parser.add_argument('--reset', action='store_true', help='Forget all progress and start over')
+    args = parser.parse_args()
+
+    scraper = make_scraper(args.scraper, args.workers)
+    crawler = HistoryCrawler(scraper, args.queue or default_queue_path(args.scraper),
+                             max_workers=scraper.max_workers)
+    crawler.run(max_events=args.max_events, refresh=args.refresh, retry_failed=args.retry_failed,
+                reset=args.reset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HTTP Client
+Pooled, retrying HTTP sessions for the scripts. Module-level requests.get/post
+open a new TCP+TLS connection to Supabase or Wikipedia on every call; these
+sessions keep connections alive in a sized pool shared by all threads, retry
+429s and 5xx responses with backoff, and apply a default timeout.
+
+    from http_client import client
+    response = client.get(url, headers=headers)
+
+requests.Session isn't thread-safe, so `client` and every session from
+create_session() hand each thread its own requests.Session (own cookies)
+mounted on one shared connection pool; headers set on them apply to all
+threads (e.g. a Wikipedia User-Agent or Supabase credentials).
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import default_headers
+from urllib3.util.retry import Retry
+
+# Connections kept per host, and hosts kept per session; sized for the
+# largest scraper worker pools (15 threads) plus headroom
+POOL_MAXSIZE = 32
+POOL_CONNECTIONS = 10
+
+# (connect, read) seconds, used when a call doesn't pass its own timeout
+DEFAULT_TIMEOUT = (5, 30)
+
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# POST isn't retried on a response, since a row may already have been inserted;
+# connection errors are retried for every method because nothing was sent
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'PATCH'})
+
+
+class PooledSession(requests.Session):
+    """requests.Session that fills in a default timeout"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+class ThreadLocalSession:
+    """One PooledSession per thread over a shared adapter (and so a shared connection pool)"""
+
+    def __init__(self, adapter: HTTPAdapter, timeout=DEFAULT_TIMEOUT):
+        self.adapter = adapter
+        self.timeout = timeout
+        self.headers = default_headers()
+        self._local = threading.local()
+
+    @property
+    def session(self) -> PooledSession:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = PooledSession(timeout=self.timeout)
+            session.mount('https://', self.adapter)
+            session.mount('http://', self.adapter)
+            session.headers = self.headers
+            self._local.session = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.session.put(url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.session.patch(url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.session.delete(url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.session.head(url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+
+def create_session(headers: Optional[Dict[str, str]] = None, pool_maxsize: int = POOL_MAXSIZE,
+                   retries: int = RETRIES, backoff_factor: float = BACKOFF_FACTOR,
+                   timeout=DEFAULT_TIMEOUT) -> ThreadLocalSession:
+    """A keep-alive session with a pool of pool_maxsize connections per host"""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = ThreadLocalSession(adapter, timeout=timeout)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def supabase_session(supabase_key: Optional[str] = None, **kwargs) -> ThreadLocalSession:
+    """Pooled session carrying the Supabase service-key headers"""
+    key = supabase_key or os.getenv('SUPABASE_SERVICE_KEY')
+    return create_session(headers={
+        'apikey': key,
+        'Authorization': f'Bearer {key}',
+        'Content-Type': 'application/json',
+    }, **kwargs)
+
+
+# Shared by every script; headers are passed per call as before
+client = create_session()
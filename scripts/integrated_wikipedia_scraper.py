@@ -5,13 +5,13 @@ Scrapes all UFC events from Wikipedia and their fight data, then populates the d
 """
 
 import os
-import requests
 import re
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import logging
 import time
 import json
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -40,7 +40,7 @@ class IntegratedWikipediaScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -140,7 +140,7 @@ class IntegratedWikipediaScraper:
     def scrape_event_fighters(self, url, event_name):
         """Scrape fighter data from a UFC event page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -230,7 +230,7 @@ class IntegratedWikipediaScraper:
         
         # Test if the URL exists
         try:
-            test_response = requests.head(test_url, headers=self.headers, timeout=5)
+            test_response = client.head(test_url, headers=self.headers, timeout=5)
             if test_response.status_code == 200:
                 return test_url
         except:
@@ -247,7 +247,7 @@ class IntegratedWikipediaScraper:
         for variation in variations:
             test_url = f"{self.base_url}/wiki/{variation}"
             try:
-                test_response = requests.head(test_url, headers=self.headers, timeout=5)
+                test_response = client.head(test_url, headers=self.headers, timeout=5)
                 if test_response.status_code == 200:
                     return test_url
             except:
@@ -260,7 +260,7 @@ class IntegratedWikipediaScraper:
         """Get or create a fighter in the database"""
         try:
             # First, try to get existing fighter
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
                 headers=self.supabase_headers
             )
@@ -278,7 +278,7 @@ class IntegratedWikipediaScraper:
                 'ufc_ranking': None
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 json=fighter_data
@@ -291,7 +291,7 @@ class IntegratedWikipediaScraper:
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fighter by name
                     logger.info(f"📝 Fighter created successfully, fetching ID by name...")
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
                         headers=self.supabase_headers
                     )
@@ -318,7 +318,7 @@ class IntegratedWikipediaScraper:
                 'location': event_data['location']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_to_create
@@ -331,7 +331,7 @@ class IntegratedWikipediaScraper:
                 except (ValueError, KeyError):
                     # If response is empty or doesn't have id, try to get the event by name
                     logger.info(f"📝 Event created successfully, fetching ID by name...")
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -374,7 +374,7 @@ class IntegratedWikipediaScraper:
                 }
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_to_create
@@ -387,7 +387,7 @@ class IntegratedWikipediaScraper:
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fight by event and fighters
                     logger.info(f"📝 Fight created successfully, fetching ID...")
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}&fighter1_id=eq.{winner_id}&fighter2_id=eq.{loser_id}",
                         headers=self.supabase_headers
                     )
@@ -5,12 +5,12 @@ Follows actual links from the main UFC events Wikipedia page to scrape fighter d
 """
 
 import os
-import requests
 import re
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import logging
 import time
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -31,7 +31,7 @@ class LinkFollowingScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -107,7 +107,7 @@ class LinkFollowingScraper:
         """Scrape fighter data from a single event page"""
         try:
             logger.info(f"🔍 Scraping fighters from: {event_name}")
-            response = requests.get(event_url, headers=self.headers)
+            response = client.get(event_url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -5,8 +5,8 @@ Manually wipe all events from the database
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -29,7 +29,7 @@ def manual_wipe_events():
     
     try:
         # First, let's check how many events we have
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1", headers=headers)
         if response.status_code == 200:
             print(f"✅ Database connection successful")
         
@@ -38,7 +38,7 @@ def manual_wipe_events():
         
         # First, delete all fights (to handle foreign key constraints)
         print("🗑️ Deleting all fights first...")
-        delete_fights_response = requests.delete(f"{SUPABASE_URL}/rest/v1/fights?event_id=not.is.null", headers=headers)
+        delete_fights_response = client.delete(f"{SUPABASE_URL}/rest/v1/fights?event_id=not.is.null", headers=headers)
         
         if delete_fights_response.status_code == 200:
             print("✅ Successfully deleted all fights")
@@ -48,7 +48,7 @@ def manual_wipe_events():
         
         # Now delete all events
         print("🗑️ Deleting all events...")
-        delete_response = requests.delete(f"{SUPABASE_URL}/rest/v1/events?name=not.is.null", headers=headers)
+        delete_response = client.delete(f"{SUPABASE_URL}/rest/v1/events?name=not.is.null", headers=headers)
         
         if delete_response.status_code == 200:
             print("✅ Successfully deleted all events")
@@ -58,7 +58,7 @@ def manual_wipe_events():
             
             # Try alternative approach
             print("🔄 Trying alternative delete approach...")
-            delete_response2 = requests.delete(f"{SUPABASE_URL}/rest/v1/events?id=not.is.null", headers=headers)
+            delete_response2 = client.delete(f"{SUPABASE_URL}/rest/v1/events?id=not.is.null", headers=headers)
             
             if delete_response2.status_code == 200:
                 print("✅ Successfully deleted all events (alternative method)")
@@ -6,17 +6,20 @@ Scrapes UFC events with perfect fight ordering
 
 import os
 import sys
-import requests
 import logging
 import time
 import json
 import re
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from http_client import client
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from card_writer import CardWriter, event_source_id, fight_source_ids
+from event_list import load_past_events
+from history_crawler import HistoryCrawler, default_queue_path
 
 load_dotenv('.env')
 
@@ -38,59 +41,18 @@ class PerfectOrderScraper:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
-        self.lock = Lock()
+        self.writer = CardWriter(SUPABASE_URL, SUPABASE_KEY)
 
     def get_all_past_events_with_actual_links(self):
-        """Get all past UFC events with their Wikipedia links"""
+        """Get all past UFC events with their Wikipedia links, dates and venues from the list page"""
         try:
-            logger.info("🔍 Loading main UFC events page: https://en.wikipedia.org/wiki/List_of_UFC_events")
-            response = requests.get("https://en.wikipedia.org/wiki/List_of_UFC_events", headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            logger.info("✅ Successfully loaded main UFC events page")
-            
-            # Find all tables
-            tables = soup.find_all('table')
-            logger.info(f"📊 Found {len(tables)} total tables on page")
-            
-            # Find the Past events table
-            past_events_table = None
-            for table in tables:
-                if 'Past events' in table.get_text():
-                    past_events_table = table
-                    break
-            
-            if not past_events_table:
-                logger.error("❌ Could not find Past events table")
-                return []
-            
-            logger.info("✅ Found Past events table")
-            
-            # Extract all UFC event links
-            ufc_links = []
-            rows = past_events_table.find_all('tr')
-            logger.info(f"📊 Found {len(rows)} total rows in Past events table")
-            
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    # Look for UFC references
-                    cell_text = row.get_text()
-                    if 'UFC' in cell_text:
-                        # Find all links in this row
-                        links = row.find_all('a')
-                        for link in links:
-                            href = link.get('href')
-                            if href and '/wiki/UFC_' in href:
-                                event_name = link.get_text(strip=True)
-                                event_url = urljoin(self.base_url, href)
-                                ufc_links.append({
-                                    'name': event_name,
-                                    'url': event_url
-                                })
-            
-            logger.info(f"📊 Found {len(ufc_links)} UFC events with links")
-            return ufc_links
+            events = [
+                {'name': event['name'], 'url': event['url'], 'date': event['date'],
+                 'venue': event['venue'], 'location': event['location']}
+                for event in load_past_events() if event['url'] and '/wiki/UFC' in event['url']
+            ]
+            logger.info(f"📊 Found {len(events)} UFC events with links")
+            return events
             
         except Exception as e:
             logger.error(f"❌ Error getting UFC events: {e}")
@@ -123,52 +85,35 @@ class PerfectOrderScraper:
             logger.warning(f"⚠️ Error parsing date '{date_str}': {e}")
             return None
 
-    def process_single_event(self, event_data):
-        """Process a single UFC event"""
-        try:
-            event_name = event_data['name']
-            event_url = event_data['url']
-            
-            logger.info(f"🔍 Processing event: {event_name}")
-            
-            # Get event info
-            event_info = self.get_event_info(event_url)
-            if not event_info:
-                logger.warning(f"⚠️ Could not get event info for {event_name}")
-                return False
-            
-            # Create event in database
-            event_id = self.create_event(event_data, event_info)
-            if not event_id:
-                logger.error(f"❌ Failed to create event: {event_name}")
-                return False
-            
-            # Scrape fights with perfect ordering
-            fights = self.scrape_event_fights_perfect_order(event_url, event_name)
-            if not fights:
-                logger.warning(f"⚠️ No fights found for {event_name}")
-                return True  # Event created but no fights
-            
-            # Create fights in database
-            created_fights = 0
-            for fight_data in fights:
-                if self.create_fight_with_winner_loser(fight_data, event_id):
-                    created_fights += 1
-            
-            logger.info(f"✅ Event {event_name}: {created_fights}/{len(fights)} fights created")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Error processing event {event_data.get('name', 'Unknown')}: {e}")
-            return False
+    def fetch_event(self, event_data):
+        """Download an event's Wikipedia page"""
+        response = client.get(event_data['url'], headers=self.headers, timeout=30)
+        response.raise_for_status()
+        return response.text
+
+    def parse_event(self, event_data, html):
+        """Fights from an event page in card order; the infobox fills in a date or venue the list page lacked"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        if not event_data.get('date') or not event_data.get('venue'):
+            event_info = self.get_event_info(soup)
+            if not event_data.get('date'):
+                event_data['date'] = event_info['date'].isoformat() if event_info['date'] else None
+            event_data['venue'] = event_data.get('venue') or event_info['venue'] or 'Unknown'
+        
+        return self.scrape_event_fights_perfect_order(soup, event_data['name'])
+
+    def write_event(self, event_data, fights):
+        """Write the event and all its fights as one bulk upsert each"""
+        event_row = self.build_event_row(event_data)
+        event_id, fight_ids = self.writer.write_card(event_row, self.build_fight_rows(fights, event_row))
+        if not event_id:
+            raise RuntimeError("event was not written")
+        return len(fight_ids)
 
-    def get_event_info(self, url):
+    def get_event_info(self, soup):
         """Extract event information from Wikipedia page"""
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Extract event details
             event_info = {
                 'name': '',
@@ -204,16 +149,12 @@ class PerfectOrderScraper:
             return event_info
             
         except Exception as e:
-            logger.error(f"❌ Error getting event info from {url}: {e}")
-            return None
+            logger.error(f"❌ Error getting event info: {e}")
+            return {'name': '', 'date': None, 'location': '', 'venue': ''}
 
-    def scrape_event_fights_perfect_order(self, url, event_name):
+    def scrape_event_fights_perfect_order(self, soup, event_name):
         """Extract ALL fights from a UFC event page with PERFECT ordering"""
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Find all tables in document order
             tables = soup.find_all('table')
             all_fights = []
@@ -248,7 +189,7 @@ class PerfectOrderScraper:
             return all_fights
             
         except Exception as e:
-            logger.error(f"❌ Error scraping fights from {url}: {e}")
+            logger.error(f"❌ Error scraping fights from {event_name}: {e}")
             return []
 
     def _is_fight_table(self, table):
@@ -383,55 +324,22 @@ class PerfectOrderScraper:
         except:
             return method.strip()
 
-    def create_event(self, event_data, event_info):
-        """Create event in Supabase"""
-        try:
-            event_payload = {
-                'name': event_data['name'],
-                'location': event_info.get('venue', 'Unknown'),
-                'date': event_info.get('date').isoformat() if event_info.get('date') else None
-            }
-            
-            logger.info(f"📝 Creating event: {event_data['name']}")
-            
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/events",
-                headers=self.supabase_headers,
-                json=event_payload
-            )
-            
-            if response.status_code == 201:
-                # Supabase returns empty response, so we need to get the created event ID
-                logger.info(f"✅ Created event: {event_data['name']}")
-                
-                # Get the created event by name
-                get_response = requests.get(
-                    f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
-                    headers=self.supabase_headers
-                )
-                
-                if get_response.status_code == 200:
-                    events = get_response.json()
-                    if events:
-                        event_id = events[0]['id']
-                        logger.info(f"✅ Event ID: {event_id}")
-                        return event_id
-                
-                logger.error(f"❌ Could not get event ID for: {event_data['name']}")
-                return None
-            else:
-                logger.error(f"❌ Error creating event: {response.status_code} - {response.text}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ Error creating event: {e}")
-            return None
+    def build_event_row(self, event_data):
+        """Events row for a card, keyed on its stable source ID"""
+        return {
+            'source_id': event_source_id(event_data['name'], event_data.get('date')),
+            'name': event_data['name'],
+            'location': event_data.get('venue', 'Unknown'),
+            'date': event_data.get('date')
+        }
 
-    def create_fight_with_winner_loser(self, fight_data, event_id):
-        """Create fight with winner/loser names in Supabase"""
-        try:
-            fight_payload = {
-                'event_id': event_id,
+    def build_fight_rows(self, fights, event_row):
+        """Fights rows with winner/loser names; the writer links them to the event"""
+        source_ids = fight_source_ids(event_row['name'], event_row['date'],
+                                      [(fight_data['winner_name'], fight_data['loser_name']) for fight_data in fights])
+        return [
+            {
+                'source_id': source_id,
                 'weight_class': fight_data['weight_class'],
                 'winner_name': fight_data['winner_name'],
                 'loser_name': fight_data['loser_name'],
@@ -443,60 +351,24 @@ class PerfectOrderScraper:
                 'is_co_main_event': fight_data['is_co_main_event'],
                 'status': 'completed'
             }
-            
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/fights",
-                headers=self.supabase_headers,
-                json=fight_payload
-            )
-            
-            if response.status_code == 201:
-                logger.info(f"✅ Created fight: {fight_data['winner_name']} def. {fight_data['loser_name']}")
-                return True
-            else:
-                logger.error(f"❌ Error creating fight: {response.status_code} - {response.text}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ Error creating fight: {e}")
-            return False
+            for source_id, fight_data in zip(source_ids, fights)
+        ]
+
+    def run_perfect_order_scraper(self, max_events=None, reset=False):
+        """Run the perfect order scraper through the resumable history crawler.
 
-    def run_perfect_order_scraper(self, max_events=None, start_from=0):
-        """Run the perfect order scraper"""
+        Progress is kept in scripts/data/crawl_queue_perfect.sqlite, so a rerun
+        continues where the last one stopped; pass reset=True after wiping
+        the database to start over.
+        """
         logger.info("🚀 Starting PERFECT ORDER Wikipedia UFC Scraper")
         
-        # Get all UFC events
-        events = self.get_all_past_events_with_actual_links()
-        if not events:
-            logger.error("❌ No events found")
-            return
-        
-        # Limit events if specified
-        if max_events:
-            events = events[start_from:start_from + max_events]
-        
-        logger.info(f"📊 Processing {len(events)} events (starting from {start_from})")
-        
-        successful_events = 0
-        failed_events = 0
-        total_fights = 0
-        
-        # Process events
-        for event_data in events:
-            logger.info(f"🔍 Processing event: {event_data['name']}")
-            if self.process_single_event(event_data):
-                successful_events += 1
-            else:
-                failed_events += 1
-        
-        logger.info("🎉 PERFECT ORDER SCRAPER COMPLETED!")
-        logger.info(f"📊 Successful events: {successful_events}")
-        logger.info(f"📊 Failed events: {failed_events}")
-        logger.info(f"📊 Total fights: {total_fights}")
+        crawler = HistoryCrawler(self, default_queue_path('perfect'), max_workers=self.max_workers)
+        return crawler.run(max_events=max_events, reset=reset)
 
 def main():
     scraper = PerfectOrderScraper()
-    scraper.run_perfect_order_scraper(max_events=5, start_from=0)
+    scraper.run_perfect_order_scraper(max_events=5)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
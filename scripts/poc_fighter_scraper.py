@@ -5,11 +5,11 @@ Scrapes fighter data from a single UFC event Wikipedia page
 """
 
 import os
-import requests
 import re
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import logging
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -36,7 +36,7 @@ class POCFighterScraper:
         
         try:
             # Get the most recent event
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id,name,date&order=date.desc&limit=1",
                 headers=headers
             )
@@ -88,7 +88,7 @@ class POCFighterScraper:
     def scrape_fight_card_tables(self, url):
         """Scrape fighter data from fight card tables"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
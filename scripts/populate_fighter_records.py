@@ -6,10 +6,10 @@ Populate fighter records from existing fighter profile data
 
 import os
 import sys
-import requests
 import logging
 import json
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -43,7 +43,7 @@ class FighterRecordPopulator:
     def get_all_fighters(self):
         """Get all fighters from database"""
         try:
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id,name",
                 headers=self.supabase_headers
             )
@@ -77,7 +77,7 @@ class FighterRecordPopulator:
     def update_fighter_record(self, fighter_id, record):
         """Update fighter record in database"""
         try:
-            response = requests.patch(
+            response = client.patch(
                 f"{SUPABASE_URL}/rest/v1/fighters?id=eq.{fighter_id}",
                 headers=self.supabase_headers,
                 json={'record': record}
@@ -6,9 +6,9 @@ Takes the focused scraper data and populates it into Supabase database
 
 import os
 import json
-import requests
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -30,7 +30,7 @@ class FocusedDataPopulator:
             return None
             
         # First try to find existing fighter
-        response = requests.get(
+        response = client.get(
             f"{self.supabase_url}/rest/v1/fighters?name=eq.{name}&select=id",
             headers=self.headers
         )
@@ -46,7 +46,7 @@ class FocusedDataPopulator:
             'ufc_ranking': None
         }
         
-        response = requests.post(
+        response = client.post(
             f"{self.supabase_url}/rest/v1/fighters",
             headers=self.headers,
             json=fighter_data
@@ -67,7 +67,7 @@ class FocusedDataPopulator:
             'location': None
         }
         
-        response = requests.post(
+        response = client.post(
             f"{self.supabase_url}/rest/v1/events",
             headers=self.headers,
             json=event_data
@@ -97,7 +97,7 @@ class FocusedDataPopulator:
             }
         }
         
-        response = requests.post(
+        response = client.post(
             f"{self.supabase_url}/rest/v1/fights",
             headers=self.headers,
             json=fight_data
@@ -6,9 +6,9 @@ Takes scraped Wikipedia data and populates it into Supabase database
 
 import os
 import json
-import requests
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -39,7 +39,7 @@ class WikipediaDataPopulator:
         """Get or create fighter in database"""
         try:
             # Check if fighter exists
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
                 headers=self.headers
             )
@@ -57,7 +57,7 @@ class WikipediaDataPopulator:
                 'is_active': 'Active'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/fighters",
                 headers=self.headers,
                 json=fighter_to_create
@@ -65,7 +65,7 @@ class WikipediaDataPopulator:
             
             if response.status_code == 201:
                 # Get the created fighter ID
-                response = requests.get(
+                response = client.get(
                     f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
                     headers=self.headers
                 )
@@ -91,7 +91,7 @@ class WikipediaDataPopulator:
                 'status': 'completed'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/events",
                 headers=self.headers,
                 json=event_to_create
@@ -99,7 +99,7 @@ class WikipediaDataPopulator:
             
             if response.status_code == 201:
                 # Get the created event ID
-                response = requests.get(
+                response = client.get(
                     f"{self.supabase_url}/rest/v1/events?name=eq.{event_data.get('title', 'Unknown Event')}",
                     headers=self.headers
                 )
@@ -148,7 +148,7 @@ class WikipediaDataPopulator:
                 'weight_class': fight_data.get('weight_class', 'Unknown')
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/fights",
                 headers=self.headers,
                 json=fight_to_create
@@ -185,7 +185,7 @@ class WikipediaDataPopulator:
             print(f"\n📅 Processing: {event_info.get('title', 'Unknown Event')}")
             
             # Check if event already exists
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/events?name=eq.{event_info.get('title', 'Unknown Event')}",
                 headers=self.headers
             )
@@ -213,7 +213,7 @@ class WikipediaDataPopulator:
                 print(f"   ✅ Created event: {event_info.get('title', 'Unknown Event')}")
             
             # Check if fights already exist for this event
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event_id}&select=id&limit=1",
                 headers=self.headers
             )
@@ -243,7 +243,7 @@ class WikipediaDataPopulator:
         
         try:
             # Check events
-            events_response = requests.get(
+            events_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date&order=date.desc&limit=10",
                 headers=self.headers
             )
@@ -254,7 +254,7 @@ class WikipediaDataPopulator:
                     print(f"      ✅ {event['name']} ({event['date']})")
             
             # Check fights
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id,event_id&limit=10",
                 headers=self.headers
             )
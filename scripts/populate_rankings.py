@@ -6,10 +6,10 @@ Populate the scraped rankings back into the database
 
 import os
 import sys
-import requests
 import json
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -40,7 +40,7 @@ def get_or_create_fighter(fighter_name):
         }
         
         # First, try to get existing fighter
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
             headers=headers
         )
@@ -58,7 +58,7 @@ def get_or_create_fighter(fighter_name):
             'ufc_ranking': None
         }
         
-        response = requests.post(
+        response = client.post(
             f"{SUPABASE_URL}/rest/v1/fighters",
             headers=headers,
             json=fighter_data
@@ -70,7 +70,7 @@ def get_or_create_fighter(fighter_name):
                 return response.json()['id']
             except (ValueError, KeyError):
                 # If response is empty, try to get the fighter by name
-                fetch_response = requests.get(
+                fetch_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
                     headers=headers
                 )
@@ -108,7 +108,7 @@ def create_ranking(ranking_data):
             'rank_type': ranking_data['rank_type']
         }
         
-        response = requests.post(
+        response = client.post(
             f"{SUPABASE_URL}/rest/v1/rankings",
             headers=headers,
             json=ranking_to_create
@@ -120,7 +120,7 @@ def create_ranking(ranking_data):
                 return response.json()['id']
             except (ValueError, KeyError):
                 # If response is empty, try to get the ranking by fighter and division
-                fetch_response = requests.get(
+                fetch_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/rankings?fighter_id=eq.{fighter_id}&weight_class=eq.{ranking_data['division']}",
                     headers=headers
                 )
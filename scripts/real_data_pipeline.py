@@ -7,10 +7,10 @@ Uses scrapers to get real UFC data and create clean fight cards with results
 import os
 import sys
 import json
-import requests
 import time
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
 
 # Add scrapers to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scrapers'))
@@ -43,7 +43,7 @@ class RealDataPipeline:
         
         for table in tables:
             try:
-                response = requests.delete(f"{self.supabase_url}/rest/v1/{table}", headers=self.headers)
+                response = client.delete(f"{self.supabase_url}/rest/v1/{table}", headers=self.headers)
                 print(f"   ✅ Cleared {table}: {response.status_code}")
             except Exception as e:
                 print(f"   ❌ Error clearing {table}: {e}")
@@ -89,7 +89,7 @@ class RealDataPipeline:
             uploaded_fighters = []
             for fighter in fighters:
                 try:
-                    response = requests.post(
+                    response = client.post(
                         f"{self.supabase_url}/rest/v1/fighters",
                         headers=self.headers,
                         json=fighter
@@ -138,7 +138,7 @@ class RealDataPipeline:
                         'status': 'completed' if event.get('date') else 'scheduled'
                     }
                     
-                    response = requests.post(
+                    response = client.post(
                         f"{self.supabase_url}/rest/v1/events",
                         headers=self.headers,
                         json=event_data
@@ -168,8 +168,8 @@ class RealDataPipeline:
         
         try:
             # Get fighters and events from database
-            fighters_response = requests.get(f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class&limit=100", headers=self.headers)
-            events_response = requests.get(f"{self.supabase_url}/rest/v1/events?select=id,name,date&limit=20", headers=self.headers)
+            fighters_response = client.get(f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class&limit=100", headers=self.headers)
+            events_response = client.get(f"{self.supabase_url}/rest/v1/events?select=id,name,date&limit=20", headers=self.headers)
             
             if fighters_response.status_code != 200 or events_response.status_code != 200:
                 print("❌ Failed to get fighters or events from database")
@@ -209,7 +209,7 @@ class RealDataPipeline:
                         }
                         
                         try:
-                            response = requests.post(
+                            response = client.post(
                                 f"{self.supabase_url}/rest/v1/fights",
                                 headers=self.headers,
                                 json=fight_data
@@ -237,7 +237,7 @@ class RealDataPipeline:
         
         try:
             # Check events
-            events_response = requests.get(f"{self.supabase_url}/rest/v1/events?select=name,status&limit=10", headers=self.headers)
+            events_response = client.get(f"{self.supabase_url}/rest/v1/events?select=name,status&limit=10", headers=self.headers)
             if events_response.status_code == 200:
                 events = events_response.json()
                 print(f"   📊 Events: {len(events)}")
@@ -245,7 +245,7 @@ class RealDataPipeline:
                     print(f"      - {event['name']} ({event['status']})")
             
             # Check fighters
-            fighters_response = requests.get(f"{self.supabase_url}/rest/v1/fighters?select=name,weight_class&limit=10", headers=self.headers)
+            fighters_response = client.get(f"{self.supabase_url}/rest/v1/fighters?select=name,weight_class&limit=10", headers=self.headers)
             if fighters_response.status_code == 200:
                 fighters = fighters_response.json()
                 print(f"   📊 Fighters: {len(fighters)}")
@@ -253,7 +253,7 @@ class RealDataPipeline:
                     print(f"      - {fighter['name']} ({fighter.get('weight_class', 'N/A')})")
             
             # Check fights
-            fights_response = requests.get(f"{self.supabase_url}/rest/v1/fights?select=status,result&limit=10", headers=self.headers)
+            fights_response = client.get(f"{self.supabase_url}/rest/v1/fights?select=status,result&limit=10", headers=self.headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 print(f"   📊 Fights: {len(fights)}")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Record Engine
+Set-based fighter record recomputation. Fights are read once in pages,
+W-L-D is aggregated for every fighter in a single pass, and only records
+that actually changed are written back as bulk upserts, instead of one fights
+query and one PATCH per fighter.
+
+Incremental runs keep a created_at watermark of the newest fight seen and
+recompute only the fighters in fights added since then. Edits to existing
+fight results need a full run.
+
+Usage: python scripts/record_engine.py [--incremental] [--state PATH] [--dry-run]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Set
+
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from http_client import supabase_session
+
+load_dotenv('scripts/.env')
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000
+WRITE_CHUNK_SIZE = 500
+# Fighter IDs per or=(fighter1_id.in.(...),fighter2_id.in.(...)) filter, so URLs stay short
+FILTER_CHUNK_SIZE = 50
+FIGHT_COLUMNS = 'id,fighter1_id,fighter2_id,result,created_at'
+DEFAULT_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'record_engine_state.json')
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def empty_record() -> Dict[str, int]:
+    return {'wins': 0, 'losses': 0, 'draws': 0, 'total': 0}
+
+
+def record_string(record: Dict[str, int]) -> str:
+    return f"{record['wins']}-{record['losses']}-{record['draws']}"
+
+
+def aggregate_records(fights: Iterable[Dict]) -> Dict[str, Dict[str, int]]:
+    """W-L-D for every fighter in the fights, in one pass.
+
+    Same rules as the per-fighter calculation: fights without a result don't
+    count, a result without a winner is a draw (or no contest). Every fighter
+    in the fights gets a record, 0-0-0 if none of their fights has a result.
+    """
+    records: Dict[str, Dict[str, int]] = {}
+    for fight in fights:
+        fighter_ids = [fighter_id for fighter_id in (fight.get('fighter1_id'), fight.get('fighter2_id')) if fighter_id]
+        for fighter_id in fighter_ids:
+            records.setdefault(fighter_id, empty_record())
+        result = fight.get('result')
+        if not result:
+            continue
+        winner_id = result.get('winner_id')
+        for fighter_id in fighter_ids:
+            record = records[fighter_id]
+            if winner_id == fighter_id:
+                record['wins'] += 1
+            elif winner_id is not None:
+                record['losses'] += 1
+            else:
+                record['draws'] += 1
+            record['total'] += 1
+    return records
+
+
+class RecordEngine:
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 page_size: int = PAGE_SIZE):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        self.session = supabase_session(supabase_key)
+        self.page_size = page_size
+
+    def _select(self, table: str, params: Dict) -> List[Dict]:
+        """Every matching row, read in pages ordered by id"""
+        rows = []
+        offset = 0
+        while True:
+            response = self.session.get(
+                f"{self.base_url}/{table}",
+                params={**params, 'order': 'id', 'limit': self.page_size, 'offset': offset}
+            )
+            response.raise_for_status()
+            page = response.json()
+            rows.extend(page)
+            if len(page) < self.page_size:
+                return rows
+            offset += self.page_size
+
+    def fetch_fighters(self, fighter_ids: Optional[Iterable[str]] = None) -> List[Dict]:
+        if fighter_ids is None:
+            return self._select('fighters', {'select': 'id,name,record'})
+        fighters = []
+        for chunk in _chunks(sorted(fighter_ids), FILTER_CHUNK_SIZE):
+            fighters.extend(self._select('fighters', {'select': 'id,name,record', 'id': f"in.({','.join(chunk)})"}))
+        return fighters
+
+    def fetch_fights(self, fighter_ids: Optional[Iterable[str]] = None, since: Optional[str] = None) -> List[Dict]:
+        """All fights, the fights of the given fighters, or those created at or after since"""
+        params = {'select': FIGHT_COLUMNS}
+        if since:
+            # gte: a fight inserted later with the watermark's exact created_at must still be
+            # seen; re-reading the boundary fight just recomputes records that don't change
+            params['created_at'] = f"gte.{since}"
+        if fighter_ids is None:
+            return self._select('fights', params)
+        fights = {}
+        for chunk in _chunks(sorted(fighter_ids), FILTER_CHUNK_SIZE):
+            ids = ','.join(chunk)
+            for fight in self._select('fights', {**params, 'or': f"(fighter1_id.in.({ids}),fighter2_id.in.({ids}))"}):
+                fights[fight['id']] = fight
+        return list(fights.values())
+
+    def fetch_ranked_fighter_ids(self) -> Set[str]:
+        return {row['fighter_id'] for row in self._select('rankings', {'select': 'id,fighter_id'}) if row['fighter_id']}
+
+    def write_records(self, rows: List[Dict]):
+        """Bulk upsert {id, name, record} rows (name keeps the insert half of the upsert valid)"""
+        for chunk in _chunks(rows, WRITE_CHUNK_SIZE):
+            response = self.session.post(
+                f"{self.base_url}/fighters",
+                params={'on_conflict': 'id', 'columns': 'id,name,record'},
+                headers={'Prefer': 'resolution=merge-duplicates,return=minimal'},
+                json=chunk
+            )
+            response.raise_for_status()
+
+    def recompute(self, fighter_ids: Optional[Iterable[str]] = None, only_missing: bool = False,
+                  dry_run: bool = False) -> Dict[str, int]:
+        """Recompute records for all fighters (or just fighter_ids) and write the changed ones.
+
+        only_missing leaves fighters that already have a record alone.
+        """
+        fighter_ids = set(fighter_ids) if fighter_ids is not None else None
+        fighters = self.fetch_fighters(fighter_ids)
+        if only_missing:
+            fighters = [f for f in fighters if not f.get('record') or f['record'] == 'None']
+            fighter_ids = {f['id'] for f in fighters}
+        logger.info(f"📊 Recomputing records for {len(fighters)} fighters")
+
+        if fighter_ids is not None and not fighter_ids:
+            return {'fighters': 0, 'with_fights': 0, 'changed': 0}
+        records = aggregate_records(self.fetch_fights(fighter_ids))
+
+        changed = []
+        for fighter in fighters:
+            record = records.get(fighter['id'])
+            if record is None:  # no fights, so nothing to recompute
+                continue
+            text = record_string(record)
+            if fighter.get('record') != text:
+                changed.append({'id': fighter['id'], 'name': fighter['name'], 'record': text})
+
+        if changed and not dry_run:
+            self.write_records(changed)
+        summary = {'fighters': len(fighters), 'with_fights': sum(1 for f in fighters if f['id'] in records),
+                   'changed': len(changed)}
+        logger.info(f"✅ {summary['changed']} records changed ({summary['with_fights']} fighters with fights)")
+        return summary
+
+    def recompute_incremental(self, state_path: str = DEFAULT_STATE_PATH, dry_run: bool = False) -> Dict[str, int]:
+        """Recompute only fighters in fights created since the last run's watermark"""
+        state = {}
+        if os.path.exists(state_path):
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+        since = state.get('fights_created_at')
+
+        new_fights = self.fetch_fights(since=since)
+        if not new_fights:
+            logger.info("✅ No new fights since the last run")
+            return {'fighters': 0, 'with_fights': 0, 'changed': 0}
+        touched = {fighter_id for fight in new_fights
+                   for fighter_id in (fight.get('fighter1_id'), fight.get('fighter2_id')) if fighter_id}
+        logger.info(f"🔍 {len(new_fights)} new fights touch {len(touched)} fighters")
+
+        summary = self.recompute(touched, dry_run=dry_run)
+        if not dry_run:
+            watermark = max(fight['created_at'] for fight in new_fights if fight.get('created_at'))
+            with open(state_path, 'w') as f:
+                json.dump({'fights_created_at': watermark}, f)
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recompute fighter records from the fights table')
+    parser.add_argument('--incremental', action='store_true', help='Only fighters in fights added since the last run')
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH, help='Watermark file for incremental runs')
+    parser.add_argument('--dry-run', action='store_true', help="Compute but don't write")
+    args = parser.parse_args()
+
+    engine = RecordEngine()
+    if args.incremental:
+        engine.recompute_incremental(args.state, dry_run=args.dry_run)
+    else:
+        engine.recompute(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
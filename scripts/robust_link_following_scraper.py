@@ -5,13 +5,13 @@ Extracts actual Wikipedia links from the table and uses them for scraping
 """
 
 import os
-import requests
 import re
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 import logging
 import time
 import json
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -40,7 +40,7 @@ class RobustLinkFollowingScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -161,7 +161,7 @@ class RobustLinkFollowingScraper:
     def scrape_event_fighters(self, url, event_name):
         """Scrape fighter data from a UFC event page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -233,7 +233,7 @@ class RobustLinkFollowingScraper:
         """Get or create a fighter in the database"""
         try:
             # First, try to get existing fighter
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
                 headers=self.supabase_headers
             )
@@ -251,7 +251,7 @@ class RobustLinkFollowingScraper:
                 'ufc_ranking': None
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 json=fighter_data
@@ -263,7 +263,7 @@ class RobustLinkFollowingScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fighter by name
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter_name}",
                         headers=self.supabase_headers
                     )
@@ -290,7 +290,7 @@ class RobustLinkFollowingScraper:
                 'location': event_data['location']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_to_create
@@ -302,7 +302,7 @@ class RobustLinkFollowingScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the event by name
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -345,7 +345,7 @@ class RobustLinkFollowingScraper:
                 }
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_to_create
@@ -357,7 +357,7 @@ class RobustLinkFollowingScraper:
                     return response.json()['id']
                 except (ValueError, KeyError):
                     # If response is empty, try to get the fight by event and fighters
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}&fighter1_id=eq.{winner_id}&fighter2_id=eq.{loser_id}",
                         headers=self.supabase_headers
                     )
@@ -6,7 +6,6 @@ Scrapes every single fight from Wikipedia with perfect accuracy
 
 import os
 import sys
-import requests
 import logging
 import time
 import json
@@ -18,6 +17,7 @@ from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import argparse
+from http_client import client
 
 load_dotenv('.env')
 
@@ -52,7 +52,7 @@ class RobustWikipediaScraper:
         
         try:
             logger.info(f"🔍 Loading main UFC events page: {url}")
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -211,7 +211,7 @@ class RobustWikipediaScraper:
     def get_event_info(self, url):
         """Extract event information from Wikipedia page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -251,7 +251,7 @@ class RobustWikipediaScraper:
     def scrape_event_fights_robust(self, url, event_name):
         """Extract ALL fights from a UFC event page with perfect accuracy"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -454,7 +454,7 @@ class RobustWikipediaScraper:
         """Create event in Supabase database"""
         try:
             # Check if event already exists
-            check_response = requests.get(
+            check_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': f'eq.{event_data["name"]}', 'select': 'id'}
@@ -483,7 +483,7 @@ class RobustWikipediaScraper:
             if preferred_date is not None:
                 event_payload['date'] = preferred_date.isoformat()
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_payload
@@ -491,7 +491,7 @@ class RobustWikipediaScraper:
             
             if response.status_code == 201:
                 # Get the created event ID
-                events_response = requests.get(
+                events_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/events",
                     headers=self.supabase_headers,
                     params={'name': f'eq.{event_data["name"]}', 'select': 'id', 'limit': 1}
@@ -515,7 +515,7 @@ class RobustWikipediaScraper:
         """Create fight in Supabase database with winner/loser data"""
         try:
             # Check if this fight already exists
-            check_response = requests.get(
+            check_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={
@@ -546,7 +546,7 @@ class RobustWikipediaScraper:
                 'status': 'completed'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_payload
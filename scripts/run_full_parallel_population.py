@@ -39,7 +39,7 @@ def run_full_parallel_population():
     logger.info("📊 Expected fights: ~8,000+ fights")
     
     # Run without any limits to process all events
-    scraper.run_parallel_scraper(max_events=None, start_from=0)
+    scraper.run_parallel_scraper(max_events=None)
     
     logger.info("🎉 Full parallel population completed!")
     logger.info("=" * 60)
@@ -39,7 +39,7 @@ def run_full_ultra_robust_scraper():
     logger.info("🎯 Expected success rate: ~85-90% (filtering out future events)")
     
     # Run without any limits to process all events
-    scraper.run_ultra_robust_scraper(max_events=None, start_from=0)
+    scraper.run_ultra_robust_scraper(max_events=None)
     
     logger.info("🎉 Full ultra robust scraper completed!")
     logger.info("=" * 60)
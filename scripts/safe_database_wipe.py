@@ -6,9 +6,9 @@ Wipe fights, fighters, and events but NEVER touch rankings
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -34,7 +34,7 @@ class SafeDatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}  # Delete all fights
@@ -48,7 +48,7 @@ class SafeDatabaseWiper:
             
             # Step 2: Delete all fighters
             logger.info("🗑️ Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all fighters
@@ -62,7 +62,7 @@ class SafeDatabaseWiper:
             
             # Step 3: Delete all events
             logger.info("🗑️ Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all events
@@ -76,7 +76,7 @@ class SafeDatabaseWiper:
             
             # Step 4: VERIFY RANKINGS ARE STILL THERE
             logger.info("🔍 Verifying rankings are preserved...")
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -100,7 +100,7 @@ class SafeDatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -112,7 +112,7 @@ class SafeDatabaseWiper:
                     logger.info("✅ Events table is empty")
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -124,7 +124,7 @@ class SafeDatabaseWiper:
                     logger.info("✅ Fighters table is empty")
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -136,7 +136,7 @@ class SafeDatabaseWiper:
                     logger.info("✅ Fights table is empty")
             
             # Check rankings (SHOULD BE THERE)
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id",
                 headers=self.supabase_headers
             )
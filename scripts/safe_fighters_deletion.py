@@ -6,9 +6,9 @@ Safely delete fighters table records while checking foreign key constraints
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -30,7 +30,7 @@ def check_foreign_key_constraints():
     
     try:
         # Check if fights table has any records that reference fighters
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?select=id,fighter1_id,fighter2_id&limit=1",
             headers=headers
         )
@@ -43,7 +43,7 @@ def check_foreign_key_constraints():
                 logger.info("✅ No fights found - safe to delete fighters")
         
         # Check if rankings table has any records that reference fighters
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/rankings?select=id,fighter_id&limit=1",
             headers=headers
         )
@@ -74,7 +74,7 @@ def delete_all_fighters():
     
     try:
         # First, get the count of fighters
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fighters?select=id",
             headers=headers
         )
@@ -88,7 +88,7 @@ def delete_all_fighters():
                 return True
         
         # Delete all fighters
-        response = requests.delete(
+        response = client.delete(
             f"{SUPABASE_URL}/rest/v1/fighters",
             headers=headers,
             params={'name': 'not.is.null'}  # Delete all fighters
@@ -117,7 +117,7 @@ def verify_fighters_deleted():
     }
     
     try:
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
             headers=headers
         )
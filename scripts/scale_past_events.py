@@ -5,10 +5,15 @@ Add more past UFC events to scale up the fight cards functionality
 """
 
 import os
+import sys
 import requests
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from fighter_loader import FighterLoader
 
 load_dotenv('scripts/.env')
 
@@ -23,6 +28,10 @@ class PastEventsScaler:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
+        self.fighters = FighterLoader(SUPABASE_URL, SUPABASE_KEY,
+                                      defaults={'weight_class': 'Unknown',
+                                                'record': {'wins': 0, 'losses': 0, 'draws': 0},
+                                                'is_active': 'Active'})
         
         # Extended past UFC events with more data
         self.extended_past_events = [
@@ -132,45 +141,9 @@ class PastEventsScaler:
         ]
     
     def get_or_create_fighter(self, fighter_name: str) -> str:
-        """Get or create fighter in database"""
+        """Get or create fighter through the shared fighter map"""
         try:
-            # Check if fighter exists
-            response = requests.get(
-                f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                fighters = response.json()
-                if fighters:
-                    return fighters[0]['id']
-            
-            # Create new fighter
-            fighter_to_create = {
-                'name': fighter_name,
-                'weight_class': 'Unknown',
-                'record': {'wins': 0, 'losses': 0, 'draws': 0},
-                'is_active': 'Active'
-            }
-            
-            response = requests.post(
-                f"{self.supabase_url}/rest/v1/fighters",
-                headers=self.headers,
-                json=fighter_to_create
-            )
-            
-            if response.status_code == 201:
-                # Get the created fighter ID
-                response = requests.get(
-                    f"{self.supabase_url}/rest/v1/fighters?name=eq.{fighter_name}",
-                    headers=self.headers
-                )
-                if response.status_code == 200:
-                    fighters = response.json()
-                    if fighters:
-                        return fighters[0]['id']
-            
-            return None
+            return self.fighters.get_or_create(fighter_name)
             
         except Exception as e:
             print(f"Error with fighter {fighter_name}: {e}")
@@ -187,7 +160,7 @@ class PastEventsScaler:
                 'status': 'completed'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/events",
                 headers=self.headers,
                 json=event_to_create
@@ -195,7 +168,7 @@ class PastEventsScaler:
             
             if response.status_code == 201:
                 # Get the created event ID
-                response = requests.get(
+                response = client.get(
                     f"{self.supabase_url}/rest/v1/events?name=eq.{event_data['name']}",
                     headers=self.headers
                 )
@@ -237,7 +210,7 @@ class PastEventsScaler:
                 'weight_class': fight_data['weight_class']
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/fights",
                 headers=self.headers,
                 json=fight_to_create
@@ -265,7 +238,7 @@ class PastEventsScaler:
             print(f"\n📅 Processing: {event_data['name']}")
             
             # Check if event already exists
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/events?name=eq.{event_data['name']}",
                 headers=self.headers
             )
@@ -293,7 +266,7 @@ class PastEventsScaler:
                 print(f"   ✅ Created event: {event_data['name']}")
             
             # Check if fights already exist for this event
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event_id}&select=id&limit=1",
                 headers=self.headers
             )
@@ -302,6 +275,13 @@ class PastEventsScaler:
                 print(f"   ⚠️  Fights already exist for {event_data['name']}, skipping...")
                 continue
             
+            # Resolve the card's fighters up front so new ones go out in one insert
+            try:
+                self.fighters.resolve_many(name for fight in event_data['fights']
+                                           for name in (fight['fighter1'], fight['fighter2']))
+            except requests.RequestException as e:
+                print(f"   ⚠️  Could not resolve fighters for {event_data['name']}: {e}")
+            
             # Create fights for this event
             fights_created = 0
             for fight_data in event_data['fights']:
@@ -323,7 +303,7 @@ class PastEventsScaler:
         
         try:
             # Check events
-            events_response = requests.get(
+            events_response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date&order=date.desc",
                 headers=self.headers
             )
@@ -334,7 +314,7 @@ class PastEventsScaler:
                     print(f"      ✅ {event['name']} ({event['date']})")
             
             # Check fights
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id,event_id&limit=10",
                 headers=self.headers
             )
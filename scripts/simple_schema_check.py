@@ -5,9 +5,9 @@ Check the schema by trying individual columns
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -40,7 +40,7 @@ def check_schema():
         
         for column in events_columns:
             try:
-                response = requests.get(
+                response = client.get(
                     f"{SUPABASE_URL}/rest/v1/events",
                     headers=headers,
                     params={'select': column, 'limit': 1}
@@ -63,7 +63,7 @@ def check_schema():
         
         for column in fights_columns:
             try:
-                response = requests.get(
+                response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'select': column, 'limit': 1}
@@ -5,9 +5,9 @@ Just wipes events and fights tables using Supabase REST API
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -35,7 +35,7 @@ def wipe_tables():
         logger.info("🗑️ Wiping fights table...")
         
         # Delete all fights
-        fights_response = requests.delete(
+        fights_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers
         )
@@ -49,7 +49,7 @@ def wipe_tables():
         logger.info("🗑️ Wiping events table...")
         
         # Delete all events
-        events_response = requests.delete(
+        events_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers
         )
@@ -63,13 +63,13 @@ def wipe_tables():
         # Verify tables are empty
         logger.info("🔍 Verifying tables are empty...")
         
-        fights_check = requests.get(
+        fights_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id', 'limit': 1}
         )
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
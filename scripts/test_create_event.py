@@ -5,9 +5,9 @@ Test creating a single event
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -42,7 +42,7 @@ def test_create_event():
         
         logger.info(f"🧪 Testing event creation with payload: {event_payload}")
         
-        response = requests.post(
+        response = client.post(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             json=event_payload
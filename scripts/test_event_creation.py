@@ -5,9 +5,9 @@ Debug why events aren't being created in Supabase
 """
 
 import os
-import requests
 import json
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -35,7 +35,7 @@ test_event = {
 print(f"\nCreating test event: {test_event['name']}")
 
 try:
-    response = requests.post(
+    response = client.post(
         f"{SUPABASE_URL}/rest/v1/events",
         headers=headers,
         json=test_event
@@ -49,7 +49,7 @@ try:
         print("✅ Event created successfully!")
         
         # Get the created event
-        get_response = requests.get(
+        get_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events?name=eq.{test_event['name']}",
             headers=headers
         )
@@ -5,9 +5,9 @@ Debug why fights aren't being created in Supabase
 """
 
 import os
-import requests
 import json
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -23,7 +23,7 @@ headers = {
 # First, get an event ID
 print("📅 Getting event ID...")
 try:
-    events_response = requests.get(
+    events_response = client.get(
         f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=1",
         headers=headers
     )
@@ -51,7 +51,7 @@ fighter1_name = "Alex Pereira"
 fighter2_name = "Jamahal Hill"
 
 # Check if fighters exist
-fighter1_response = requests.get(
+fighter1_response = client.get(
     f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter1_name}",
     headers=headers
 )
@@ -71,7 +71,7 @@ if fighter1_response.status_code == 200:
             'is_active': 'Active'
         }
         
-        create_response = requests.post(
+        create_response = client.post(
             f"{SUPABASE_URL}/rest/v1/fighters",
             headers=headers,
             json=fighter1_data
@@ -79,7 +79,7 @@ if fighter1_response.status_code == 200:
         
         if create_response.status_code == 201:
             # Get the created fighter ID
-            get_response = requests.get(
+            get_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter1_name}",
                 headers=headers
             )
@@ -90,7 +90,7 @@ if fighter1_response.status_code == 200:
                     print(f"✅ Created fighter1: {fighter1_name} (ID: {fighter1_id})")
 
 # Same for fighter2
-fighter2_response = requests.get(
+fighter2_response = client.get(
     f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter2_name}",
     headers=headers
 )
@@ -110,7 +110,7 @@ if fighter2_response.status_code == 200:
             'is_active': 'Active'
         }
         
-        create_response = requests.post(
+        create_response = client.post(
             f"{SUPABASE_URL}/rest/v1/fighters",
             headers=headers,
             json=fighter2_data
@@ -118,7 +118,7 @@ if fighter2_response.status_code == 200:
         
         if create_response.status_code == 201:
             # Get the created fighter ID
-            get_response = requests.get(
+            get_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?name=eq.{fighter2_name}",
                 headers=headers
             )
@@ -159,7 +159,7 @@ fight_data = {
 print(f"Fight data: {json.dumps(fight_data, indent=2)}")
 
 try:
-    response = requests.post(
+    response = client.post(
         f"{SUPABASE_URL}/rest/v1/fights",
         headers=headers,
         json=fight_data
@@ -172,7 +172,7 @@ try:
         print("✅ Fight created successfully!")
         
         # Get the created fight
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event_id}",
             headers=headers
         )
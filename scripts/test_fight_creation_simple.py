@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 import os
-import requests
+from http_client import client
 load_dotenv('.env')
 
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -30,7 +30,7 @@ test_fight = {
 print(f'Testing simple fight creation...')
 
 # First, let's check if we have any events
-response = requests.get(f'{SUPABASE_URL}/rest/v1/events', headers=headers)
+response = client.get(f'{SUPABASE_URL}/rest/v1/events', headers=headers)
 print(f'Events response: {response.status_code}')
 if response.status_code == 200:
     events = response.json()
@@ -41,6 +41,6 @@ if response.status_code == 200:
         print(f'Using event ID: {event_id}')
         
         # Try to create the fight
-        response = requests.post(f'{SUPABASE_URL}/rest/v1/fights', headers=headers, json=test_fight)
+        response = client.post(f'{SUPABASE_URL}/rest/v1/fights', headers=headers, json=test_fight)
         print(f'Fight creation response: {response.status_code}')
         print(f'Response text: {response.text}')
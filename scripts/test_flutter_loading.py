@@ -5,9 +5,9 @@ Test what Flutter would load after cleanup
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -35,7 +35,7 @@ def test_flutter_loading():
         logger.info("🔍 Testing Flutter's event loading logic...")
         
         # Simulate what Flutter does - get events ordered by date
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 10}
@@ -50,7 +50,7 @@ def test_flutter_loading():
                 logger.info(f"   {i+1}. {event.get('name', 'Unknown')} (ID: {event['id']})")
                 
                 # Check if this event has fights
-                fights_response = requests.get(
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'event_id': f'eq.{event["id"]}', 'select': 'id,winner_name,loser_name,fight_order,is_main_event'}
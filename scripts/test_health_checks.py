@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test Health Checks
+Run the views from create_health_checks.sql on an in-memory SQLite database
+seeded with one of each problem, and check every check finds exactly those
+"""
+
+import json
+import sqlite3
+
+from health_checks import SQLiteHealthChecks
+
+def seed(conn):
+    """Two clean events plus one of each problem the checks look for"""
+    conn.executemany("INSERT INTO events (id, name, date, status, created_at) VALUES (?, ?, ?, ?, ?)", [
+        ('e1', 'UFC 300: Pereira vs. Hill', '2024-04-13', 'completed', '2024-01-01'),
+        ('e2', 'UFC 300', None, 'completed', '2024-02-01'),  # duplicate of e1
+        ('e3', 'UFC Fight Night: Smith vs. Jones', '2024-05-01', 'completed', '2024-01-01'),
+        ('e4', 'UFC Fight Night: Brown vs. Lee', '2024-06-01', 'scheduled', '2024-01-01'),
+    ])
+    conn.executemany("INSERT INTO fighters (id, name, record, weight_class) VALUES (?, ?, ?, ?)", [
+        ('a', 'Alex Pereira', '12-2-0', 'Light Heavyweight'),
+        ('b', 'Jamahal Hill', None, 'Light Heavyweight'),
+        ('c', 'Chris Smith', 'None', 'Lightweight'),
+        ('d', 'Dan Jones', '5-1-0', 'Lightweight'),
+    ])
+    win = lambda fighter_id: json.dumps({'winner_id': fighter_id, 'method': 'KO/TKO'})
+    conn.executemany(
+        "INSERT INTO fights (id, event_id, fighter1_id, fighter2_id, weight_class, result, fight_order,"
+        " is_main_event, is_co_main_event) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            ('f1', 'e1', 'a', 'b', 'Light Heavyweight', win('a'), 1, True, False),
+            ('f2', 'e1', 'b', 'a', 'Light Heavyweight', win('a'), 2, False, False),  # duplicate pairing, not co-main
+            ('f3', 'e3', 'c', 'd', 'Lightweight', win('d'), 1, True, False),
+            ('f4', 'e3', 'c', 'zz', 'Lightweight', None, 3, False, False),  # unknown fighter
+            ('f5', 'gone', 'a', 'd', 'Lightweight', None, 4, False, False),  # unknown event
+        ])
+
+def test_health_checks():
+    """Every check against the seeded problems"""
+    print("🧪 TESTING HEALTH CHECKS")
+    print("=" * 40)
+
+    conn = sqlite3.connect(':memory:')
+    checks = SQLiteHealthChecks(conn, create_tables=True)
+    seed(conn)
+
+    summary = checks.summary()
+    print(f"📊 Summary: {summary}")
+    assert summary == {
+        'events': 4, 'completed_events': 3, 'scheduled_events': 1, 'fights': 5, 'fighters': 4,
+        'events_without_fights': 2, 'orphan_fights': 2, 'duplicate_event_names': 1, 'duplicate_fights': 1,
+        'fighters_without_records': 2, 'fight_order_mismatches': 1,
+    }, summary
+
+    counts = {row['event_id']: (row['fights'], row['fights_with_winner']) for row in checks.event_fight_counts()}
+    print(f"📅 Fights per event: {counts}")
+    assert counts == {'e1': (2, 2), 'e2': (0, 0), 'e3': (2, 1), 'e4': (0, 0)}, counts
+    assert [row['event_id'] for row in checks.event_fight_counts(order='fights.desc', limit=1, fights='gt.1',
+                                                                 event_id='in.(e3)')] == ['e3']
+
+    orphans = {row['fight_id']: row['problem'] for row in checks.orphan_fights()}
+    print(f"🔍 Orphan fights: {orphans}")
+    assert orphans == {'f4': 'missing_fighter', 'f5': 'missing_event'}, orphans
+
+    duplicates = checks.duplicate_event_names()
+    print(f"🔍 Duplicate events: {duplicates}")
+    assert [(row['name_key'], row['copies'], row['event_ids']) for row in duplicates] == [('ufc 300', 2, ['e1', 'e2'])]
+
+    duplicate_fights = checks.duplicate_fights()
+    assert [(row['event_id'], row['copies']) for row in duplicate_fights] == [('e1', 2)], duplicate_fights
+
+    without_records = [row['name'] for row in checks.fighters_without_records()]
+    print(f"👊 Fighters without records: {without_records}")
+    assert without_records == ['Chris Smith', 'Jamahal Hill'], without_records
+
+    mismatches = [row['fight_id'] for row in checks.fight_order_mismatches()]
+    assert mismatches == ['f2'], mismatches
+
+    weight_classes = {(row['source'], row['weight_class']): row['count'] for row in checks.weight_class_counts()}
+    assert weight_classes[('fights', 'Lightweight')] == 3 and weight_classes[('fighters', 'Lightweight')] == 2
+    assert all(row['source'] == 'fighters' for row in checks.weight_class_counts('fighters'))
+
+    print("✅ All health checks found the seeded problems")
+
+if __name__ == "__main__":
+    test_health_checks()
@@ -1,10 +1,10 @@
 from dotenv import load_dotenv
 import os
 load_dotenv('.env')
-import requests
 from bs4 import BeautifulSoup
+from http_client import client
 
-response = requests.get('https://en.wikipedia.org/wiki/UFC_on_ESPN:_Taira_vs._Park')
+response = client.get('https://en.wikipedia.org/wiki/UFC_on_ESPN:_Taira_vs._Park')
 soup = BeautifulSoup(response.content, 'html.parser')
 tables = soup.find_all('table')
 
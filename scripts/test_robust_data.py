@@ -5,9 +5,9 @@ Verify the quality of data from the robust scraper
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def test_robust_data():
         logger.info("🔍 Testing robust scraper data quality...")
         
         # Get recent events
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 5}
@@ -50,7 +50,7 @@ def test_robust_data():
                 logger.info(f"   Date: {event.get('date', 'N/A')}")
                 
                 # Get fights for this event
-                fights_response = requests.get(
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={
@@ -82,7 +82,7 @@ def test_robust_data():
         
         # Test Flutter loading simulation
         logger.info("\n🔍 Testing Flutter loading simulation...")
-        flutter_events_response = requests.get(
+        flutter_events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id,name,date', 'order': 'date.desc', 'limit': 3}
@@ -94,7 +94,7 @@ def test_robust_data():
             
             total_fights = 0
             for event in flutter_events:
-                fights_response = requests.get(
+                fights_response = client.get(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'event_id': f'eq.{event["id"]}', 'select': 'id'}
@@ -6,7 +6,6 @@ Test the simplified scraper with just one event
 
 import os
 import sys
-import requests
 import logging
 import time
 import json
@@ -17,6 +16,7 @@ from threading import Lock
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from http_client import client
 
 load_dotenv('.env')
 
@@ -51,7 +51,7 @@ class SimpleWikipediaScraper:
         
         try:
             # Get the event page
-            response = requests.get(event_url, headers=self.headers)
+            response = client.get(event_url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
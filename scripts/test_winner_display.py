@@ -5,9 +5,9 @@ Test script to populate events and fights with winner/loser data
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -37,7 +37,7 @@ class TestWinnerDisplay:
             'location': 'Las Vegas, Nevada'
         }
         
-        event1_response = requests.post(
+        event1_response = client.post(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=self.supabase_headers,
             json=event1_data
@@ -91,7 +91,7 @@ class TestWinnerDisplay:
             ]
             
             for fight in fights1:
-                response = requests.post(
+                response = client.post(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=self.supabase_headers,
                     json=fight
@@ -109,7 +109,7 @@ class TestWinnerDisplay:
             'location': 'Rio de Janeiro, Brazil'
         }
         
-        event2_response = requests.post(
+        event2_response = client.post(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=self.supabase_headers,
             json=event2_data
@@ -150,7 +150,7 @@ class TestWinnerDisplay:
             ]
             
             for fight in fights2:
-                response = requests.post(
+                response = client.post(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=self.supabase_headers,
                     json=fight
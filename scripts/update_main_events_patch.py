@@ -5,9 +5,9 @@ Update existing fights with correct main event identification using PATCH
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -66,7 +66,7 @@ def update_main_events():
             logger.info(f"\n🎯 Updating event: {event_id}")
             
             # Get all fights for this event
-            fights_response = requests.get(
+            fights_response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=headers,
                 params={
@@ -84,7 +84,7 @@ def update_main_events():
                     fight_id = fight['id']
                     
                     # Reset main event flags
-                    reset_response = requests.patch(
+                    reset_response = client.patch(
                         f"{SUPABASE_URL}/rest/v1/fights",
                         headers=headers,
                         params={'id': f'eq.{fight_id}'},
@@ -112,7 +112,7 @@ def update_main_events():
                         logger.info(f"      Setting {fight_name} as {'MAIN EVENT' if is_main_event else 'CO-MAIN EVENT'}")
                         
                         # Update the fight using PATCH
-                        update_response = requests.patch(
+                        update_response = client.patch(
                             f"{SUPABASE_URL}/rest/v1/fights",
                             headers=headers,
                             params={'id': f'eq.{fight_id}'},
@@ -6,9 +6,9 @@ Check what's currently in the database and identify issues
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -31,7 +31,7 @@ def verify_database_state():
     
     try:
         # Check events
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/events?select=id,name,date&order=date.desc&limit=10",
             headers=headers
         )
@@ -44,7 +44,7 @@ def verify_database_state():
             logger.error(f"❌ Error getting events: {response.status_code}")
         
         # Check fighters
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fighters?select=id,name&limit=10",
             headers=headers
         )
@@ -57,7 +57,7 @@ def verify_database_state():
             logger.error(f"❌ Error getting fighters: {response.status_code}")
         
         # Check fights
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,fighter1_id,fighter2_id&limit=10",
             headers=headers
         )
@@ -70,7 +70,7 @@ def verify_database_state():
             logger.error(f"❌ Error getting fights: {response.status_code}")
         
         # Get total counts
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/events?select=id",
             headers=headers
         )
@@ -78,7 +78,7 @@ def verify_database_state():
             total_events = len(response.json())
             logger.info(f"📊 Total events: {total_events}")
         
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fighters?select=id",
             headers=headers
         )
@@ -86,7 +86,7 @@ def verify_database_state():
             total_fighters = len(response.json())
             logger.info(f"🥊 Total fighters: {total_fighters}")
         
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?select=id",
             headers=headers
         )
@@ -4,8 +4,8 @@ Final Verification - Confirm Real Fight Cards Are Working
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv()
 
@@ -28,7 +28,7 @@ def verify_final_fix():
     ufc300_id = "6e1ff370-17d9-4622-b5b4-4b5d65501e2d"
     
     # Get event details
-    event_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?id=eq.{ufc300_id}", headers=headers)
+    event_response = client.get(f"{SUPABASE_URL}/rest/v1/events?id=eq.{ufc300_id}", headers=headers)
     if event_response.status_code == 200:
         events = event_response.json()
         if events:
@@ -38,7 +38,7 @@ def verify_final_fix():
             print(f"   📍 Location: {event.get('venue', 'No venue')}")
     
     # Get fights for UFC 300
-    fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{ufc300_id}&select=id,status,result,fighter1_id,fighter2_id&limit=10", headers=headers)
+    fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{ufc300_id}&select=id,status,result,fighter1_id,fighter2_id&limit=10", headers=headers)
     if fights_response.status_code == 200:
         fights = fights_response.json()
         print(f"   🥊 Fights: {len(fights)}")
@@ -53,12 +53,12 @@ def verify_final_fix():
     
     # Check what events have fights
     print("\n📊 EVENTS WITH FIGHTS:")
-    events_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=10", headers=headers)
+    events_response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=10", headers=headers)
     if events_response.status_code == 200:
         events = events_response.json()
         
         for event in events:
-            fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id&limit=1", headers=headers)
+            fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id&limit=1", headers=headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 if fights:
@@ -4,8 +4,12 @@ Final Verification - Real Fight Data with Winners/Losers
 """
 
 import os
-import requests
+import sys
 from dotenv import load_dotenv
+from http_client import client, supabase_session
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'processors'))
+from fetch_planner import FetchPlanner
 
 load_dotenv()
 
@@ -25,7 +29,7 @@ def verify_final_real_fights():
     
     # Check UFC 300 specifically
     print("\n🥊 UFC 300: Pereira vs Hill")
-    ufc300_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?name=eq.UFC 300: Pereira vs Hill", headers=headers)
+    ufc300_response = client.get(f"{SUPABASE_URL}/rest/v1/events?name=eq.UFC 300: Pereira vs Hill", headers=headers)
     if ufc300_response.status_code == 200:
         events = ufc300_response.json()
         if events:
@@ -35,22 +39,17 @@ def verify_final_real_fights():
             print(f"   📍 Location: {event.get('venue', 'No venue')}")
             
             # Get fights for UFC 300
-            fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id,fighter1_id,fighter2_id,winner_id,result&limit=20", headers=headers)
+            fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id,fighter1_id,fighter2_id,winner_id,result&limit=20", headers=headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 print(f"   🥊 Total Fights: {len(fights)}")
                 
-                # Get fighter details
-                fighter_ids = set()
-                for fight in fights:
-                    fighter_ids.add(fight.get('fighter1_id'))
-                    fighter_ids.add(fight.get('fighter2_id'))
-                
-                fighters_response = requests.get(f"{SUPABASE_URL}/rest/v1/fighters?select=id,name&limit=100", headers=headers)
-                fighters_dict = {}
-                if fighters_response.status_code == 200:
-                    all_fighters = fighters_response.json()
-                    fighters_dict = {f['id']: f['name'] for f in all_fighters}
+                # Get fighter details: just the fighters on this card, in batched in.() queries
+                planner = FetchPlanner(SUPABASE_URL, session=supabase_session(SUPABASE_KEY),
+                                       columns={'fighters': 'id,name'})
+                fighter_ids = [fight.get(column) for fight in fights for column in ('fighter1_id', 'fighter2_id')]
+                fighters_dict = {fighter_id: row['name']
+                                 for fighter_id, row in planner.fetch_by_ids('fighters', fighter_ids).items()}
                 
                 print(f"\n   📋 FIGHT CARD:")
                 for i, fight in enumerate(fights, 1):
@@ -90,12 +89,12 @@ def verify_final_real_fights():
     
     # Check all events with fights
     print("\n📊 ALL EVENTS WITH REAL FIGHTS:")
-    events_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=10", headers=headers)
+    events_response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name&limit=10", headers=headers)
     if events_response.status_code == 200:
         events = events_response.json()
         
         for event in events:
-            fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id&limit=1", headers=headers)
+            fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id&limit=1", headers=headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 if fights:
@@ -5,10 +5,11 @@ Comprehensive verification of past events, fights, and winner/loser data in Supa
 """
 
 import os
-import requests
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from http_client import client
+from health_checks import HealthChecks
 
 load_dotenv()
 
@@ -23,6 +24,7 @@ class PastEventsVerifier:
             'Authorization': f'Bearer {SUPABASE_KEY}',
             'Content-Type': 'application/json',
         }
+        self.checks = HealthChecks(SUPABASE_URL, SUPABASE_KEY)
     
     def verify_events(self):
         """Verify events are properly created"""
@@ -30,7 +32,7 @@ class PastEventsVerifier:
         print("=" * 50)
         
         try:
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/events?select=id,name,date,venue,location,status&order=date.desc",
                 headers=self.headers
             )
@@ -58,7 +60,7 @@ class PastEventsVerifier:
         print("=" * 50)
         
         try:
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/fighters?select=id,name,weight_class,is_active&order=name.asc",
                 headers=self.headers
             )
@@ -95,52 +97,16 @@ class PastEventsVerifier:
         print("=" * 50)
         
         try:
-            # Get all fights with event and fighter details
-            response = requests.get(
-                f"{self.supabase_url}/rest/v1/fights?select=id,event_id,weight_class,result&order=created_at.desc",
-                headers=self.headers
-            )
+            # Per-event counts come from the event_fight_counts view
+            events = self.checks.event_fight_counts(fights='gt.0')
+            print(f"✅ Found {sum(event['fights'] for event in events)} fights across {len(events)} events")
+            print()
             
-            if response.status_code == 200:
-                fights = response.json()
-                print(f"✅ Found {len(fights)} fights in database")
+            for event in events:
+                print(f"📅 {event['name']}: {event['fights']} fights")
+                print(f"   ✅ {event['fights_with_winner']} fights with winners")
                 print()
                 
-                # Group fights by event
-                event_fights = {}
-                for fight in fights:
-                    event_id = fight['event_id']
-                    if event_id not in event_fights:
-                        event_fights[event_id] = []
-                    event_fights[event_id].append(fight)
-                
-                # Get event names
-                events_response = requests.get(
-                    f"{self.supabase_url}/rest/v1/events?select=id,name",
-                    headers=self.headers
-                )
-                events_map = {}
-                if events_response.status_code == 200:
-                    events = events_response.json()
-                    events_map = {event['id']: event['name'] for event in events}
-                
-                for event_id, event_fights_list in event_fights.items():
-                    event_name = events_map.get(event_id, f"Event {event_id[:8]}")
-                    print(f"📅 {event_name}: {len(event_fights_list)} fights")
-                    
-                    # Count fights with winners
-                    fights_with_winners = [f for f in event_fights_list if f.get('winner_id')]
-                    print(f"   ✅ {len(fights_with_winners)} fights with winners")
-                    
-                    # Show sample fights
-                    for fight in event_fights_list[:3]:  # Show first 3
-                        print(f"   🥊 {fight['weight_class']}: {fight['method']} (Round {fight['round']})")
-                        if fight.get('winner_id'):
-                            print(f"      🏆 Winner ID: {fight['winner_id']}")
-                    print()
-            else:
-                print(f"❌ Error getting fights: {response.status_code}")
-                
         except Exception as e:
             print(f"❌ Error verifying fights: {e}")
     
@@ -151,7 +117,7 @@ class PastEventsVerifier:
         
         try:
             # Get fights with fighter details
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id,fighter1_id,fighter2_id,result&limit=10",
                 headers=self.headers
             )
@@ -196,38 +162,23 @@ class PastEventsVerifier:
         print("=" * 50)
         
         try:
-            # Get events with fight counts
-            response = requests.get(
-                f"{self.supabase_url}/rest/v1/events?select=id,name,date",
-                headers=self.headers
-            )
+            # Events with fight counts, one request
+            events = self.checks.event_fight_counts()
+            print(f"✅ Found {len(events)} events")
+            print()
             
-            if response.status_code == 200:
-                events = response.json()
-                print(f"✅ Found {len(events)} events")
+            for event in events:
+                print(f"📅 {event['name']}")
+                print(f"   📊 Total fights: {event['fights']}")
+                print(f"   🏆 Fights with winners: {event['fights_with_winner']}")
                 print()
-                
-                for event in events:
-                    # Get fights for this event
-                    fights_response = requests.get(
-                        f"{self.supabase_url}/rest/v1/fights?event_id=eq.{event['id']}&select=id,weight_class,winner_id",
-                        headers=self.headers
-                    )
-                    
-                    if fights_response.status_code == 200:
-                        fights = fights_response.json()
-                        fights_with_winners = [f for f in fights if f.get('result', {}).get('winner_id')]
-                        
-                        print(f"📅 {event['name']}")
-                        print(f"   📊 Total fights: {len(fights)}")
-                        print(f"   🏆 Fights with winners: {len(fights_with_winners)}")
-                        
-                        # Show weight classes
-                        weight_classes = set(f['weight_class'] for f in fights)
-                        print(f"   🏆 Weight classes: {', '.join(weight_classes)}")
-                        print()
-            else:
-                print(f"❌ Error getting events: {response.status_code}")
+            
+            empty = [event for event in events if event['fights'] == 0]
+            if empty:
+                print(f"⚠️ {len(empty)} events have no fights")
+            orphans = self.checks.orphan_fights()
+            if orphans:
+                print(f"⚠️ {len(orphans)} fights point at a missing event or fighter")
                 
         except Exception as e:
             print(f"❌ Error verifying event distribution: {e}")
@@ -239,7 +190,7 @@ class PastEventsVerifier:
         
         try:
             # Get a few fights with all details
-            response = requests.get(
+            response = client.get(
                 f"{self.supabase_url}/rest/v1/fights?select=id,event_id,weight_class,result&limit=5",
                 headers=self.headers
             )
@@ -5,8 +5,8 @@ Shows the real UFC data that was scraped and uploaded
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv()
 
@@ -26,7 +26,7 @@ def verify_real_data():
     
     # Check fighters
     print("\n👥 REAL UFC FIGHTERS:")
-    fighters_response = requests.get(f"{SUPABASE_URL}/rest/v1/fighters?select=name,weight_class,ufc_ranking&limit=20", headers=headers)
+    fighters_response = client.get(f"{SUPABASE_URL}/rest/v1/fighters?select=name,weight_class,ufc_ranking&limit=20", headers=headers)
     if fighters_response.status_code == 200:
         fighters = fighters_response.json()
         print(f"   📊 Total fighters: {len(fighters)}")
@@ -42,7 +42,7 @@ def verify_real_data():
     
     # Check events
     print("\n📅 REAL UFC EVENTS:")
-    events_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=name,date,status&limit=10", headers=headers)
+    events_response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=name,date,status&limit=10", headers=headers)
     if events_response.status_code == 200:
         events = events_response.json()
         print(f"   📊 Total events: {len(events)}")
@@ -55,7 +55,7 @@ def verify_real_data():
     
     # Check fights
     print("\n🥊 REAL UFC FIGHTS:")
-    fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status,result&limit=10", headers=headers)
+    fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=id,event_id,status,result&limit=10", headers=headers)
     if fights_response.status_code == 200:
         fights = fights_response.json()
         print(f"   📊 Total fights: {len(fights)}")
@@ -76,7 +76,7 @@ def verify_real_data():
     
     # Check champions
     print("\n👑 UFC CHAMPIONS:")
-    champions_response = requests.get(f"{SUPABASE_URL}/rest/v1/fighters?select=name,weight_class,ufc_ranking&ufc_ranking=eq.1&limit=20", headers=headers)
+    champions_response = client.get(f"{SUPABASE_URL}/rest/v1/fighters?select=name,weight_class,ufc_ranking&ufc_ranking=eq.1&limit=20", headers=headers)
     if champions_response.status_code == 200:
         champions = champions_response.json()
         print(f"   📊 Found {len(champions)} champions")
@@ -5,8 +5,8 @@ Confirms that real fight cards are properly linked and ready for Flutter
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv()
 
@@ -26,13 +26,13 @@ def verify_real_fight_cards():
     
     # Get events with fights
     print("\n📅 EVENTS WITH FIGHTS:")
-    events_response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name,date&limit=20", headers=headers)
+    events_response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=id,name,date&limit=20", headers=headers)
     if events_response.status_code == 200:
         events = events_response.json()
         
         for event in events:
             # Get fights for this event
-            fights_response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id,status,result&limit=10", headers=headers)
+            fights_response = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.{event['id']}&select=id,status,result&limit=10", headers=headers)
             if fights_response.status_code == 200:
                 fights = fights_response.json()
                 if fights:
@@ -47,7 +47,7 @@ def verify_real_fight_cards():
     
     # Check UFC 300 specifically
     print("\n🎯 UFC 300 SPECIFIC:")
-    ufc300_fights = requests.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.6e1ff370-17d9-4622-b5b4-4b5d65501e2d&select=id,status,result,fighter1_id,fighter2_id&limit=10", headers=headers)
+    ufc300_fights = client.get(f"{SUPABASE_URL}/rest/v1/fights?event_id=eq.6e1ff370-17d9-4622-b5b4-4b5d65501e2d&select=id,status,result,fighter1_id,fighter2_id&limit=10", headers=headers)
     if ufc300_fights.status_code == 200:
         fights = ufc300_fights.json()
         print(f"   📊 UFC 300 has {len(fights)} fights")
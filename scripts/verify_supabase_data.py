@@ -5,8 +5,8 @@ Show exactly what data should be visible in the Supabase dashboard
 """
 
 import os
-import requests
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -31,7 +31,7 @@ def verify_supabase_data():
     print("📊 EVENTS TABLE:")
     print("-" * 30)
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/events?select=*&limit=10", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/events?select=*&limit=10", headers=headers)
         if response.status_code == 200:
             events = response.json()
             print(f"✅ Found {len(events)} events")
@@ -49,7 +49,7 @@ def verify_supabase_data():
     print("🥊 FIGHTERS TABLE:")
     print("-" * 30)
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fighters?select=*&limit=10", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fighters?select=*&limit=10", headers=headers)
         if response.status_code == 200:
             fighters = response.json()
             print(f"✅ Found {len(fighters)} fighters")
@@ -67,7 +67,7 @@ def verify_supabase_data():
     print("👊 FIGHTS TABLE:")
     print("-" * 30)
     try:
-        response = requests.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=10", headers=headers)
+        response = client.get(f"{SUPABASE_URL}/rest/v1/fights?select=*&limit=10", headers=headers)
         if response.status_code == 200:
             fights = response.json()
             print(f"✅ Found {len(fights)} fights")
@@ -94,7 +94,7 @@ def verify_supabase_data():
     print("-" * 30)
     try:
         # Get a sample fight with fighter details
-        response = requests.get(
+        response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights?select=*,fighters!fights_fighter_a_id_fkey(name),fighters!fights_fighter_b_id_fkey(name)&limit=3", 
             headers=headers
         )
@@ -6,9 +6,9 @@ Wipe the current database and populate with all 667 UFC events
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -37,7 +37,7 @@ class DatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}  # Delete all fights
@@ -51,7 +51,7 @@ class DatabaseWiper:
             
             # Step 2: Delete all fighters
             logger.info("🗑️ Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all fighters
@@ -65,7 +65,7 @@ class DatabaseWiper:
             
             # Step 3: Delete all events
             logger.info("🗑️ Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all events
@@ -90,7 +90,7 @@ class DatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -99,7 +99,7 @@ class DatabaseWiper:
                 logger.info(f"📊 Events in database: {len(events)}")
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -108,7 +108,7 @@ class DatabaseWiper:
                 logger.info(f"📊 Fighters in database: {len(fighters)}")
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
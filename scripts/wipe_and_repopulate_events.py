@@ -9,11 +9,11 @@ import re
 import json
 import time
 import logging
-import requests
 from datetime import datetime
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from http_client import client, create_session
 
 load_dotenv('scripts/.env')
 
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 class WipeAndRepopulateEvents:
     def __init__(self):
         self.base_url = "https://en.wikipedia.org"
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -44,7 +44,7 @@ class WipeAndRepopulateEvents:
         
         try:
             # Delete all events
-            response = requests.delete(f"{self.supabase_url}/rest/v1/events", headers=self.headers)
+            response = client.delete(f"{self.supabase_url}/rest/v1/events", headers=self.headers)
             if response.status_code == 200:
                 logger.info("✅ Successfully wiped all events")
             else:
@@ -195,7 +195,7 @@ class WipeAndRepopulateEvents:
                 'status': 'completed'
             }
             
-            response = requests.post(
+            response = client.post(
                 f"{self.supabase_url}/rest/v1/events",
                 headers=self.headers,
                 json=event_to_create
@@ -6,10 +6,10 @@ First wipe the database completely, then run the full parallel scraper
 
 import os
 import sys
-import requests
 import logging
 import time
 from dotenv import load_dotenv
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -38,7 +38,7 @@ class DatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}  # Delete all fights
@@ -52,7 +52,7 @@ class DatabaseWiper:
             
             # Step 2: Delete all fighters
             logger.info("🗑️ Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all fighters
@@ -66,7 +66,7 @@ class DatabaseWiper:
             
             # Step 3: Delete all events
             logger.info("🗑️ Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}  # Delete all events
@@ -91,7 +91,7 @@ class DatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -102,7 +102,7 @@ class DatabaseWiper:
                     return False
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -113,7 +113,7 @@ class DatabaseWiper:
                     return False
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -167,7 +167,7 @@ def run_wipe_and_parallel_population():
     logger.info("📊 Expected fights: ~8,000+ fights")
     
     # Run without any limits to process all events
-    scraper.run_parallel_scraper(max_events=None, start_from=0)
+    scraper.run_parallel_scraper(max_events=None, reset=True)
     
     logger.info("🎉 Complete database reset and population finished!")
     logger.info("=" * 60)
@@ -8,7 +8,7 @@ import os
 import sys
 import logging
 from dotenv import load_dotenv
-import requests
+from http_client import client
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -40,7 +40,7 @@ def wipe_events_fights_db():
         
         # Delete all fights first (due to foreign key constraints)
         logger.info("🗑️ Deleting all fights...")
-        fights_response = requests.delete(
+        fights_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id'}
@@ -54,7 +54,7 @@ def wipe_events_fights_db():
         
         # Delete all events
         logger.info("🗑️ Deleting all events...")
-        events_response = requests.delete(
+        events_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id'}
@@ -69,13 +69,13 @@ def wipe_events_fights_db():
         # Verify the tables are empty
         logger.info("🔍 Verifying tables are empty...")
         
-        fights_check = requests.get(
+        fights_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id', 'limit': 1}
         )
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
@@ -6,9 +6,9 @@ Wipe fights, fighters, and events but preserve rankings
 
 import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('scripts/.env')
 
@@ -34,7 +34,7 @@ class DatabaseWiper:
         try:
             # Step 1: Delete all fights (due to foreign key constraints)
             logger.info("🗑️ Deleting all fights...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 params={'event_id': 'not.is.null'}
@@ -48,7 +48,7 @@ class DatabaseWiper:
             
             # Step 2: Delete all fighters
             logger.info("🗑️ Deleting all fighters...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/fighters",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}
@@ -62,7 +62,7 @@ class DatabaseWiper:
             
             # Step 3: Delete all events
             logger.info("🗑️ Deleting all events...")
-            response = requests.delete(
+            response = client.delete(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 params={'name': 'not.is.null'}
@@ -76,7 +76,7 @@ class DatabaseWiper:
             
             # Step 4: VERIFY RANKINGS ARE STILL THERE
             logger.info("🔍 Verifying rankings are preserved...")
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -100,7 +100,7 @@ class DatabaseWiper:
         
         try:
             # Check events
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/events?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -109,7 +109,7 @@ class DatabaseWiper:
                 logger.info(f"📊 Events: {len(events)}")
             
             # Check fighters
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fighters?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -118,7 +118,7 @@ class DatabaseWiper:
                 logger.info(f"👤 Fighters: {len(fighters)}")
             
             # Check fights
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/fights?select=id&limit=1",
                 headers=self.supabase_headers
             )
@@ -127,7 +127,7 @@ class DatabaseWiper:
                 logger.info(f"🥊 Fights: {len(fights)}")
             
             # Check rankings
-            response = requests.get(
+            response = client.get(
                 f"{SUPABASE_URL}/rest/v1/rankings?select=id&limit=1",
                 headers=self.supabase_headers
             )
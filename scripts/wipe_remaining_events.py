@@ -5,9 +5,9 @@ Wipe the remaining events in the events table
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def wipe_remaining_events():
     try:
         # Get all event IDs
         logger.info("🔍 Getting all event IDs...")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id'}
@@ -54,7 +54,7 @@ def wipe_remaining_events():
                 
                 for event in batch:
                     event_id = event['id']
-                    delete_response = requests.delete(
+                    delete_response = client.delete(
                         f"{SUPABASE_URL}/rest/v1/events",
                         headers=headers,
                         params={'id': f'eq.{event_id}'}
@@ -72,7 +72,7 @@ def wipe_remaining_events():
         # Verify table is empty
         logger.info("🔍 Verifying events table is empty...")
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
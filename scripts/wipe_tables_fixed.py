@@ -5,9 +5,9 @@ Wipes events and fights tables with proper WHERE clauses
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -35,7 +35,7 @@ def wipe_tables():
         logger.info("🗑️ Wiping fights table...")
         
         # Delete all fights with WHERE clause
-        fights_response = requests.delete(
+        fights_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'id': 'gte.0'}  # Delete all records where id >= 0
@@ -50,7 +50,7 @@ def wipe_tables():
         logger.info("🗑️ Wiping events table...")
         
         # Delete all events with WHERE clause
-        events_response = requests.delete(
+        events_response = client.delete(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'id': 'gte.0'}  # Delete all records where id >= 0
@@ -65,13 +65,13 @@ def wipe_tables():
         # Verify tables are empty
         logger.info("🔍 Verifying tables are empty...")
         
-        fights_check = requests.get(
+        fights_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id', 'limit': 1}
         )
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
@@ -5,9 +5,9 @@ Wipes events and fights tables with proper UUID handling
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
+from http_client import client
 
 load_dotenv('.env')
 
@@ -34,7 +34,7 @@ def wipe_tables():
     try:
         # Step 1: Get all fight IDs
         logger.info("🔍 Getting all fight IDs...")
-        fights_response = requests.get(
+        fights_response = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id'}
@@ -48,7 +48,7 @@ def wipe_tables():
             deleted_fights = 0
             for fight in fights:
                 fight_id = fight['id']
-                delete_response = requests.delete(
+                delete_response = client.delete(
                     f"{SUPABASE_URL}/rest/v1/fights",
                     headers=headers,
                     params={'id': f'eq.{fight_id}'}
@@ -62,7 +62,7 @@ def wipe_tables():
         
         # Step 2: Get all event IDs
         logger.info("🔍 Getting all event IDs...")
-        events_response = requests.get(
+        events_response = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id'}
@@ -76,7 +76,7 @@ def wipe_tables():
             deleted_events = 0
             for event in events:
                 event_id = event['id']
-                delete_response = requests.delete(
+                delete_response = client.delete(
                     f"{SUPABASE_URL}/rest/v1/events",
                     headers=headers,
                     params={'id': f'eq.{event_id}'}
@@ -91,13 +91,13 @@ def wipe_tables():
         # Step 3: Verify tables are empty
         logger.info("🔍 Verifying tables are empty...")
         
-        fights_check = requests.get(
+        fights_check = client.get(
             f"{SUPABASE_URL}/rest/v1/fights",
             headers=headers,
             params={'select': 'id', 'limit': 1}
         )
         
-        events_check = requests.get(
+        events_check = client.get(
             f"{SUPABASE_URL}/rest/v1/events",
             headers=headers,
             params={'select': 'id', 'limit': 1}
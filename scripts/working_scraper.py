@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 import os
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from threading import Lock
 import logging
+from http_client import client
 
 # Load environment variables
 load_dotenv('.env')
@@ -31,7 +31,7 @@ class WorkingWikipediaScraper:
     def scrape_event_fighters(self, url, event_name):
         """Scrape fighter data from a UFC event page"""
         try:
-            response = requests.get(url, headers=self.headers)
+            response = client.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -108,7 +108,7 @@ class WorkingWikipediaScraper:
             
             print(f"🔍 DEBUG: Creating event: {event_data['name']}")
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/events",
                 headers=self.supabase_headers,
                 json=event_to_create
@@ -120,7 +120,7 @@ class WorkingWikipediaScraper:
                 try:
                     return response.json()['id']
                 except (ValueError, KeyError):
-                    fetch_response = requests.get(
+                    fetch_response = client.get(
                         f"{SUPABASE_URL}/rest/v1/events?name=eq.{event_data['name']}",
                         headers=self.supabase_headers
                     )
@@ -155,7 +155,7 @@ class WorkingWikipediaScraper:
             
             print(f"   Creating fight: {fight_data['winner']} vs {fight_data['loser']}")
             
-            response = requests.post(
+            response = client.post(
                 f"{SUPABASE_URL}/rest/v1/fights",
                 headers=self.supabase_headers,
                 json=fight_to_create
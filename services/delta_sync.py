@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Delta Sync
+Pushes the changes written by `ufc_data_processor.py --manifest` to Firestore
+and Supabase, then commits the processor's manifest so the next run diffs
+against what was actually synced.
+
+Usage: python services/delta_sync.py processed_ufc_data.delta.json [--skip-firestore] [--skip-supabase]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add parent directory (services) and data/ (processors) to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data'))
+
+from processors.manifest import Delta, commit_manifest
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def run_delta_sync(delta: Delta, firestore: bool = True, supabase: bool = True) -> bool:
+    """Apply the delta to each enabled stage; the manifest is committed only if all succeed"""
+    logger.info(f"🚀 Syncing changes: {delta.summary()}")
+    success = True
+
+    if firestore:
+        from services.firestore_service import FirestoreService
+        success = FirestoreService().apply_delta(delta) and success
+
+    if supabase:
+        from services.supabase_sync import SupabaseDeltaSync
+        success = SupabaseDeltaSync().apply_delta(delta) and success
+
+    if success:
+        commit_manifest(delta.manifest_path, delta.skipped)
+        skipped = sum(len(record_ids) for record_ids in delta.skipped.values())
+        if skipped:
+            logger.warning(f"⚠️ Delta synced except {skipped} skipped records; they'll be sent again next run")
+        else:
+            logger.info("✅ Delta synced and manifest committed")
+    else:
+        logger.error("❌ Delta sync failed; the next processor run will include these changes again")
+    return success
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync a processor delta to Firestore and Supabase')
+    parser.add_argument('delta', help='Delta file written by ufc_data_processor.py --manifest')
+    parser.add_argument('--skip-firestore', action='store_true')
+    parser.add_argument('--skip-supabase', action='store_true')
+    args = parser.parse_args()
+
+    delta = Delta.load(args.delta)
+    success = run_delta_sync(delta, firestore=not args.skip_firestore, supabase=not args.skip_supabase)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ import json
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+FIRESTORE_BATCH_LIMIT = 500
+
 class FirestoreService:
     def __init__(self, project_id: str = "mmamania-5a974"):
         """Initialize Firestore service"""
@@ -220,6 +222,46 @@ class FirestoreService:
             logger.error(f"❌ Error uploading events: {e}")
             return False
     
+    def apply_delta(self, delta) -> bool:
+        """Apply a processor delta (data/processors/manifest.py) to the processed collections
+
+        Only added/changed fighters, events and fights are written and removed ones
+        deleted, keyed by their stable IDs under ufc_data/processed/<kind>.
+        """
+        if not self.authenticated:
+            logger.error("❌ Not authenticated with Firebase")
+            return False
+
+        try:
+            processed_ref = self.db.collection('ufc_data').document('processed')
+            operations = 0
+
+            for kind, removed_ids in delta.removed.items():
+                collection_ref = processed_ref.collection(kind)
+                upserts = delta.upserts(kind)
+                logger.info(f"🔄 Syncing {kind}: {len(upserts)} upserts, {len(removed_ids)} deletes")
+
+                writes = [(collection_ref.document(record['id']), record) for record in upserts]
+                writes += [(collection_ref.document(record_id), None) for record_id in removed_ids]
+
+                # Firestore batches hold at most FIRESTORE_BATCH_LIMIT writes
+                for start in range(0, len(writes), FIRESTORE_BATCH_LIMIT):
+                    batch = self.db.batch()
+                    for doc_ref, record in writes[start:start + FIRESTORE_BATCH_LIMIT]:
+                        if record is None:
+                            batch.delete(doc_ref)
+                        else:
+                            batch.set(doc_ref, {**record, 'last_updated': datetime.now()})
+                    batch.commit()
+                operations += len(writes)
+
+            logger.info(f"✅ Applied delta to Firestore ({operations} writes)")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Error applying delta: {e}")
+            return False
+
     def update_metadata(self, metadata: Dict[str, Any]) -> bool:
         """Update global metadata"""
         if not self.authenticated:
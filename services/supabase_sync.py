@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Supabase Delta Sync
+Applies a processor delta (data/processors/manifest.py) to the Supabase
+fighters, rankings, events and fights tables through PostgREST, upserting on
+the stable source_id column (scripts/add_source_ids.sql) and deleting only
+what the processor reports as removed.
+
+Events and fights stored before the source_id column existed are adopted
+first (scripts/card_writer.py), so the upsert updates them instead of adding
+a second copy. Fights are linked to their event by looking up the event's row
+from its source_id; fights whose event isn't in Supabase are skipped rather
+than written as orphans, and recorded on the delta so they're sent again.
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from dotenv import load_dotenv
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+from card_writer import CardWriter
+
+load_dotenv('.env')
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Rows per bulk request, and IDs per in.(...) filter so URLs stay short
+CHUNK_SIZE = 500
+FILTER_CHUNK_SIZE = 100
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _record_text(record: Dict) -> Optional[str]:
+    if not record:
+        return None
+    return f"{record.get('wins', 0)}-{record.get('losses', 0)}-{record.get('draws', 0)}"
+
+
+def fighter_row(fighter: Dict) -> Dict:
+    rankings = fighter.get('rankings', [])
+    return {
+        'source_id': fighter['id'],
+        'name': fighter['name'],
+        'record': _record_text(fighter.get('record')),
+        'weight_class': rankings[0]['division'] if rankings else None,
+    }
+
+
+def event_row(event: Dict) -> Dict:
+    return {
+        'source_id': event['id'],
+        'name': event['title'],
+        'date': event.get('date'),
+        'location': event.get('location'),
+        'status': 'completed' if event.get('type') == 'past' else 'scheduled',
+    }
+
+
+def fight_row(fight: Dict) -> Dict:
+    if isinstance(fight['fighter1'], dict):  # upcoming fight
+        return {
+            'source_id': fight['id'],
+            'fighter1_name': fight['fighter1']['name'],
+            'fighter2_name': fight['fighter2']['name'],
+            'weight_class': fight.get('weight_class'),
+            'status': 'scheduled',
+            'result': None,
+        }
+    return {
+        'source_id': fight['id'],
+        'fighter1_name': fight['fighter1'],
+        'fighter2_name': fight['fighter2'],
+        'weight_class': fight.get('weight_class'),
+        'status': 'completed',
+        'result': {
+            'winner_name': fight.get('winner_name'),
+            'method': fight.get('method'),
+            'round': fight.get('round'),
+            'time': fight.get('time'),
+        },
+    }
+
+
+def ranking_rows(fighter: Dict, fighter_uuid: str) -> List[Dict]:
+    return [
+        {
+            'fighter_id': fighter_uuid,
+            'weight_class': ranking['division'],
+            'rank_position': ranking['rank'],
+            'rank_type': 'champion' if ranking['rank'] == 0 else 'contender',
+        }
+        for ranking in fighter.get('rankings', [])
+    ]
+
+
+class SupabaseDeltaSync:
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None):
+        self.base_url = f"{supabase_url or os.getenv('SUPABASE_URL')}/rest/v1"
+        key = supabase_key or os.getenv('SUPABASE_SERVICE_KEY')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'apikey': key,
+            'Authorization': f'Bearer {key}',
+            'Content-Type': 'application/json',
+        })
+        # Adopts events and fights stored without a source_id
+        self.card_writer = CardWriter(supabase_url, supabase_key)
+
+    def _upsert(self, table: str, rows: List[Dict], returning: Optional[str] = None,
+                on_conflict: str = 'source_id') -> List[Dict]:
+        returned = []
+        prefer = 'resolution=merge-duplicates,' + ('return=representation' if returning else 'return=minimal')
+        params = {'on_conflict': on_conflict}
+        if returning:
+            params['select'] = returning
+        for chunk in _chunks(rows, CHUNK_SIZE):
+            response = self.session.post(f"{self.base_url}/{table}", params=params, json=chunk,
+                                         headers={'Prefer': prefer})
+            response.raise_for_status()
+            if returning:
+                returned.extend(response.json())
+        return returned
+
+    def _delete_in(self, table: str, column: str, values: List[str]):
+        for chunk in _chunks(values, FILTER_CHUNK_SIZE):
+            response = self.session.delete(f"{self.base_url}/{table}",
+                                           params={column: f"in.({','.join(chunk)})"})
+            response.raise_for_status()
+
+    def _insert(self, table: str, rows: List[Dict]):
+        for chunk in _chunks(rows, CHUNK_SIZE):
+            response = self.session.post(f"{self.base_url}/{table}", json=chunk,
+                                         headers={'Prefer': 'return=minimal'})
+            response.raise_for_status()
+
+    def sync_fighters(self, delta):
+        fighters = delta.upserts('fighters')
+        if fighters:
+            # Fighter names are unique, so rows loaded before source_id existed are adopted
+            stored = self._upsert('fighters', [fighter_row(f) for f in fighters], returning='id,source_id',
+                                  on_conflict='name')
+            uuid_by_source = {row['source_id']: row['id'] for row in stored}
+            # A changed fighter's rankings are replaced wholesale
+            uuids = list(uuid_by_source.values())
+            self._delete_in('rankings', 'fighter_id', uuids)
+            self._insert('rankings', [row for fighter in fighters if fighter['id'] in uuid_by_source
+                                      for row in ranking_rows(fighter, uuid_by_source[fighter['id']])])
+        # Rankings go with the fighter (ON DELETE CASCADE)
+        self._delete_in('fighters', 'source_id', delta.removed['fighters'])
+        logger.info(f"✅ Fighters: {len(fighters)} upserted, {len(delta.removed['fighters'])} deleted")
+
+    def sync_events(self, delta):
+        events = delta.upserts('events')
+        rows = [event_row(e) for e in events]
+        self.card_writer.adopt_events(rows)
+        self._upsert('events', rows)
+        self._delete_in('events', 'source_id', delta.removed['events'])
+        logger.info(f"✅ Events: {len(events)} upserted, {len(delta.removed['events'])} deleted")
+
+    def _event_ids(self, source_ids: List[str]) -> Dict[str, str]:
+        """events.id by source_id"""
+        event_ids = {}
+        for chunk in _chunks(sorted(source_ids), FILTER_CHUNK_SIZE):
+            response = self.session.get(f"{self.base_url}/events",
+                                        params={'select': 'id,source_id', 'source_id': f"in.({','.join(chunk)})"})
+            response.raise_for_status()
+            event_ids.update({row['source_id']: row['id'] for row in response.json()})
+        return event_ids
+
+    def sync_fights(self, delta):
+        fights = delta.upserts('fights')
+        event_ids = self._event_ids(list({f['event_id'] for f in fights if f.get('event_id')}))
+        rows = [{**fight_row(f), 'event_id': event_ids[f['event_id']]}
+                for f in fights if event_ids.get(f.get('event_id'))]
+        skipped = [f['id'] for f in fights if not event_ids.get(f.get('event_id'))]
+        if skipped:
+            # Left out of the committed manifest, so the next sync sends them again
+            delta.skip('fights', skipped)
+            logger.warning(f"⚠️ Skipped {len(skipped)} fights whose event isn't in Supabase")
+        self.card_writer.adopt_fights(rows)
+        self._upsert('fights', rows)
+        self._delete_in('fights', 'source_id', delta.removed['fights'])
+        logger.info(f"✅ Fights: {len(rows)} upserted, {len(delta.removed['fights'])} deleted")
+
+    def apply_delta(self, delta) -> bool:
+        """Apply the delta; returns False (and logs) on the first failed request"""
+        if delta.is_empty():
+            logger.info("✅ Nothing changed since the last sync")
+            return True
+        try:
+            self.sync_fighters(delta)
+            self.sync_events(delta)
+            self.sync_fights(delta)
+            return True
+        except requests.RequestException as e:
+            logger.error(f"❌ Error applying delta to Supabase: {e}")
+            return False